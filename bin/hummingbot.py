@@ -5,6 +5,7 @@ from typing import Coroutine, List, Optional
 from weakref import ReferenceType, ref
 
 import path_util  # noqa: F401
+import startup_profiler
 
 from bin.docker_connection import fork_and_start
 from hummingbot import chdir_to_data_directory, init_logging
@@ -48,14 +49,20 @@ class UIStartListener(EventListener):
 
 
 async def main_async(client_config_map: ClientConfigAdapter):
-    await create_yml_files_legacy()
+    with startup_profiler.phase("create config files"):
+        await create_yml_files_legacy()
 
     # This init_logging() call is important, to skip over the missing config warnings.
-    init_logging("hummingbot_logs.yml", client_config_map)
+    with startup_profiler.phase("init logging"):
+        init_logging("hummingbot_logs.yml", client_config_map)
 
-    AllConnectorSettings.initialize_paper_trade_settings(client_config_map.paper_trade.paper_trade_exchanges)
+    with startup_profiler.phase("connector settings"):
+        AllConnectorSettings.initialize_paper_trade_settings(client_config_map.paper_trade.paper_trade_exchanges)
+        AllConnectorSettings.save_connector_settings_manifest()
 
-    hb = HummingbotApplication.main_application(client_config_map)
+    with startup_profiler.phase("application init"):
+        hb = HummingbotApplication.main_application(client_config_map)
+    startup_profiler.report()
 
     # The listener needs to have a named variable for keeping reference, since the event listener system
     # uses weak references to remove unneeded listeners.
@@ -78,7 +85,8 @@ def main():
     chdir_to_data_directory()
     secrets_manager_cls = ETHKeyFileSecretManger
     ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
-    client_config_map = load_client_config_map_from_file()
+    with startup_profiler.phase("load client config"):
+        client_config_map = load_client_config_map_from_file()
     if login_prompt(secrets_manager_cls, style=load_style(client_config_map)):
         ev_loop.run_until_complete(main_async(client_config_map))
 
@@ -11,6 +11,7 @@ from pathlib import Path
 from typing import Coroutine, List
 
 import path_util  # noqa: F401
+import startup_profiler
 
 from bin.docker_connection import fork_and_start
 from bin.hummingbot import UIStartListener, detect_available_port
@@ -51,6 +52,9 @@ class CmdlineParser(argparse.ArgumentParser):
                           required=False,
                           help="Try to automatically set config / logs / data dir permissions, "
                                "useful for Docker containers.")
+        self.add_argument(startup_profiler.PROFILE_STARTUP_ARGUMENT,
+                          action="store_true",
+                          help="Report the import time of each module and the duration of the startup phases.")
 
 
 def autofix_permissions(user_group_spec: str):
@@ -84,14 +88,21 @@ async def quick_start(args: argparse.Namespace, secrets_manager: BaseSecretsMana
         logging.getLogger().error("Invalid password.")
         return
 
-    await Security.wait_til_decryption_done()
-    await create_yml_files_legacy()
-    init_logging("hummingbot_logs.yml", client_config_map)
-    await read_system_configs_from_yml()
-
-    AllConnectorSettings.initialize_paper_trade_settings(client_config_map.paper_trade.paper_trade_exchanges)
-
-    hb = HummingbotApplication.main_application(client_config_map=client_config_map)
+    with startup_profiler.phase("decrypt configs"):
+        await Security.wait_til_decryption_done()
+    with startup_profiler.phase("create config files"):
+        await create_yml_files_legacy()
+    with startup_profiler.phase("init logging"):
+        init_logging("hummingbot_logs.yml", client_config_map)
+    with startup_profiler.phase("read system configs"):
+        await read_system_configs_from_yml()
+
+    with startup_profiler.phase("connector settings"):
+        AllConnectorSettings.initialize_paper_trade_settings(client_config_map.paper_trade.paper_trade_exchanges)
+        AllConnectorSettings.save_connector_settings_manifest()
+
+    with startup_profiler.phase("application init"):
+        hb = HummingbotApplication.main_application(client_config_map=client_config_map)
     # Todo: validate strategy and config_file_name before assinging
 
     strategy_config = None
@@ -106,6 +117,7 @@ async def quick_start(args: argparse.Namespace, secrets_manager: BaseSecretsMana
             else strategy_config.get("strategy").value
         )
         hb.strategy_config_map = strategy_config
+    startup_profiler.report()
 
     if strategy_config is not None:
         if not all_configs_complete(strategy_config, hb.client_config_map):
@@ -137,7 +149,8 @@ def main():
 
     # If no password is given from the command line, prompt for one.
     secrets_manager_cls = ETHKeyFileSecretManger
-    client_config_map = load_client_config_map_from_file()
+    with startup_profiler.phase("load client config"):
+        client_config_map = load_client_config_map_from_file()
     if args.config_password is None:
         secrets_manager = login_prompt(secrets_manager_cls, style=load_style(client_config_map))
         if not secrets_manager:
@@ -0,0 +1,140 @@
+#!/usr/bin/python
+
+"""
+Startup profiling for the Hummingbot entry points.
+
+Like `path_util`, this module is imported for its side effect before any other Hummingbot module. When the
+`--profile-startup` argument is given, it records the time spent importing every module and the duration of the
+startup phases declared with `phase`, and `report` prints them once the client is initialized.
+"""
+
+import sys
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from importlib.abc import MetaPathFinder
+from typing import Dict, Iterator, List, Optional, Tuple
+
+PROFILE_STARTUP_ARGUMENT = "--profile-startup"
+REPORTED_MODULES_COUNT = 30
+
+
+class _TimedLoader:
+    """
+    Wraps the loader of a module spec to measure the module execution. The original loader is restored on the module
+    once it has been executed.
+    """
+
+    def __init__(self, loader, profiler: "StartupProfiler"):
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        # Extension modules using single-phase initialization are executed when created
+        return self._profiler.measure_import(spec.name, lambda: self._loader.create_module(spec))
+
+    def exec_module(self, module):
+        try:
+            self._profiler.measure_import(module.__name__, lambda: self._loader.exec_module(module))
+        finally:
+            module.__loader__ = self._loader
+            if getattr(module, "__spec__", None) is not None:
+                module.__spec__.loader = self._loader
+
+
+class StartupProfiler(MetaPathFinder):
+    def __init__(self):
+        self._start_time = time.perf_counter()
+        self._import_total_times: Dict[str, float] = defaultdict(float)
+        self._import_self_times: Dict[str, float] = defaultdict(float)
+        self._nested_import_times: List[float] = []
+        self._phase_times: List[Tuple[str, float]] = []
+
+    def install(self):
+        sys.meta_path.insert(0, self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self)
+                return spec
+        return None
+
+    def measure_import(self, module_name: str, load_fn):
+        self._nested_import_times.append(0.0)
+        start = time.perf_counter()
+        try:
+            return load_fn()
+        finally:
+            elapsed = time.perf_counter() - start
+            nested_time = self._nested_import_times.pop()
+            self._import_total_times[module_name] += elapsed
+            self._import_self_times[module_name] += elapsed - nested_time
+            if len(self._nested_import_times) > 0:
+                self._nested_import_times[-1] += elapsed
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._phase_times.append((name, time.perf_counter() - start))
+
+    def report_lines(self) -> List[str]:
+        lines = [f"Startup profile ({time.perf_counter() - self._start_time:.3f}s since launch)", "", "Phases:"]
+        lines.extend(f"  {seconds:8.3f}s  {name}" for name, seconds in self._phase_times)
+
+        lines.extend([
+            "",
+            f"Imports: {len(self._import_self_times)} modules in {sum(self._import_self_times.values()):.3f}s",
+            f"  {'self':>8}  {'cumulative':>10}  module",
+        ])
+        slowest_modules = sorted(self._import_self_times.items(), key=lambda item: item[1], reverse=True)
+        lines.extend(
+            f"  {self_time:7.3f}s  {self._import_total_times[module_name]:9.3f}s  {module_name}"
+            for module_name, self_time in slowest_modules[:REPORTED_MODULES_COUNT]
+        )
+        return lines
+
+
+profiler: Optional[StartupProfiler] = None
+
+
+def phase(name: str):
+    """
+    Measures the duration of a startup phase, does nothing when startup profiling is disabled.
+    """
+    if profiler is None:
+        return _null_phase()
+    return profiler.phase(name)
+
+
+@contextmanager
+def _null_phase() -> Iterator[None]:
+    yield
+
+
+def report():
+    """
+    Prints the startup profile and stops recording imports, does nothing when startup profiling is disabled.
+    """
+    if profiler is not None:
+        profiler.uninstall()
+        print("\n".join(profiler.report_lines()), file=sys.stderr)
+
+
+if PROFILE_STARTUP_ARGUMENT in sys.argv:
+    profiler = StartupProfiler()
+    profiler.install()
@@ -22,8 +22,6 @@ from hummingbot.connector.utils import split_hb_trading_pair
 from hummingbot.core.utils import map_df_to_str
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.model.inventory_cost import InventoryCost
-from hummingbot.strategy.perpetual_market_making import PerpetualMarketMakingStrategy
-from hummingbot.strategy.pure_market_making import PureMarketMakingStrategy
 from hummingbot.user.user_balances import UserBalances
 
 if TYPE_CHECKING:
@@ -305,6 +303,8 @@ class ConfigCommand:
         self.app.app.style = load_style(self.client_config_map)
         for config in missings:
             self.notify(f"{config.key}: {str(config.value)}")
+        from hummingbot.strategy.perpetual_market_making import PerpetualMarketMakingStrategy
+        from hummingbot.strategy.pure_market_making import PureMarketMakingStrategy
         if (
                 isinstance(self.strategy, PureMarketMakingStrategy) or
                 isinstance(self.strategy, PerpetualMarketMakingStrategy)
@@ -30,11 +30,11 @@ from hummingbot.core.rate_oracle.rate_oracle import RATE_ORACLE_SOURCES, RateOra
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
 from hummingbot.core.utils.kill_switch import ActiveKillSwitch, KillSwitch, PassThroughKillSwitch
 from hummingbot.notifier.telegram_notifier import TelegramNotifier
-from hummingbot.pmm_script.pmm_script_iterator import PMMScriptIterator
 from hummingbot.strategy.strategy_base import StrategyBase
 
 if TYPE_CHECKING:
     from hummingbot.client.hummingbot_application import HummingbotApplication
+    from hummingbot.pmm_script.pmm_script_iterator import PMMScriptIterator
 
 PMM_SCRIPT_ENABLED_KEY = "pmm_script_enabled"
 PMM_SCRIPT_FILE_PATH_KEY = "pmm_script_file_path"
@@ -471,7 +471,7 @@ class PMMScriptMode(BaseClientModel, ABC):
             self,
             strategy_name: str,
             markets: List[ExchangeBase],
-            strategy: StrategyBase) -> Optional[PMMScriptIterator]:
+            strategy: StrategyBase) -> Optional["PMMScriptIterator"]:
         ...
 
 
@@ -483,7 +483,7 @@ class PMMScriptDisabledMode(PMMScriptMode):
             self,
             strategy_name: str,
             markets: List[ExchangeBase],
-            strategy: StrategyBase) -> Optional[PMMScriptIterator]:
+            strategy: StrategyBase) -> Optional["PMMScriptIterator"]:
         return None
 
 
@@ -500,7 +500,10 @@ class PMMScriptEnabledMode(PMMScriptMode):
             self,
             strategy_name: str,
             markets: List[ExchangeBase],
-            strategy: StrategyBase) -> Optional[PMMScriptIterator]:
+            strategy: StrategyBase) -> Optional["PMMScriptIterator"]:
+        # The iterator pulls in the pure market making strategy, imported only when the feature is used
+        from hummingbot.pmm_script.pmm_script_iterator import PMMScriptIterator
+
         if strategy_name != "pure_market_making":
             raise ValueError("PMM script feature is only available for pure_market_making strategy.")
         folder = dirname(self.pmm_script_file_path)
@@ -629,6 +632,38 @@ class CommandsTimeoutConfigMap(BaseClientModel):
         return super().validate_decimal(v, field)
 
 
+class OrderBookWorkersConfigMap(BaseClientModel):
+    order_book_worker_connectors: List = Field(
+        default=[],
+        description="Connectors whose order books are tracked in worker processes instead of the main event loop",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enter the connectors whose order books should be tracked in worker processes"
+                " (Input must be a valid list, e.g. [\"binance\", \"kucoin\"])"
+            ),
+        ),
+    )
+    order_book_worker_processes: int = Field(
+        default=1,
+        ge=1,
+        description="Number of worker processes per connector. The trading pairs are split between them",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "How many worker processes should track the order books of each connector?",
+        ),
+    )
+    order_book_worker_depth: int = Field(
+        default=20,
+        ge=1,
+        description="Number of levels per side the worker processes publish for each order book",
+        client_data=ClientFieldData(
+            prompt=lambda cm: "How many levels per side should the worker processes publish for each order book?",
+        ),
+    )
+
+    class Config:
+        title = "order_book_workers"
+
+
 class AnonymizedMetricsMode(BaseClientModel, ABC):
     @abstractmethod
     def get_collector(
@@ -975,6 +1010,7 @@ class ClientConfigMap(BaseClientModel):
         ),
     )
     paper_trade: PaperTradeConfigMap = Field(default=PaperTradeConfigMap())
+    order_book_workers: OrderBookWorkersConfigMap = Field(default=OrderBookWorkersConfigMap())
     color: ColorConfigMap = Field(default=ColorConfigMap())
     tick_size: float = Field(
         default=1.0,
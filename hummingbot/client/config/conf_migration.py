@@ -28,12 +28,6 @@ from hummingbot.client.config.config_data_types import BaseConnectorConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, save_to_yml
 from hummingbot.client.config.security import Security
 from hummingbot.client.settings import CLIENT_CONFIG_PATH, CONF_DIR_PATH, STRATEGIES_CONF_DIR_PATH
-from hummingbot.strategy.avellaneda_market_making.avellaneda_market_making_config_map_pydantic import (
-    AvellanedaMarketMakingConfigMap,
-)
-from hummingbot.strategy.cross_exchange_market_making.cross_exchange_market_making_config_map_pydantic import (
-    CrossExchangeMarketMakingConfigMap,
-)
 
 encrypted_conf_prefix = "encrypted_"
 encrypted_conf_postfix = ".json"
@@ -287,6 +281,10 @@ def migrate_strategy_confs_paths():
 
 
 def migrate_amm_confs(conf, new_path) -> List[str]:
+    from hummingbot.strategy.avellaneda_market_making.avellaneda_market_making_config_map_pydantic import (
+        AvellanedaMarketMakingConfigMap,
+    )
+
     execution_timeframe = conf.pop("execution_timeframe")
     if execution_timeframe == "infinite":
         conf["execution_timeframe_mode"] = {}
@@ -333,6 +331,10 @@ def migrate_amm_confs(conf, new_path) -> List[str]:
 
 
 def migrate_xemm_confs(conf, new_path) -> List[str]:
+    from hummingbot.strategy.cross_exchange_market_making.cross_exchange_market_making_config_map_pydantic import (
+        CrossExchangeMarketMakingConfigMap,
+    )
+
     if "active_order_canceling" in conf:
         if conf["active_order_canceling"]:
             conf["order_refresh_mode"] = {}
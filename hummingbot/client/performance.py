@@ -208,41 +208,60 @@ class PerformanceMetrics:
 
     async def _calculate_fees(self, quote: str, trades: List[Any]):
         for trade in trades:
-            fee_percent = None
-            trade_price = None
-            trade_amount = None
-            if self._is_trade_fill(trade):
-                if trade.trade_fee.get("percent") is not None and Decimal(trade.trade_fee["percent"]) > 0:
-                    trade_price = Decimal(str(trade.price))
-                    trade_amount = Decimal(str(trade.amount))
-                    fee_percent = Decimal(str(trade.trade_fee["percent"]))
-                flat_fees = [TokenAmount(token=flat_fee["token"], amount=Decimal(flat_fee["amount"]))
-                             for flat_fee in trade.trade_fee.get("flat_fees", [])]
-            else:  # assume this is Trade object
-                if trade.trade_fee.percent is not None and trade.trade_fee.percent > 0:
-                    trade_price = Decimal(trade.price)
-                    trade_amount = Decimal(trade.amount)
-                    fee_percent = Decimal(trade.trade_fee.percent)
-                flat_fees = trade.trade_fee.flat_fees
-
-            if fee_percent is not None and fee_percent > 0:
-                self.fees[quote] += trade_price * trade_amount * fee_percent
-            for flat_fee in flat_fees:
-                self.fees[flat_fee.token] += flat_fee.amount
-
-        for fee_token, fee_amount in self.fees.items():
+            for fee_token, fee_amount in self.trade_fee_amounts(quote, trade):
+                self.fees[fee_token] += fee_amount
+        self.fee_in_quote += await self.fees_in_quote(quote, self.fees)
+
+    def trade_fee_amounts(self, quote: str, trade: Any) -> List[Tuple[str, Decimal]]:
+        """
+        Returns the fees paid for a trade, as (token, amount) pairs
+        :param quote: the quote asset of the trade, used for the percent fees
+        :param trade: a TradeFill or Trade object
+        """
+        fee_amounts = []
+        fee_percent = None
+        trade_price = None
+        trade_amount = None
+        if self._is_trade_fill(trade):
+            if trade.trade_fee.get("percent") is not None and Decimal(trade.trade_fee["percent"]) > 0:
+                trade_price = Decimal(str(trade.price))
+                trade_amount = Decimal(str(trade.amount))
+                fee_percent = Decimal(str(trade.trade_fee["percent"]))
+            flat_fees = [TokenAmount(token=flat_fee["token"], amount=Decimal(flat_fee["amount"]))
+                         for flat_fee in trade.trade_fee.get("flat_fees", [])]
+        else:  # assume this is Trade object
+            if trade.trade_fee.percent is not None and trade.trade_fee.percent > 0:
+                trade_price = Decimal(trade.price)
+                trade_amount = Decimal(trade.amount)
+                fee_percent = Decimal(trade.trade_fee.percent)
+            flat_fees = trade.trade_fee.flat_fees
+
+        if fee_percent is not None and fee_percent > 0:
+            fee_amounts.append((quote, trade_price * trade_amount * fee_percent))
+        for flat_fee in flat_fees:
+            fee_amounts.append((flat_fee.token, flat_fee.amount))
+        return fee_amounts
+
+    @classmethod
+    async def fees_in_quote(cls, quote: str, fees: Dict[str, Decimal]) -> Decimal:
+        """
+        Returns the total of the fees converted to the quote asset with the rate oracle
+        """
+        fee_in_quote = s_decimal_0
+        for fee_token, fee_amount in fees.items():
             if fee_token == quote:
-                self.fee_in_quote += fee_amount
+                fee_in_quote += fee_amount
             else:
                 rate_pair: str = combine_to_hb_trading_pair(fee_token, quote)
                 last_price = await RateOracle.get_instance().stored_or_live_rate(rate_pair)
                 if last_price is not None:
-                    self.fee_in_quote += fee_amount * last_price
+                    fee_in_quote += fee_amount * last_price
                 else:
-                    self.logger().warning(
+                    cls.logger().warning(
                         f"Could not find exchange rate for {rate_pair} "
                         f"using {RateOracle.get_instance()}. PNL value will be inconsistent."
                     )
+        return fee_in_quote
 
     def _calculate_trade_pnl(self, buys: list, sells: list):
         self.trade_pnl = self.cur_value - self.hold_value
@@ -306,3 +325,79 @@ class PerformanceMetrics:
 
         self.total_pnl = self.trade_pnl - self.fee_in_quote
         self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+
+class PerformanceMetricsAccumulator:
+    """
+    Running totals of the trades of one market, updated trade by trade, to calculate the same PnL and Return % as
+    PerformanceMetrics without going through all the trades again.
+
+    The spot PnL only depends on the base and quote volumes and on the fees, so they are the only state kept.
+    Derivatives PnL needs the open and close positions pairing, so the trades of a derivative market are kept and
+    the metrics are calculated with PerformanceMetrics, from copies of the trades since it aggregates the fills of
+    an order in place.
+    """
+
+    def __init__(self, trading_pair: str):
+        self._trading_pair: str = trading_pair
+        self._quote: str = split_hb_trading_pair(trading_pair)[1]
+        self._num_trades: int = 0
+        self._tot_vol_base: Decimal = s_decimal_0
+        self._tot_vol_quote: Decimal = s_decimal_0
+        self._last_price: Decimal = s_decimal_0
+        self._fees: Dict[str, Decimal] = defaultdict(lambda: s_decimal_0)
+        self._fees_calculator: PerformanceMetrics = PerformanceMetrics()
+        self._derivative_trades: List[Any] = []
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def num_trades(self) -> int:
+        return self._num_trades
+
+    def add_trade(self, trade: Any):
+        """
+        :param trade: a TradeFill or Trade object of the market
+        """
+        self._num_trades += 1
+        if self._fees_calculator._is_trade_fill(trade) and trade.position != PositionAction.NIL.value:
+            self._derivative_trades.append(trade)
+            return
+        amount = Decimal(str(trade.amount))
+        price = Decimal(str(trade.price))
+        if trade.trade_type.upper() == TradeType.BUY.name.upper():
+            self._tot_vol_base += amount
+            self._tot_vol_quote -= amount * price
+        elif trade.trade_type.upper() == TradeType.SELL.name.upper():
+            self._tot_vol_base -= amount
+            self._tot_vol_quote += amount * price
+        self._last_price = price
+        for fee_token, fee_amount in self._fees_calculator.trade_fee_amounts(self._quote, trade):
+            self._fees[fee_token] += fee_amount
+
+    async def pnl_and_return(self, current_balances: Dict[str, Decimal]) -> Tuple[Decimal, Decimal]:
+        """
+        Returns the total PnL (in quote asset) and the Return % of the trades, as calculated by PerformanceMetrics
+        :param current_balances: current user account balance
+        """
+        if len(self._derivative_trades) > 0:
+            trades = [self._copy_trade_fill(trade) for trade in self._derivative_trades]
+            performance = await PerformanceMetrics.create(self._trading_pair, trades, current_balances)
+            return performance.total_pnl, performance.return_pct
+
+        base, quote = split_hb_trading_pair(self._trading_pair)
+        cur_base_bal = current_balances.get(base, s_decimal_0)
+        cur_quote_bal = current_balances.get(quote, s_decimal_0)
+        cur_price = await RateOracle.get_instance().stored_or_live_rate(self._trading_pair)
+        if cur_price is None:
+            cur_price = self._last_price
+        hold_value = ((cur_base_bal - self._tot_vol_base) * cur_price) + (cur_quote_bal - self._tot_vol_quote)
+        trade_pnl = self._tot_vol_base * cur_price + self._tot_vol_quote
+        total_pnl = trade_pnl - await PerformanceMetrics.fees_in_quote(quote, self._fees)
+        return total_pnl, PerformanceMetrics.divide(total_pnl, hold_value)
+
+    @staticmethod
+    def _copy_trade_fill(trade: TradeFill) -> TradeFill:
+        return TradeFill(**{column.name: getattr(trade, column.name) for column in TradeFill.__table__.columns})
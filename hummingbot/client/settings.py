@@ -1,19 +1,22 @@
 import importlib
 import json
+import logging
 from decimal import Decimal
 from enum import Enum
 from os import DirEntry, scandir
-from os.path import exists, join, realpath
-from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Union, cast
+from os.path import exists, getmtime, join, realpath
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Set, Tuple, Union, cast
 
 from pydantic import SecretStr
 
-from hummingbot import get_strategy_list, root_path
-from hummingbot.core.data_type.trade_fee import TradeFeeSchema
+from hummingbot import data_path, get_strategy_list, root_path
+from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeSchema
 from hummingbot.core.utils.gateway_config_utils import SUPPORTED_CHAINS
 
 if TYPE_CHECKING:
     from hummingbot.client.config.config_data_types import BaseConnectorConfigMap
+    from hummingbot.client.config.config_helpers import ClientConfigAdapter
     from hummingbot.connector.connector_base import ConnectorBase
 
 # Global variables
@@ -58,6 +61,7 @@ PAPER_TRADE_EXCHANGES = [  # todo: fix after global config map refactor
 ]
 
 CONNECTOR_SUBMODULES_THAT_ARE_NOT_TYPES = ["test_support", "utilities"]
+CONNECTOR_SETTINGS_MANIFEST_FILE_NAME = "connector_settings_manifest.json"
 
 
 class ConnectorType(Enum):
@@ -244,7 +248,8 @@ class ConnectorSetting(NamedTuple):
 
     def non_trading_connector_instance_with_default_configuration(
             self,
-            trading_pairs: Optional[List[str]] = None) -> 'ConnectorBase':
+            trading_pairs: Optional[List[str]] = None,
+            client_config_map: Optional["ClientConfigAdapter"] = None) -> 'ConnectorBase':
         from hummingbot.client.config.config_helpers import ClientConfigAdapter
         from hummingbot.client.hummingbot_application import HummingbotApplication
 
@@ -265,22 +270,75 @@ class ConnectorSetting(NamedTuple):
         kwargs = self.conn_init_parameters(kwargs)
         kwargs = self.add_domain_parameter(kwargs)
         kwargs.update(trading_pairs=trading_pairs, trading_required=False)
-        kwargs["client_config_map"] = HummingbotApplication.main_application().client_config_map
+        kwargs["client_config_map"] = client_config_map or HummingbotApplication.main_application().client_config_map
         connector = connector_class(**kwargs)
 
         return connector
 
 
+class ConfigKeysReference(NamedTuple):
+    """
+    Location of the config keys of a connector in its utils module, used to import them only when required.
+    """
+    module_path: str
+    attribute: str
+    domain: Optional[str] = None
+
+    def load(self) -> Optional["BaseConnectorConfigMap"]:
+        config_keys = getattr(importlib.import_module(self.module_path), self.attribute, None)
+        if self.domain is not None:
+            config_keys = config_keys[self.domain]
+        return config_keys
+
+
+class ManifestConnectorSetting(ConnectorSetting):
+    """
+    A connector setting restored from the connector settings manifest. The `config_keys` field holds a
+    `ConfigKeysReference`, and the config keys are imported from the connector utils module on first access.
+    """
+
+    @property
+    def config_keys(self) -> Optional["BaseConnectorConfigMap"]:
+        if "_config_keys" not in self.__dict__:
+            config_keys_reference: ConfigKeysReference = tuple.__getitem__(self, self._fields.index("config_keys"))
+            self.__dict__["_config_keys"] = config_keys_reference.load()
+        return self.__dict__["_config_keys"]
+
+
 class AllConnectorSettings:
     all_connector_settings: Dict[str, ConnectorSetting] = {}
+    # The connector settings manifest file, in the data folder by default
+    connector_settings_manifest_path: Optional[Path] = None
+    # The connector directories and config keys of the last connector utils modules scan, kept for the manifest
+    _scanned_connectors: Optional[Tuple[List[DirEntry], Dict[str, ConfigKeysReference]]] = None
 
     @classmethod
-    def create_connector_settings(cls):
+    def create_connector_settings(cls, use_manifest: bool = False):
         """
         Iterate over files in specific Python directories to create a dictionary of exchange names to ConnectorSetting.
+
+        :param use_manifest: if True the settings are restored from the connector settings manifest when it is up to
+        date, instead of importing every connector utils module. The manifest is only written by
+        `save_connector_settings_manifest`.
         """
         cls.all_connector_settings = {}  # reset
+
+        connector_dirs = cls._connector_dirs()
+        manifest_settings = cls._load_connector_settings_manifest(connector_dirs) if use_manifest else None
+        if manifest_settings is not None:
+            cls.all_connector_settings.update(manifest_settings)
+            cls._scanned_connectors = None
+        else:
+            cls._scanned_connectors = (connector_dirs, cls._scan_connector_utils_modules(connector_dirs))
+
+        cls._add_gateway_connector_settings()
+
+        return cls.all_connector_settings
+
+    @classmethod
+    def _connector_dirs(cls) -> List[DirEntry]:
         connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade"]
+        connector_dirs: List[DirEntry] = []
 
         type_dirs: List[DirEntry] = [
             cast(DirEntry, f) for f in scandir(f"{root_path() / 'hummingbot' / 'connector'}")
@@ -289,58 +347,75 @@ class AllConnectorSettings:
         for type_dir in type_dirs:
             if type_dir.name == 'gateway':
                 continue
-            connector_dirs: List[DirEntry] = [
+            connector_dirs.extend(
                 cast(DirEntry, f) for f in scandir(type_dir.path)
-                if f.is_dir() and exists(join(f.path, "__init__.py"))
-            ]
-            for connector_dir in connector_dirs:
-                if connector_dir.name.startswith("_") or connector_dir.name in connector_exceptions:
-                    continue
-                if connector_dir.name in cls.all_connector_settings:
-                    raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
-                try:
-                    util_module_path: str = f"hummingbot.connector.{type_dir.name}." \
-                                            f"{connector_dir.name}.{connector_dir.name}_utils"
-                    util_module = importlib.import_module(util_module_path)
-                except ModuleNotFoundError:
-                    continue
-                trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
-                trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
-                    connector_dir.name, trade_fee_settings
-                )
-                cls.all_connector_settings[connector_dir.name] = ConnectorSetting(
-                    name=connector_dir.name,
-                    type=ConnectorType[type_dir.name.capitalize()],
-                    centralised=getattr(util_module, "CENTRALIZED", True),
-                    example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
-                    use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
+                if f.is_dir()
+                and exists(join(f.path, "__init__.py"))
+                and not f.name.startswith("_")
+                and f.name not in connector_exceptions
+            )
+        return connector_dirs
+
+    @staticmethod
+    def _util_module_path(connector_dir: DirEntry) -> str:
+        type_dir_name = Path(connector_dir.path).parent.name
+        return f"hummingbot.connector.{type_dir_name}.{connector_dir.name}.{connector_dir.name}_utils"
+
+    @classmethod
+    def _scan_connector_utils_modules(cls, connector_dirs: List[DirEntry]) -> Dict[str, ConfigKeysReference]:
+        config_keys_references: Dict[str, ConfigKeysReference] = {}
+        for connector_dir in connector_dirs:
+            type_dir_name = Path(connector_dir.path).parent.name
+            if connector_dir.name in cls.all_connector_settings:
+                raise Exception(f"Multiple connectors with the same {connector_dir.name} name.")
+            try:
+                util_module_path: str = cls._util_module_path(connector_dir)
+                util_module = importlib.import_module(util_module_path)
+            except ModuleNotFoundError:
+                continue
+            config_keys_references[connector_dir.name] = ConfigKeysReference(util_module_path, "KEYS")
+            trade_fee_settings: List[float] = getattr(util_module, "DEFAULT_FEES", None)
+            trade_fee_schema: TradeFeeSchema = cls._validate_trade_fee_schema(
+                connector_dir.name, trade_fee_settings
+            )
+            cls.all_connector_settings[connector_dir.name] = ConnectorSetting(
+                name=connector_dir.name,
+                type=ConnectorType[type_dir_name.capitalize()],
+                centralised=getattr(util_module, "CENTRALIZED", True),
+                example_pair=getattr(util_module, "EXAMPLE_PAIR", ""),
+                use_ethereum_wallet=getattr(util_module, "USE_ETHEREUM_WALLET", False),
+                trade_fee_schema=trade_fee_schema,
+                config_keys=getattr(util_module, "KEYS", None),
+                is_sub_domain=False,
+                parent_name=None,
+                domain_parameter=None,
+                use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
+            )
+            # Adds other domains of connector
+            other_domains = getattr(util_module, "OTHER_DOMAINS", [])
+            for domain in other_domains:
+                trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
+                trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
+                parent = cls.all_connector_settings[connector_dir.name]
+                cls.all_connector_settings[domain] = ConnectorSetting(
+                    name=domain,
+                    type=parent.type,
+                    centralised=parent.centralised,
+                    example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
+                    use_ethereum_wallet=parent.use_ethereum_wallet,
                     trade_fee_schema=trade_fee_schema,
-                    config_keys=getattr(util_module, "KEYS", None),
-                    is_sub_domain=False,
-                    parent_name=None,
-                    domain_parameter=None,
-                    use_eth_gas_lookup=getattr(util_module, "USE_ETH_GAS_LOOKUP", False),
+                    config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
+                    is_sub_domain=True,
+                    parent_name=parent.name,
+                    domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
+                    use_eth_gas_lookup=parent.use_eth_gas_lookup,
                 )
-                # Adds other domains of connector
-                other_domains = getattr(util_module, "OTHER_DOMAINS", [])
-                for domain in other_domains:
-                    trade_fee_settings = getattr(util_module, "OTHER_DOMAINS_DEFAULT_FEES")[domain]
-                    trade_fee_schema = cls._validate_trade_fee_schema(domain, trade_fee_settings)
-                    parent = cls.all_connector_settings[connector_dir.name]
-                    cls.all_connector_settings[domain] = ConnectorSetting(
-                        name=domain,
-                        type=parent.type,
-                        centralised=parent.centralised,
-                        example_pair=getattr(util_module, "OTHER_DOMAINS_EXAMPLE_PAIR")[domain],
-                        use_ethereum_wallet=parent.use_ethereum_wallet,
-                        trade_fee_schema=trade_fee_schema,
-                        config_keys=getattr(util_module, "OTHER_DOMAINS_KEYS")[domain],
-                        is_sub_domain=True,
-                        parent_name=parent.name,
-                        domain_parameter=getattr(util_module, "OTHER_DOMAINS_PARAMETER")[domain],
-                        use_eth_gas_lookup=parent.use_eth_gas_lookup,
-                    )
+                config_keys_references[domain] = ConfigKeysReference(util_module_path, "OTHER_DOMAINS_KEYS", domain)
+
+        return config_keys_references
 
+    @classmethod
+    def _add_gateway_connector_settings(cls):
         # add gateway connectors
         gateway_connections_conf: List[Dict[str, str]] = GatewayConnectionSetting.load()
         trade_fee_settings: List[float] = [0.0, 0.0]  # we assume no swap fees for now
@@ -362,7 +437,118 @@ class AllConnectorSettings:
                 use_eth_gas_lookup=False,
             )
 
-        return cls.all_connector_settings
+    @classmethod
+    def save_connector_settings_manifest(cls):
+        """
+        Writes the connector settings manifest when the current connector settings were scanned from the connector
+        utils modules (i.e. the manifest is missing or outdated). Only the client entry points call it, so that
+        importing the settings (e.g. in tests) never writes to the data folder.
+        """
+        if cls._scanned_connectors is not None:
+            connector_dirs, config_keys_references = cls._scanned_connectors
+            cls._save_connector_settings_manifest(connector_dirs, config_keys_references)
+            cls._scanned_connectors = None
+
+    @classmethod
+    def _connector_settings_manifest_path(cls) -> Path:
+        if cls.connector_settings_manifest_path is not None:
+            return cls.connector_settings_manifest_path
+        return Path(data_path()) / CONNECTOR_SETTINGS_MANIFEST_FILE_NAME
+
+    @classmethod
+    def _connector_dirs_fingerprint(cls, connector_dirs: List[DirEntry]) -> Dict[str, Optional[float]]:
+        # The modification times of the utils modules identify the version of the connectors the manifest describes
+        fingerprint = {}
+        for connector_dir in connector_dirs:
+            util_file_path = join(connector_dir.path, f"{connector_dir.name}_utils.py")
+            fingerprint[cls._util_module_path(connector_dir)] = getmtime(util_file_path) if exists(util_file_path) else None
+        return fingerprint
+
+    @classmethod
+    def _load_connector_settings_manifest(cls, connector_dirs: List[DirEntry]) -> Optional[Dict[str, ConnectorSetting]]:
+        """
+        Returns the connector settings stored in the manifest, or None if there is no manifest or if the connector
+        packages changed since it was written.
+        """
+        try:
+            with open(cls._connector_settings_manifest_path()) as manifest_file:
+                manifest: Dict[str, Any] = json.load(manifest_file)
+            if manifest["fingerprint"] != cls._connector_dirs_fingerprint(connector_dirs):
+                return None
+            return {
+                entry["name"]: ManifestConnectorSetting(
+                    name=entry["name"],
+                    type=ConnectorType[entry["type"]],
+                    centralised=entry["centralised"],
+                    example_pair=entry["example_pair"],
+                    use_ethereum_wallet=entry["use_ethereum_wallet"],
+                    trade_fee_schema=cls._trade_fee_schema_from_json(entry["trade_fee_schema"]),
+                    config_keys=ConfigKeysReference(*entry["config_keys"]),
+                    is_sub_domain=entry["is_sub_domain"],
+                    parent_name=entry["parent_name"],
+                    domain_parameter=entry["domain_parameter"],
+                    use_eth_gas_lookup=entry["use_eth_gas_lookup"],
+                )
+                for entry in manifest["connectors"]
+            }
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logging.getLogger(__name__).warning("The connector settings manifest could not be read.", exc_info=True)
+            return None
+
+    @classmethod
+    def _save_connector_settings_manifest(
+            cls,
+            connector_dirs: List[DirEntry],
+            config_keys_references: Dict[str, ConfigKeysReference]):
+        manifest = {
+            "fingerprint": cls._connector_dirs_fingerprint(connector_dirs),
+            "connectors": [
+                {
+                    "name": setting.name,
+                    "type": setting.type.name,
+                    "centralised": setting.centralised,
+                    "example_pair": setting.example_pair,
+                    "use_ethereum_wallet": setting.use_ethereum_wallet,
+                    "trade_fee_schema": cls._trade_fee_schema_to_json(setting.trade_fee_schema),
+                    "config_keys": list(config_keys_references[setting.name]),
+                    "is_sub_domain": setting.is_sub_domain,
+                    "parent_name": setting.parent_name,
+                    "domain_parameter": setting.domain_parameter,
+                    "use_eth_gas_lookup": setting.use_eth_gas_lookup,
+                }
+                for setting in cls.all_connector_settings.values()
+                if setting.name in config_keys_references
+            ],
+        }
+        try:
+            with open(cls._connector_settings_manifest_path(), "w") as manifest_file:
+                json.dump(manifest, manifest_file)
+        except Exception:
+            logging.getLogger(__name__).warning("The connector settings manifest could not be saved.", exc_info=True)
+
+    @staticmethod
+    def _trade_fee_schema_to_json(trade_fee_schema: TradeFeeSchema) -> Dict[str, Any]:
+        return {
+            "percent_fee_token": trade_fee_schema.percent_fee_token,
+            "maker_percent_fee_decimal": str(trade_fee_schema.maker_percent_fee_decimal),
+            "taker_percent_fee_decimal": str(trade_fee_schema.taker_percent_fee_decimal),
+            "buy_percent_fee_deducted_from_returns": trade_fee_schema.buy_percent_fee_deducted_from_returns,
+            "maker_fixed_fees": [fee.to_json() for fee in trade_fee_schema.maker_fixed_fees],
+            "taker_fixed_fees": [fee.to_json() for fee in trade_fee_schema.taker_fixed_fees],
+        }
+
+    @staticmethod
+    def _trade_fee_schema_from_json(data: Dict[str, Any]) -> TradeFeeSchema:
+        return TradeFeeSchema(
+            percent_fee_token=data["percent_fee_token"],
+            maker_percent_fee_decimal=Decimal(data["maker_percent_fee_decimal"]),
+            taker_percent_fee_decimal=Decimal(data["taker_percent_fee_decimal"]),
+            buy_percent_fee_deducted_from_returns=data["buy_percent_fee_deducted_from_returns"],
+            maker_fixed_fees=[TokenAmount.from_json(fee) for fee in data["maker_fixed_fees"]],
+            taker_fixed_fees=[TokenAmount.from_json(fee) for fee in data["taker_fixed_fees"]],
+        )
 
     @classmethod
     def initialize_paper_trade_settings(cls, paper_trade_exchanges: List[str]):
@@ -387,7 +573,7 @@ class AllConnectorSettings:
     @classmethod
     def get_connector_settings(cls) -> Dict[str, ConnectorSetting]:
         if len(cls.all_connector_settings) == 0:
-            cls.all_connector_settings = cls.create_connector_settings()
+            cls.all_connector_settings = cls.create_connector_settings(use_manifest=True)
         return cls.all_connector_settings
 
     @classmethod
@@ -513,6 +699,7 @@ def gateway_connector_trading_pairs(connector: str) -> List[str]:
 
 MAXIMUM_OUTPUT_PANE_LINE_COUNT = 1000
 MAXIMUM_LOG_PANE_LINE_COUNT = 1000
+LOG_PANE_MAX_REFRESH_RATE = 10  # log pane redraws per second, log lines received in between are shown together
 MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT = 100
 
 STRATEGIES: List[str] = get_strategy_list()
@@ -1,6 +1,9 @@
 from __future__ import unicode_literals
 
+import asyncio
 import re
+import threading
+import time
 from collections import deque
 from typing import Callable, Deque, Dict, List, Tuple
 
@@ -38,6 +41,7 @@ class CustomBuffer(Buffer):
 class FormattedTextLexer(Lexer):
 
     PROMPT_TEXT = ">>> "
+    LINE_FRAGMENTS_CACHE_SIZE = 1000
 
     def __init__(self, client_config_map: ClientConfigAdapter) -> None:
         super().__init__()
@@ -53,6 +57,10 @@ class FormattedTextLexer(Lexer):
         # Maps specific text to its corresponding UI styles
         self.text_style_tag_map: Dict[str, str] = text_ui_style
 
+        # Fragments of the lines already lexed. The lines shown are mostly the same from one document to the next
+        # (new lines are appended at the bottom), so they are not lexed again each time the document changes
+        self._line_fragments_cache: Dict[str, StyleAndTextTuples] = {}
+
     def get_css_style(self, tag: str) -> str:
         style = self.html_tag_css_style_map.get(tag, "")
         return style
@@ -64,36 +72,44 @@ class FormattedTextLexer(Lexer):
             "Return the tokens for the given line."
             try:
                 current_line = lines[lineno]
-
-                # Apply styling to command prompt
-                if current_line.startswith(self.PROMPT_TEXT):
-                    return [(self.get_css_style("primary_label"), current_line)]
-
-                matched_indexes: List[Tuple[int, int, str]] = [(match.start(), match.end(), style)
-                                                               for special_word, style in self.text_style_tag_map.items()
-                                                               for match in list(re.finditer(special_word, current_line))
-                                                               ]
-                if len(matched_indexes) == 0:
-                    return [("", current_line)]
-
-                previous_idx = 0
-                line_fragments = []
-                for start_idx, end_idx, style in matched_indexes:
-                    line_fragments.extend([
-                        ("", current_line[previous_idx:start_idx]),
-                        (self.get_css_style("output_pane"), current_line[start_idx:start_idx + 2]),
-                        (self.get_css_style(style), current_line[start_idx + 2:end_idx])
-                    ])
-                    previous_idx = end_idx
-
-                line_fragments.append(("", current_line[previous_idx:]))
-
-                return line_fragments
             except IndexError:
                 return []
+            line_fragments = self._line_fragments_cache.get(current_line)
+            if line_fragments is None:
+                line_fragments = self._lex_line(current_line)
+                if len(self._line_fragments_cache) >= self.LINE_FRAGMENTS_CACHE_SIZE:
+                    self._line_fragments_cache.clear()
+                self._line_fragments_cache[current_line] = line_fragments
+            return line_fragments
 
         return get_line
 
+    def _lex_line(self, current_line: str) -> StyleAndTextTuples:
+        # Apply styling to command prompt
+        if current_line.startswith(self.PROMPT_TEXT):
+            return [(self.get_css_style("primary_label"), current_line)]
+
+        matched_indexes: List[Tuple[int, int, str]] = [(match.start(), match.end(), style)
+                                                       for special_word, style in self.text_style_tag_map.items()
+                                                       for match in list(re.finditer(special_word, current_line))
+                                                       ]
+        if len(matched_indexes) == 0:
+            return [("", current_line)]
+
+        previous_idx = 0
+        line_fragments = []
+        for start_idx, end_idx, style in matched_indexes:
+            line_fragments.extend([
+                ("", current_line[previous_idx:start_idx]),
+                (self.get_css_style("output_pane"), current_line[start_idx:start_idx + 2]),
+                (self.get_css_style(style), current_line[start_idx + 2:end_idx])
+            ])
+            previous_idx = end_idx
+
+        line_fragments.append(("", current_line[previous_idx:]))
+
+        return line_fragments
+
 
 class CustomTextArea:
     def __init__(self, text='', multiline=True, password=False,
@@ -104,7 +120,8 @@ class CustomTextArea:
                  dont_extend_height=False, dont_extend_width=False,
                  line_numbers=False, get_line_prefix=None, scrollbar=False,
                  style='', search_field=None, preview_search=True, prompt='',
-                 input_processors=None, max_line_count=1000, initial_text="", align=WindowAlign.LEFT):
+                 input_processors=None, max_line_count=1000, initial_text="", align=WindowAlign.LEFT,
+                 max_refresh_rate=0):
         assert isinstance(text, six.text_type)
         assert search_field is None or isinstance(search_field, SearchToolbar)
 
@@ -124,6 +141,13 @@ class CustomTextArea:
         self.read_only = read_only
         self.wrap_lines = wrap_lines
         self.max_line_count = max_line_count
+        # When positive, the text is refreshed at most max_refresh_rate times per second with all the lines logged in
+        # between, instead of being rebuilt for each logged text
+        self.max_refresh_rate = max_refresh_rate
+        self._ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        self._refresh_lock = threading.Lock()
+        self._refresh_requested: bool = False
+        self._last_refresh_time: float = 0
 
         self.buffer = CustomBuffer(
             document=Document(text, 0),
@@ -247,8 +271,32 @@ class CustomTextArea:
             self.log_lines.extend(new_lines)
             while len(self.log_lines) > self.max_line_count:
                 self.log_lines.popleft()
+            if self.max_refresh_rate > 0:
+                if not silent:
+                    self._request_refresh()
+                return
             new_text: str = "\n".join(self.log_lines)
         else:
             new_text: str = "\n".join(new_lines)
         if not silent:
             self.buffer.document = Document(text=new_text, cursor_position=len(new_text))
+
+    def _request_refresh(self):
+        # Log can be called from other threads, the refresh is always done in the event loop thread
+        with self._refresh_lock:
+            if self._refresh_requested:
+                return
+            self._refresh_requested = True
+        delay = max(0.0, self._last_refresh_time + 1 / self.max_refresh_rate - self._time())
+        self._ev_loop.call_soon_threadsafe(self._ev_loop.call_later, delay, self._refresh)
+
+    def _refresh(self):
+        with self._refresh_lock:
+            self._refresh_requested = False
+        self._last_refresh_time = self._time()
+        new_text: str = "\n".join(self.log_lines)
+        self.buffer.document = Document(text=new_text, cursor_position=len(new_text))
+
+    @staticmethod
+    def _time() -> float:
+        return time.monotonic()
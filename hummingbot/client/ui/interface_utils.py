@@ -1,15 +1,23 @@
 import asyncio
+import time
 from decimal import Decimal
-from typing import List, Optional, Set, Tuple
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import pandas as pd
 import psutil
 import tabulate
 
 from hummingbot.client.config.config_data_types import ClientConfigEnum
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import PerformanceMetrics, PerformanceMetricsAccumulator
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.data_type.common import PositionAction
+from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
+from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
 from hummingbot.model.trade_fill import TradeFill
 
+if TYPE_CHECKING:
+    from hummingbot.client.hummingbot_application import HummingbotApplication  # noqa: F401
+
 s_decimal_0 = Decimal("0")
 
 
@@ -55,10 +63,92 @@ async def start_process_monitor(process_monitor):
         await _sleep(1)
 
 
+class TradeMonitorFills:
+    """
+    Trades of the running strategy, accumulated per market and trading pair for the trade monitor.
+    The trades done since the application started are loaded from the database when the strategy starts, and the
+    following ones are added from the markets fill events, so the database is not queried again while it runs.
+    """
+
+    def __init__(self):
+        self._strategy_task: Optional[asyncio.Task] = None
+        self._markets: List[ConnectorBase] = []
+        self._accumulators: Dict[Tuple[str, str], PerformanceMetricsAccumulator] = {}
+        self._fill_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_fill_order)
+
+    @property
+    def num_trades(self) -> int:
+        return sum(accumulator.num_trades for accumulator in self._accumulators.values())
+
+    @property
+    def accumulators(self) -> Dict[Tuple[str, str], PerformanceMetricsAccumulator]:
+        """
+        The trades accumulators keyed by (market, trading pair)
+        """
+        return self._accumulators
+
+    def track(self, hb: "HummingbotApplication"):
+        """
+        Starts accumulating the trades of the running strategy, if it is not the one already tracked
+        """
+        if hb.strategy_task is self._strategy_task:
+            return
+        self.stop()
+        self._strategy_task = hb.strategy_task
+        # Loading the recorded trades and adding the listeners without awaiting in between, no fill can be missed
+        with hb.trade_fill_db.get_new_session() as session:
+            trades: List[TradeFill] = hb._get_trades_from_session(
+                int(hb.init_time * 1e3),
+                session=session,
+                config_file_path=hb.strategy_file_name)
+            for trade in trades:
+                self._add_trade(trade)
+        self._markets = list(hb.markets.values())
+        for market in self._markets:
+            market.add_listener(MarketEvent.OrderFilled, self._fill_order_forwarder)
+
+    def stop(self):
+        for market in self._markets:
+            market.remove_listener(MarketEvent.OrderFilled, self._fill_order_forwarder)
+        self._markets = []
+        self._accumulators = {}
+        self._strategy_task = None
+
+    def _add_trade(self, trade: TradeFill):
+        key = (trade.market, trade.symbol)
+        accumulator = self._accumulators.get(key)
+        if accumulator is None:
+            accumulator = PerformanceMetricsAccumulator(trade.symbol)
+            self._accumulators[key] = accumulator
+        accumulator.add_trade(trade)
+
+    def _did_fill_order(self, event_tag: int, market: ConnectorBase, evt: OrderFilledEvent):
+        # Same fields as the trade fill recorded by the MarketsRecorder
+        base_asset, quote_asset = evt.trading_pair.split("-")
+        self._add_trade(TradeFill(
+            market=market.display_name,
+            symbol=evt.trading_pair,
+            base_asset=base_asset,
+            quote_asset=quote_asset,
+            timestamp=int(evt.timestamp * 1e3) if evt.timestamp is not None else int(time.time() * 1e3),
+            order_id=evt.order_id,
+            trade_type=evt.trade_type.name,
+            order_type=evt.order_type.name,
+            price=Decimal(evt.price) if evt.price == evt.price else s_decimal_0,
+            amount=Decimal(evt.amount),
+            leverage=evt.leverage if evt.leverage else 1,
+            trade_fee=evt.trade_fee.to_json(),
+            exchange_trade_id=evt.exchange_trade_id,
+            position=evt.position if evt.position else PositionAction.NIL.value,
+        ))
+
+
 async def start_trade_monitor(trade_monitor):
     from hummingbot.client.hummingbot_application import HummingbotApplication
     hb = HummingbotApplication.main_application()
-    trade_monitor.log("Trades: 0, Total P&L: 0.00, Return %: 0.00%")
+    last_text = "Trades: 0, Total P&L: 0.00, Return %: 0.00%"
+    trade_monitor.log(last_text)
+    fills = TradeMonitorFills()
     return_pcts = []
     pnls = []
 
@@ -66,31 +156,30 @@ async def start_trade_monitor(trade_monitor):
         try:
             if hb.strategy_task is not None and not hb.strategy_task.done():
                 if all(market.ready for market in hb.markets.values()):
-                    with hb.trade_fill_db.get_new_session() as session:
-                        trades: List[TradeFill] = hb._get_trades_from_session(
-                            int(hb.init_time * 1e3),
-                            session=session,
-                            config_file_path=hb.strategy_file_name)
-                        if len(trades) > 0:
-                            market_info: Set[Tuple[str, str]] = set((t.market, t.symbol) for t in trades)
-                            for market, symbol in market_info:
-                                cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
-                                cur_balances = await hb.get_current_balances(market)
-                                perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
-                                return_pcts.append(perf.return_pct)
-                                pnls.append(perf.total_pnl)
-                            avg_return = sum(return_pcts) / len(return_pcts) if len(return_pcts) > 0 else s_decimal_0
-                            quote_assets = set(t.symbol.split("-")[1] for t in trades)
-                            if len(quote_assets) == 1:
-                                total_pnls = f"{PerformanceMetrics.smart_round(sum(pnls))} {list(quote_assets)[0]}"
-                            else:
-                                total_pnls = "N/A"
-                            trade_monitor.log(f"Trades: {len(trades)}, Total P&L: {total_pnls}, "
-                                              f"Return %: {avg_return:.2%}")
-                            return_pcts.clear()
-                            pnls.clear()
+                    fills.track(hb)
+                    if fills.num_trades > 0:
+                        for (market, symbol), accumulator in fills.accumulators.items():
+                            cur_balances = await hb.get_current_balances(market)
+                            total_pnl, return_pct = await accumulator.pnl_and_return(cur_balances)
+                            return_pcts.append(return_pct)
+                            pnls.append(total_pnl)
+                        avg_return = sum(return_pcts) / len(return_pcts) if len(return_pcts) > 0 else s_decimal_0
+                        quote_assets = set(symbol.split("-")[1] for _, symbol in fills.accumulators.keys())
+                        if len(quote_assets) == 1:
+                            total_pnls = f"{PerformanceMetrics.smart_round(sum(pnls))} {list(quote_assets)[0]}"
+                        else:
+                            total_pnls = "N/A"
+                        text = f"Trades: {fills.num_trades}, Total P&L: {total_pnls}, Return %: {avg_return:.2%}"
+                        if text != last_text:
+                            trade_monitor.log(text)
+                            last_text = text
+                        return_pcts.clear()
+                        pnls.clear()
+            else:
+                fills.stop()
             await _sleep(2)  # sleeping for longer to manage resources
         except asyncio.CancelledError:
+            fills.stop()
             raise
         except Exception:
             hb.logger().exception("start_trade_monitor failed.")
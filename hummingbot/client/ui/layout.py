@@ -19,7 +19,11 @@ from prompt_toolkit.layout.menus import CompletionsMenu
 from prompt_toolkit.widgets import Box, Button, SearchToolbar
 
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
-from hummingbot.client.settings import MAXIMUM_LOG_PANE_LINE_COUNT, MAXIMUM_OUTPUT_PANE_LINE_COUNT
+from hummingbot.client.settings import (
+    LOG_PANE_MAX_REFRESH_RATE,
+    MAXIMUM_LOG_PANE_LINE_COUNT,
+    MAXIMUM_OUTPUT_PANE_LINE_COUNT,
+)
 from hummingbot.client.tab.data_types import CommandTab
 from hummingbot.client.ui.custom_widgets import CustomTextArea as TextArea, FormattedTextLexer
 
@@ -153,6 +157,7 @@ def create_log_field(search_field: SearchToolbar):
         read_only=False,
         scrollbar=True,
         max_line_count=MAXIMUM_LOG_PANE_LINE_COUNT,
+        max_refresh_rate=LOG_PANE_MAX_REFRESH_RATE,
         initial_text="Running Logs \n",
         search_field=search_field,
         preview_search=False,
@@ -1,8 +1,9 @@
 import asyncio
 import logging
-from collections import defaultdict
+from collections import ChainMap, defaultdict
 from decimal import Decimal
-from typing import Callable, Dict, Optional
+from types import MappingProxyType
+from typing import Callable, Dict, Mapping, Optional
 
 from cachetools import TTLCache
 
@@ -55,6 +56,21 @@ class ClientOrderTracker:
         self._cached_orders: TTLCache = TTLCache(maxsize=self.MAX_CACHE_SIZE, ttl=self.CACHED_ORDER_TTL)
         self._lost_orders: Dict[str, InFlightOrder] = {}
 
+        # Read-only live views over the internal collections. They are built once and never copy the orders.
+        # In the merged views the later collections take precedence, matching the previous dict merge order.
+        self._cached_orders_view: Mapping[str, InFlightOrder] = MappingProxyType(self._cached_orders)
+        self._lost_orders_view: Mapping[str, InFlightOrder] = MappingProxyType(self._lost_orders)
+        self._all_orders_view: Mapping[str, InFlightOrder] = MappingProxyType(
+            ChainMap(self._cached_orders, self._in_flight_orders))
+        self._all_fillable_orders_view: Mapping[str, InFlightOrder] = MappingProxyType(
+            ChainMap(self._lost_orders, self._cached_orders, self._in_flight_orders))
+        self._all_updatable_orders_view: Mapping[str, InFlightOrder] = MappingProxyType(
+            ChainMap(self._lost_orders, self._in_flight_orders))
+
+        # Secondary indexes
+        self._client_order_id_by_exchange_order_id: Dict[str, str] = {}
+        self._active_orders_by_trading_pair: Dict[str, Dict[str, InFlightOrder]] = defaultdict(dict)
+
         self._order_tracking_task: Optional[asyncio.Task] = None
         self._last_poll_timestamp: int = -1
         self._order_not_found_records: Dict[str, int] = defaultdict(lambda: 0)
@@ -67,32 +83,34 @@ class ClientOrderTracker:
         return self._in_flight_orders
 
     @property
-    def cached_orders(self) -> Dict[str, InFlightOrder]:
+    def cached_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns orders that are no longer actively tracked.
+        The result is a read-only live view, copy it before iterating if the tracker can change meanwhile.
         """
-        return {client_order_id: order for client_order_id, order in self._cached_orders.items()}
+        return self._cached_orders_view
 
     @property
-    def all_orders(self) -> Dict[str, InFlightOrder]:
+    def all_orders(self) -> Mapping[str, InFlightOrder]:
         """
-        Returns both active and cached order.
+        Returns both active and cached order (read-only live view).
         """
-        return {**self.active_orders, **self.cached_orders}
+        return self._all_orders_view
 
     @property
-    def all_fillable_orders(self) -> Dict[str, InFlightOrder]:
+    def all_fillable_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns all orders that could still be impacted by trades: active orders, cached orders and lost orders
+        (read-only live view).
         """
-        return {**self.active_orders, **self.cached_orders, **self.lost_orders}
+        return self._all_fillable_orders_view
 
     @property
-    def all_updatable_orders(self) -> Dict[str, InFlightOrder]:
+    def all_updatable_orders(self) -> Mapping[str, InFlightOrder]:
         """
-        Returns all orders that could receive status updates
+        Returns all orders that could receive status updates (read-only live view)
         """
-        return {**self.active_orders, **self.lost_orders}
+        return self._all_updatable_orders_view
 
     @property
     def current_timestamp(self) -> int:
@@ -102,19 +120,32 @@ class ClientOrderTracker:
         return self._connector.current_timestamp
 
     @property
-    def lost_orders(self) -> Dict[str, InFlightOrder]:
+    def lost_orders(self) -> Mapping[str, InFlightOrder]:
+        """
+        Returns all orders marked as failed after not being found more times than the configured limit
+        (read-only live view).
         """
-        Returns a dictionary of all orders marked as failed after not being found more times than the configured limit
+        return self._lost_orders_view
+
+    def active_orders_for_trading_pair(self, trading_pair: str) -> Mapping[str, InFlightOrder]:
+        """
+        Returns the actively tracked orders of a single trading pair (read-only live view).
+
+        :param trading_pair: the trading pair of the orders
         """
-        return {client_order_id: order for client_order_id, order in self._lost_orders.items()}
+        return MappingProxyType(self._active_orders_by_trading_pair.get(trading_pair, {}))
 
     def start_tracking_order(self, order: InFlightOrder):
         self._in_flight_orders[order.client_order_id] = order
+        self._active_orders_by_trading_pair[order.trading_pair][order.client_order_id] = order
+        self._index_exchange_order_id(order)
 
     def stop_tracking_order(self, client_order_id: str):
         if client_order_id in self._in_flight_orders:
-            self._cached_orders[client_order_id] = self._in_flight_orders[client_order_id]
+            order = self._in_flight_orders[client_order_id]
+            self._cached_orders[client_order_id] = order
             del self._in_flight_orders[client_order_id]
+            self._remove_from_trading_pair_index(order)
 
     def restore_tracking_states(self, tracking_states: Dict[str, any]):
         """
@@ -126,6 +157,22 @@ class ClientOrderTracker:
             if order.is_open:
                 self.start_tracking_order(order)
 
+    def update_exchange_order_id(self, client_order_id: str, exchange_order_id: str) -> Optional[InFlightOrder]:
+        """
+        Assigns the exchange order id to a tracked order. Connectors must use this method instead of updating the
+        order directly, to keep the exchange order id index used by `fetch_order` complete.
+
+        :param client_order_id: the client order id of the order
+        :param exchange_order_id: the order id assigned by the exchange
+
+        :return: the updated order, or None if the order is not tracked
+        """
+        order = self._all_orders_view.get(client_order_id)
+        if order is not None:
+            order.update_exchange_order_id(exchange_order_id)
+            self._index_exchange_order_id(order)
+        return order
+
     def fetch_tracked_order(self, client_order_id: str) -> Optional[InFlightOrder]:
         return self._in_flight_orders.get(client_order_id, None)
 
@@ -135,14 +182,10 @@ class ClientOrderTracker:
     def fetch_order(
         self, client_order_id: Optional[str] = None, exchange_order_id: Optional[str] = None
     ) -> Optional[InFlightOrder]:
-        found_order = None
+        found_order = self._all_orders_view.get(client_order_id) if client_order_id is not None else None
 
-        if client_order_id in self.all_orders:
-            found_order = self.all_orders[client_order_id]
-        elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self.all_orders.values() if order.exchange_order_id == exchange_order_id),
-                None)
+        if found_order is None and exchange_order_id is not None:
+            found_order = self._fetch_order_by_exchange_order_id(exchange_order_id)
 
         return found_order
 
@@ -152,7 +195,7 @@ class ClientOrderTracker:
     def process_trade_update(self, trade_update: TradeUpdate):
         client_order_id: str = trade_update.client_order_id
 
-        tracked_order: Optional[InFlightOrder] = self.all_fillable_orders.get(client_order_id)
+        tracked_order: Optional[InFlightOrder] = self._all_fillable_orders_view.get(client_order_id)
 
         if tracked_order:
             previous_executed_amount_base: Decimal = tracked_order.executed_amount_base
@@ -218,6 +261,7 @@ class ClientOrderTracker:
             previous_state: OrderState = tracked_order.current_state
 
             updated: bool = tracked_order.update_with_order_update(order_update)
+            self._index_exchange_order_id(tracked_order)
             if updated:
                 self._trigger_order_creation(tracked_order, previous_state, order_update.new_state)
                 self._trigger_order_completion(tracked_order, order_update)
@@ -229,6 +273,41 @@ class ClientOrderTracker:
         else:
             self.logger().debug(f"Order is not/no longer being tracked ({order_update})")
 
+    def _index_exchange_order_id(self, order: InFlightOrder):
+        if order.exchange_order_id is not None:
+            self._client_order_id_by_exchange_order_id[order.exchange_order_id] = order.client_order_id
+            if len(self._client_order_id_by_exchange_order_id) > self.MAX_CACHE_SIZE + 2 * len(self._in_flight_orders):
+                self._prune_exchange_order_id_index()
+
+    def _prune_exchange_order_id_index(self):
+        """
+        Drops the index entries of orders that are no longer tracked (i.e. expired from the cache). The index size
+        is kept proportional to the number of tracked orders, so the amortized cost per indexed order is constant.
+        """
+        all_orders = self._all_orders_view
+        self._client_order_id_by_exchange_order_id = {
+            exchange_order_id: client_order_id
+            for exchange_order_id, client_order_id in self._client_order_id_by_exchange_order_id.items()
+            if client_order_id in all_orders
+        }
+
+    def _fetch_order_by_exchange_order_id(self, exchange_order_id: str) -> Optional[InFlightOrder]:
+        client_order_id = self._client_order_id_by_exchange_order_id.get(exchange_order_id)
+        found_order = self._all_orders_view.get(client_order_id) if client_order_id is not None else None
+
+        if found_order is not None and found_order.exchange_order_id != exchange_order_id:
+            # Stale entry, the order has been assigned another exchange order id since it was indexed
+            found_order = None
+
+        return found_order
+
+    def _remove_from_trading_pair_index(self, order: InFlightOrder):
+        orders_for_pair = self._active_orders_by_trading_pair.get(order.trading_pair)
+        if orders_for_pair is not None:
+            orders_for_pair.pop(order.client_order_id, None)
+            if not orders_for_pair:
+                del self._active_orders_by_trading_pair[order.trading_pair]
+
     def _trigger_created_event(self, order: InFlightOrder):
         event_tag = MarketEvent.BuyOrderCreated if order.trade_type is TradeType.BUY else MarketEvent.SellOrderCreated
         event_class: Callable = BuyOrderCreatedEvent if order.trade_type is TradeType.BUY else SellOrderCreatedEvent
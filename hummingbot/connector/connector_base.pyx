@@ -192,6 +192,13 @@ cdef class ConnectorBase(NetworkIterator):
         """
         raise NotImplementedError
 
+    def is_trading_pair_ready(self, trading_pair: str) -> bool:
+        """
+        Indicates whether the connector is ready to be used to operate on the trading pair. Connectors initializing
+        their trading pairs independently report each of them ready before the connector is.
+        """
+        return self.ready
+
     @property
     def in_flight_orders(self) -> Dict[str, InFlightOrderBase]:
         raise NotImplementedError
@@ -3,6 +3,7 @@ from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from hummingbot.connector.exchange.ascend_ex import ascend_ex_constants as CONSTANTS, ascend_ex_web_utils as web_utils
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -16,6 +17,8 @@ if TYPE_CHECKING:
 
 
 class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    SNAPSHOT_THROTTLER_LIMIT_ID = CONSTANTS.DEPTH_PATH_URL
+
     _logger: Optional[HummingbotLogger] = None
 
     def __init__(
@@ -33,6 +36,9 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
     async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
         return await self._connector.get_last_traded_prices(trading_pairs=trading_pairs)
 
+    def _snapshot_requests_throttler(self) -> Optional[AsyncThrottlerBase]:
+        return self._api_factory.throttler
+
     async def _request_order_book_snapshot(self, trading_pair: str) -> Dict[str, Any]:
         """
         Retrieves a copy of the full order book from the exchange, for a particular trading pair.
@@ -123,6 +129,7 @@ class AscendExAPIOrderBookDataSource(OrderBookTrackerDataSource):
             "update_id": timestamp,
             "bids": diff_data["bids"],
             "asks": diff_data["asks"],
+            "exchange_timestamp": timestamp,
         }
         diff_message: OrderBookMessage = OrderBookMessage(OrderBookMessageType.DIFF, message_content, timestamp)
 
@@ -14,6 +14,7 @@ from hummingbot.connector.exchange.binance.binance_api_order_book_data_source im
 from hummingbot.connector.exchange.binance.binance_api_user_stream_data_source import BinanceAPIUserStreamDataSource
 from hummingbot.connector.exchange.binance.binance_auth import BinanceAuth
 from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.ticker_snapshot_service import Ticker, decimal_or_none
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import TradeFillOrderDetails, combine_to_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
@@ -520,6 +521,26 @@ class BinanceExchange(ExchangePyBase):
                                                                         quote=symbol_data["quoteAsset"])
         self._set_trading_pair_symbol_map(mapping)
 
+    async def _fetch_all_tickers(self) -> Dict[str, Ticker]:
+        # The book tickers and the prices of all the symbols weigh 2 each, the 24hr tickers of all the symbols 40
+        symbol_map = await self.trading_pair_symbol_map()
+        book_tickers, prices = await safe_gather(
+            self._api_get(path_url=CONSTANTS.TICKER_BOOK_PATH_URL),
+            self._api_get(path_url=CONSTANTS.TICKER_PRICE_PATH_URL))
+        last_prices = {price["symbol"]: price.get("price") for price in prices}
+        tickers = {}
+        for book_ticker in book_tickers:
+            trading_pair = symbol_map.get(book_ticker["symbol"])
+            if trading_pair is None:
+                continue  # skip pairs that we don't track
+            tickers[trading_pair] = Ticker(
+                trading_pair=trading_pair,
+                last_price=decimal_or_none(last_prices.get(book_ticker["symbol"])),
+                best_bid=decimal_or_none(book_ticker.get("bidPrice")),
+                best_ask=decimal_or_none(book_ticker.get("askPrice")),
+            )
+        return tickers
+
     async def _get_last_traded_price(self, trading_pair: str) -> float:
         params = {
             "symbol": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
@@ -50,7 +50,8 @@ class BinanceOrderBook(OrderBook):
             "first_update_id": msg["U"],
             "update_id": msg["u"],
             "bids": msg["b"],
-            "asks": msg["a"]
+            "asks": msg["a"],
+            "exchange_timestamp": msg["E"] * 1e-3 if "E" in msg else None,
         }, timestamp=timestamp)
 
     @classmethod
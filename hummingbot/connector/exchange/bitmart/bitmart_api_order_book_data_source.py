@@ -7,6 +7,7 @@ from hummingbot.connector.exchange.bitmart import (
     bitmart_utils as utils,
     bitmart_web_utils as web_utils,
 )
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -21,6 +22,8 @@ if TYPE_CHECKING:
 
 class BitmartAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
+    SNAPSHOT_THROTTLER_LIMIT_ID = CONSTANTS.GET_ORDER_BOOK_PATH_URL
+
     _logger: Optional[HummingbotLogger] = None
 
     def __init__(self,
@@ -83,6 +86,9 @@ class BitmartAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
         return snapshot_msg
 
+    def _snapshot_requests_throttler(self) -> Optional[AsyncThrottlerBase]:
+        return self._api_factory.throttler
+
     async def _request_order_book_snapshot(self, trading_pair: str) -> Dict[str, Any]:
         """
         Retrieves a copy of the full order book from the exchange, for a particular trading pair.
@@ -69,7 +69,8 @@ class BybitOrderBook(OrderBook):
             "trading_pair": msg["trading_pair"],
             "update_id": ts,
             "bids": msg["b"],
-            "asks": msg["a"]
+            "asks": msg["a"],
+            "exchange_timestamp": ts * 1e-3,
         }, timestamp=timestamp)
 
     @classmethod
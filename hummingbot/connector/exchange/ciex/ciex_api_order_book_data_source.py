@@ -3,6 +3,7 @@ from decimal import Decimal
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from hummingbot.connector.exchange.ciex import ciex_constants as CONSTANTS, ciex_web_utils as web_utils
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -17,6 +18,8 @@ if TYPE_CHECKING:
 
 class CiexAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
+    SNAPSHOT_THROTTLER_LIMIT_ID = CONSTANTS.CIEX_DEPTH_PATH
+
     _logger: Optional[HummingbotLogger] = None
 
     def __init__(self,
@@ -51,6 +54,9 @@ class CiexAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
         return snapshot_msg
 
+    def _snapshot_requests_throttler(self) -> Optional[AsyncThrottlerBase]:
+        return self._api_factory.throttler
+
     async def _request_order_book_snapshot(self, trading_pair: str) -> Dict[str, Any]:
         """
         Retrieves a copy of the full order book from the exchange, for a particular trading pair.
@@ -109,6 +115,7 @@ class CiexAPIOrderBookDataSource(OrderBookTrackerDataSource):
             "update_id": update_id,
             "bids": [(price, amount) for price, amount in diff_data.get("buys", [])],
             "asks": [(price, amount) for price, amount in diff_data.get("asks", [])],
+            "exchange_timestamp": timestamp,
         }
         diff_message: OrderBookMessage = OrderBookMessage(
             message_type,
@@ -4,6 +4,7 @@ from collections import defaultdict
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from hummingbot.connector.exchange.gate_io import gate_io_constants as CONSTANTS, gate_io_web_utils as web_utils
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -18,6 +19,8 @@ if TYPE_CHECKING:
 
 class GateIoAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
+    SNAPSHOT_THROTTLER_LIMIT_ID = CONSTANTS.ORDER_BOOK_PATH_URL
+
     _logger: Optional[HummingbotLogger] = None
 
     def __init__(self,
@@ -51,6 +54,9 @@ class GateIoAPIOrderBookDataSource(OrderBookTrackerDataSource):
             timestamp=snapshot_timestamp)
         return snapshot_msg
 
+    def _snapshot_requests_throttler(self) -> Optional[AsyncThrottlerBase]:
+        return self._api_factory.throttler
+
     async def _request_order_book_snapshot(self, trading_pair: str) -> Dict[str, Any]:
         """
         Retrieves a copy of the full order book from the exchange, for a particular trading pair.
@@ -107,6 +113,7 @@ class GateIoAPIOrderBookDataSource(OrderBookTrackerDataSource):
             "first_update_id": diff_data["U"],
             "bids": diff_data["b"],
             "asks": diff_data["a"],
+            "exchange_timestamp": timestamp,
         }
         diff_message: OrderBookMessage = OrderBookMessage(
             OrderBookMessageType.DIFF,
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import hummingbot.connector.exchange.huobi.huobi_constants as CONSTANTS
 from hummingbot.connector.exchange.huobi.huobi_web_utils import public_rest_url
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -18,6 +19,8 @@ if TYPE_CHECKING:
 
 class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
+    SNAPSHOT_THROTTLER_LIMIT_ID = CONSTANTS.DEPTH_URL
+
     _logger: Optional[HummingbotLogger] = None
 
     def __init__(self,
@@ -93,6 +96,9 @@ class HuobiAPIOrderBookDataSource(OrderBookTrackerDataSource):
         }
         return OrderBookMessage(OrderBookMessageType.TRADE, content, timestamp=msg_ts)
 
+    def _snapshot_requests_throttler(self) -> Optional[AsyncThrottlerBase]:
+        return self._api_factory.throttler
+
     async def _request_new_orderbook_snapshot(self, trading_pair: str) -> Dict[str, Any]:
         rest_assistant = await self._api_factory.get_rest_assistant()
         url = public_rest_url(CONSTANTS.DEPTH_URL)
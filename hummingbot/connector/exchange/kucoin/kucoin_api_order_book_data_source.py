@@ -2,6 +2,7 @@ import asyncio
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from hummingbot.connector.exchange.kucoin import kucoin_constants as CONSTANTS, kucoin_web_utils as web_utils
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -16,6 +17,8 @@ if TYPE_CHECKING:
 
 class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
+    SNAPSHOT_THROTTLER_LIMIT_ID = CONSTANTS.SNAPSHOT_NO_AUTH_PATH_URL
+
     _logger: Optional[HummingbotLogger] = None
 
     def __init__(
@@ -55,6 +58,9 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
         return snapshot_msg
 
+    def _snapshot_requests_throttler(self) -> Optional[AsyncThrottlerBase]:
+        return self._api_factory.throttler
+
     async def _request_order_book_snapshot(self, trading_pair: str) -> Dict[str, Any]:
         """
         Retrieves a copy of the full order book from the exchange, for a particular trading pair.
@@ -110,6 +116,7 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
             "first_update_id": diff_data["sequenceStart"],
             "bids": diff_data["changes"]["bids"],
             "asks": diff_data["changes"]["asks"],
+            "exchange_timestamp": diff_data["time"] * 1e-3 if "time" in diff_data else None,
         }
         diff_message: OrderBookMessage = OrderBookMessage(
             OrderBookMessageType.DIFF,
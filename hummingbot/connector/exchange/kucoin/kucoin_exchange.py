@@ -14,6 +14,7 @@ from hummingbot.connector.exchange.kucoin.kucoin_api_order_book_data_source impo
 from hummingbot.connector.exchange.kucoin.kucoin_api_user_stream_data_source import KucoinAPIUserStreamDataSource
 from hummingbot.connector.exchange.kucoin.kucoin_auth import KucoinAuth
 from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.ticker_snapshot_service import Ticker, decimal_or_none
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
@@ -484,6 +485,22 @@ class KucoinExchange(ExchangePyBase):
 
         return order_update
 
+    async def _fetch_all_tickers(self) -> Dict[str, Ticker]:
+        symbol_map = await self.trading_pair_symbol_map()
+        pairs_tickers = await self._api_get(path_url=CONSTANTS.ALL_TICKERS_PATH_URL)
+        tickers = {}
+        for pair_ticker in pairs_tickers["data"]["ticker"]:
+            trading_pair = symbol_map.get(pair_ticker["symbol"])
+            if trading_pair is None:
+                continue  # Ignore results for which their symbols is not tracked by the connector
+            tickers[trading_pair] = Ticker(
+                trading_pair=trading_pair,
+                last_price=decimal_or_none(pair_ticker.get("last")),
+                best_bid=decimal_or_none(pair_ticker.get("buy")),
+                best_ask=decimal_or_none(pair_ticker.get("sell")),
+            )
+        return tickers
+
     async def _get_last_traded_price(self, trading_pair: str) -> float:
         params = {
             "symbol": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
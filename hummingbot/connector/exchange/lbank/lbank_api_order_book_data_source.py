@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional
 import dateutil.parser as date_parser
 
 from hummingbot.connector.exchange.lbank import lbank_constants as CONSTANTS, lbank_web_utils as web_utils
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -19,6 +20,8 @@ if TYPE_CHECKING:
 
 class LbankAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
+    SNAPSHOT_THROTTLER_LIMIT_ID = CONSTANTS.LBANK_ORDER_BOOK_PATH_URL
+
     _logger: Optional[HummingbotLogger] = None
 
     def __init__(self, trading_pairs: List[str], connector: "LbankExchange", api_factory: WebAssistantsFactory):
@@ -55,6 +58,9 @@ class LbankAPIOrderBookDataSource(OrderBookTrackerDataSource):
         )
         return snapshot_msg
 
+    def _snapshot_requests_throttler(self) -> Optional[AsyncThrottlerBase]:
+        return self._api_factory.throttler
+
     async def _request_order_book_snapshot(self, trading_pair: str) -> Dict[str, Any]:
         """
         Retrieves a copy of the order book from the exchange, for the specified trading pair.
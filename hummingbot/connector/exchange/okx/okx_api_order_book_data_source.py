@@ -2,6 +2,7 @@ import asyncio
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from hummingbot.connector.exchange.okx import okx_constants as CONSTANTS, okx_web_utils as web_utils
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -16,6 +17,8 @@ if TYPE_CHECKING:
 
 class OkxAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
+    SNAPSHOT_THROTTLER_LIMIT_ID = CONSTANTS.OKX_ORDER_BOOK_PATH
+
     _logger: Optional[HummingbotLogger] = None
 
     def __init__(self,
@@ -50,6 +53,9 @@ class OkxAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
         return snapshot_msg
 
+    def _snapshot_requests_throttler(self) -> Optional[AsyncThrottlerBase]:
+        return self._api_factory.throttler
+
     async def _request_order_book_snapshot(self, trading_pair: str) -> Dict[str, Any]:
         """
         Retrieves a copy of the full order book from the exchange, for a particular trading pair.
@@ -126,6 +132,7 @@ class OkxAPIOrderBookDataSource(OrderBookTrackerDataSource):
                 "update_id": update_id,
                 "bids": [(bid[0], bid[1]) for bid in diff_data["bids"]],
                 "asks": [(ask[0], ask[1]) for ask in diff_data["asks"]],
+                "exchange_timestamp": timestamp,
             }
             diff_message: OrderBookMessage = OrderBookMessage(
                 OrderBookMessageType.DIFF,
@@ -27,6 +27,20 @@ cdef class QuantizationParams:
         int order_size_decimals
 
 
+cdef class TradingPairFillSchedule:
+    cdef:
+        readonly str trading_pair
+        readonly str base_asset
+        readonly str quote_asset
+        readonly str base_balance_key
+        readonly str quote_balance_key
+        tuple _fees
+        tuple _returns_fee_percents
+
+    cdef object c_get_fee(self, bint is_buy, bint is_maker)
+    cdef object c_get_returns_fee_percent(self, bint is_buy, bint is_maker)
+
+
 cdef class PaperTradeExchange(ExchangeBase):
     cdef:
         LimitOrders _bid_limit_orders
@@ -35,6 +49,7 @@ cdef class PaperTradeExchange(ExchangeBase):
         dict _trading_pairs
         object _queued_orders
         dict _quantization_params
+        dict _fill_schedules
         object _order_book_trade_listener
         object _market_order_filled_listener
         LimitOrderExpirationSet _limit_order_expiration_set
@@ -43,6 +58,14 @@ cdef class PaperTradeExchange(ExchangeBase):
 
     cdef c_execute_buy(self, str order_id, str trading_pair, object amount)
     cdef c_execute_sell(self, str order_id, str trading_pair, object amount)
+    cdef c_execute_market_order(self, str order_id, str trading_pair, bint is_buy, object amount)
+    cdef TradingPairFillSchedule c_get_fill_schedule(self, str trading_pair)
+    cdef tuple c_settle_fill(self,
+                             TradingPairFillSchedule fill_schedule,
+                             bint is_buy,
+                             bint is_maker,
+                             object price,
+                             object amount)
     cdef c_process_market_orders(self)
     cdef c_set_balance(self, str currency, object amount)
     cdef object c_get_fee(self,
@@ -61,15 +84,8 @@ cdef class PaperTradeExchange(ExchangeBase):
                                bint is_buy,
                                LimitOrders *limit_orders_map_ptr,
                                LimitOrdersIterator *map_it_ptr,
-                               SingleTradingPairLimitOrdersIterator orders_it)
-    cdef c_process_limit_bid_order(self,
-                                   LimitOrders *limit_orders_map_ptr,
-                                   LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it)
-    cdef c_process_limit_ask_order(self,
-                                   LimitOrders *limit_orders_map_ptr,
-                                   LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it)
+                               SingleTradingPairLimitOrdersIterator orders_it,
+                               object fill_amount=*)
     cdef c_process_crossed_limit_orders_for_trading_pair(self,
                                                          bint is_buy,
                                                          LimitOrders *limit_orders_map_ptr,
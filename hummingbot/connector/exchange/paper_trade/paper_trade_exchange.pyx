@@ -19,14 +19,16 @@ from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.core.clock cimport Clock
 from hummingbot.core.clock import Clock
 from hummingbot.core.data_type.cancellation_result import CancellationResult
+from hummingbot.core.data_type.candles import Candles
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
 from hummingbot.core.data_type.composite_order_book cimport CompositeOrderBook
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.limit_order cimport c_create_limit_order_from_cpp_limit_order
 from hummingbot.core.data_type.order_book cimport OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
-from hummingbot.core.data_type.order_candidate import OrderCandidate
+from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee
 from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
@@ -70,6 +72,46 @@ cdef class QuantizationParams:
                 f"{self.order_size_precision}, {self.order_size_decimals})")
 
 
+cdef class TradingPairFillSchedule:
+    """
+    Fees and balance keys of a trading pair, resolved once and reused by every simulated fill on the pair.
+    """
+    def __init__(self, str trading_pair, str base_asset, str quote_asset, tuple fees):
+        """
+        :param fees: the trade fees ordered as sell taker, sell maker, buy taker and buy maker
+        """
+        self.trading_pair = trading_pair
+        self.base_asset = base_asset
+        self.quote_asset = quote_asset
+        self.base_balance_key = base_asset.upper()
+        self.quote_balance_key = quote_asset.upper()
+        self._fees = fees
+        self._returns_fee_percents = tuple(
+            fee.percent if isinstance(fee, DeductedFromReturnsTradeFee) else s_decimal_0
+            for fee in fees
+        )
+
+    cdef object c_get_fee(self, bint is_buy, bint is_maker):
+        return self._fees[is_buy * 2 + is_maker]
+
+    cdef object c_get_returns_fee_percent(self, bint is_buy, bint is_maker):
+        return self._returns_fee_percents[is_buy * 2 + is_maker]
+
+    def __repr__(self) -> str:
+        return f"TradingPairFillSchedule('{self.trading_pair}', '{self.base_asset}', '{self.quote_asset}', {self._fees})"
+
+
+cdef object c_get_filled_quantity(const CPPLimitOrder *cpp_limit_order_ptr):
+    cdef:
+        PyObject *filled_quantity_ptr = cpp_limit_order_ptr.getFilledQuantity()
+    if filled_quantity_ptr == NULL:
+        return s_decimal_0
+    filled_quantity = <object> filled_quantity_ptr
+    if filled_quantity is None or filled_quantity.is_nan():
+        return s_decimal_0
+    return filled_quantity
+
+
 cdef class QueuedOrder:
     cdef:
         double create_timestamp
@@ -169,6 +211,7 @@ cdef class PaperTradeExchange(ExchangeBase):
         self._trading_pairs = {}
         self._queued_orders = deque()
         self._quantization_params = {}
+        self._fill_schedules = {}
         self._order_book_trade_listener = OrderBookTradeListener(self)
         self._target_market = target_market
         self._market_order_filled_listener = OrderBookMarketOrderFillListener(self)
@@ -278,10 +321,13 @@ cdef class PaperTradeExchange(ExchangeBase):
     def on_hold_balances(self) -> Dict[str, Decimal]:
         _on_hold_balances = defaultdict(Decimal)
         for limit_order in self.limit_orders:
+            remaining_quantity = limit_order.quantity
+            if limit_order.filled_quantity is not None and not limit_order.filled_quantity.is_nan():
+                remaining_quantity -= limit_order.filled_quantity
             if limit_order.is_buy:
-                _on_hold_balances[limit_order.quote_currency] += limit_order.quantity * limit_order.price
+                _on_hold_balances[limit_order.quote_currency] += remaining_quantity * limit_order.price
             else:
-                _on_hold_balances[limit_order.base_currency] += limit_order.quantity
+                _on_hold_balances[limit_order.base_currency] += remaining_quantity
         return _on_hold_balances
 
     @property
@@ -437,169 +483,148 @@ cdef class PaperTradeExchange(ExchangeBase):
                                   self._current_timestamp)))
         return order_id
 
-    cdef c_execute_buy(self, str order_id, str trading_pair_str, object amount):
+    cdef TradingPairFillSchedule c_get_fill_schedule(self, str trading_pair_str):
         cdef:
-            str quote_asset = self._trading_pairs[trading_pair_str].quote_asset
-            str base_asset = self._trading_pairs[trading_pair_str].base_asset
-            object quote_balance = self.c_get_balance(quote_asset)
-            object base_balance = self.c_get_balance(base_asset)
+            TradingPairFillSchedule fill_schedule = self._fill_schedules.get(trading_pair_str)
+            object trading_pair
+            list fees = []
+        if fill_schedule is None:
+            trading_pair = self._trading_pairs[trading_pair_str]
+            # Ordered as expected by TradingPairFillSchedule: sell taker, sell maker, buy taker, buy maker
+            for order_side in (TradeType.SELL, TradeType.BUY):
+                for is_maker in (False, True):
+                    fees.append(build_trade_fee(
+                        exchange=self.name,
+                        is_maker=is_maker,
+                        base_currency=trading_pair.base_asset,
+                        quote_currency=trading_pair.quote_asset,
+                        order_type=OrderType.LIMIT if is_maker else OrderType.MARKET,
+                        order_side=order_side,
+                        amount=s_decimal_0,
+                        price=s_decimal_0,
+                    ))
+            fill_schedule = TradingPairFillSchedule(trading_pair_str,
+                                                    trading_pair.base_asset,
+                                                    trading_pair.quote_asset,
+                                                    tuple(fees))
+            self._fill_schedules[trading_pair_str] = fill_schedule
+        return fill_schedule
+
+    cdef tuple c_settle_fill(self,
+                             TradingPairFillSchedule fill_schedule,
+                             bint is_buy,
+                             bint is_maker,
+                             object price,
+                             object amount):
+        """
+        Transfers the balances for a fill. The collateral spent and the returns acquired are the same the
+        `BudgetChecker` computes for the order: fees are charged only when they are deducted from the returns.
 
-        order_book = self.order_books[trading_pair_str]
+        :return: the amounts spent and acquired, or None if the balance of the spent asset is not enough for the fill
+        """
+        cdef:
+            str spent_asset = fill_schedule.quote_balance_key if is_buy else fill_schedule.base_balance_key
+            str acquired_asset = fill_schedule.base_balance_key if is_buy else fill_schedule.quote_balance_key
+            object returns_fee_percent = fill_schedule.c_get_returns_fee_percent(is_buy, is_maker)
+            object spent_balance = self._account_balances.get(spent_asset, s_decimal_0)
 
-        buy_entries = order_book.simulate_buy(amount)
+        if is_buy:
+            spent_amount = amount * price
+            acquired_amount = amount
+        else:
+            spent_amount = amount
+            acquired_amount = amount * price
+        if returns_fee_percent != s_decimal_0:
+            acquired_amount -= acquired_amount * returns_fee_percent
 
-        # Get the weighted average price of the trade
-        avg_price = Decimal(0)
-        for entry in buy_entries:
-            avg_price += Decimal(entry.price) * Decimal(entry.amount)
-        avg_price = avg_price / amount
+        if spent_amount > spent_balance:
+            return None
 
-        order_candidate = OrderCandidate(
-            trading_pair=trading_pair_str,
-            # Market orders are not maker orders
-            is_maker=False,
-            order_type=OrderType.MARKET,
-            order_side=TradeType.BUY,
-            amount=amount,
-            price=avg_price,
-            from_total_balances=True
-        )
+        self._account_balances[spent_asset] = spent_balance - spent_amount
+        self._account_balances[acquired_asset] = (self._account_balances.get(acquired_asset, s_decimal_0)
+                                                  + acquired_amount)
+        return spent_amount, acquired_amount
 
-        adjusted_order_candidate = self._budget_checker.populate_collateral_entries(order_candidate)
+    cdef c_execute_buy(self, str order_id, str trading_pair_str, object amount):
+        self.c_execute_market_order(order_id, trading_pair_str, True, amount)
 
-        # Quote currency used, including fees.
-        paid_amount = adjusted_order_candidate.order_collateral.amount
-        # Base currency acquired, including fees.
-        acquired_amount = adjusted_order_candidate.potential_returns.amount
+    cdef c_execute_sell(self, str order_id, str trading_pair_str, object amount):
+        self.c_execute_market_order(order_id, trading_pair_str, False, amount)
 
-        # It's not possible to fulfill the order, the possible acquired amount is less than requested
-        if paid_amount > quote_balance:
-            self.logger().warning(f"Insufficient {quote_asset} balance available for buy order. "
-                                  f"{quote_balance} {quote_asset} available vs. "
-                                  f"{paid_amount} {quote_asset} required for the order.")
+    cdef c_execute_market_order(self, str order_id, str trading_pair_str, bint is_buy, object amount):
+        cdef:
+            TradingPairFillSchedule fill_schedule = self.c_get_fill_schedule(trading_pair_str)
+            double amount_left = float(amount)
+            double filled_notional = 0
+            double row_amount
+            list fill_rows = []
+            str spent_asset = fill_schedule.quote_asset if is_buy else fill_schedule.base_asset
+            object trade_type = TradeType.BUY if is_buy else TradeType.SELL
+
+        # Walk the book once, taking liquidity until the order amount is covered
+        order_book = self.order_books[trading_pair_str]
+        for row in (order_book.ask_entries() if is_buy else order_book.bid_entries()):
+            row_amount = row.amount if row.amount < amount_left else amount_left
+            fill_rows.append(OrderBookRow(row.price, row_amount, row.update_id))
+            filled_notional += row.price * row_amount
+            amount_left -= row_amount
+            if amount_left <= 0:
+                break
+
+        if amount_left > 0:
+            self.logger().warning(f"Not enough liquidity in the {trading_pair_str} order book to fill the "
+                                  f"{trade_type.name.lower()} order {order_id} of {amount}.")
             self.c_trigger_event(
                 self.MARKET_ORDER_FAILURE_EVENT_TAG,
                 MarketOrderFailureEvent(self._current_timestamp, order_id, OrderType.MARKET)
             )
             return
 
-        # The order was successfully executed
-        self.c_set_balance(quote_asset,
-                           quote_balance - paid_amount)
-        self.c_set_balance(base_asset,
-                           base_balance + acquired_amount)
-
-        # add fee
-        fees = build_trade_fee(
-            exchange=self.name,
-            is_maker=False,
-            base_currency="",
-            quote_currency="",
-            order_type=OrderType.LIMIT,
-            order_side=TradeType.BUY,
-            amount=Decimal("0"),
-            price=Decimal("0"),
-        )
-
-        order_filled_events = OrderFilledEvent.order_filled_events_from_order_book_rows(
-            self._current_timestamp, order_id, trading_pair_str, TradeType.BUY, OrderType.MARKET,
-            fees, buy_entries
-        )
-
-        for order_filled_event in order_filled_events:
-            self.c_trigger_event(self.ORDER_FILLED_EVENT_TAG, order_filled_event)
-
-        self.c_trigger_event(
-            self.BUY_ORDER_COMPLETED_EVENT_TAG,
-            BuyOrderCompletedEvent(self._current_timestamp,
-                                   order_id,
-                                   base_asset,
-                                   quote_asset,
-                                   acquired_amount,
-                                   paid_amount,
-                                   OrderType.MARKET))
-
-    cdef c_execute_sell(self, str order_id, str trading_pair_str, object amount):
-        cdef:
-            str quote_asset = self._trading_pairs[trading_pair_str].quote_asset
-            str base_asset = self._trading_pairs[trading_pair_str].base_asset
-            object quote_balance = self.c_get_balance(quote_asset)
-            object base_balance = self.c_get_balance(base_asset)
-
-        order_book = self.order_books[trading_pair_str]
-
-        sell_entries = order_book.simulate_sell(amount)
-
-        # Get the weighted average price of the trade
-        avg_price = Decimal(0)
-        for entry in sell_entries:
-            avg_price += Decimal(entry.price) * Decimal(entry.amount)
-        avg_price = avg_price / amount
-
-        order_candidate = OrderCandidate(
-            trading_pair=trading_pair_str,
-            # Market orders are not maker orders
-            is_maker=False,
-            order_type=OrderType.MARKET,
-            order_side=TradeType.SELL,
-            amount=amount,
-            price=avg_price,
-            from_total_balances=True
-        )
-
-        adjusted_order_candidate = self._budget_checker.populate_collateral_entries(order_candidate)
-
-        # Base currency used, including fees.
-        sold_amount = adjusted_order_candidate.order_collateral.amount
-        # Quote currency acquired, including fees.
-        acquired_amount = adjusted_order_candidate.potential_returns.amount
-
-        # It's not possible to fulfill the order, the possible sold amount is less than requested
-        if sold_amount > base_balance:
-            self.logger().warning(f"Insufficient {base_asset} balance available for sell order. "
-                                  f"{base_balance} {base_asset} available vs. "
-                                  f"{amount} {base_asset} required for the order.")
+        # Weighted average price of the trade
+        avg_price = Decimal(str(filled_notional / float(amount)))
+        settled_amounts = self.c_settle_fill(fill_schedule, is_buy, False, avg_price, amount)
+
+        # It's not possible to fulfill the order, the balance is less than required
+        if settled_amounts is None:
+            self.logger().warning(f"Insufficient {spent_asset} balance available for "
+                                  f"{trade_type.name.lower()} order. "
+                                  f"{self.c_get_balance(spent_asset)} {spent_asset} available vs. "
+                                  f"{amount * avg_price if is_buy else amount} {spent_asset} "
+                                  f"required for the order.")
             self.c_trigger_event(
                 self.MARKET_ORDER_FAILURE_EVENT_TAG,
                 MarketOrderFailureEvent(self._current_timestamp, order_id, OrderType.MARKET)
             )
             return
 
-        # The order was successfully executed
-        self.c_set_balance(quote_asset,
-                           quote_balance + acquired_amount)
-        self.c_set_balance(base_asset,
-                           base_balance - sold_amount)
-
-        # add fee
-        fees = build_trade_fee(
-            exchange=self.name,
-            is_maker=False,
-            base_currency="",
-            quote_currency="",
-            order_type=OrderType.LIMIT,
-            order_side=TradeType.BUY,
-            amount=Decimal("0"),
-            price=Decimal("0"),
-        )
-
+        spent_amount, acquired_amount = settled_amounts
         order_filled_events = OrderFilledEvent.order_filled_events_from_order_book_rows(
-            self._current_timestamp, order_id, trading_pair_str, TradeType.SELL,
-            OrderType.MARKET, fees, sell_entries
+            self._current_timestamp, order_id, trading_pair_str, trade_type, OrderType.MARKET,
+            fill_schedule.c_get_fee(is_buy, False), fill_rows
         )
-
         for order_filled_event in order_filled_events:
             self.c_trigger_event(self.ORDER_FILLED_EVENT_TAG, order_filled_event)
 
-        self.c_trigger_event(
-            self.SELL_ORDER_COMPLETED_EVENT_TAG,
-            SellOrderCompletedEvent(self._current_timestamp,
-                                    order_id,
-                                    base_asset,
-                                    quote_asset,
-                                    sold_amount,
-                                    acquired_amount,
-                                    OrderType.MARKET))
+        if is_buy:
+            self.c_trigger_event(
+                self.BUY_ORDER_COMPLETED_EVENT_TAG,
+                BuyOrderCompletedEvent(self._current_timestamp,
+                                       order_id,
+                                       fill_schedule.base_asset,
+                                       fill_schedule.quote_asset,
+                                       acquired_amount,
+                                       spent_amount,
+                                       OrderType.MARKET))
+        else:
+            self.c_trigger_event(
+                self.SELL_ORDER_COMPLETED_EVENT_TAG,
+                SellOrderCompletedEvent(self._current_timestamp,
+                                        order_id,
+                                        fill_schedule.base_asset,
+                                        fill_schedule.quote_asset,
+                                        spent_amount,
+                                        acquired_amount,
+                                        OrderType.MARKET))
 
     cdef c_process_market_orders(self):
         cdef:
@@ -633,199 +658,120 @@ cdef class PaperTradeExchange(ExchangeBase):
             self.logger().error("Error deleting limit order.", exc_info=True)
             return False
 
-    cdef c_process_limit_bid_order(self,
-                                   LimitOrders *limit_orders_map_ptr,
-                                   LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it):
-        cdef:
-            const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
-            str trading_pair_str = cpp_limit_order_ptr.getTradingPair().decode("utf8")
-            str quote_asset = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
-            str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
-            str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
-            object amount = <object> cpp_limit_order_ptr.getQuantity()
-            object price = <object> cpp_limit_order_ptr.getPrice()
-            object quote_balance = self.c_get_balance(quote_asset)
-            object base_balance = self.c_get_balance(base_asset)
-
-        order_candidate = OrderCandidate(
-            trading_pair=trading_pair_str,
-            # Market orders are not maker orders
-            is_maker=False,
-            order_type=OrderType.LIMIT,
-            order_side=TradeType.BUY,
-            amount=amount,
-            price=price,
-            from_total_balances=True
-        )
-
-        adjusted_order_candidate = self._budget_checker.populate_collateral_entries(order_candidate)
-
-        # Quote currency used, including fees.
-        paid_amount = adjusted_order_candidate.order_collateral.amount
-        # Base currency acquired, including fees.
-        acquired_amount = adjusted_order_candidate.potential_returns.amount
-
-        # It's not possible to fulfill the order, the possible acquired amount is less than requested
-        if paid_amount > quote_balance:
-            self.logger().warning(f"Not enough {quote_asset} balance to fill limit buy order on {trading_pair_str}. "
-                                  f"{paid_amount:.8g} {quote_asset} needed vs. "
-                                  f"{quote_balance:.8g} {quote_asset} available.")
-
-            self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
-            self.c_trigger_event(self.MARKET_ORDER_CANCELED_EVENT_TAG,
-                                 OrderCancelledEvent(self._current_timestamp,
-                                                     order_id)
-                                 )
-            return
-
-        # The order was successfully executed
-        self.c_set_balance(quote_asset,
-                           quote_balance - paid_amount)
-        self.c_set_balance(base_asset,
-                           base_balance + acquired_amount)
-
-        # add fee
-        fees = build_trade_fee(
-            exchange=self.name,
-            is_maker=True,
-            base_currency="",
-            quote_currency="",
-            order_type=OrderType.LIMIT,
-            order_side=TradeType.BUY,
-            amount=Decimal("0"),
-            price=Decimal("0"),
-        )
-
-        # Emit the trade and order completed events.
-        self.c_trigger_event(
-            self.ORDER_FILLED_EVENT_TAG,
-            OrderFilledEvent(
-                self._current_timestamp,
-                order_id,
-                trading_pair_str,
-                TradeType.BUY,
-                OrderType.LIMIT,
-                <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
-                fees,
-                exchange_trade_id=str(int(self._time() * 1e6))
-            ))
-
-        self.c_trigger_event(
-            self.BUY_ORDER_COMPLETED_EVENT_TAG,
-            BuyOrderCompletedEvent(
-                self._current_timestamp,
-                order_id,
-                base_asset,
-                quote_asset,
-                acquired_amount,
-                paid_amount,
-                OrderType.LIMIT
-            ))
-        self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
-
-    cdef c_process_limit_ask_order(self,
-                                   LimitOrders *limit_orders_map_ptr,
-                                   LimitOrdersIterator *map_it_ptr,
-                                   SingleTradingPairLimitOrdersIterator orders_it):
-        cdef:
-            const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
-            str trading_pair_str = cpp_limit_order_ptr.getTradingPair().decode("utf8")
-            str quote_asset = cpp_limit_order_ptr.getQuoteCurrency().decode("utf8")
-            str base_asset = cpp_limit_order_ptr.getBaseCurrency().decode("utf8")
-            str order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
-            object amount = <object> cpp_limit_order_ptr.getQuantity()
-            object price = <object> cpp_limit_order_ptr.getPrice()
-            object quote_balance = self.c_get_balance(quote_asset)
-            object base_balance = self.c_get_balance(base_asset)
-
-        order_candidate = OrderCandidate(
-            trading_pair=trading_pair_str,
-            # Market orders are not maker orders
-            is_maker=True,
-            order_type=OrderType.LIMIT,
-            order_side=TradeType.SELL,
-            amount=amount,
-            price=price,
-            from_total_balances=True
-        )
-
-        adjusted_order_candidate = self._budget_checker.populate_collateral_entries(order_candidate)
-
-        # Base currency used, including fees.
-        sold_amount = adjusted_order_candidate.order_collateral.amount
-        # Quote currency acquired, including fees.
-        acquired_amount = adjusted_order_candidate.potential_returns.amount
-
-        # It's not possible to fulfill the order, the possible sold amount is less than requested
-        if sold_amount > base_balance:
-            self.logger().warning(f"Not enough {base_asset} balance to fill limit sell order on {trading_pair_str}. "
-                                  f"{sold_amount:.8g} {base_asset} needed vs. "
-                                  f"{base_balance:.8g} {base_asset} available.")
-            self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
-            self.c_trigger_event(self.MARKET_ORDER_CANCELED_EVENT_TAG,
-                                 OrderCancelledEvent(self._current_timestamp,
-                                                     order_id)
-                                 )
-            return
-
-        # The order was successfully executed
-        self.c_set_balance(quote_asset,
-                           quote_balance + acquired_amount)
-        self.c_set_balance(base_asset,
-                           base_balance - sold_amount)
-
-        # add fee
-        fees = build_trade_fee(
-            exchange=self.name,
-            is_maker=True,
-            base_currency="",
-            quote_currency="",
-            order_type=OrderType.LIMIT,
-            order_side=TradeType.SELL,
-            amount=Decimal("0"),
-            price=Decimal("0"),
-        )
-
-        # Emit the trade and order completed events.
-        self.c_trigger_event(
-            self.ORDER_FILLED_EVENT_TAG,
-            OrderFilledEvent(
-                self._current_timestamp,
-                order_id,
-                trading_pair_str,
-                TradeType.SELL,
-                OrderType.LIMIT,
-                <object> cpp_limit_order_ptr.getPrice(),
-                <object> cpp_limit_order_ptr.getQuantity(),
-                fees,
-                exchange_trade_id=str(int(self._time() * 1e6))
-            ))
-
-        self.c_trigger_event(
-            self.SELL_ORDER_COMPLETED_EVENT_TAG,
-            SellOrderCompletedEvent(
-                self._current_timestamp,
-                order_id,
-                base_asset,
-                quote_asset,
-                sold_amount,
-                acquired_amount,
-                OrderType.LIMIT
-            ))
-        self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
-
     cdef c_process_limit_order(self,
                                bint is_buy,
                                LimitOrders *limit_orders_map_ptr,
                                LimitOrdersIterator *map_it_ptr,
-                               SingleTradingPairLimitOrdersIterator orders_it):
+                               SingleTradingPairLimitOrdersIterator orders_it,
+                               object fill_amount=None):
+        """
+        Fills a limit order at its price. The order is completed and removed once its whole quantity is filled,
+        otherwise it stays in the book with the remaining quantity.
+
+        :param fill_amount: the amount to fill, the remaining quantity of the order if None
+        """
+        cdef:
+            const CPPLimitOrder *cpp_limit_order_ptr = address(deref(orders_it))
+            str trading_pair_str
+            str order_id
+            object price
+            object quantity
+            object filled_quantity
+            object remaining_quantity
+            TradingPairFillSchedule fill_schedule
+            SingleTradingPairLimitOrders *orders_collection_ptr
+            str spent_asset
+            object trade_type = TradeType.BUY if is_buy else TradeType.SELL
+            CPPLimitOrder replacement_order
         try:
+            trading_pair_str = cpp_limit_order_ptr.getTradingPair().decode("utf8")
+            order_id = cpp_limit_order_ptr.getClientOrderID().decode("utf8")
+            price = <object> cpp_limit_order_ptr.getPrice()
+            quantity = <object> cpp_limit_order_ptr.getQuantity()
+            filled_quantity = c_get_filled_quantity(cpp_limit_order_ptr)
+            remaining_quantity = quantity - filled_quantity
+            if fill_amount is None or fill_amount > remaining_quantity:
+                fill_amount = remaining_quantity
+            fill_schedule = self.c_get_fill_schedule(trading_pair_str)
+
+            # It's not possible to fill the order, the balance is less than required
+            if self.c_settle_fill(fill_schedule, is_buy, True, price, fill_amount) is None:
+                spent_asset = fill_schedule.quote_asset if is_buy else fill_schedule.base_asset
+                self.logger().warning(f"Not enough {spent_asset} balance to fill limit {trade_type.name.lower()} "
+                                      f"order on {trading_pair_str}. "
+                                      f"{fill_amount * price if is_buy else fill_amount:.8g} {spent_asset} needed vs. "
+                                      f"{self.c_get_balance(spent_asset):.8g} {spent_asset} available.")
+                self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_trigger_event(self.MARKET_ORDER_CANCELED_EVENT_TAG,
+                                     OrderCancelledEvent(self._current_timestamp,
+                                                         order_id)
+                                     )
+                return
+
+            self.c_trigger_event(
+                self.ORDER_FILLED_EVENT_TAG,
+                OrderFilledEvent(
+                    self._current_timestamp,
+                    order_id,
+                    trading_pair_str,
+                    trade_type,
+                    OrderType.LIMIT,
+                    price,
+                    fill_amount,
+                    fill_schedule.c_get_fee(is_buy, True),
+                    exchange_trade_id=str(int(self._time() * 1e6))
+                ))
+
+            if fill_amount < remaining_quantity:
+                # The order stays in the book with the filled quantity updated. Its position in the set is unchanged,
+                # since the orders are sorted by price and order id.
+                orders_collection_ptr = address(deref(deref(map_it_ptr)).second)
+                filled_quantity = filled_quantity + fill_amount
+                replacement_order = CPPLimitOrder(
+                    cpp_limit_order_ptr.getClientOrderID(),
+                    cpp_limit_order_ptr.getTradingPair(),
+                    is_buy,
+                    cpp_limit_order_ptr.getBaseCurrency(),
+                    cpp_limit_order_ptr.getQuoteCurrency(),
+                    cpp_limit_order_ptr.getPrice(),
+                    cpp_limit_order_ptr.getQuantity(),
+                    <PyObject *> filled_quantity,
+                    cpp_limit_order_ptr.getCreationTimestamp(),
+                    cpp_limit_order_ptr.getStatus()
+                )
+                orders_collection_ptr.erase(orders_it)
+                orders_collection_ptr.insert(replacement_order)
+                return
+
+            # The order is completed, the event reports the amounts of the whole order
+            spent_amount = quantity * price if is_buy else quantity
+            acquired_amount = quantity if is_buy else quantity * price
+            acquired_amount -= acquired_amount * fill_schedule.c_get_returns_fee_percent(is_buy, True)
             if is_buy:
-                self.c_process_limit_bid_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_trigger_event(
+                    self.BUY_ORDER_COMPLETED_EVENT_TAG,
+                    BuyOrderCompletedEvent(
+                        self._current_timestamp,
+                        order_id,
+                        fill_schedule.base_asset,
+                        fill_schedule.quote_asset,
+                        acquired_amount,
+                        spent_amount,
+                        OrderType.LIMIT
+                    ))
             else:
-                self.c_process_limit_ask_order(limit_orders_map_ptr, map_it_ptr, orders_it)
+                self.c_trigger_event(
+                    self.SELL_ORDER_COMPLETED_EVENT_TAG,
+                    SellOrderCompletedEvent(
+                        self._current_timestamp,
+                        order_id,
+                        fill_schedule.base_asset,
+                        fill_schedule.quote_asset,
+                        spent_amount,
+                        acquired_amount,
+                        OrderType.LIMIT
+                    ))
+            self.c_delete_limit_order(limit_orders_map_ptr, map_it_ptr, orders_it)
         except Exception as e:
             self.logger().error(f"Error processing limit order.", exc_info=True)
 
@@ -890,7 +836,8 @@ cdef class PaperTradeExchange(ExchangeBase):
     # <editor-fold desc="Event listener functions">
     cdef c_match_trade_to_limit_orders(self, object order_book_trade_event):
         """
-        Trigger limit orders when incoming market orders have crossed the limit order's price.
+        Trigger limit orders when incoming market orders have crossed the limit order's price. The limit orders are
+        filled up to the traded quantity, so an order can be partially filled by a trade.
 
         :param order_book_trade_event: trade event from order book
         """
@@ -898,7 +845,7 @@ cdef class PaperTradeExchange(ExchangeBase):
             string cpp_trading_pair = order_book_trade_event.trading_pair.encode("utf8")
             bint is_maker_buy = order_book_trade_event.type is TradeType.SELL
             object trade_price = order_book_trade_event.price
-            object trade_quantity = order_book_trade_event.amount
+            object trade_quantity_left = Decimal(str(order_book_trade_event.amount))
             LimitOrders *limit_orders_map_ptr = (address(self._bid_limit_orders)
                                                  if is_maker_buy
                                                  else address(self._ask_limit_orders))
@@ -931,8 +878,15 @@ cdef class PaperTradeExchange(ExchangeBase):
                 process_order_its.push_back(orders_it)
                 inc(orders_it)
 
+        # The orders are filled in price priority, each one up to the quantity left from the trade
         for orders_it in process_order_its:
-            self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it)
+            if trade_quantity_left <= s_decimal_0:
+                break
+            cpp_limit_order_ptr = address(deref(orders_it))
+            fill_amount = min(<object>cpp_limit_order_ptr.getQuantity() - c_get_filled_quantity(cpp_limit_order_ptr),
+                              trade_quantity_left)
+            self.c_process_limit_order(is_maker_buy, limit_orders_map_ptr, address(map_it), orders_it, fill_amount)
+            trade_quantity_left -= fill_amount
 
     # </editor-fold>
 
@@ -1122,6 +1076,18 @@ cdef class PaperTradeExchange(ExchangeBase):
     def get_order_book(self, trading_pair: str) -> OrderBook:
         return self.c_get_order_book(trading_pair)
 
+    def get_candles(self, trading_pair: str, interval: float) -> Candles:
+        """
+        Returns the OHLCV bars of a particular market, built from the public trades since they were first requested
+
+        :param trading_pair: the pair of tokens for which the bars should be retrieved
+        :param interval: the bars length in seconds
+        """
+        if trading_pair not in self._trading_pairs:
+            raise ValueError(f"No order book exists for '{trading_pair}'.")
+        trading_pair = self._target_market.convert_to_exchange_trading_pair(trading_pair)
+        return self._order_book_tracker.get_candles(trading_pair, interval)
+
     def get_maker_order_type(self):
         return OrderType.LIMIT
 
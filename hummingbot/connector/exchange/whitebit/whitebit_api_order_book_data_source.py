@@ -2,6 +2,7 @@ import asyncio
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from hummingbot.connector.exchange.whitebit import whitebit_constants as CONSTANTS, whitebit_web_utils as web_utils
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -15,6 +16,8 @@ if TYPE_CHECKING:
 
 
 class WhitebitAPIOrderBookDataSource(OrderBookTrackerDataSource):
+    SNAPSHOT_THROTTLER_LIMIT_ID = CONSTANTS.WHITEBIT_ORDER_BOOK_PATH
+
     _logger: Optional[HummingbotLogger] = None
 
     def __init__(
@@ -57,6 +60,9 @@ class WhitebitAPIOrderBookDataSource(OrderBookTrackerDataSource):
 
         return snapshot_msg
 
+    def _snapshot_requests_throttler(self) -> Optional[AsyncThrottlerBase]:
+        return self._api_factory.throttler
+
     async def _request_order_book_snapshot(self, trading_pair: str) -> Dict[str, Any]:
         """
         Retrieves a copy of the full order book from the exchange, for a particular trading pair.
@@ -111,6 +117,7 @@ class WhitebitAPIOrderBookDataSource(OrderBookTrackerDataSource):
             "update_id": update_id,
             "bids": [(bid[0], bid[1]) for bid in depth_update.get("bids", [])],
             "asks": [(ask[0], ask[1]) for ask in depth_update.get("asks", [])],
+            "exchange_timestamp": depth_update.get("timestamp"),
         }
         diff_message: OrderBookMessage = OrderBookMessage(
             order_book_message_type, order_book_message_content, timestamp
@@ -10,19 +10,23 @@ from async_timeout import timeout
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.constants import MINUTE, TWELVE_HOURS, s_decimal_0, s_decimal_NaN
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.ticker_snapshot_service import Ticker, TickerSnapshotService
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
-from hummingbot.connector.utils import get_new_client_order_id
+from hummingbot.connector.utils import ConnectorOrderBookTrackerFactory, get_new_client_order_id
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.api_throttler.data_types import RateLimit
 from hummingbot.core.data_type.cancellation_result import CancellationResult
+from hummingbot.core.data_type.candles import Candles
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.sharded_order_book_tracker import ShardedOrderBookTracker
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.data_type.trade_tape import TradeTape
 from hummingbot.core.data_type.user_stream_tracker import UserStreamTracker
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
 from hummingbot.core.network_iterator import NetworkStatus
@@ -44,6 +48,7 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    TICKER_SNAPSHOT_TTL = 5.0
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -72,22 +77,39 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         # init OrderBook Data Source and Tracker
         self._orderbook_ds: OrderBookTrackerDataSource = self._create_order_book_data_source()
-        self._set_order_book_tracker(OrderBookTracker(
-            data_source=self._orderbook_ds,
-            trading_pairs=self.trading_pairs,
-            domain=self.domain))
+        self._set_order_book_tracker(self._create_order_book_tracker(client_config_map))
 
         # init UserStream Data Source and Tracker
         self._user_stream_tracker = self._create_user_stream_tracker()
 
         self._order_tracker: ClientOrderTracker = ClientOrderTracker(connector=self)
 
+        self._ticker_snapshot_service: Optional[TickerSnapshotService] = (
+            TickerSnapshotService(fetch_tickers=self._fetch_all_tickers, ttl=self.TICKER_SNAPSHOT_TTL)
+            if self.supports_ticker_snapshots
+            else None)
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         if cls._logger is None:
             cls._logger = logging.getLogger(HummingbotLogger.logger_name_for_class(cls))
         return cls._logger
 
+    def _create_order_book_tracker(self, client_config_map: "ClientConfigAdapter") -> OrderBookTracker:
+        workers_config = client_config_map.order_book_workers
+        if self.name in workers_config.order_book_worker_connectors and len(self.trading_pairs) > 0:
+            return ShardedOrderBookTracker(
+                data_source=self._orderbook_ds,
+                trading_pairs=self.trading_pairs,
+                tracker_factory=ConnectorOrderBookTrackerFactory(self.name),
+                shards=workers_config.order_book_worker_processes,
+                depth=workers_config.order_book_worker_depth,
+                domain=self.domain)
+        return OrderBookTracker(
+            data_source=self._orderbook_ds,
+            trading_pairs=self.trading_pairs,
+            domain=self.domain)
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -185,6 +207,18 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         return all(self.status_dict.values())
 
+    def is_trading_pair_ready(self, trading_pair: str) -> bool:
+        """
+        Returns True if the connector is ready to operate on the trading pair. The order books are initialized
+        independently, so the pair is ready once its own order book is initialized, even if other order books are
+        still being initialized.
+
+        :param trading_pair: the trading pair to check
+        """
+        status = self.status_dict
+        status.pop("order_books_initialized", None)
+        return all(status.values()) and self.order_book_tracker.is_order_book_ready(trading_pair)
+
     @property
     def name_cap(self) -> str:
         return self.name.capitalize()
@@ -260,6 +294,46 @@ class ExchangePyBase(ExchangeBase, ABC):
             return s_decimal_0
         return quantized_amount
 
+    @property
+    def supports_ticker_snapshots(self) -> bool:
+        """
+        True if the connector can request the tickers of all the pairs at once (implements `_fetch_all_tickers`)
+        """
+        return type(self)._fetch_all_tickers is not ExchangePyBase._fetch_all_tickers
+
+    @property
+    def ticker_snapshot_service(self) -> Optional[TickerSnapshotService]:
+        """
+        The cached tickers of all the pairs of the exchange, or None if the exchange does not support bulk tickers
+        requests. Use it instead of requesting prices directly to the exchange to share the requests with the other
+        components of the bot.
+        """
+        return self._ticker_snapshot_service
+
+    async def get_last_traded_prices(self, trading_pairs: List[str]) -> Dict[str, float]:
+        """
+        Return a dictionary the trading_pair as key and the current price as value for each trading pair passed as
+        parameter. The prices are taken from the tickers snapshot when the exchange supports it, and requested one by
+        one otherwise (or for the pairs missing in the snapshot)
+
+        :param trading_pairs: list of trading pairs to get the prices for
+
+        :return: Dictionary of associations between token pair and its latest price
+        """
+        last_prices = {}
+        if self._ticker_snapshot_service is not None:
+            try:
+                last_prices = await self._ticker_snapshot_service.get_last_traded_prices(trading_pairs=trading_pairs)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().warning("Error requesting the tickers snapshot. Requesting the prices one by one.",
+                                      exc_info=True)
+        missing_trading_pairs = [trading_pair for trading_pair in trading_pairs if trading_pair not in last_prices]
+        if len(missing_trading_pairs) > 0:
+            last_prices.update(await super().get_last_traded_prices(missing_trading_pairs))
+        return last_prices
+
     def get_order_book(self, trading_pair: str) -> OrderBook:
         """
         Returns the current order book for a particular market
@@ -270,6 +344,27 @@ class ExchangePyBase(ExchangeBase, ABC):
             raise ValueError(f"No order book exists for '{trading_pair}'.")
         return self.order_book_tracker.order_books[trading_pair]
 
+    def get_trade_tape(self, trading_pair: str) -> TradeTape:
+        """
+        Returns the recent public trades of a particular market, with rolling aggregates (VWAP, volume, imbalance)
+
+        :param trading_pair: the pair of tokens for which the trade tape should be retrieved
+        """
+        if trading_pair not in self.order_book_tracker.order_books:
+            raise ValueError(f"No order book exists for '{trading_pair}'.")
+        return self.order_book_tracker.get_trade_tape(trading_pair)
+
+    def get_candles(self, trading_pair: str, interval: float) -> Candles:
+        """
+        Returns the OHLCV bars of a particular market, built from the public trades since they were first requested
+
+        :param trading_pair: the pair of tokens for which the bars should be retrieved
+        :param interval: the bars length in seconds
+        """
+        if trading_pair not in self.order_book_tracker.order_books:
+            raise ValueError(f"No order book exists for '{trading_pair}'.")
+        return self.order_book_tracker.get_candles(trading_pair, interval)
+
     def tick(self, timestamp: float):
         """
         Includes the logic that has to be processed every time a new tick happens in the bot. Particularly it enables
@@ -987,7 +1082,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         await self._update_lost_orders()
 
     async def _cancel_lost_orders(self):
-        for _, lost_order in self._order_tracker.lost_orders.items():
+        for lost_order in list(self._order_tracker.lost_orders.values()):
             await self._execute_order_cancel(order=lost_order)
 
     # Methods tied to specific API data formats
@@ -996,6 +1091,15 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _update_trading_fees(self):
         raise NotImplementedError
 
+    async def _fetch_all_tickers(self) -> Dict[str, Ticker]:
+        """
+        Requests the tickers of all the trading pairs in a single request. Implement it in the connectors of exchanges
+        offering a bulk tickers endpoint to enable the ticker snapshot service.
+
+        :return: the tickers keyed by trading pair (only for the pairs supported by the connector)
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def _user_stream_event_listener(self):
         raise NotImplementedError
@@ -314,8 +314,7 @@ class GatewayEVMAMM(ConnectorBase):
             transaction_hash: Optional[str] = resp.get("approval", {}).get("hash")
             nonce: Optional[int] = resp.get("nonce")
             if transaction_hash is not None and nonce is not None:
-                tracked_order = self._order_tracker.fetch_order(client_order_id=approval_id)
-                tracked_order.update_exchange_order_id(transaction_hash)
+                tracked_order = self._order_tracker.update_exchange_order_id(approval_id, transaction_hash)
                 tracked_order.nonce = nonce
                 self.logger().info(
                     f"Maximum {token_symbol} approval for {self.connector_name} contract sent, hash: {transaction_hash}."
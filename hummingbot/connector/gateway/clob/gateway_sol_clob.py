@@ -397,8 +397,7 @@ class GatewaySOLCLOB(ConnectorBase):
 
             mint_address: Optional[str] = resp.get("mintAddress")
             if mint_address is not None:
-                tracked_order = self._order_tracker.fetch_order(client_order_id=approval_id)
-                tracked_order.update_exchange_order_id(mint_address)
+                tracked_order = self._order_tracker.update_exchange_order_id(approval_id, mint_address)
                 self.logger().info(
                     f"Maximum {token_symbol} approval for {self.connector_name} contract sent,"
                     f" mint address: {mint_address}."
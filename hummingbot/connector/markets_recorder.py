@@ -4,7 +4,7 @@ import threading
 import time
 from decimal import Decimal
 from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from sqlalchemy.orm import Query, Session
@@ -32,6 +32,7 @@ from hummingbot.core.event.events import (
 )
 from hummingbot.model.funding_payment import FundingPayment
 from hummingbot.model.market_state import MarketState
+from hummingbot.model.market_state_delta import MarketStateDelta
 from hummingbot.model.order import Order
 from hummingbot.model.order_status import OrderStatus
 from hummingbot.model.range_position_collected_fees import RangePositionCollectedFees
@@ -41,6 +42,8 @@ from hummingbot.model.trade_fill import TradeFill
 
 
 class MarketsRecorder:
+    MARKET_STATE_COMPACTION_THRESHOLD = 100  # number of journal entries before a new snapshot is written
+
     market_event_tag_map: Dict[int, MarketEvent] = {
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
@@ -59,6 +62,9 @@ class MarketsRecorder:
         self._markets: List[ConnectorBase] = markets
         self._config_file_path: str = config_file_path
         self._strategy_name: str = strategy_name
+        # Last persisted tracking states and journal length of each market, keyed by (config_file_path, market)
+        self._persisted_market_states: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._market_state_deltas_count: Dict[Tuple[str, str], int] = {}
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -153,25 +159,48 @@ class MarketsRecorder:
                 return query.limit(number_of_rows).all()
 
     def save_market_states(self, config_file_path: str, market: ConnectorBase, session: Session):
-        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
+        """
+        Persists the changes in the tracking states of the market since the last call. The changes are appended to the
+        market state journal, which is compacted into a new snapshot once it reaches
+        `MARKET_STATE_COMPACTION_THRESHOLD` entries.
+        """
+        state_key = (config_file_path, market.display_name)
+        tracking_states: Dict[str, Any] = market.tracking_states
         timestamp: int = self.db_timestamp
 
-        if market_states is not None:
-            market_states.saved_state = market.tracking_states
-            market_states.timestamp = timestamp
+        if state_key not in self._persisted_market_states:
+            self._load_persisted_market_states(config_file_path, market, session=session)
+        persisted_states: Optional[Dict[str, Any]] = self._persisted_market_states.get(state_key)
+
+        if persisted_states is None:
+            session.add(MarketState(config_file_path=config_file_path,
+                                    market=market.display_name,
+                                    timestamp=timestamp,
+                                    saved_state=tracking_states))
+            self._market_state_deltas_count[state_key] = 0
         else:
-            market_states = MarketState(config_file_path=config_file_path,
-                                        market=market.display_name,
-                                        timestamp=timestamp,
-                                        saved_state=market.tracking_states)
-            session.add(market_states)
+            updated_states = {key: state for key, state in tracking_states.items() if persisted_states.get(key) != state}
+            removed_keys = [key for key in persisted_states if key not in tracking_states]
+            if len(updated_states) == 0 and len(removed_keys) == 0:
+                return
+            if self._market_state_deltas_count[state_key] >= self.MARKET_STATE_COMPACTION_THRESHOLD:
+                self._compact_market_states(config_file_path, market, tracking_states, timestamp, session=session)
+            else:
+                session.add(MarketStateDelta(config_file_path=config_file_path,
+                                             market=market.display_name,
+                                             timestamp=timestamp,
+                                             updated_states=updated_states,
+                                             removed_keys=removed_keys))
+                self._market_state_deltas_count[state_key] += 1
+
+        self._persisted_market_states[state_key] = dict(tracking_states)
 
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
         with self._sql_manager.get_new_session() as session:
-            market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
+            tracking_states = self._load_persisted_market_states(config_file_path, market, session=session)
 
-            if market_states is not None:
-                market.restore_tracking_states(market_states.saved_state)
+            if tracking_states is not None:
+                market.restore_tracking_states(tracking_states)
 
     def get_market_states(self,
                           config_file_path: str,
@@ -184,6 +213,58 @@ class MarketsRecorder:
         market_states: Optional[MarketState] = query.one_or_none()
         return market_states
 
+    def get_market_state_deltas(self,
+                                config_file_path: str,
+                                market: ConnectorBase,
+                                session: Session) -> List[MarketStateDelta]:
+        query: Query = (session
+                        .query(MarketStateDelta)
+                        .filter(MarketStateDelta.config_file_path == config_file_path,
+                                MarketStateDelta.market == market.display_name)
+                        .order_by(MarketStateDelta.id))
+        return query.all()
+
+    def _load_persisted_market_states(self,
+                                      config_file_path: str,
+                                      market: ConnectorBase,
+                                      session: Session) -> Optional[Dict[str, Any]]:
+        """
+        Rebuilds the tracking states of the market by replaying the journal on top of the last snapshot.
+        """
+        state_key = (config_file_path, market.display_name)
+        market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
+        if market_states is None:
+            self._persisted_market_states.pop(state_key, None)
+            self._market_state_deltas_count[state_key] = 0
+            return None
+
+        tracking_states: Dict[str, Any] = dict(market_states.saved_state)
+        deltas: List[MarketStateDelta] = self.get_market_state_deltas(config_file_path, market, session=session)
+        for delta in deltas:
+            tracking_states.update(delta.updated_states)
+            for key in delta.removed_keys:
+                tracking_states.pop(key, None)
+
+        self._persisted_market_states[state_key] = dict(tracking_states)
+        self._market_state_deltas_count[state_key] = len(deltas)
+        return tracking_states
+
+    def _compact_market_states(self,
+                               config_file_path: str,
+                               market: ConnectorBase,
+                               tracking_states: Dict[str, Any],
+                               timestamp: int,
+                               session: Session):
+        market_states: MarketState = self.get_market_states(config_file_path, market, session=session)
+        market_states.saved_state = tracking_states
+        market_states.timestamp = timestamp
+        (session
+         .query(MarketStateDelta)
+         .filter(MarketStateDelta.config_file_path == config_file_path,
+                 MarketStateDelta.market == market.display_name)
+         .delete(synchronize_session=False))
+        self._market_state_deltas_count[(config_file_path, market.display_name)] = 0
+
     def _did_create_order(self,
                           event_tag: int,
                           market: ConnectorBase,
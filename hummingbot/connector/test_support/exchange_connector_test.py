@@ -5,7 +5,7 @@ from abc import ABC, abstractmethod
 from decimal import Decimal
 from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 from unittest import TestCase
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, PropertyMock, patch
 
 from aioresponses import aioresponses
 from aioresponses.core import RequestCall
@@ -591,6 +591,21 @@ class AbstractExchangeConnectorTests:
             self.assertEqual(self._expected_initial_status_dict(), status_dict)
             self.assertFalse(self.exchange.ready)
 
+        def test_trading_pair_ready_once_its_order_book_is_initialized(self):
+            status_dict = {key: True for key in self._expected_initial_status_dict()}
+            status_dict["order_books_initialized"] = False
+
+            with patch.object(type(self.exchange), "status_dict", new_callable=PropertyMock) as status_dict_mock:
+                status_dict_mock.side_effect = lambda: dict(status_dict)
+
+                self.assertFalse(self.exchange.is_trading_pair_ready(self.trading_pair))
+
+                self.exchange.order_book_tracker._order_book_initialized_events[self.trading_pair].set()
+
+                self.assertTrue(self.exchange.is_trading_pair_ready(self.trading_pair))
+                self.assertFalse(self.exchange.is_trading_pair_ready("OTHER-PAIR"))
+                self.assertFalse(self.exchange.ready)
+
         @aioresponses()
         def test_update_trading_rules(self, mock_api):
             self.exchange._set_current_timestamp(1000)
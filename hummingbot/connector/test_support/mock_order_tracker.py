@@ -1,8 +1,11 @@
 import asyncio
+from collections import defaultdict
 from typing import Dict, List
 
+from hummingbot.core.data_type.candles import Candles
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker, OrderBookTrackerDataSource
+from hummingbot.core.data_type.trade_tape import TradeTape
 
 
 class MockOrderBookTrackerDataSource(OrderBookTrackerDataSource):
@@ -32,6 +35,8 @@ class MockOrderTracker(OrderBookTracker):
         self._data_source: MockOrderBookTrackerDataSource = MockOrderBookTrackerDataSource([])
         # self._trading_pairs: List[str] = trading_pairs
         self._order_books: Dict[str, OrderBook] = {}
+        self._trade_tapes: Dict[str, TradeTape] = {}
+        self._candles: Dict[str, Dict[float, Candles]] = defaultdict(dict)
 
     # def exchange_name(self):
     #     return "MockPaperExchange" # self.__class__.__name__
@@ -0,0 +1,86 @@
+import asyncio
+import time
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional
+
+
+def decimal_or_none(value: Any) -> Optional[Decimal]:
+    """
+    Converts a price from an exchange response, returning None for missing or empty values
+    """
+    return None if value is None or value == "" else Decimal(str(value))
+
+
+class Ticker(NamedTuple):
+    trading_pair: str
+    last_price: Optional[Decimal]
+    best_bid: Optional[Decimal]
+    best_ask: Optional[Decimal]
+
+    @property
+    def mid_price(self) -> Optional[Decimal]:
+        if self.best_bid is None or self.best_ask is None or not 0 < self.best_bid <= self.best_ask:
+            return None
+        return (self.best_bid + self.best_ask) / Decimal("2")
+
+
+class TickerSnapshotService:
+    """
+    Keeps the tickers of all the trading pairs of an exchange, fetched with a single bulk request, for `ttl` seconds.
+
+    It is shared by all the components requesting prices from the same exchange (the order book tracker last trade
+    price fallback, the rate oracle sources, the client commands), so they are served by one request instead of
+    one per component and trading pair. Concurrent requests while the snapshot is being fetched wait for the same
+    request.
+    """
+
+    def __init__(self, fetch_tickers: Callable[[], Awaitable[Dict[str, Ticker]]], ttl: float):
+        """
+        :param fetch_tickers: coroutine function requesting the tickers of all the pairs, keyed by trading pair
+        :param ttl: seconds a snapshot is used before requesting a new one
+        """
+        self._fetch_tickers = fetch_tickers
+        self._ttl = ttl
+        self._tickers: Dict[str, Ticker] = {}
+        self._snapshot_timestamp: float = 0
+        self._fetch_task: Optional[asyncio.Task] = None
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    @property
+    def snapshot_timestamp(self) -> float:
+        return self._snapshot_timestamp
+
+    async def get_tickers(self) -> Dict[str, Ticker]:
+        """
+        Returns the tickers of all the pairs, requesting a new snapshot if the current one is older than the TTL
+        """
+        if self._time() - self._snapshot_timestamp < self._ttl:
+            return self._tickers
+        if self._fetch_task is None or self._fetch_task.done():
+            self._fetch_task = asyncio.get_event_loop().create_task(self._fetch_snapshot())
+        return await asyncio.shield(self._fetch_task)
+
+    async def get_last_traded_prices(self, trading_pairs: List[str]) -> Dict[str, float]:
+        """
+        Returns the last traded price of the trading pairs present in the snapshot
+        """
+        tickers = await self.get_tickers()
+        return {trading_pair: float(tickers[trading_pair].last_price)
+                for trading_pair in trading_pairs
+                if trading_pair in tickers and tickers[trading_pair].last_price is not None}
+
+    def invalidate(self):
+        self._snapshot_timestamp = 0
+
+    async def _fetch_snapshot(self) -> Dict[str, Ticker]:
+        tickers = await self._fetch_tickers()
+        self._tickers = tickers
+        self._snapshot_timestamp = self._time()
+        return tickers
+
+    @staticmethod
+    def _time() -> float:
+        return time.monotonic()
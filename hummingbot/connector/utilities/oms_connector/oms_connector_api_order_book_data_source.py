@@ -61,6 +61,7 @@ class OMSConnectorAPIOrderBookDataSource(OrderBookTrackerDataSource):
             "update_id": update_id,
             "bids": bids,
             "asks": asks,
+            "exchange_timestamp": ts_ms * 1e-3,
         }
         diff_message: OrderBookMessage = OrderBookMessage(
             OrderBookMessageType.DIFF,
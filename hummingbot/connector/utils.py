@@ -5,9 +5,7 @@ import os
 import platform
 from collections import namedtuple
 from hashlib import md5
-from typing import Any, Callable, Dict, Optional, Tuple
-
-from zero_ex.order_utils import Order as ZeroExOrder
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
@@ -18,10 +16,15 @@ from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBa
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_post_processors import WSPostProcessorBase
 
+if TYPE_CHECKING:
+    from zero_ex.order_utils import Order as ZeroExOrder
+
+    from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+
 TradeFillOrderDetails = namedtuple("TradeFillOrderDetails", "market exchange_trade_id symbol")
 
 
-def zrx_order_to_json(order: Optional[ZeroExOrder]) -> Optional[Dict[str, any]]:
+def zrx_order_to_json(order: Optional["ZeroExOrder"]) -> Optional[Dict[str, any]]:
     if order is None:
         return None
 
@@ -34,7 +37,10 @@ def zrx_order_to_json(order: Optional[ZeroExOrder]) -> Optional[Dict[str, any]]:
     return retval
 
 
-def json_to_zrx_order(data: Optional[Dict[str, any]]) -> Optional[ZeroExOrder]:
+def json_to_zrx_order(data: Optional[Dict[str, any]]) -> Optional["ZeroExOrder"]:
+    # zero_ex pulls in web3, imported on use to keep it out of the startup path
+    from zero_ex.order_utils import Order as ZeroExOrder
+
     if data is None:
         return None
 
@@ -121,6 +127,32 @@ def get_new_numeric_client_order_id(nonce_creator: NonceCreator, max_id_bit_coun
     return client_order_id
 
 
+class ConnectorOrderBookTrackerFactory:
+    """
+    Picklable factory used by the order book tracking worker processes. It creates a non trading instance of the
+    connector (no API keys, default client configuration) and returns its order book tracker.
+    """
+
+    def __init__(self, connector_name: str):
+        self._connector_name = connector_name
+        self._connector = None
+
+    def __call__(self, trading_pairs: List[str]) -> "OrderBookTracker":
+        from hummingbot.client.config.client_config_map import ClientConfigMap
+        from hummingbot.client.config.config_helpers import ClientConfigAdapter
+        from hummingbot.client.settings import AllConnectorSettings
+
+        connector_setting = AllConnectorSettings.get_connector_settings()[self._connector_name]
+        # The connector is kept to preserve the objects its order book data source depends on
+        self._connector = connector_setting.non_trading_connector_instance_with_default_configuration(
+            trading_pairs=trading_pairs,
+            client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        return self._connector.order_book_tracker
+
+    def __getstate__(self):
+        return {"_connector_name": self._connector_name, "_connector": None}
+
+
 class TimeSynchronizerRESTPreProcessor(RESTPreProcessorBase):
     """
     This pre processor is intended to be used in those connectors that require synchronization with the server time
@@ -84,6 +84,20 @@ class AsyncThrottlerBase(ABC):
 #
         return rate_limit, related_limits
 
+    def max_concurrent_tasks(self, limit_id: str) -> Optional[int]:
+        """
+        Returns the number of tasks for the limit that fit at once in the limit and in all its linked limits, or None
+        if the limit is not defined in the throttler.
+
+        :param limit_id: the id of the rate limit of the tasks
+        """
+        rate_limit, related_limits = self.get_related_limits(limit_id)
+        if rate_limit is None:
+            return None
+        capacities = [int(rate_limit.limit // rate_limit.weight)]
+        capacities.extend(int(limit.limit // weight) for limit, weight in related_limits)
+        return max(1, min(capacities))
+
     @abstractmethod
     def execute_task(self, limit_id: str) -> AsyncRequestContextBase:
         raise NotImplementedError
@@ -0,0 +1,152 @@
+import math
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+
+class Candles:
+    """
+    Rolling OHLCV bars of a trading pair for one interval, built incrementally from the public trades.
+
+    Bars without trades are built from the mid prices sampled during the bar (the trades take over as soon as there is
+    one), and the intervals with neither trades nor mid prices are filled with the previous close and no volume, so
+    there is exactly one bar per interval.
+
+    The bars are stored in a NumPy array in which every bar is written twice, at its slot and at its slot plus the
+    capacity, so the bars kept are always a contiguous block of rows. `to_array` and `to_pandas` return views of that
+    block instead of copies: they are valid until the next update and must not be modified.
+    """
+    TIMESTAMP = 0
+    OPEN = 1
+    HIGH = 2
+    LOW = 3
+    CLOSE = 4
+    VOLUME = 5
+    TRADES = 6
+    COLUMNS = ("timestamp", "open", "high", "low", "close", "volume", "trades")
+
+    def __init__(self, trading_pair: str, interval: float, capacity: int = 1000):
+        """
+        :param trading_pair: the trading pair of the trades
+        :param interval: the bars length in seconds
+        :param capacity: the number of bars kept
+        """
+        if interval <= 0:
+            raise ValueError(f"The candles interval must be positive ({interval}).")
+        if capacity < 1:
+            raise ValueError(f"The candles capacity must be positive ({capacity}).")
+        self._trading_pair: str = trading_pair
+        self._interval: float = interval
+        self._capacity: int = capacity
+        self._data: np.ndarray = np.zeros((capacity * 2, len(self.COLUMNS)), dtype=np.float64)
+        self._start: int = 0
+        self._size: int = 0
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def interval(self) -> float:
+        return self._interval
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def last_close(self) -> float:
+        return float(self._data[self._start + self._size - 1, self.CLOSE]) if self._size > 0 else float("nan")
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add_trade(self, timestamp: float, price: float, amount: float):
+        """
+        Adds a trade to the bar of its timestamp. Trades older than the oldest bar kept are ignored.
+        """
+        slot = self._bar_slot(timestamp, price)
+        if slot is None:
+            return
+        bar = self._data[slot]
+        if bar[self.TRADES] == 0:
+            bar[self.OPEN] = bar[self.HIGH] = bar[self.LOW] = price
+        else:
+            bar[self.HIGH] = max(bar[self.HIGH], price)
+            bar[self.LOW] = min(bar[self.LOW], price)
+        bar[self.CLOSE] = price
+        bar[self.VOLUME] += amount
+        bar[self.TRADES] += 1
+        self._data[slot + self._capacity] = bar
+
+    def add_mid_price(self, timestamp: float, price: float):
+        """
+        Adds a mid price sample to the bar of its timestamp. It is only used if the bar has no trade.
+        """
+        if math.isnan(price):
+            return
+        slot = self._bar_slot(timestamp, price)
+        if slot is None:
+            return
+        bar = self._data[slot]
+        if bar[self.TRADES] > 0:
+            return
+        bar[self.HIGH] = max(bar[self.HIGH], price)
+        bar[self.LOW] = min(bar[self.LOW], price)
+        bar[self.CLOSE] = price
+        self._data[slot + self._capacity] = bar
+
+    def to_array(self) -> np.ndarray:
+        """
+        Returns a read only view of the bars, oldest first, with the columns in COLUMNS
+        """
+        view = self._data[self._start:self._start + self._size]
+        view.flags.writeable = False
+        return view
+
+    def to_pandas(self) -> pd.DataFrame:
+        """
+        Returns the bars as a DataFrame built on the array view, indexed by the bars open time
+        """
+        array = self.to_array()
+        df = pd.DataFrame(array[:, self.OPEN:], columns=self.COLUMNS[self.OPEN:], copy=False)
+        df.index = pd.to_datetime(array[:, self.TIMESTAMP], unit="s")
+        df.index.name = "timestamp"
+        return df
+
+    def _bar_slot(self, timestamp: float, price: float) -> Optional[int]:
+        """
+        Returns the slot of the bar containing the timestamp, appending the bars up to it if it is after the last bar
+        """
+        bar_timestamp = math.floor(timestamp / self._interval) * self._interval
+        if self._size == 0:
+            return self._append_bar(bar_timestamp, price)
+        last_bar_timestamp = self._data[self._start + self._size - 1, self.TIMESTAMP]
+        bars_after_last = int(round((bar_timestamp - last_bar_timestamp) / self._interval))
+        if bars_after_last <= 0:
+            bars_before_last = -bars_after_last
+            if bars_before_last >= self._size:
+                return None
+            return (self._start + self._size - 1 - bars_before_last) % self._capacity
+        # Fill the intervals without trades nor mid prices with the previous close
+        last_close = self.last_close
+        for missing_bar in range(max(1, bars_after_last - self._capacity), bars_after_last):
+            self._append_bar(last_bar_timestamp + missing_bar * self._interval, last_close)
+        return self._append_bar(bar_timestamp, price)
+
+    def _append_bar(self, bar_timestamp: float, price: float) -> int:
+        if self._size < self._capacity:
+            slot = self._start + self._size
+            self._size += 1
+        else:
+            slot = self._start
+            self._start = (self._start + 1) % self._capacity
+        slot %= self._capacity
+        bar = self._data[slot]
+        bar[self.TIMESTAMP] = bar_timestamp
+        bar[self.OPEN:self.CLOSE + 1] = price
+        bar[self.VOLUME] = 0
+        bar[self.TRADES] = 0
+        self._data[slot + self._capacity] = bar
+        return slot
@@ -5,4 +5,4 @@ cdef class CompositeOrderBook(OrderBook):
     cdef:
         OrderBook _traded_order_book
 
-    cdef double c_get_price(self, bint is_buy) except? -1
+    cdef c_remove_stale_traded_entries(self)
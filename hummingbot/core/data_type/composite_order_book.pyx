@@ -5,6 +5,7 @@ from typing import Iterator
 
 from cython.operator cimport address as ref, dereference as deref, postincrement as inc
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from libc.stdint cimport int64_t
 from libcpp.set cimport set
 from libcpp.vector cimport vector
 
@@ -15,7 +16,10 @@ cdef class CompositeOrderBook(OrderBook):
     """
     Record orders that are bought during back testing and used to simulate order book consumption without modifying
     the actual order book.
-    Override the order book bid_entries, ask_entries methods to return the composite order book entries
+
+    The filled amounts are kept in the traded order book, an overlay deducted from the order book levels by all the
+    queries (bid_entries, ask_entries, prices and volumes queries). An overlay level is cleared as soon as the
+    underlying order book level changes, or is removed from the book.
     """
     def __init__(self, order_book: OrderBook = None):
         super().__init__()
@@ -31,164 +35,76 @@ cdef class CompositeOrderBook(OrderBook):
 
     def record_filled_order(self, order_fill_event):
         cdef:
-            vector[OrderBookEntry] cpp_bids
-            vector[OrderBookEntry] cpp_asks
-            set[OrderBookEntry].reverse_iterator bid_order_it = self._traded_order_book._bid_book.rbegin()
-            set[OrderBookEntry].iterator ask_order_it = self._traded_order_book._ask_book.begin()
-            OrderBookEntry entry
-
-        price = order_fill_event.price
-        amount = float(order_fill_event.amount)
-        timestamp = order_fill_event.timestamp
-
-        if order_fill_event.trade_type is TradeType.BUY:
-            while ask_order_it != self._traded_order_book._ask_book.end():
-                entry = deref(ask_order_it)
-                # price is in the order book, sum the amount
-                if entry.getPrice() == price:
-                    amount += entry.getAmount()
-                    break
-                # price is outside of the ask price range, break and insert the new filled ask order into the ask book
-                elif entry.getPrice() > price:
-                    break
-                # price is further up the ask price range, continue searching
-                elif entry.getPrice() < price:
-                    inc(ask_order_it)
-            cpp_asks.push_back(OrderBookEntry(price, amount, timestamp))
-
-        elif order_fill_event.trade_type is TradeType.SELL:
-            while bid_order_it != self._traded_order_book._bid_book.rend():
-                entry = deref(bid_order_it)
-                if entry.getPrice() == price:
-                    amount += entry.getAmount()
-                    break
-                # price is further down the bid price range, continue searching
-                elif entry.getPrice() > price:
-                    inc(bid_order_it)
-                # price is outside of the bid price range, break and insert the new filled order into the bid book
-                elif entry.getPrice() < price:
-                    break
-            cpp_bids.push_back(OrderBookEntry(price, amount, timestamp))
-
-        self._traded_order_book.c_apply_diffs(cpp_bids, cpp_asks, timestamp)
+            bint is_buy = order_fill_event.trade_type is TradeType.BUY
+            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
+            set[OrderBookEntry] *traded_book = (ref(self._traded_order_book._ask_book) if is_buy
+                                                else ref(self._traded_order_book._bid_book))
+            set[OrderBookEntry].iterator level_it
+            set[OrderBookEntry].iterator traded_it
+            OrderBookEntry entry = OrderBookEntry(order_fill_event.price,
+                                                  float(order_fill_event.amount),
+                                                  int(order_fill_event.timestamp))
+            double amount = entry.getAmount()
+
+        if order_fill_event.trade_type not in (TradeType.BUY, TradeType.SELL):
+            return
+        # The level is not in the book anymore, there is nothing to deduct the fill from
+        level_it = deref(book).find(entry)
+        if level_it == deref(book).end():
+            return
+        traded_it = deref(traded_book).find(entry)
+        if traded_it != deref(traded_book).end():
+            amount += deref(traded_it).getAmount()
+            deref(traded_book).erase(traded_it)
+        # The level can't be consumed by more than its amount
+        amount = min(amount, deref(level_it).getAmount())
+        deref(traded_book).insert(OrderBookEntry(entry.getPrice(), amount, entry.getUpdateId()))
 
     def original_bid_entries(self) -> Iterator[OrderBookRow]:
-        return super().bid_entries()
+        return self._level_entries(True, False)
 
     def original_ask_entries(self) -> Iterator[OrderBookRow]:
-        return super().ask_entries()
+        return self._level_entries(False, False)
 
-    def bid_entries(self) -> Iterator[OrderBookRow]:
+    cdef set[OrderBookEntry] *c_consumed_levels(self, bint is_bid):
         cdef:
-            set[OrderBookEntry].reverse_iterator order_it = self._bid_book.rbegin()
-            set[OrderBookEntry].reverse_iterator traded_order_it = self._traded_order_book._bid_book.rbegin()
-            OrderBookEntry traded_order_entry
-            OrderBookEntry original_order_entry
-            vector[OrderBookEntry] cpp_asks_changes
-            vector[OrderBookEntry] cpp_bids_changes
-
-        while order_it != self._bid_book.rend():
-            original_order_entry = deref(order_it)
-            original_order_price = original_order_entry.getPrice()
-            original_order_amount = original_order_entry.getAmount()
-            original_order_update_id = original_order_entry.getUpdateId()
-
-            while traded_order_it != self._traded_order_book._bid_book.rend():
-                traded_order_entry = deref(traded_order_it)
-                traded_order_price = traded_order_entry.getPrice()
-                traded_order_amount = traded_order_entry.getAmount()
-                traded_order_update_id = traded_order_entry.getUpdateId()
-
-                # Found matching price for the recorded filled order, return composite order book row
-                if traded_order_price == original_order_price:
-                    composite_amount = original_order_amount - traded_order_amount
-                    if composite_amount > 0:
-                        yield OrderBookRow(original_order_price, composite_amount, original_order_update_id)
-                    else:
-                        cpp_bids_changes.push_back(OrderBookEntry(original_order_price,
-                                                                  min(original_order_amount, traded_order_amount),
-                                                                  traded_order_update_id))
-                    inc(traded_order_it)
-                    # continue to next original order book row
-                    break
-                # Recorded filled order price is outside of the bid price range
-                elif traded_order_price > original_order_price:
-                    # Remove the recorded entry and increment the pointer
-                    cpp_bids_changes.push_back(OrderBookEntry(traded_order_price, 0, traded_order_update_id))
-                    inc(traded_order_it)
-                # Recorded filled order price is within lower end of the bid price range, yield original bid entry
-                elif traded_order_price < original_order_price:
-                    yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
-                    break
-            else:
-                yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
+            set[OrderBookEntry] *traded_book = (ref(self._traded_order_book._bid_book) if is_bid
+                                                else ref(self._traded_order_book._ask_book))
+        return traded_book if deref(traded_book).size() > 0 else NULL
 
-            inc(order_it)
-
-        self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
-
-    def ask_entries(self) -> Iterator[OrderBookRow]:
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        cdef:
+            size_t i
+        OrderBook.c_apply_diffs(self, bids, asks, update_id)
+        if self._traded_order_book._bid_book.size() == 0 and self._traded_order_book._ask_book.size() == 0:
+            return
+        # The fills recorded on the levels that changed are not deducted anymore
+        for i in range(bids.size()):
+            self._traded_order_book._bid_book.erase(bids[i])
+        for i in range(asks.size()):
+            self._traded_order_book._ask_book.erase(asks[i])
+        self.c_remove_stale_traded_entries()
+
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        OrderBook.c_apply_snapshot(self, bids, asks, update_id)
+        self.clear_traded_order_book()
+
+    cdef c_remove_stale_traded_entries(self):
+        """
+        Removes the recorded fills of levels no longer in the order book (removed by the overlapping entries
+        truncation or the depth limit)
+        """
         cdef:
-            set[OrderBookEntry].iterator order_it = self._ask_book.begin()
-            set[OrderBookEntry].iterator traded_order_it = self._traded_order_book._ask_book.begin()
-            OrderBookEntry original_order_entry
-            OrderBookEntry traded_order_entry
-            vector[OrderBookEntry] cpp_asks_changes
-            vector[OrderBookEntry] cpp_bids_changes
-
-        while order_it != self._ask_book.end():
-            original_order_entry = deref(order_it)
-            original_order_price = original_order_entry.getPrice()
-            original_order_amount = original_order_entry.getAmount()
-            original_order_update_id = original_order_entry.getUpdateId()
-
-            while traded_order_it != self._traded_order_book._ask_book.end():
-                traded_order_entry = deref(traded_order_it)
-                traded_order_price = traded_order_entry.getPrice()
-                traded_order_amount = traded_order_entry.getAmount()
-                traded_order_update_id = traded_order_entry.getUpdateId()
-
-                if traded_order_price == original_order_price:
-                    composite_amount = original_order_amount - traded_order_amount
-                    if composite_amount > 0:
-                        yield OrderBookRow(original_order_price, composite_amount, original_order_update_id)
-                    else:
-                        cpp_asks_changes.push_back(OrderBookEntry(original_order_price,
-                                                                  min(original_order_amount, traded_order_amount),
-                                                                  traded_order_update_id))
-                    inc(traded_order_it)
-                    # continue to next original order book row
-                    break
-                # Recorded filled order price is within upper end of the ask price range, yield original ask entry
-                elif traded_order_price > original_order_price:
-                    yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
-                    break
-                # Recorded filled order price is outside of the ask price range, remove the recorded ask order
-                elif traded_order_price < original_order_price:
-                    cpp_asks_changes.push_back(OrderBookEntry(traded_order_price, 0, traded_order_update_id))
-                    inc(traded_order_it)
+            set[OrderBookEntry].iterator it = self._traded_order_book._bid_book.begin()
 
+        while it != self._traded_order_book._bid_book.end():
+            if self._bid_book.find(deref(it)) == self._bid_book.end():
+                it = self._traded_order_book._bid_book.erase(it)
             else:
-                yield OrderBookRow(original_order_price, original_order_amount, original_order_update_id)
-
-            inc(order_it)
-
-        self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
-
-    cdef double c_get_price(self, bint is_buy) except? -1:
-        cdef:
-            set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
-        if deref(book).size() < 1:
-            raise EnvironmentError("Order book is empty - no price quote is possible.")
-
-        ask_it = self.ask_entries()
-        bid_it = self.bid_entries()
-        try:
-            if is_buy:
-                best_ask = next(ask_it)
-                return best_ask.price
+                inc(it)
+        it = self._traded_order_book._ask_book.begin()
+        while it != self._traded_order_book._ask_book.end():
+            if self._ask_book.find(deref(it)) == self._ask_book.end():
+                it = self._traded_order_book._ask_book.erase(it)
             else:
-                best_bid = next(bid_it)
-                return best_bid.price
-        except Exception:
-            raise
+                inc(it)
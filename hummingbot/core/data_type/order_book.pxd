@@ -20,16 +20,37 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef int64_t _max_depth
+    cdef double _max_distance_from_mid
+    cdef double _bid_pruned_price
+    cdef double _ask_pruned_price
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_trade(self, object trade_event)
+    cdef c_apply_trades(self, list trade_events)
+    cdef c_prepare_batch_event(self, int64_t event_tag, object arg)
+    cdef c_apply_deep_levels(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks)
+    cdef c_prune_levels(self)
+    cdef bint c_is_depth_incomplete(self)
     cdef c_apply_numpy_diffs(self,
                              np.ndarray[np.float64_t, ndim=2] bids_array,
                              np.ndarray[np.float64_t, ndim=2] asks_array)
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
                                 np.ndarray[np.float64_t, ndim=2] asks_array)
+    cdef int64_t c_fill_entries_array(self,
+                                      bint is_bid,
+                                      np.ndarray[np.float64_t, ndim=2] entries_array,
+                                      int64_t levels) except -1
+    cdef list c_simulate(self, bint is_buy, double amount)
+    cdef set[OrderBookEntry] *c_consumed_levels(self, bint is_bid)
+    cdef set[OrderBookEntry].iterator c_first_level_iterator(self, bint is_bid)
+    cdef bint c_next_level(self,
+                           bint is_bid,
+                           set[OrderBookEntry].iterator *it,
+                           set[OrderBookEntry] *consumed_levels,
+                           OrderBookEntry *level)
     cdef double c_get_price(self, bint is_buy) except? -1
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
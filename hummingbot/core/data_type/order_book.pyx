@@ -19,6 +19,7 @@ from cython.operator cimport(
     address as ref,
     dereference as deref,
     postincrement as inc,
+    predecrement as dec,
 )
 
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
@@ -35,10 +36,14 @@ cimport numpy as np
 
 ob_logger = None
 NaN = float("nan")
+cdef double INF = float("inf")
 
 
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    # Depth limited books keep up to this multiple of the configured depth (or distance from mid), so that levels
+    # removed from the top of the book don't immediately require a new snapshot
+    DEPTH_LIMIT_HEADROOM = 2
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -47,7 +52,14 @@ cdef class OrderBook(PubSub):
             ob_logger = logging.getLogger(__name__)
         return ob_logger
 
-    def __init__(self, dex=False):
+    def __init__(self, dex=False, max_depth: int = 0, max_distance_from_mid: float = 0):
+        """
+        :param dex: True if the order book belongs to a decentralized exchange
+        :param max_depth: if greater than 0, the number of price levels per side the book guarantees to keep. Levels
+        further away are discarded
+        :param max_distance_from_mid: if greater than 0, the distance from the mid price (as a fraction of the mid
+        price) of the levels the book guarantees to keep. Levels further away are discarded
+        """
         super().__init__()
         self._snapshot_uid = 0
         self._last_diff_uid = 0
@@ -56,6 +68,10 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._max_depth = max_depth
+        self._max_distance_from_mid = max_distance_from_mid
+        self._bid_pruned_price = -INF
+        self._ask_pruned_price = INF
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -67,14 +83,18 @@ cdef class OrderBook(PubSub):
             OrderBookEntry top_bid
             OrderBookEntry top_ask
 
-        # Apply the diffs. Diffs with 0 amounts mean deletion.
+        # Apply the diffs. Diffs with 0 amounts mean deletion. Diffs for levels in the discarded range are ignored.
         for bid in bids:
+            if bid.getPrice() <= self._bid_pruned_price:
+                continue
             result = self._bid_book.find(bid)
             if result != bid_book_end:
                 self._bid_book.erase(result)
             if bid.getAmount() > 0:
                 self._bid_book.insert(bid)
         for ask in asks:
+            if ask.getPrice() >= self._ask_pruned_price:
+                continue
             result = self._ask_book.find(ask)
             if result != ask_book_end:
                 self._ask_book.erase(result)
@@ -94,6 +114,9 @@ cdef class OrderBook(PubSub):
             top_ask = deref(ask_iterator)
             self._best_ask = top_ask.getPrice()
 
+        if self._max_depth > 0 or self._max_distance_from_mid > 0:
+            self.c_prune_levels()
+
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
 
@@ -109,6 +132,8 @@ cdef class OrderBook(PubSub):
         # Start with an empty order book, and then insert all entries.
         self._bid_book.clear()
         self._ask_book.clear()
+        self._bid_pruned_price = -INF
+        self._ask_pruned_price = INF
         for bid in bids:
             self._bid_book.insert(bid)
             if not (bid.getPrice() <= best_bid_price):
@@ -134,14 +159,119 @@ cdef class OrderBook(PubSub):
         self._best_bid = best_bid_price
         self._best_ask = best_ask_price
 
+        if self._max_depth > 0 or self._max_distance_from_mid > 0:
+            self.c_prune_levels()
+
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
 
+    cdef c_apply_deep_levels(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks):
+        """
+        Fills the levels discarded by the depth limits from a snapshot. Only the levels of the discarded range are
+        taken, the levels closer to the mid price are kept as the diffs left them.
+        """
+        cdef:
+            double bid_pruned_price = self._bid_pruned_price
+            double ask_pruned_price = self._ask_pruned_price
+            set[OrderBookEntry].iterator result
+
+        for bid in bids:
+            if bid.getPrice() > bid_pruned_price:
+                continue
+            result = self._bid_book.find(bid)
+            if result != self._bid_book.end():
+                self._bid_book.erase(result)
+            if bid.getAmount() > 0:
+                self._bid_book.insert(bid)
+        for ask in asks:
+            if ask.getPrice() < ask_pruned_price:
+                continue
+            result = self._ask_book.find(ask)
+            if result != self._ask_book.end():
+                self._ask_book.erase(result)
+            if ask.getAmount() > 0:
+                self._ask_book.insert(ask)
+
+        # The refilled levels are the best ones when a whole side had been discarded
+        if self._bid_book.size() > 0:
+            self._best_bid = deref(self._bid_book.rbegin()).getPrice()
+        if self._ask_book.size() > 0:
+            self._best_ask = deref(self._ask_book.begin()).getPrice()
+
+        self._bid_pruned_price = -INF
+        self._ask_pruned_price = INF
+        if self._max_depth > 0 or self._max_distance_from_mid > 0:
+            self.c_prune_levels()
+
+    cdef c_prune_levels(self):
+        """
+        Discards the levels beyond the depth limits, remembering the best discarded price of each side. The book has
+        no information about the levels beyond that price until the next snapshot.
+        """
+        cdef:
+            size_t max_levels = <size_t>(self._max_depth * self.DEPTH_LIMIT_HEADROOM)
+            double distance = self._max_distance_from_mid * self.DEPTH_LIMIT_HEADROOM
+            double mid_price
+            double min_bid_price = -INF
+            double max_ask_price = INF
+            set[OrderBookEntry].iterator it
+
+        if self._max_distance_from_mid > 0 and self._bid_book.size() > 0 and self._ask_book.size() > 0:
+            mid_price = (deref(self._bid_book.rbegin()).getPrice() + deref(self._ask_book.begin()).getPrice()) / 2
+            min_bid_price = mid_price * (1 - distance)
+            max_ask_price = mid_price * (1 + distance)
+
+        while self._bid_book.size() > 0 and (
+                (self._max_depth > 0 and self._bid_book.size() > max_levels)
+                or deref(self._bid_book.begin()).getPrice() < min_bid_price):
+            it = self._bid_book.begin()
+            self._bid_pruned_price = max(self._bid_pruned_price, deref(it).getPrice())
+            self._bid_book.erase(it)
+        while self._ask_book.size() > 0 and (
+                (self._max_depth > 0 and self._ask_book.size() > max_levels)
+                or deref(self._ask_book.rbegin()).getPrice() > max_ask_price):
+            it = self._ask_book.end()
+            dec(it)
+            self._ask_pruned_price = min(self._ask_pruned_price, deref(it).getPrice())
+            self._ask_book.erase(it)
+
+    cdef bint c_is_depth_incomplete(self):
+        cdef:
+            double mid_price
+            bint bids_pruned = self._bid_pruned_price > -INF
+            bint asks_pruned = self._ask_pruned_price < INF
+
+        if (bids_pruned and self._bid_book.size() == 0) or (asks_pruned and self._ask_book.size() == 0):
+            return True
+        if self._max_depth > 0:
+            if ((bids_pruned and self._bid_book.size() < <size_t>self._max_depth)
+                    or (asks_pruned and self._ask_book.size() < <size_t>self._max_depth)):
+                return True
+        if self._max_distance_from_mid > 0 and self._bid_book.size() > 0 and self._ask_book.size() > 0:
+            mid_price = (deref(self._bid_book.rbegin()).getPrice() + deref(self._ask_book.begin()).getPrice()) / 2
+            if (self._bid_pruned_price >= mid_price * (1 - self._max_distance_from_mid)
+                    or self._ask_pruned_price <= mid_price * (1 + self._max_distance_from_mid)):
+                return True
+        return False
+
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
         self._last_applied_trade = time.perf_counter()
         self.c_trigger_event(self.ORDER_BOOK_TRADE_EVENT_TAG, trade_event)
 
+    cdef c_apply_trades(self, list trade_events):
+        if len(trade_events) == 0:
+            return
+        self._last_applied_trade = time.perf_counter()
+        self.c_trigger_events(self.ORDER_BOOK_TRADE_EVENT_TAG, trade_events)
+        self._last_trade_price = trade_events[-1].price
+
+    cdef c_prepare_batch_event(self, int64_t event_tag, object arg):
+        # Listeners processing a batch of trades see the last trade price of the trade they process, as with
+        # c_apply_trade
+        if event_tag == self.ORDER_BOOK_TRADE_EVENT_TAG:
+            self._last_trade_price = arg.price
+
     @property
     def last_trade_price(self) -> float:
         return self._last_trade_price
@@ -162,6 +292,22 @@ cdef class OrderBook(PubSub):
     def last_trade_price_rest_updated(self, value: float):
         self._last_trade_price_rest_updated = value
 
+    @property
+    def max_depth(self) -> int:
+        return self._max_depth
+
+    @property
+    def max_distance_from_mid(self) -> float:
+        return self._max_distance_from_mid
+
+    @property
+    def depth_incomplete(self) -> bool:
+        """
+        True when levels discarded by the depth limits are back within the guaranteed depth (because the levels
+        closer to the mid price were removed or the price moved). A new snapshot is required to fill the book again.
+        """
+        return self.c_is_depth_incomplete()
+
     @property
     def snapshot_uid(self) -> int:
         return self._snapshot_uid
@@ -172,10 +318,8 @@ cdef class OrderBook(PubSub):
 
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
+        bids_df = pd.DataFrame(data=self.bids_array(), columns=OrderBookRow._fields, dtype="float64")
+        asks_df = pd.DataFrame(data=self.asks_array(), columns=OrderBookRow._fields, dtype="float64")
         return bids_df, asks_df
 
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
@@ -198,9 +342,26 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
 
+    def apply_deep_levels(self, bids: List[OrderBookRow], asks: List[OrderBookRow]):
+        cdef:
+            vector[OrderBookEntry] cpp_bids
+            vector[OrderBookEntry] cpp_asks
+        for row in bids:
+            cpp_bids.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
+        for row in asks:
+            cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
+        self.c_apply_deep_levels(cpp_bids, cpp_asks)
+
     def apply_trade(self, trade: OrderBookTradeEvent):
         self.c_apply_trade(trade)
 
+    def apply_trades(self, trades: List[OrderBookTradeEvent]):
+        """
+        Applies several trades in order, delivered to each listener as one batch. The listeners see the last trade
+        price of the trade they process
+        """
+        self.c_apply_trades(list(trades))
+
     def apply_pandas_diffs(self, bids_df: pd.DataFrame, asks_df: pd.DataFrame):
         """
         The diffs data frame must have 3 columns, [price, amount, update_id], and a UNIX timestamp index.
@@ -264,57 +425,165 @@ cdef class OrderBook(PubSub):
         self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
-        cdef:
-            set[OrderBookEntry].reverse_iterator it = self._bid_book.rbegin()
-            OrderBookEntry entry
-        while it != self._bid_book.rend():
-            entry = deref(it)
-            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
-            inc(it)
+        return self._level_entries(True, True)
 
     def ask_entries(self) -> Iterator[OrderBookRow]:
+        return self._level_entries(False, True)
+
+    def _level_entries(self, bint is_bid, bint deduct_consumed_levels) -> Iterator[OrderBookRow]:
         cdef:
-            set[OrderBookEntry].iterator it = self._ask_book.begin()
+            set[OrderBookEntry].iterator it = self.c_first_level_iterator(is_bid)
+            set[OrderBookEntry] *consumed_levels = self.c_consumed_levels(is_bid) if deduct_consumed_levels else NULL
+            OrderBookEntry level
+        while self.c_next_level(is_bid, &it, consumed_levels, &level):
+            yield OrderBookRow(level.getPrice(), level.getAmount(), level.getUpdateId())
+
+    cdef set[OrderBookEntry] *c_consumed_levels(self, bint is_bid):
+        """
+        Levels (price and amount) of the side already consumed by simulated fills, to deduct from the book levels in
+        all the queries. NULL if there are none, which is always the case for a plain order book
+        (see CompositeOrderBook).
+        """
+        return NULL
+
+    cdef set[OrderBookEntry].iterator c_first_level_iterator(self, bint is_bid):
+        """
+        Iterator to pass to c_next_level to walk the side from the best level
+        """
+        return self._bid_book.end() if is_bid else self._ask_book.begin()
+
+    cdef bint c_next_level(self,
+                           bint is_bid,
+                           set[OrderBookEntry].iterator *it,
+                           set[OrderBookEntry] *consumed_levels,
+                           OrderBookEntry *level):
+        """
+        Moves `it` to the next level of the side, best first, and stores the level in `level`, with the amount in
+        `consumed_levels` deducted. Fully consumed levels are skipped.
+        Returns False when there are no more levels.
+        """
+        cdef:
+            set[OrderBookEntry] *book = ref(self._bid_book) if is_bid else ref(self._ask_book)
+            set[OrderBookEntry].iterator consumed_it
             OrderBookEntry entry
-        while it != self._ask_book.end():
-            entry = deref(it)
-            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
-            inc(it)
+            double amount
+
+        while True:
+            if is_bid:
+                if it[0] == deref(book).begin():
+                    return False
+                dec(it[0])
+                entry = deref(it[0])
+            else:
+                if it[0] == deref(book).end():
+                    return False
+                entry = deref(it[0])
+                inc(it[0])
+            amount = entry.getAmount()
+            if consumed_levels != NULL:
+                consumed_it = deref(consumed_levels).find(entry)
+                if consumed_it != deref(consumed_levels).end():
+                    amount -= deref(consumed_it).getAmount()
+                    if amount <= 0:
+                        continue
+            level[0] = OrderBookEntry(entry.getPrice(), amount, entry.getUpdateId())
+            return True
+
+    def bids_array(self, levels: int = 0, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Exports the bid levels, best first, as an array with the [price, amount, update_id] columns (the format
+        expected by apply_numpy_snapshot) without creating an OrderBookRow per level.
+
+        :param levels: the maximum number of levels to export. 0 exports all the levels (or as many as fit in `out`)
+        :param out: optional preallocated float64 C-contiguous array with 3 columns to fill, to avoid allocating a new
+        array on every call
+        :return: the filled rows (a view of `out` when it is provided)
+        """
+        return self._export_entries(True, levels, out)
+
+    def asks_array(self, levels: int = 0, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Exports the ask levels, best first, as an array with the [price, amount, update_id] columns.
+        See bids_array for the parameters.
+        """
+        return self._export_entries(False, levels, out)
+
+    def _export_entries(self, is_bid: bool, levels: int, out: Optional[np.ndarray]) -> np.ndarray:
+        cdef:
+            int64_t book_size = self._bid_book.size() if is_bid else self._ask_book.size()
+            int64_t rows_count = book_size if levels <= 0 else min(levels, book_size)
+        if out is None:
+            out = np.empty((rows_count, 3), dtype=np.float64)
+        elif out.ndim != 2 or out.shape[1] != 3:
+            raise ValueError(f"The output array must have 3 columns (price, amount, update_id). Got {out.shape}.")
+        elif levels <= 0:
+            rows_count = min(rows_count, out.shape[0])
+        rows_count = self.c_fill_entries_array(is_bid, out, rows_count)
+        return out[:rows_count]
+
+    cdef int64_t c_fill_entries_array(self,
+                                      bint is_bid,
+                                      np.ndarray[np.float64_t, ndim=2] entries_array,
+                                      int64_t levels) except -1:
+        """
+        Fills the first rows of entries_array with up to `levels` levels of one side of the book, best first.
+        Returns the number of rows filled.
+        """
+        cdef:
+            set[OrderBookEntry].iterator it = self.c_first_level_iterator(is_bid)
+            set[OrderBookEntry] *consumed_levels = self.c_consumed_levels(is_bid)
+            OrderBookEntry level
+            int64_t rows_count = 0
+
+        levels = min(levels, entries_array.shape[0])
+        while rows_count < levels and self.c_next_level(is_bid, &it, consumed_levels, &level):
+            entries_array[rows_count, 0] = level.getPrice()
+            entries_array[rows_count, 1] = level.getAmount()
+            entries_array[rows_count, 2] = level.getUpdateId()
+            rows_count += 1
+        return rows_count
 
     def simulate_buy(self, amount: float) -> List[OrderBookRow]:
-        amount_left = amount
-        retval = []
-        for ask_entry in self.ask_entries():
-            ask_entry = ask_entry
-            if ask_entry.amount < amount_left:
-                retval.append(ask_entry)
-                amount_left -= ask_entry.amount
-            else:
-                retval.append(OrderBookRow(ask_entry.price, amount_left, ask_entry.update_id))
-                amount_left = 0.0
-                break
-        return retval
+        return self.c_simulate(True, amount)
 
     def simulate_sell(self, amount: float) -> List[OrderBookRow]:
-        amount_left = amount
-        retval = []
-        for bid_entry in self.bid_entries():
-            bid_entry = bid_entry
-            if bid_entry.amount < amount_left:
-                retval.append(bid_entry)
-                amount_left -= bid_entry.amount
+        return self.c_simulate(False, amount)
+
+    cdef list c_simulate(self, bint is_buy, double amount):
+        """
+        Returns the levels (with the amount taken from the last one) a market order of `amount` would fill.
+        Only the rows of the levels consumed are created.
+        """
+        cdef:
+            set[OrderBookEntry].iterator it = self.c_first_level_iterator(not is_buy)
+            set[OrderBookEntry] *consumed_levels = self.c_consumed_levels(not is_buy)
+            OrderBookEntry level
+            double amount_left = amount
+            list retval = []
+
+        while self.c_next_level(not is_buy, &it, consumed_levels, &level):
+            if level.getAmount() < amount_left:
+                retval.append(OrderBookRow(level.getPrice(), level.getAmount(), level.getUpdateId()))
+                amount_left -= level.getAmount()
             else:
-                retval.append(OrderBookRow(bid_entry.price, amount_left, bid_entry.update_id))
-                amount_left = 0.0
+                retval.append(OrderBookRow(level.getPrice(), amount_left, level.getUpdateId()))
                 break
         return retval
 
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
             set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
+            set[OrderBookEntry] *consumed_levels = self.c_consumed_levels(not is_buy)
+            set[OrderBookEntry].iterator it
+            OrderBookEntry level
         if deref(book).size() < 1:
             raise EnvironmentError("Order book is empty - no price quote is possible.")
-        return self._best_ask if is_buy else self._best_bid
+        if consumed_levels == NULL:
+            return self._best_ask if is_buy else self._best_bid
+        it = self.c_first_level_iterator(not is_buy)
+        if not self.c_next_level(not is_buy, &it, consumed_levels, &level):
+            raise EnvironmentError("Order book is empty - no price quote is possible.")
+        return level.getPrice()
 
     def get_price(self, is_buy: bool) -> float:
         return self.c_get_price(is_buy)
@@ -323,19 +592,15 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount
-                if cumulative_volume >= volume:
-                    result_price = order_book_row.price
-                    break
+            set[OrderBookEntry].iterator it = self.c_first_level_iterator(not is_buy)
+            set[OrderBookEntry] *consumed_levels = self.c_consumed_levels(not is_buy)
+            OrderBookEntry level
+
+        while self.c_next_level(not is_buy, &it, consumed_levels, &level):
+            cumulative_volume += level.getAmount()
+            if cumulative_volume >= volume:
+                result_price = level.getPrice()
+                break
 
         return OrderBookQueryResult(NaN, volume, result_price, min(cumulative_volume, volume))
 
@@ -344,30 +609,18 @@ cdef class OrderBook(PubSub):
             double total_cost = 0
             double total_volume = 0
             double result_vwap = NaN
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                total_cost += order_book_row.amount * order_book_row.price
-                total_volume += order_book_row.amount
-                if total_volume >= volume:
-                    total_cost -= order_book_row.amount * order_book_row.price
-                    total_volume -= order_book_row.amount
-                    incremental_amount = volume - total_volume
-                    total_cost += incremental_amount * order_book_row.price
-                    total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
-                    break
+            set[OrderBookEntry].iterator it = self.c_first_level_iterator(not is_buy)
+            set[OrderBookEntry] *consumed_levels = self.c_consumed_levels(not is_buy)
+            OrderBookEntry level
+
+        while self.c_next_level(not is_buy, &it, consumed_levels, &level):
+            if total_volume + level.getAmount() >= volume:
+                total_cost += (volume - total_volume) * level.getPrice()
+                total_volume = volume
+                result_vwap = total_cost / total_volume
+                break
+            total_cost += level.getAmount() * level.getPrice()
+            total_volume += level.getAmount()
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
 
@@ -375,19 +628,15 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                if cumulative_volume >= quote_volume:
-                    result_price = order_book_row.price
-                    break
+            set[OrderBookEntry].iterator it = self.c_first_level_iterator(not is_buy)
+            set[OrderBookEntry] *consumed_levels = self.c_consumed_levels(not is_buy)
+            OrderBookEntry level
+
+        while self.c_next_level(not is_buy, &it, consumed_levels, &level):
+            cumulative_volume += level.getAmount() * level.getPrice()
+            if cumulative_volume >= quote_volume:
+                result_price = level.getPrice()
+                break
 
         return OrderBookQueryResult(NaN, quote_volume, result_price, min(cumulative_volume, quote_volume))
 
@@ -396,25 +645,18 @@ cdef class OrderBook(PubSub):
             double cumulative_volume = 0
             double cumulative_base_amount = 0
             double row_amount = 0
-
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
-        else:
-            for order_book_row in self.bid_entries():
-                row_amount = order_book_row.amount
-                if row_amount + cumulative_base_amount >= base_amount:
-                    row_amount = base_amount - cumulative_base_amount
-                cumulative_base_amount += row_amount
-                cumulative_volume += row_amount * order_book_row.price
-                if cumulative_base_amount >= base_amount:
-                    break
+            set[OrderBookEntry].iterator it = self.c_first_level_iterator(not is_buy)
+            set[OrderBookEntry] *consumed_levels = self.c_consumed_levels(not is_buy)
+            OrderBookEntry level
+
+        while self.c_next_level(not is_buy, &it, consumed_levels, &level):
+            row_amount = level.getAmount()
+            if row_amount + cumulative_base_amount >= base_amount:
+                row_amount = base_amount - cumulative_base_amount
+            cumulative_base_amount += row_amount
+            cumulative_volume += row_amount * level.getPrice()
+            if cumulative_base_amount >= base_amount:
+                break
 
         return OrderBookQueryResult(NaN, base_amount, NaN, cumulative_volume)
 
@@ -422,19 +664,15 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
+            set[OrderBookEntry].iterator it = self.c_first_level_iterator(not is_buy)
+            set[OrderBookEntry] *consumed_levels = self.c_consumed_levels(not is_buy)
+            OrderBookEntry level
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount
-                result_price = order_book_row.price
+        while self.c_next_level(not is_buy, &it, consumed_levels, &level):
+            if (is_buy and level.getPrice() > price) or (not is_buy and level.getPrice() < price):
+                break
+            cumulative_volume += level.getAmount()
+            result_price = level.getPrice()
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
@@ -442,19 +680,15 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
+            set[OrderBookEntry].iterator it = self.c_first_level_iterator(not is_buy)
+            set[OrderBookEntry] *consumed_levels = self.c_consumed_levels(not is_buy)
+            OrderBookEntry level
 
-        if is_buy:
-            for order_book_row in self.ask_entries():
-                if order_book_row.price > price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
-        else:
-            for order_book_row in self.bid_entries():
-                if order_book_row.price < price:
-                    break
-                cumulative_volume += order_book_row.amount * order_book_row.price
-                result_price = order_book_row.price
+        while self.c_next_level(not is_buy, &it, consumed_levels, &level):
+            if (is_buy and level.getPrice() > price) or (not is_buy and level.getPrice() < price):
+                break
+            cumulative_volume += level.getAmount() * level.getPrice()
+            result_price = level.getPrice()
 
         return OrderBookQueryResult(price, NaN, result_price, cumulative_volume)
 
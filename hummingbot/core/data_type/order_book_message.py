@@ -52,6 +52,14 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
     def trading_pair(self) -> str:
         return self.content["trading_pair"]
 
+    @property
+    def exchange_timestamp(self) -> Optional[float]:
+        """
+        The time (in seconds) the exchange generated the event, if the exchange provides it. Unlike `timestamp`, that
+        is usually the local time the message was parsed, it can be used to measure the exchange to client latency.
+        """
+        return self.content.get("exchange_timestamp")
+
     @property
     def asks(self) -> List[OrderBookRow]:
         return [
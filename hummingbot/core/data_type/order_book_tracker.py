@@ -3,16 +3,20 @@ import logging
 import time
 from collections import defaultdict, deque
 from enum import Enum
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import Callable, Deque, Dict, List, Optional, Tuple
 
 import pandas as pd
 
+from hummingbot.core.data_type.candles import Candles
 from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.trade_tape import TradeTape
 from hummingbot.core.event.events import OrderBookTradeEvent
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
 from hummingbot.logger import HummingbotLogger
 
 
@@ -21,8 +25,32 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
+class OrderBookMessageDispatcher:
+    """
+    Queue like output for the data source listeners. Each message put in the dispatcher is processed immediately by
+    the callback, instead of being stored for a router task.
+    """
+
+    def __init__(self, callback: Callable[[OrderBookMessage], None]):
+        self._callback = callback
+
+    def put_nowait(self, message: OrderBookMessage):
+        self._callback(message)
+
+    async def put(self, message: OrderBookMessage):
+        self._callback(message)
+
+
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    INIT_ORDER_BOOK_RETRY_INTERVAL: float = 5.0
+    RESYNC_BUFFER_SIZE: int = 1000
+    RESYNC_RETRY_INTERVAL: float = 1.0
+    EXCHANGE_TO_RECEIVE_LATENCY = "exchange_to_receive"
+    RECEIVE_TO_APPLY_LATENCY = "receive_to_apply"
+    TRADE_TAPE_CAPACITY: int = 10000
+    CANDLES_CAPACITY: int = 1000
+    CANDLES_MID_PRICE_SAMPLING_INTERVAL: float = 1.0
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -36,6 +64,8 @@ class OrderBookTracker:
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._order_book_initialized_events: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
+        self._initialized_order_books_count: int = 0
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
@@ -45,6 +75,19 @@ class OrderBookTracker:
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._resync_diffs_buffers: Dict[str, Deque[OrderBookMessage]] = {}
+        self._resync_tasks: Dict[str, asyncio.Task] = {}
+        self._depth_refill_diffs_buffers: Dict[str, Deque[OrderBookMessage]] = {}
+        self._depth_refill_tasks: Dict[str, asyncio.Task] = {}
+        self._sequence_gap_counts: Dict[str, int] = defaultdict(int)
+        self._resync_counts: Dict[str, int] = defaultdict(int)
+        self._depth_refill_counts: Dict[str, int] = defaultdict(int)
+        self._trade_tapes: Dict[str, TradeTape] = {}
+        self._candles: Dict[str, Dict[float, Candles]] = defaultdict(dict)
+        self._latency_histograms: Dict[str, LatencyHistogram] = {
+            self.EXCHANGE_TO_RECEIVE_LATENCY: LatencyHistogram(),
+            self.RECEIVE_TO_APPLY_LATENCY: LatencyHistogram(),
+        }
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -54,6 +97,7 @@ class OrderBookTracker:
         self._order_book_diff_router_task: Optional[asyncio.Task] = None
         self._order_book_snapshot_router_task: Optional[asyncio.Task] = None
         self._update_last_trade_prices_task: Optional[asyncio.Task] = None
+        self._update_candles_task: Optional[asyncio.Task] = None
         self._order_book_stream_listener_task: Optional[asyncio.Task] = None
 
     @property
@@ -64,10 +108,111 @@ class OrderBookTracker:
     def order_books(self) -> Dict[str, OrderBook]:
         return self._order_books
 
+    @property
+    def trade_tapes(self) -> Dict[str, TradeTape]:
+        """
+        The recent public trades of each trading pair, with rolling aggregates (VWAP, volume, imbalance)
+        """
+        return self._trade_tapes
+
+    def get_trade_tape(self, trading_pair: str) -> TradeTape:
+        trade_tape = self._trade_tapes.get(trading_pair)
+        if trade_tape is None:
+            trade_tape = TradeTape(trading_pair=trading_pair, capacity=self.TRADE_TAPE_CAPACITY)
+            self._trade_tapes[trading_pair] = trade_tape
+        return trade_tape
+
+    def get_candles(self, trading_pair: str, interval: float) -> Candles:
+        """
+        Returns the OHLCV bars of the trading pair for the interval. The bars are built from the moment they are first
+        requested, and shared by all the callers requesting the same interval.
+
+        :param trading_pair: the trading pair
+        :param interval: the bars length in seconds
+        """
+        candles = self._candles[trading_pair].get(interval)
+        if candles is None:
+            candles = Candles(trading_pair=trading_pair, interval=interval, capacity=self.CANDLES_CAPACITY)
+            self._candles[trading_pair][interval] = candles
+        return candles
+
     @property
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def ready_trading_pairs(self) -> List[str]:
+        """
+        The trading pairs whose order book is already initialized and tracked. Order books are initialized
+        concurrently, so strategies can operate on these pairs before the tracker is ready for all of them.
+        """
+        return [trading_pair for trading_pair in self._trading_pairs if self.is_order_book_ready(trading_pair)]
+
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        initialized_event = self._order_book_initialized_events.get(trading_pair)
+        return initialized_event is not None and initialized_event.is_set()
+
+    async def wait_for_order_book(self, trading_pair: str) -> OrderBook:
+        """
+        Waits until the order book of the trading pair is initialized and returns it.
+
+        :param trading_pair: the trading pair of the order book
+        """
+        await self._order_book_initialized_events[trading_pair].wait()
+        return self._order_books[trading_pair]
+
+    @property
+    def sequence_gap_counts(self) -> Dict[str, int]:
+        """
+        Number of gaps detected in the diff messages update ids sequence, per trading pair
+        """
+        return dict(self._sequence_gap_counts)
+
+    @property
+    def resync_counts(self) -> Dict[str, int]:
+        """
+        Number of times the order book of each trading pair was rebuilt from a snapshot after a sequence gap
+        """
+        return dict(self._resync_counts)
+
+    @property
+    def depth_refill_counts(self) -> Dict[str, int]:
+        """
+        Number of snapshots requested for each depth limited order book because levels it had discarded came back
+        within its guaranteed depth
+        """
+        return dict(self._depth_refill_counts)
+
+    @property
+    def latency_histograms(self) -> Dict[str, LatencyHistogram]:
+        """
+        Latency histograms of the order book diff messages processed through direct dispatch:
+        - exchange_to_receive: from the exchange event time to the moment the tracker receives the parsed message.
+        Only the messages carrying the exchange event time (`OrderBookMessage.exchange_timestamp`) are recorded, so
+        it stays empty for connectors streaming full order book snapshots instead of diffs (e.g. Bitmart, Huobi, LBank)
+        and for diffs the exchange sends without an event time
+        - receive_to_apply: from the moment the tracker receives the message until it is applied to the order book
+        """
+        return self._latency_histograms
+
+    @property
+    def uses_direct_dispatch(self) -> bool:
+        """
+        Messages are applied to the order books as soon as the data source parses them, without going through the
+        router tasks and the per trading pair queues. Trackers that customize the routing or the tracking of the
+        messages keep the queues based pipeline.
+        """
+        tracker_class = type(self)
+        return (tracker_class._order_book_diff_router is OrderBookTracker._order_book_diff_router
+                and tracker_class._order_book_snapshot_router is OrderBookTracker._order_book_snapshot_router
+                and tracker_class._track_single_book is OrderBookTracker._track_single_book)
+
+    def is_order_book_resyncing(self, trading_pair: str) -> bool:
+        return trading_pair in self._resync_diffs_buffers
+
+    def is_order_book_refilling_depth(self, trading_pair: str) -> bool:
+        return trading_pair in self._depth_refill_diffs_buffers
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -83,27 +228,36 @@ class OrderBookTracker:
         self._emit_trade_event_task = safe_ensure_future(
             self._emit_trade_event_loop()
         )
+        if self.uses_direct_dispatch:
+            diff_output = OrderBookMessageDispatcher(self._dispatch_diff_message)
+            snapshot_output = OrderBookMessageDispatcher(self._dispatch_snapshot_message)
+        else:
+            diff_output = self._order_book_diff_stream
+            snapshot_output = self._order_book_snapshot_stream
+            self._order_book_diff_router_task = safe_ensure_future(
+                self._order_book_diff_router()
+            )
+            self._order_book_snapshot_router_task = safe_ensure_future(
+                self._order_book_snapshot_router()
+            )
         self._order_book_diff_listener_task = safe_ensure_future(
-            self._data_source.listen_for_order_book_diffs(self._ev_loop, self._order_book_diff_stream)
+            self._data_source.listen_for_order_book_diffs(self._ev_loop, diff_output)
         )
         self._order_book_trade_listener_task = safe_ensure_future(
             self._data_source.listen_for_trades(self._ev_loop, self._order_book_trade_stream)
         )
         self._order_book_snapshot_listener_task = safe_ensure_future(
-            self._data_source.listen_for_order_book_snapshots(self._ev_loop, self._order_book_snapshot_stream)
+            self._data_source.listen_for_order_book_snapshots(self._ev_loop, snapshot_output)
         )
         self._order_book_stream_listener_task = safe_ensure_future(
             self._data_source.listen_for_subscriptions()
         )
-        self._order_book_diff_router_task = safe_ensure_future(
-            self._order_book_diff_router()
-        )
-        self._order_book_snapshot_router_task = safe_ensure_future(
-            self._order_book_snapshot_router()
-        )
         self._update_last_trade_prices_task = safe_ensure_future(
             self._update_last_trade_prices_loop()
         )
+        self._update_candles_task = safe_ensure_future(
+            self._update_candles_loop()
+        )
 
     def stop(self):
         if self._init_order_books_task is not None:
@@ -131,25 +285,38 @@ class OrderBookTracker:
         if self._update_last_trade_prices_task is not None:
             self._update_last_trade_prices_task.cancel()
             self._update_last_trade_prices_task = None
+        if self._update_candles_task is not None:
+            self._update_candles_task.cancel()
+            self._update_candles_task = None
         if self._order_book_stream_listener_task is not None:
             self._order_book_stream_listener_task.cancel()
         if len(self._tracking_tasks) > 0:
             for _, task in self._tracking_tasks.items():
                 task.cancel()
             self._tracking_tasks.clear()
+        for task in self._resync_tasks.values():
+            task.cancel()
+        self._resync_tasks.clear()
+        self._resync_diffs_buffers.clear()
+        for task in self._depth_refill_tasks.values():
+            task.cancel()
+        self._depth_refill_tasks.clear()
+        self._depth_refill_diffs_buffers.clear()
         self._order_books_initialized.clear()
+        self._order_book_initialized_events.clear()
+        self._initialized_order_books_count = 0
 
     async def _update_last_trade_prices_loop(self):
         '''
         Updates last trade price for all order books through REST API, it is to initiate last_trade_price and as
         fall-back mechanism for when the web socket update channel fails.
         '''
-        await self._order_books_initialized.wait()
         while True:
             try:
+                now = time.perf_counter()
                 outdateds = [t_pair for t_pair, o_book in self._order_books.items()
-                             if o_book.last_applied_trade < time.perf_counter() - (60. * 3)
-                             and o_book.last_trade_price_rest_updated < time.perf_counter() - 5]
+                             if o_book.last_applied_trade < now - (60. * 3)
+                             and o_book.last_trade_price_rest_updated < now - 5]
                 if outdateds:
                     args = {"trading_pairs": outdateds}
                     if self._domain is not None:
@@ -158,29 +325,86 @@ class OrderBookTracker:
                     for trading_pair, last_price in last_prices.items():
                         self._order_books[trading_pair].last_trade_price = last_price
                         self._order_books[trading_pair].last_trade_price_rest_updated = time.perf_counter()
-                else:
-                    await asyncio.sleep(1)
+                # Pairs without price in the response are requested again in the next iteration, not immediately
+                await asyncio.sleep(1)
             except asyncio.CancelledError:
                 raise
             except Exception:
                 self.logger().network("Unexpected error while fetching last trade price.", exc_info=True)
                 await asyncio.sleep(30)
 
+    def _update_candles_mid_prices(self, timestamp: float):
+        for trading_pair, pair_candles in self._candles.items():
+            if len(pair_candles) == 0 or not self.is_order_book_ready(trading_pair):
+                continue
+            order_book = self._order_books[trading_pair]
+            try:
+                mid_price = (order_book.get_price(True) + order_book.get_price(False)) / 2
+            except EnvironmentError:
+                # No mid price while one side of the order book is empty
+                continue
+            for candles in pair_candles.values():
+                candles.add_mid_price(timestamp, mid_price)
+
+    async def _update_candles_loop(self):
+        """
+        Samples the mid prices used for the candles intervals without trades
+        """
+        while True:
+            try:
+                self._update_candles_mid_prices(time.time())
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().exception("Unexpected error updating candles mid prices.")
+            await self._sleep(self.CANDLES_MID_PRICE_SAMPLING_INTERVAL)
+
     async def _initial_order_book_for_trading_pair(self, trading_pair: str) -> OrderBook:
         return await self._data_source.get_new_order_book(trading_pair)
 
     async def _init_order_books(self):
         """
-        Initialize order books
+        Initialize order books. The snapshots are requested concurrently, up to the data source
+        `max_concurrent_snapshot_requests` at a time, and the connector throttler spaces the requests according to the
+        exchange rate limits. Each order book is tracked as soon as its snapshot is received.
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
+        snapshot_requests_semaphore = asyncio.Semaphore(self._data_source.max_concurrent_snapshot_requests)
+        await safe_gather(*[
+            self._init_order_book(trading_pair, snapshot_requests_semaphore)
+            for trading_pair in self._trading_pairs
+        ])
+        self._order_books_initialized.set()
+
+    async def _init_order_book(self, trading_pair: str, snapshot_requests_semaphore: asyncio.Semaphore):
+        while True:
+            try:
+                async with snapshot_requests_semaphore:
+                    order_book = await self._initial_order_book_for_trading_pair(trading_pair)
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error initializing order book for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg=f"Could not initialize order book for {trading_pair}. "
+                                    f"Retrying after {self.INIT_ORDER_BOOK_RETRY_INTERVAL} seconds."
+                )
+                await self._sleep(self.INIT_ORDER_BOOK_RETRY_INTERVAL)
+
+        self._order_books[trading_pair] = order_book
+        if self.uses_direct_dispatch:
+            self._process_saved_messages(trading_pair)
+        else:
             self._tracking_message_queues[trading_pair] = asyncio.Queue()
             self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await asyncio.sleep(1)
-        self._order_books_initialized.set()
+        self._order_book_initialized_events[trading_pair].set()
+        self._initialized_order_books_count += 1
+        self.logger().info(f"Initialized order book for {trading_pair}. "
+                           f"{self._initialized_order_books_count}/{len(self._trading_pairs)} completed.")
+
+    async def _sleep(self, delay: float):
+        await asyncio.sleep(delay)
 
     async def _order_book_diff_router(self):
         """
@@ -235,7 +459,6 @@ class OrderBookTracker:
         """
         Route the real-time order book snapshot messages to the correct order book.
         """
-        await self._order_books_initialized.wait()
         while True:
             try:
                 ob_message: OrderBookMessage = await self._order_book_snapshot_stream.get()
@@ -251,10 +474,7 @@ class OrderBookTracker:
                 await asyncio.sleep(5.0)
 
     async def _track_single_book(self, trading_pair: str):
-        past_diffs_window = self._past_diffs_windows[trading_pair]
-
         message_queue: asyncio.Queue = self._tracking_message_queues[trading_pair]
-        order_book: OrderBook = self._order_books[trading_pair]
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
 
@@ -268,9 +488,9 @@ class OrderBookTracker:
                 else:
                     message = await message_queue.get()
 
+                self._process_order_book_message(trading_pair, message)
+
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
-                    past_diffs_window.append(message)
                     diff_messages_accepted += 1
 
                     # Output some statistics periodically.
@@ -279,10 +499,6 @@ class OrderBookTracker:
                         self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}.")
                         diff_messages_accepted = 0
                     last_message_timestamp = now
-                elif message.type is OrderBookMessageType.SNAPSHOT:
-                    past_diffs: List[OrderBookMessage] = list(past_diffs_window)
-                    order_book.restore_from_snapshot_and_diffs(message, past_diffs)
-                    self.logger().debug(f"Processed order book snapshot for {trading_pair}.")
             except asyncio.CancelledError:
                 raise
             except Exception:
@@ -293,31 +509,209 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    def _process_order_book_message(self, trading_pair: str, message: OrderBookMessage):
+        order_book: OrderBook = self._order_books[trading_pair]
+        if message.type is OrderBookMessageType.DIFF:
+            if self.is_order_book_resyncing(trading_pair):
+                self._resync_diffs_buffers[trading_pair].append(message)
+            elif self._is_sequence_gap(order_book, message):
+                self._on_sequence_gap(trading_pair, [message])
+            else:
+                order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                self._past_diffs_windows[trading_pair].append(message)
+                if self.is_order_book_refilling_depth(trading_pair):
+                    self._depth_refill_diffs_buffers[trading_pair].append(message)
+                elif order_book.depth_incomplete:
+                    # Levels discarded by the book depth limits are needed again
+                    self._depth_refill_counts[trading_pair] += 1
+                    self.logger().debug(f"Order book for {trading_pair} is missing levels beyond its depth limit. "
+                                        f"Requesting a new snapshot.")
+                    self._start_depth_refill(trading_pair)
+        elif message.type is OrderBookMessageType.SNAPSHOT and self.is_order_book_resyncing(trading_pair):
+            self._complete_order_book_resync(trading_pair, order_book, message)
+        elif message.type is OrderBookMessageType.SNAPSHOT and self.is_order_book_refilling_depth(trading_pair):
+            self._complete_depth_refill(trading_pair, order_book, message)
+        elif message.type is OrderBookMessageType.SNAPSHOT:
+            past_diffs: List[OrderBookMessage] = list(self._past_diffs_windows[trading_pair])
+            order_book.restore_from_snapshot_and_diffs(message, past_diffs)
+            self.logger().debug(f"Processed order book snapshot for {trading_pair}.")
+
+    def _dispatch_diff_message(self, message: OrderBookMessage):
+        receive_timestamp = time.time()
+        receive_counter = time.perf_counter()
+        trading_pair: str = message.trading_pair
+        try:
+            order_book: Optional[OrderBook] = self._order_books.get(trading_pair)
+            if order_book is None:
+                # Save diff messages received before snapshots are ready
+                self._saved_message_queues[trading_pair].append(message)
+                return
+            if order_book.snapshot_uid > message.update_id:
+                return
+            self._process_order_book_message(trading_pair, message)
+            exchange_timestamp: Optional[float] = message.exchange_timestamp
+            if exchange_timestamp is not None:
+                # Messages without exchange event time are not recorded, their timestamp is the local parsing time
+                self._latency_histograms[self.EXCHANGE_TO_RECEIVE_LATENCY].record(
+                    receive_timestamp - exchange_timestamp)
+            self._latency_histograms[self.RECEIVE_TO_APPLY_LATENCY].record(time.perf_counter() - receive_counter)
+        except Exception:
+            self.logger().network(
+                f"Unexpected error processing order book diff for {trading_pair}.",
+                exc_info=True,
+                app_warning_msg=f"Unexpected error processing order book diff for {trading_pair}."
+            )
+
+    def _dispatch_snapshot_message(self, message: OrderBookMessage):
+        trading_pair: str = message.trading_pair
+        if trading_pair not in self._order_books:
+            return
+        try:
+            self._process_order_book_message(trading_pair, message)
+        except Exception:
+            self.logger().network(
+                f"Unexpected error processing order book snapshot for {trading_pair}.",
+                exc_info=True,
+                app_warning_msg=f"Unexpected error processing order book snapshot for {trading_pair}."
+            )
+
+    def _process_saved_messages(self, trading_pair: str):
+        saved_messages: Deque[OrderBookMessage] = self._saved_message_queues[trading_pair]
+        while len(saved_messages) > 0:
+            self._dispatch_diff_message(saved_messages.popleft())
+
+    @staticmethod
+    def _is_sequence_gap(order_book: OrderBook, message: OrderBookMessage) -> bool:
+        """
+        Checks the continuity of a diff message with the order book content. Only diff messages that explicitly
+        include the first update id (exchanges with contiguous update ids) can be checked.
+        """
+        return OrderBookTracker._is_sequence_gap_after(
+            max(order_book.snapshot_uid, order_book.last_diff_uid), message)
+
+    @staticmethod
+    def _is_sequence_gap_after(last_update_id: int, message: OrderBookMessage) -> bool:
+        return "first_update_id" in message.content and message.first_update_id > last_update_id + 1
+
+    def _on_sequence_gap(self, trading_pair: str, pending_diffs: List[OrderBookMessage], delay: float = 0):
+        self._sequence_gap_counts[trading_pair] += 1
+        self.logger().warning(f"Order book update ids gap detected for {trading_pair} (next update id "
+                              f"{pending_diffs[0].first_update_id}). Requesting a new snapshot.")
+        self._start_order_book_resync(trading_pair, pending_diffs, delay)
+
+    def _start_order_book_resync(self, trading_pair: str, pending_diffs: List[OrderBookMessage], delay: float = 0):
+        # The book is restored from the snapshot, including the levels beyond the depth limits
+        self._cancel_depth_refill(trading_pair)
+        self._resync_diffs_buffers[trading_pair] = deque(pending_diffs, maxlen=self.RESYNC_BUFFER_SIZE)
+        self._resync_tasks[trading_pair] = safe_ensure_future(self._request_resync_snapshot(trading_pair, delay))
+
+    def _complete_order_book_resync(self, trading_pair: str, order_book: OrderBook, snapshot: OrderBookMessage):
+        resync_task = self._resync_tasks.pop(trading_pair, None)
+        if resync_task is not None:
+            resync_task.cancel()
+        replayed_diffs: List[OrderBookMessage] = sorted(
+            (diff for diff in self._resync_diffs_buffers.pop(trading_pair) if diff.update_id > snapshot.update_id),
+            key=lambda diff: diff.update_id)
+        order_book.restore_from_snapshot_and_diffs(snapshot, replayed_diffs)
+        past_diffs_window = self._past_diffs_windows[trading_pair]
+        past_diffs_window.clear()
+        past_diffs_window.extend(replayed_diffs)
+
+        if len(replayed_diffs) > 0 and self._is_sequence_gap_after(snapshot.update_id, replayed_diffs[0]):
+            # The snapshot is older than the first buffered diff, the book is still missing updates
+            self._on_sequence_gap(trading_pair, replayed_diffs, delay=self.RESYNC_RETRY_INTERVAL)
+        else:
+            self._resync_counts[trading_pair] += 1
+            self.logger().info(f"Order book for {trading_pair} resynchronized from snapshot {snapshot.update_id}.")
+
+    def _start_depth_refill(self, trading_pair: str):
+        # The diffs keep being applied while the snapshot is requested, they are only kept to update the deep levels
+        # taken from the snapshot
+        self._depth_refill_diffs_buffers[trading_pair] = deque(maxlen=self.RESYNC_BUFFER_SIZE)
+        self._depth_refill_tasks[trading_pair] = safe_ensure_future(self._request_resync_snapshot(trading_pair, 0))
+
+    def _cancel_depth_refill(self, trading_pair: str):
+        refill_task = self._depth_refill_tasks.pop(trading_pair, None)
+        if refill_task is not None:
+            refill_task.cancel()
+        self._depth_refill_diffs_buffers.pop(trading_pair, None)
+
+    def _complete_depth_refill(self, trading_pair: str, order_book: OrderBook, snapshot: OrderBookMessage):
+        newer_diffs: List[OrderBookMessage] = sorted(
+            (diff for diff in self._depth_refill_diffs_buffers[trading_pair] if diff.update_id > snapshot.update_id),
+            key=lambda diff: diff.update_id)
+        self._cancel_depth_refill(trading_pair)
+        bids: Dict[float, OrderBookRow] = {row.price: row for row in snapshot.bids}
+        asks: Dict[float, OrderBookRow] = {row.price: row for row in snapshot.asks}
+        for diff in newer_diffs:
+            bids.update((row.price, row) for row in diff.bids)
+            asks.update((row.price, row) for row in diff.asks)
+        order_book.apply_deep_levels(list(bids.values()), list(asks.values()))
+        self.logger().debug(f"Order book for {trading_pair} levels beyond its depth limit refilled from snapshot "
+                            f"{snapshot.update_id}.")
+
+    async def _request_resync_snapshot(self, trading_pair: str, delay: float):
+        if delay > 0:
+            await self._sleep(delay)
+        while True:
+            try:
+                snapshot: OrderBookMessage = await self._data_source.get_order_book_snapshot(trading_pair)
+                if self.uses_direct_dispatch:
+                    self._dispatch_snapshot_message(snapshot)
+                else:
+                    await self._tracking_message_queues[trading_pair].put(snapshot)
+                break
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    f"Unexpected error requesting order book snapshot for {trading_pair}.",
+                    exc_info=True,
+                    app_warning_msg=f"Could not resynchronize order book for {trading_pair}. "
+                                    f"Retrying after {self.INIT_ORDER_BOOK_RETRY_INTERVAL} seconds."
+                )
+                await self._sleep(self.INIT_ORDER_BOOK_RETRY_INTERVAL)
+
+    def _apply_trades(self, trading_pair: str, trades: List[OrderBookTradeEvent]):
+        """
+        Records the trades of a trading pair in its trade tape and candles, and applies them to its order book
+        """
+        trade_tape = self.get_trade_tape(trading_pair)
+        pair_candles = self._candles.get(trading_pair, {}).values()
+        for trade in trades:
+            trade_tape.append(trade.timestamp, trade.price, trade.amount, trade.type)
+            for candles in pair_candles:
+                candles.add_trade(trade.timestamp, trade.price, trade.amount)
+        self._order_books[trading_pair].apply_trades(trades)
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
         messages_rejected: int = 0
-        await self._order_books_initialized.wait()
         while True:
             try:
-                trade_message: OrderBookMessage = await self._order_book_trade_stream.get()
-                trading_pair: str = trade_message.trading_pair
-
-                if trading_pair not in self._order_books:
-                    messages_rejected += 1
-                    continue
-
-                order_book: OrderBook = self._order_books[trading_pair]
-                order_book.apply_trade(OrderBookTradeEvent(
-                    trading_pair=trade_message.trading_pair,
-                    timestamp=trade_message.timestamp,
-                    price=float(trade_message.content["price"]),
-                    amount=float(trade_message.content["amount"]),
-                    type=TradeType.SELL if
-                    trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
-                ))
-
-                messages_accepted += 1
+                trade_messages: List[OrderBookMessage] = [await self._order_book_trade_stream.get()]
+                # Apply all the trades already queued together, with a single call per order book
+                while not self._order_book_trade_stream.empty():
+                    trade_messages.append(self._order_book_trade_stream.get_nowait())
+
+                trades_by_pair: Dict[str, List[OrderBookTradeEvent]] = defaultdict(list)
+                for trade_message in trade_messages:
+                    if trade_message.trading_pair not in self._order_books:
+                        messages_rejected += 1
+                        continue
+                    trades_by_pair[trade_message.trading_pair].append(OrderBookTradeEvent(
+                        trading_pair=trade_message.trading_pair,
+                        timestamp=trade_message.timestamp,
+                        price=float(trade_message.content["price"]),
+                        amount=float(trade_message.content["amount"]),
+                        type=TradeType.SELL if
+                        trade_message.content["trade_type"] == float(TradeType.SELL.value) else TradeType.BUY
+                    ))
+                    messages_accepted += 1
+
+                for trading_pair, trades in trades_by_pair.items():
+                    self._apply_trades(trading_pair, trades)
 
                 # Log some statistics.
                 now: float = time.time()
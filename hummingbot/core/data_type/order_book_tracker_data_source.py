@@ -5,14 +5,18 @@ from abc import ABCMeta, abstractmethod
 from collections import defaultdict
 from typing import Any, Callable, Dict, List, Optional
 
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 from hummingbot.logger import HummingbotLogger
 
 
 class OrderBookTrackerDataSource(metaclass=ABCMeta):
     FULL_ORDER_BOOK_RESET_DELTA_SECONDS = 60 * 60
+    MAX_CONCURRENT_SNAPSHOT_REQUESTS = 10
+    SNAPSHOT_THROTTLER_LIMIT_ID: Optional[str] = None
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -39,6 +43,18 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
     def order_book_create_function(self, func: Callable[[], OrderBook]):
         self._order_book_create_function = func
 
+    @property
+    def max_concurrent_snapshot_requests(self) -> int:
+        """
+        The number of order book snapshots requested at the same time. Data sources defining the throttler limit of
+        the snapshot requests derive it from the exchange rate limits, the others use MAX_CONCURRENT_SNAPSHOT_REQUESTS.
+        """
+        throttler = self._snapshot_requests_throttler()
+        concurrent_requests = None
+        if throttler is not None and self.SNAPSHOT_THROTTLER_LIMIT_ID is not None:
+            concurrent_requests = throttler.max_concurrent_tasks(limit_id=self.SNAPSHOT_THROTTLER_LIMIT_ID)
+        return concurrent_requests or self.MAX_CONCURRENT_SNAPSHOT_REQUESTS
+
     @abstractmethod
     async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
         """
@@ -67,6 +83,16 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
         return order_book
 
+    async def get_order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        """
+        Requests the current order book of a particular trading pair to the exchange
+
+        :param trading_pair: the trading pair for which the order book snapshot has to be retrieved
+
+        :return: a snapshot message with the current order book content in the exchange
+        """
+        return await self._order_book_snapshot(trading_pair=trading_pair)
+
     async def listen_for_subscriptions(self):
         """
         Connects to the trade events and order diffs websocket endpoints and listens to the messages sent by the
@@ -152,15 +178,28 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
             except Exception:
                 self.logger().exception("Unexpected error when processing public trade updates from exchange")
 
+    def _snapshot_requests_throttler(self) -> Optional[AsyncThrottlerBase]:
+        """
+        The throttler applying the SNAPSHOT_THROTTLER_LIMIT_ID limit to the order book snapshot requests, if any.
+        """
+        return None
+
     async def _request_order_book_snapshots(self, output: asyncio.Queue):
-        for trading_pair in self._trading_pairs:
+        snapshot_requests_semaphore = asyncio.Semaphore(self.max_concurrent_snapshot_requests)
+
+        async def request_snapshot(trading_pair: str):
             try:
-                snapshot = await self._order_book_snapshot(trading_pair=trading_pair)
+                async with snapshot_requests_semaphore:
+                    snapshot = await self._order_book_snapshot(trading_pair=trading_pair)
                 output.put_nowait(snapshot)
+            except asyncio.CancelledError:
+                raise
             except Exception:
                 self.logger().exception(f"Unexpected error fetching order book snapshot for {trading_pair}.")
                 raise
 
+        await safe_gather(*[request_snapshot(trading_pair) for trading_pair in self._trading_pairs])
+
     async def _parse_trade_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
         """
         Create an instance of OrderBookMessage of type OrderBookMessageType.TRADE
@@ -0,0 +1,274 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+import time
+import weakref
+from collections import defaultdict
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+from typing import Callable, Dict, List, Optional, Tuple
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.shared_order_book import SharedTopOfBook, SharedTopOfBookBuffer
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import OrderBookEvent, OrderBookTradeEvent
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+OrderBookTrackerFactory = Callable[[List[str]], OrderBookTracker]
+
+
+class ShardedOrderBookTracker(OrderBookTracker):
+    """
+    Order book tracker that runs the order books tracking (websocket messages parsing, diffs and snapshots processing)
+    in worker processes, so that the feed volume does not compete with the strategies for the main event loop.
+
+    The trading pairs are split in shards, each tracked by one worker process with the tracker created by
+    `tracker_factory`. The workers publish the top `depth` levels of each book to shared memory, and this tracker
+    keeps an `OrderBook` per trading pair in the main process refreshed from it, so the order books offer the same API
+    as the ones from a local tracker. The order books are refreshed when they are accessed, and periodically to
+    detect the initialized ones. `get_top_of_book` reads the published levels without going through an order book.
+
+    The workers forward the order book trades to the main process, where they are recorded in the trade tapes and
+    candles and delivered to the order books trade listeners.
+    """
+    SYNC_INTERVAL: float = 0.05
+    PUBLISH_INTERVAL: float = 0.01
+    WORKER_STOP_TIMEOUT: float = 5.0
+    _sobt_logger: Optional[HummingbotLogger] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._sobt_logger is None:
+            cls._sobt_logger = logging.getLogger(__name__)
+        return cls._sobt_logger
+
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 tracker_factory: OrderBookTrackerFactory,
+                 shards: int = 1,
+                 depth: int = 20,
+                 domain: Optional[str] = None):
+        """
+        :param data_source: the data source of the connector in the main process, used for REST requests only
+        :param trading_pairs: the trading pairs to track
+        :param tracker_factory: picklable callable creating, in the worker process, the tracker for a list of pairs
+        :param shards: number of worker processes
+        :param depth: number of levels per side published by the workers
+        :param domain: the connector domain
+        """
+        super().__init__(data_source=data_source, trading_pairs=trading_pairs, domain=domain)
+        self._tracker_factory: OrderBookTrackerFactory = tracker_factory
+        self._shards_count: int = max(1, min(shards, len(trading_pairs)))
+        self._depth: int = depth
+        self._buffers: List[SharedTopOfBookBuffer] = []
+        self._worker_processes: List[BaseProcess] = []
+        self._synced_sequences: Dict[str, int] = {}
+        self._synced_generations: List[int] = []
+        self._trading_pairs_buffers: Dict[str, SharedTopOfBookBuffer] = {}
+        self._trades_reader_threads: List[threading.Thread] = []
+        self._sync_order_books_task: Optional[asyncio.Task] = None
+
+    @property
+    def worker_processes(self) -> List[BaseProcess]:
+        return self._worker_processes
+
+    @property
+    def order_books(self) -> Dict[str, OrderBook]:
+        self._sync_order_books()
+        return self._order_books
+
+    def get_top_of_book(self, trading_pair: str) -> Optional[SharedTopOfBook]:
+        """
+        Returns the levels last published by the worker tracking the trading pair, read from the shared memory, or
+        None if they were not published yet
+        """
+        buffer: Optional[SharedTopOfBookBuffer] = self._trading_pairs_buffers.get(trading_pair)
+        return buffer.read(trading_pair) if buffer is not None else None
+
+    def start(self):
+        self.stop()
+        context = multiprocessing.get_context("spawn")
+        for shard_trading_pairs in self._shard_trading_pairs():
+            buffer = SharedTopOfBookBuffer(trading_pairs=shard_trading_pairs, depth=self._depth, create=True)
+            # One pipe per worker, a worker terminated while sending trades can not block the other ones
+            trades_receiver, trades_sender = context.Pipe(duplex=False)
+            process = context.Process(
+                target=run_order_book_tracker_worker,
+                args=(self._tracker_factory,
+                      shard_trading_pairs,
+                      buffer.name,
+                      self._depth,
+                      self.PUBLISH_INTERVAL,
+                      trades_sender),
+                daemon=True)
+            process.start()
+            # The worker holds the only sending end, the reader gets EOF when the worker is gone
+            trades_sender.close()
+            reader_thread = threading.Thread(target=self._read_forwarded_trades,
+                                             args=(trades_receiver, self._ev_loop),
+                                             name="order-book-trades-reader",
+                                             daemon=True)
+            reader_thread.start()
+            self._buffers.append(buffer)
+            self._trading_pairs_buffers.update((trading_pair, buffer) for trading_pair in shard_trading_pairs)
+            self._synced_generations.append(0)
+            self._worker_processes.append(process)
+            self._trades_reader_threads.append(reader_thread)
+        self._sync_order_books_task = safe_ensure_future(self._sync_order_books_loop())
+        self._update_candles_task = safe_ensure_future(self._update_candles_loop())
+
+    def stop(self):
+        if self._sync_order_books_task is not None:
+            self._sync_order_books_task.cancel()
+            self._sync_order_books_task = None
+        for process in self._worker_processes:
+            process.terminate()
+            process.join(self.WORKER_STOP_TIMEOUT)
+        self._worker_processes.clear()
+        for reader_thread in self._trades_reader_threads:
+            reader_thread.join(self.WORKER_STOP_TIMEOUT)
+        self._trades_reader_threads.clear()
+        for buffer in self._buffers:
+            buffer.close()
+            buffer.unlink()
+        self._buffers.clear()
+        self._trading_pairs_buffers.clear()
+        self._synced_sequences.clear()
+        self._synced_generations.clear()
+        super().stop()
+
+    def _shard_trading_pairs(self) -> List[List[str]]:
+        return [shard for shard in (self._trading_pairs[i::self._shards_count] for i in range(self._shards_count))
+                if len(shard) > 0]
+
+    def _sync_order_books(self):
+        """
+        Refreshes the main process order books with the levels published by the workers since the last sync. The
+        shards without new publications are skipped, and only the order books published again are rebuilt.
+        """
+        for shard, buffer in enumerate(self._buffers):
+            generation = buffer.generation
+            if generation == self._synced_generations[shard]:
+                continue
+            # Publications made while the shard is synced increase the generation again, they are synced next time
+            self._synced_generations[shard] = generation
+            for trading_pair in buffer.trading_pairs:
+                if buffer.sequence(trading_pair) == self._synced_sequences.get(trading_pair):
+                    continue
+                top_of_book = buffer.read(trading_pair)
+                if top_of_book is None:
+                    continue
+                order_book: Optional[OrderBook] = self._order_books.get(trading_pair)
+                if order_book is None:
+                    order_book = self._data_source.order_book_create_function()
+                    self._order_books[trading_pair] = order_book
+                order_book.apply_numpy_snapshot(top_of_book.bids, top_of_book.asks)
+                order_book.last_trade_price = top_of_book.last_trade_price
+                self._synced_sequences[trading_pair] = top_of_book.sequence
+                if not self.is_order_book_ready(trading_pair):
+                    self._order_book_initialized_events[trading_pair].set()
+                    self._initialized_order_books_count += 1
+                    self.logger().info(f"Initialized order book for {trading_pair}. "
+                                       f"{self._initialized_order_books_count}/{len(self._trading_pairs)} completed.")
+        if not self.ready and self._initialized_order_books_count == len(self._trading_pairs):
+            self._order_books_initialized.set()
+
+    def _read_forwarded_trades(self, trades_receiver: Connection, ev_loop: asyncio.AbstractEventLoop):
+        try:
+            while True:
+                try:
+                    trades: List[OrderBookTradeEvent] = trades_receiver.recv()
+                except (EOFError, OSError):
+                    # The worker process is gone
+                    break
+                try:
+                    ev_loop.call_soon_threadsafe(self._apply_forwarded_trades, trades)
+                except RuntimeError:
+                    # The event loop has been closed
+                    break
+        finally:
+            trades_receiver.close()
+
+    def _apply_forwarded_trades(self, trades: List[OrderBookTradeEvent]):
+        trades_by_pair: Dict[str, List[OrderBookTradeEvent]] = defaultdict(list)
+        for trade in trades:
+            trades_by_pair[trade.trading_pair].append(trade)
+        # The order books include the levels published with the trades
+        self._sync_order_books()
+        for trading_pair, pair_trades in trades_by_pair.items():
+            if trading_pair in self._order_books:
+                self._apply_trades(trading_pair, pair_trades)
+
+    async def _sync_order_books_loop(self):
+        while True:
+            try:
+                self._sync_order_books()
+                await self._sleep(self.SYNC_INTERVAL)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network(
+                    "Unexpected error synchronizing order books from the tracking workers.",
+                    exc_info=True,
+                    app_warning_msg="Unexpected error synchronizing order books. Retrying after 5 seconds."
+                )
+                await self._sleep(5.0)
+
+
+def run_order_book_tracker_worker(tracker_factory: OrderBookTrackerFactory,
+                                  trading_pairs: List[str],
+                                  buffer_name: str,
+                                  depth: int,
+                                  publish_interval: float,
+                                  trades_sender: Connection):
+    """
+    Entry point of the order book tracking worker processes
+    """
+    buffer = SharedTopOfBookBuffer(trading_pairs=trading_pairs, depth=depth, name=buffer_name)
+    try:
+        asyncio.get_event_loop().run_until_complete(
+            _publish_order_books(tracker_factory, trading_pairs, buffer, publish_interval, trades_sender))
+    finally:
+        trades_sender.close()
+        buffer.close()
+
+
+async def _publish_order_books(tracker_factory: OrderBookTrackerFactory,
+                               trading_pairs: List[str],
+                               buffer: SharedTopOfBookBuffer,
+                               publish_interval: float,
+                               trades_sender: Connection):
+    tracker: OrderBookTracker = tracker_factory(trading_pairs)
+    tracker.start()
+    published_states: Dict[str, Tuple] = {}
+    trades: List[OrderBookTradeEvent] = []
+    trade_forwarder: EventForwarder = EventForwarder(trades.append)
+    listened_order_books: weakref.WeakSet = weakref.WeakSet()
+    parent_pid = os.getppid()
+    try:
+        # Stop when the main process is gone
+        while os.getppid() == parent_pid:
+            for trading_pair, order_book in tracker.order_books.items():
+                if order_book not in listened_order_books:
+                    order_book.add_listener(OrderBookEvent.TradeEvent, trade_forwarder)
+                    listened_order_books.add(order_book)
+                state = (order_book.snapshot_uid,
+                         order_book.last_diff_uid,
+                         order_book.last_applied_trade,
+                         order_book.last_trade_price_rest_updated)
+                if published_states.get(trading_pair) != state:
+                    buffer.publish(trading_pair, order_book, time.time())
+                    published_states[trading_pair] = state
+            if len(trades) > 0:
+                # Sent after the publications including them, in one message per interval
+                trades_sender.send(trades)
+                trades.clear()
+            await asyncio.sleep(publish_interval)
+    finally:
+        tracker.stop()
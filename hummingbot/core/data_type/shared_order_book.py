@@ -0,0 +1,179 @@
+import time
+from multiprocessing import shared_memory
+from typing import Dict, List, NamedTuple, Optional
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+
+
+class SharedTopOfBook(NamedTuple):
+    sequence: int
+    update_id: int
+    best_bid: float
+    best_ask: float
+    mid_price: float
+    last_trade_price: float
+    timestamp: float
+    bids: np.ndarray
+    asks: np.ndarray
+
+
+class SharedTopOfBookBuffer:
+    """
+    Top levels of the order books of a set of trading pairs, stored in a shared memory block. One process publishes
+    the order books and other processes read them.
+
+    Each trading pair slot is protected by a seqlock: the writer makes the slot sequence odd while it updates the slot
+    and even again when it is done. Readers copy the slot and retry if the sequence was odd or changed in the meantime,
+    so they never see a partially written slot and never block the writer. Retries yield the CPU to the writer and
+    are bounded by `MAX_READ_ATTEMPTS`.
+
+    The buffer generation is incremented after each publication, so readers can skip the whole buffer when nothing
+    was published since their last read.
+    """
+    UPDATE_ID = 0
+    BEST_BID = 1
+    BEST_ASK = 2
+    MID_PRICE = 3
+    LAST_TRADE_PRICE = 4
+    TIMESTAMP = 5
+    BIDS_COUNT = 6
+    ASKS_COUNT = 7
+    HEADER_SIZE = 8
+    MAX_READ_ATTEMPTS = 100
+
+    def __init__(self, trading_pairs: List[str], depth: int, name: Optional[str] = None, create: bool = False):
+        """
+        :param trading_pairs: the trading pairs stored in the buffer, in the same order in all the processes
+        :param depth: the number of levels stored per side
+        :param name: the shared memory block name. Required to attach to an existing block
+        :param create: True to create the shared memory block, False to attach to an existing one
+        """
+        self._trading_pairs: List[str] = list(trading_pairs)
+        self._slots: Dict[str, int] = {trading_pair: slot for slot, trading_pair in enumerate(self._trading_pairs)}
+        self._depth: int = depth
+        self._bids_export: np.ndarray = np.empty((depth, 3), dtype=np.float64)
+        self._asks_export: np.ndarray = np.empty((depth, 3), dtype=np.float64)
+        slots_count = len(self._trading_pairs)
+        slot_size = self.HEADER_SIZE + depth * 4
+        counters_size = (1 + slots_count) * np.dtype(np.int64).itemsize
+        size = counters_size + slots_count * slot_size * np.dtype(np.float64).itemsize
+        self._shared_memory = shared_memory.SharedMemory(name=name, create=create, size=size if create else 0)
+        counters: np.ndarray = np.ndarray((1 + slots_count,), dtype=np.int64, buffer=self._shared_memory.buf)
+        self._generation: np.ndarray = counters[:1]
+        self._sequences: np.ndarray = counters[1:]
+        self._data: np.ndarray = np.ndarray(
+            (slots_count, slot_size), dtype=np.float64, buffer=self._shared_memory.buf, offset=counters_size)
+        self._read_retries: int = 0
+        if create:
+            counters[:] = 0
+            self._data[:] = np.nan
+
+    @property
+    def name(self) -> str:
+        return self._shared_memory.name
+
+    @property
+    def trading_pairs(self) -> List[str]:
+        return self._trading_pairs
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    @property
+    def generation(self) -> int:
+        """
+        The number of publications in the buffer, for all the trading pairs
+        """
+        return int(self._generation[0])
+
+    @property
+    def read_retries(self) -> int:
+        """
+        The number of slot reads of this process retried because the writer was updating the slot
+        """
+        return self._read_retries
+
+    def sequence(self, trading_pair: str) -> int:
+        """
+        The slot sequence changes each time the order book is published. 0 means it was never published.
+        """
+        return int(self._sequences[self._slots[trading_pair]])
+
+    def publish(self, trading_pair: str, order_book: OrderBook, timestamp: float):
+        slot = self._slots[trading_pair]
+        bids = order_book.bids_array(self._depth, out=self._bids_export)
+        asks = order_book.asks_array(self._depth, out=self._asks_export)
+        best_bid = bids[0, 0] if len(bids) > 0 else np.nan
+        best_ask = asks[0, 0] if len(asks) > 0 else np.nan
+        row = self._data[slot]
+        bids_start = self.HEADER_SIZE
+        asks_start = self.HEADER_SIZE + self._depth * 2
+
+        self._sequences[slot] += 1
+        row[self.UPDATE_ID] = max(order_book.snapshot_uid, order_book.last_diff_uid)
+        row[self.BEST_BID] = best_bid
+        row[self.BEST_ASK] = best_ask
+        row[self.MID_PRICE] = (best_bid + best_ask) / 2
+        row[self.LAST_TRADE_PRICE] = order_book.last_trade_price
+        row[self.TIMESTAMP] = timestamp
+        row[self.BIDS_COUNT] = len(bids)
+        row[self.ASKS_COUNT] = len(asks)
+        if len(bids) > 0:
+            row[bids_start:bids_start + len(bids) * 2] = np.ravel(bids[:, :2])
+        if len(asks) > 0:
+            row[asks_start:asks_start + len(asks) * 2] = np.ravel(asks[:, :2])
+        self._sequences[slot] += 1
+        self._generation[0] += 1
+
+    def read(self, trading_pair: str) -> Optional[SharedTopOfBook]:
+        """
+        Returns a consistent copy of the trading pair slot, or None if it was never published or the writer kept
+        updating it during all the read attempts.
+        The bids and asks are arrays with the [price, amount, update_id] columns expected by
+        OrderBook.apply_numpy_snapshot
+        """
+        slot = self._slots[trading_pair]
+        for attempt in range(self.MAX_READ_ATTEMPTS):
+            if attempt > 0:
+                self._read_retries += 1
+                # Let the writer complete the slot update
+                time.sleep(0)
+            sequence = int(self._sequences[slot])
+            if sequence % 2 == 1:
+                continue
+            row = self._data[slot].copy()
+            if int(self._sequences[slot]) != sequence:
+                continue
+            if sequence == 0:
+                return None
+            return SharedTopOfBook(
+                sequence=sequence,
+                update_id=int(row[self.UPDATE_ID]),
+                best_bid=float(row[self.BEST_BID]),
+                best_ask=float(row[self.BEST_ASK]),
+                mid_price=float(row[self.MID_PRICE]),
+                last_trade_price=float(row[self.LAST_TRADE_PRICE]),
+                timestamp=float(row[self.TIMESTAMP]),
+                bids=self._levels_array(row, self.HEADER_SIZE, int(row[self.BIDS_COUNT])),
+                asks=self._levels_array(row, self.HEADER_SIZE + self._depth * 2, int(row[self.ASKS_COUNT])),
+            )
+        return None
+
+    def close(self):
+        self._generation = None
+        self._sequences = None
+        self._data = None
+        self._shared_memory.close()
+
+    def unlink(self):
+        self._shared_memory.unlink()
+
+    @staticmethod
+    def _levels_array(row: np.ndarray, start: int, levels_count: int) -> np.ndarray:
+        levels = np.empty((levels_count, 3), dtype=np.float64)
+        levels[:, :2] = row[start:start + levels_count * 2].reshape(levels_count, 2)
+        levels[:, 2] = row[SharedTopOfBookBuffer.UPDATE_ID]
+        return levels
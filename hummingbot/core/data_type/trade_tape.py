@@ -0,0 +1,179 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
+from hummingbot.core.data_type.common import TradeType
+
+
+class TradeTape:
+    """
+    Ring buffer with the most recent public trades of a trading pair, stored in NumPy arrays.
+
+    Besides the trades, each slot keeps the running totals (notional, volume, buy volume and trades count) since the
+    tape was created, so the aggregates over any time window are the difference between the totals at the last trade
+    and the totals before the first trade of the window. A window query is a binary search of its start plus a few
+    subtractions, whatever the number of trades in the window.
+
+    Every trade is written twice, at its slot and at its slot plus the capacity, so the trades in the buffer are always
+    a contiguous slice of the arrays (no wrap around handling in the queries).
+    Timestamps are kept non decreasing: a trade received with a timestamp older than the previous one is recorded
+    with the previous trade timestamp.
+    """
+    TIMESTAMP = 0
+    PRICE = 1
+    AMOUNT = 2
+    SIDE = 3
+    NOTIONAL_TOTAL = 4
+    VOLUME_TOTAL = 5
+    BUY_VOLUME_TOTAL = 6
+    COUNT_TOTAL = 7
+    COLUMNS = 8
+
+    def __init__(self, trading_pair: str, capacity: int = 10000):
+        """
+        :param trading_pair: the trading pair of the trades
+        :param capacity: the number of trades kept. Windows reaching past the oldest kept trade only aggregate the
+        kept trades
+        """
+        if capacity < 1:
+            raise ValueError(f"The trade tape capacity must be positive ({capacity}).")
+        self._trading_pair: str = trading_pair
+        self._capacity: int = capacity
+        self._data: np.ndarray = np.zeros((self.COLUMNS, capacity * 2), dtype=np.float64)
+        self._start: int = 0
+        self._size: int = 0
+        self._totals: np.ndarray = np.zeros(4, dtype=np.float64)
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    @property
+    def last_timestamp(self) -> float:
+        return float(self._data[self.TIMESTAMP, self._start + self._size - 1]) if self._size > 0 else 0.0
+
+    @property
+    def last_price(self) -> float:
+        return float(self._data[self.PRICE, self._start + self._size - 1]) if self._size > 0 else float("nan")
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: float, price: float, amount: float, trade_type: TradeType):
+        """
+        Records a trade
+
+        :param timestamp: the trade timestamp in seconds
+        :param price: the trade price
+        :param amount: the trade amount in base asset
+        :param trade_type: the taker side of the trade
+        """
+        if self._size > 0:
+            timestamp = max(timestamp, self.last_timestamp)
+        is_buy = trade_type == TradeType.BUY
+        self._totals[0] += price * amount
+        self._totals[1] += amount
+        if is_buy:
+            self._totals[2] += amount
+        self._totals[3] += 1
+
+        if self._size < self._capacity:
+            slot = self._start + self._size
+            self._size += 1
+        else:
+            slot = self._start
+            self._start = (self._start + 1) % self._capacity
+        slot %= self._capacity
+        for index in (slot, slot + self._capacity):
+            column = self._data[:, index]
+            column[self.TIMESTAMP] = timestamp
+            column[self.PRICE] = price
+            column[self.AMOUNT] = amount
+            column[self.SIDE] = 1.0 if is_buy else -1.0
+            column[self.NOTIONAL_TOTAL:] = self._totals
+
+    def clear(self):
+        self._start = 0
+        self._size = 0
+        self._totals[:] = 0
+
+    def trades(self, window: Optional[float] = None, now: Optional[float] = None) -> np.ndarray:
+        """
+        Returns a copy of the trades in the window, oldest first, as an array with the columns timestamp, price,
+        amount and side (1 for buys, -1 for sells)
+
+        :param window: the window length in seconds. None for all the trades kept
+        :param now: the window end timestamp. Defaults to the last trade timestamp
+        """
+        first, end = self._window_range(window, now)
+        return self._data[self.TIMESTAMP:self.SIDE + 1, first:end].T.copy()
+
+    def volume(self, window: float, now: Optional[float] = None) -> float:
+        """
+        Returns the base asset volume traded in the window
+        """
+        return self._window_total(self.VOLUME_TOTAL, window, now)
+
+    def buy_volume(self, window: float, now: Optional[float] = None) -> float:
+        return self._window_total(self.BUY_VOLUME_TOTAL, window, now)
+
+    def sell_volume(self, window: float, now: Optional[float] = None) -> float:
+        return self.volume(window, now) - self.buy_volume(window, now)
+
+    def trades_count(self, window: float, now: Optional[float] = None) -> int:
+        return int(round(self._window_total(self.COUNT_TOTAL, window, now)))
+
+    def vwap(self, window: float, now: Optional[float] = None) -> float:
+        """
+        Returns the volume weighted average price of the trades in the window, NaN if there is no trade in the window
+        """
+        volume = self.volume(window, now)
+        if volume <= 0:
+            return float("nan")
+        return self._window_total(self.NOTIONAL_TOTAL, window, now) / volume
+
+    def imbalance(self, window: float, now: Optional[float] = None) -> float:
+        """
+        Returns (buy volume - sell volume) / volume for the trades in the window, between -1 (sells only) and 1 (buys
+        only). 0 if there is no trade in the window
+        """
+        volume = self.volume(window, now)
+        if volume <= 0:
+            return 0.0
+        buy_volume = self.buy_volume(window, now)
+        return (2 * buy_volume - volume) / volume
+
+    def _window_range(self, window: Optional[float], now: Optional[float]) -> Tuple[int, int]:
+        """
+        Returns the [first, end) columns of the trades with window start < timestamp <= now
+        """
+        if self._size == 0:
+            return self._start, self._start
+        timestamps = self._data[self.TIMESTAMP, self._start:self._start + self._size]
+        end = self._size if now is None else int(np.searchsorted(timestamps, now, side="right"))
+        if window is None:
+            first = 0
+        else:
+            window_end = self.last_timestamp if now is None else now
+            first = int(np.searchsorted(timestamps, window_end - window, side="right"))
+        return self._start + first, self._start + max(first, end)
+
+    def _window_total(self, column: int, window: float, now: Optional[float]) -> float:
+        first, end = self._window_range(window, now)
+        if first == end:
+            return 0.0
+        totals = self._data[column]
+        # The totals before the first trade are the totals at the first trade minus the first trade contribution
+        if column == self.NOTIONAL_TOTAL:
+            first_contribution = self._data[self.PRICE, first] * self._data[self.AMOUNT, first]
+        elif column == self.VOLUME_TOTAL:
+            first_contribution = self._data[self.AMOUNT, first]
+        elif column == self.BUY_VOLUME_TOTAL:
+            first_contribution = self._data[self.AMOUNT, first] if self._data[self.SIDE, first] > 0 else 0.0
+        else:
+            first_contribution = 1.0
+        return float(totals[end - 1] - totals[first] + first_contribution)
@@ -1,9 +1,13 @@
 #!/usr/bin/env python
 
-from typing import Callable
+import asyncio
+import logging
+from collections import deque
+from typing import Awaitable, Callable, Deque, Optional
 
 from hummingbot.core.event.event_listener import EventListener
 from hummingbot.core.pubsub import PubSub
+from hummingbot.core.utils.async_utils import safe_ensure_future
 
 
 class EventForwarder(EventListener):
@@ -22,3 +26,64 @@ class SourceInfoEventForwarder(EventListener):
 
     def __call__(self, arg: any):
         self._to_function(self.current_event_tag, self.current_event_caller, arg)
+
+
+class AsyncEventForwarder(EventListener):
+    """
+    Forwards the events to `to_function` from a task, instead of calling it while the event is being triggered.
+    Use it for slow listeners (e.g. network forwarders, recorders), so they don't delay the delivery of the events to
+    the other listeners. `to_function` can be a function or a coroutine function.
+
+    The events are queued in order, and the task starts with the first event received while the event loop is running.
+    """
+
+    def __init__(self, to_function: Callable[[any], Optional[Awaitable]], max_queue_size: int = 0):
+        """
+        :param to_function: the function called with each event
+        :param max_queue_size: if greater than 0, the maximum number of events waiting to be forwarded. The oldest
+        events are discarded when the queue is full
+        """
+        super().__init__()
+        self._to_function: Callable[[any], Optional[Awaitable]] = to_function
+        self._queue: Deque[any] = deque(maxlen=max_queue_size if max_queue_size > 0 else None)
+        self._queue_event: Optional[asyncio.Event] = None
+        self._forward_task: Optional[asyncio.Task] = None
+        self._discarded_events_count: int = 0
+
+    @property
+    def pending_events_count(self) -> int:
+        return len(self._queue)
+
+    @property
+    def discarded_events_count(self) -> int:
+        return self._discarded_events_count
+
+    def __call__(self, arg: any):
+        if self._queue.maxlen is not None and len(self._queue) == self._queue.maxlen:
+            self._discarded_events_count += 1
+        self._queue.append(arg)
+        if self._forward_task is None:
+            self._queue_event = asyncio.Event()
+            self._forward_task = safe_ensure_future(self._forward_events_loop())
+        self._queue_event.set()
+
+    def stop(self):
+        if self._forward_task is not None:
+            self._forward_task.cancel()
+            self._forward_task = None
+        self._queue.clear()
+
+    async def _forward_events_loop(self):
+        while True:
+            await self._queue_event.wait()
+            self._queue_event.clear()
+            while len(self._queue) > 0:
+                arg = self._queue.popleft()
+                try:
+                    result = self._to_function(arg)
+                    if asyncio.iscoroutine(result):
+                        await result
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    logging.getLogger(__name__).error("Unexpected error forwarding event.", exc_info=True)
@@ -11,3 +11,4 @@ cdef class EventListener:
 
     cdef c_set_event_info(self, int64_t current_event_tag, PubSub current_event_caller)
     cdef c_call(self, object arg)
+    cdef c_call_batch(self, list args)
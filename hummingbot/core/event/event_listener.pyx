@@ -23,3 +23,23 @@ cdef class EventListener:
 
     cdef c_call(self, object arg):
         self(arg)
+
+    cdef c_call_batch(self, list args):
+        """
+        Called with the events triggered together with PubSub.trigger_events, in order. Listeners that can process
+        the events in bulk override it, by default each event is processed with c_call, after letting the publisher
+        prepare it. An event failing is logged by the publisher and does not prevent the following events from being
+        processed
+        """
+        cdef:
+            PubSub caller = self._current_event_caller
+            int64_t event_tag = self._current_event_tag
+        for arg in args:
+            try:
+                if caller is not None:
+                    caller.c_prepare_batch_event(event_tag, arg)
+                self.c_call(arg)
+            except Exception:
+                if caller is None:
+                    raise
+                caller.c_log_exception(event_tag, arg)
@@ -39,8 +39,14 @@ cdef class PubSub:
        make sense to do the GC every time.
     2. c_remove_listener():
        Every time. This assumes c_remove_listener() is called infrequently.
-    3. c_get_listeners() and c_trigger_event():
-       Every time. Both functions take O(n) already.
+    3. c_get_listeners():
+       Every time. The function takes O(n) already.
+    4. c_trigger_event() and c_trigger_events():
+       Only when a dead listener is found while delivering the event.
+
+    Events are delivered from a snapshot of the listeners (a tuple of weak references) built on the first event after
+    a listener is added or removed, so triggering an event does not copy the listeners collection. Listeners can still
+    add or remove listeners while they process an event, it only invalidates the snapshot for the next event.
     """
 
     ADD_LISTENER_GC_PROBABILITY = 0.005
@@ -52,6 +58,9 @@ cdef class PubSub:
             class_logger = logging.getLogger(__name__)
         return class_logger
 
+    def __cinit__(self):
+        self._listeners_snapshots = {}
+
     def __init__(self):
         self._events = Events()
 
@@ -67,9 +76,19 @@ cdef class PubSub:
     def trigger_event(self, event_tag: Enum, message: any):
         self.c_trigger_event(event_tag.value, message)
 
+    def trigger_events(self, event_tag: Enum, messages: List[any]):
+        self.c_trigger_events(event_tag.value, messages)
+
     cdef c_log_exception(self, int64_t event_tag, object arg):
         self.logger().error(f"Unexpected error while processing event {event_tag}.", exc_info=True)
 
+    cdef c_prepare_batch_event(self, int64_t event_tag, object arg):
+        """
+        Called by the listeners right before they process each event of a batch, for publishers that update their
+        state event by event (e.g. the last trade price of an order book)
+        """
+        pass
+
     cdef c_add_listener(self, int64_t event_tag, EventListener listener):
         cdef:
             EventsIterator it = self._events.find(event_tag)
@@ -83,6 +102,7 @@ cdef class PubSub:
         else:
             new_listeners.insert(listener_wrapper)
             self._events.insert(EventsPair(event_tag, new_listeners))
+        self._listeners_snapshots.pop(event_tag, None)
 
         if random.random() < PubSub.ADD_LISTENER_GC_PROBABILITY:
             self.c_remove_dead_listeners(event_tag)
@@ -100,6 +120,7 @@ cdef class PubSub:
         lit = deref(listeners_ptr).find(listener_wrapper)
         if lit != deref(listeners_ptr).end():
             deref(listeners_ptr).erase(lit)
+            self._listeners_snapshots.pop(event_tag, None)
         self.c_remove_dead_listeners(event_tag)
 
     cdef c_remove_dead_listeners(self, int64_t event_tag):
@@ -118,6 +139,8 @@ cdef class PubSub:
             if <object>(PyWeakref_GetObject(listener_weakref)) is None:
                 lit_to_remove.push_back(lit)
             inc(lit)
+        if lit_to_remove.size() > 0:
+            self._listeners_snapshots.pop(event_tag, None)
         for lit in lit_to_remove:
             deref(listeners_ptr).erase(lit)
         if deref(listeners_ptr).size() < 1:
@@ -143,27 +166,79 @@ cdef class PubSub:
             retval.append(typed_listener)
         return retval
 
-    cdef c_trigger_event(self, int64_t event_tag, object arg):
-        self.c_remove_dead_listeners(event_tag)
+    cdef tuple c_get_listeners_snapshot(self, int64_t event_tag):
+        """
+        Returns the weak references to the event listeners, building the snapshot if the listeners changed since
+        the last event
+        """
+        cdef:
+            tuple snapshot = self._listeners_snapshots.get(event_tag)
+            EventsIterator it
+        if snapshot is None:
+            self.c_remove_dead_listeners(event_tag)
+            it = self._events.find(event_tag)
+            if it == self._events.end():
+                snapshot = ()
+            else:
+                snapshot = tuple([<object>pyref.get() for pyref in deref(it).second])
+            self._listeners_snapshots[event_tag] = snapshot
+        return snapshot
 
+    cdef c_trigger_event(self, int64_t event_tag, object arg):
         cdef:
-            EventsIterator it = self._events.find(event_tag)
-            EventListenersCollection listeners
-            object listener_weafref
+            tuple snapshot = self.c_get_listeners_snapshot(event_tag)
+            object listener
             EventListener typed_listener
-        if it == self._events.end():
-            return
-
-        # It is extremely important that this set of listeners is a C++ copy - because listeners are allowed to call
-        # c_remove_listener(), which breaks the iterator if we're using the underlying set.
-        listeners = deref(it).second
-        for pyref in listeners:
-            listener_weafref = <object>pyref.get()
-            typed_listener = <object>PyWeakref_GetObject(listener_weafref)
+            bint dead_listener_found = False
+
+        for listener_weakref in snapshot:
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is None:
+                dead_listener_found = True
+                continue
+            typed_listener = listener
             try:
-                typed_listener.c_set_event_info(event_tag, self)
+                typed_listener._current_event_tag = event_tag
+                typed_listener._current_event_caller = self
                 typed_listener.c_call(arg)
             except Exception:
                 self.c_log_exception(event_tag, arg)
             finally:
-                typed_listener.c_set_event_info(0, None)
+                typed_listener._current_event_tag = 0
+                typed_listener._current_event_caller = None
+
+        if dead_listener_found:
+            self.c_remove_dead_listeners(event_tag)
+
+    cdef c_trigger_events(self, int64_t event_tag, list args):
+        """
+        Delivers a batch of events of the same type. Each listener receives all the events in a single c_call_batch
+        call, which saves the per event dispatch for high frequency events (e.g. order book trades)
+        """
+        cdef:
+            tuple snapshot
+            object listener
+            EventListener typed_listener
+            bint dead_listener_found = False
+
+        if len(args) == 0:
+            return
+        snapshot = self.c_get_listeners_snapshot(event_tag)
+        for listener_weakref in snapshot:
+            listener = <object>PyWeakref_GetObject(listener_weakref)
+            if listener is None:
+                dead_listener_found = True
+                continue
+            typed_listener = listener
+            try:
+                typed_listener._current_event_tag = event_tag
+                typed_listener._current_event_caller = self
+                typed_listener.c_call_batch(args)
+            except Exception:
+                self.c_log_exception(event_tag, args)
+            finally:
+                typed_listener._current_event_tag = 0
+                typed_listener._current_event_caller = None
+
+        if dead_listener_found:
+            self.c_remove_dead_listeners(event_tag)
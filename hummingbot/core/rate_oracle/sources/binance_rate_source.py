@@ -54,21 +54,16 @@ class BinanceRateSource(RateSourceBase):
         :param quote_token: A quote symbol, if specified only pairs with the quote symbol are included for prices
         :return: A dictionary of trading pairs and prices
         """
-        pairs_prices = await exchange.get_all_pairs_prices()
+        tickers = await exchange.ticker_snapshot_service.get_tickers()
         results = {}
-        for pair_price in pairs_prices:
-            try:
-                trading_pair = await exchange.trading_pair_associated_to_exchange_symbol(symbol=pair_price["symbol"])
-            except KeyError:
-                continue  # skip pairs that we don't track
+        for trading_pair, ticker in tickers.items():
             if quote_token is not None:
                 base, quote = split_hb_trading_pair(trading_pair=trading_pair)
                 if quote != quote_token:
                     continue
-            bid_price = pair_price.get("bidPrice")
-            ask_price = pair_price.get("askPrice")
-            if bid_price is not None and ask_price is not None and 0 < Decimal(bid_price) <= Decimal(ask_price):
-                results[trading_pair] = (Decimal(bid_price) + Decimal(ask_price)) / Decimal("2")
+            mid_price = ticker.mid_price
+            if mid_price is not None:
+                results[trading_pair] = mid_price
 
         return results
 
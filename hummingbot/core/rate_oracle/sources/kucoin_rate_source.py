@@ -22,15 +22,11 @@ class KucoinRateSource(RateSourceBase):
         self._ensure_exchange()
         results = {}
         try:
-            records = await self._exchange.get_all_pairs_prices()
-            for record in records["data"]["ticker"]:
-                try:
-                    pair = await self._exchange.trading_pair_associated_to_exchange_symbol(record["symbolName"])
-                except KeyError:
-                    # Ignore results for which their symbols is not tracked by the connector
-                    continue
-                if Decimal(record["buy"]) > 0 and Decimal(record["sell"]) > 0:
-                    results[pair] = (Decimal(str(record["buy"])) + Decimal(str(record["sell"]))) / Decimal("2")
+            tickers = await self._exchange.ticker_snapshot_service.get_tickers()
+            for trading_pair, ticker in tickers.items():
+                mid_price = ticker.mid_price
+                if mid_price is not None:
+                    results[trading_pair] = mid_price
         except Exception:
             self.logger().exception(
                 msg="Unexpected error while retrieving rates from KuCoin. Check the log file for more info.",
@@ -0,0 +1,69 @@
+from bisect import bisect_left
+from typing import Dict, List, Tuple
+
+
+class LatencyHistogram:
+    """
+    Fixed buckets histogram of latencies. Recording a value is O(log(buckets)) and the memory used does not depend on
+    the number of values recorded, so it can be updated for every message received from an exchange.
+    """
+    BUCKET_BOUNDS_MS: Tuple[float, ...] = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+    def __init__(self):
+        self._bucket_counts: List[int] = [0] * (len(self.BUCKET_BOUNDS_MS) + 1)
+        self._count: int = 0
+        self._total_ms: float = 0
+        self._max_ms: float = 0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean_ms(self) -> float:
+        return self._total_ms / self._count if self._count > 0 else 0
+
+    @property
+    def max_ms(self) -> float:
+        return self._max_ms
+
+    def record(self, latency: float):
+        """
+        Records a latency
+
+        :param latency: the latency in seconds. Negative values (caused by clocks out of sync) are recorded as 0
+        """
+        latency_ms = max(latency * 1e3, 0)
+        self._bucket_counts[bisect_left(self.BUCKET_BOUNDS_MS, latency_ms)] += 1
+        self._count += 1
+        self._total_ms += latency_ms
+        self._max_ms = max(self._max_ms, latency_ms)
+
+    def percentile_ms(self, percentile: float) -> float:
+        """
+        Returns the upper bound of the bucket containing the requested percentile (the max latency for the last bucket)
+
+        :param percentile: the percentile, between 0 and 100
+        """
+        if self._count == 0:
+            return 0
+        target = self._count * percentile / 100
+        accumulated = 0
+        for bound, bucket_count in zip(self.BUCKET_BOUNDS_MS, self._bucket_counts):
+            accumulated += bucket_count
+            if accumulated >= target:
+                return min(bound, self._max_ms)
+        return self._max_ms
+
+    def buckets(self) -> Dict[str, int]:
+        """
+        Returns the number of values recorded in each bucket, keyed by the bucket upper bound in milliseconds
+        """
+        labels = [f"<={bound:g}ms" for bound in self.BUCKET_BOUNDS_MS] + [f">{self.BUCKET_BOUNDS_MS[-1]:g}ms"]
+        return dict(zip(labels, self._bucket_counts))
+
+    def reset(self):
+        self._bucket_counts = [0] * (len(self.BUCKET_BOUNDS_MS) + 1)
+        self._count = 0
+        self._total_ms = 0
+        self._max_ms = 0
@@ -1,7 +1,13 @@
+import asyncio
+import json
 import logging
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Dict, List, Optional
 
+from hummingbot import data_path
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.client.config.security import Security
 from hummingbot.client.settings import AllConnectorSettings, ConnectorSetting
 from hummingbot.logger import HummingbotLogger
 
@@ -9,6 +15,11 @@ from .async_utils import safe_ensure_future
 
 
 class TradingPairFetcher:
+    CACHE_FILE_NAME = "trading_pairs_cache.json"
+    CACHE_TTL = 24 * 60 * 60  # seconds
+    FETCH_RETRY_INTERVAL = 60  # seconds
+    MAX_CONCURRENT_FETCHES = 5
+
     _sf_shared_instance: "TradingPairFetcher" = None
     _tpf_logger: Optional[HummingbotLogger] = None
 
@@ -26,62 +37,148 @@ class TradingPairFetcher:
         return cls._sf_shared_instance
 
     def __init__(self, client_config_map: ClientConfigAdapter):
+        """
+        Collects the trading pairs of the connectors, used for autocompletion and trading pair validation.
+
+        The trading pairs are persisted in an on-disk cache. At startup only the connectors configured by the user
+        are fetched, and only if they are not in the cache already (stale entries are refreshed in the background).
+        The trading pairs of any other connector are fetched on demand, the first time they are requested through
+        `get_trading_pairs`.
+        """
         self.ready = False
         self.trading_pairs: Dict[str, Any] = {}
+        self._fetch_timestamps: Dict[str, float] = {}
+        self._fetch_attempt_timestamps: Dict[str, float] = {}
+        self._pending_fetches: Dict[str, asyncio.Task] = {}
+        self._fetch_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_FETCHES)
         self._fetch_task = safe_ensure_future(self.fetch_all(client_config_map))
 
-    def _fetch_pairs_from_connector_setting(
+    def get_trading_pairs(self, connector_name: str) -> List[str]:
+        """
+        Returns the known trading pairs of the connector. If they are unknown or outdated a fetch is scheduled in
+        the background, and the result will be available in subsequent calls.
+
+        :param connector_name: the name of the connector
+        """
+        if (self.ready
+                and (connector_name not in self.trading_pairs or self._is_cache_expired(connector_name))
+                and time.time() - self._fetch_attempt_timestamps.get(connector_name, 0) > self.FETCH_RETRY_INTERVAL):
+            connector_setting = self._all_connector_settings().get(connector_name)
+            if connector_setting is not None:
+                self._schedule_fetch(connector_setting)
+        return self.trading_pairs.get(connector_name, [])
+
+    def _trading_pairs_from_connector_setting(
             self,
-            connector_setting: ConnectorSetting,
-            connector_name: Optional[str] = None):
-        connector_name = connector_name or connector_setting.name
+            connector_setting: ConnectorSetting) -> Awaitable[List[str]]:
         connector = connector_setting.non_trading_connector_instance_with_default_configuration()
         if connector_setting.uses_gateway_generic_connector():
             connector_params = connector_setting.name.split("_")
             try:
-                safe_ensure_future(self.call_fetch_pairs(
-                    connector.all_trading_pairs(connector_params[1], connector_params[2]), connector_name))
+                return connector.all_trading_pairs(connector_params[1], connector_params[2])
             except TypeError:  # some gateway generic connector like gateway_EVM_Perpetual require an extra name parameter
-                safe_ensure_future(self.call_fetch_pairs(
-                    connector.all_trading_pairs(connector_params[1], connector_params[2], connector_params[0]), connector_name))
+                return connector.all_trading_pairs(connector_params[1], connector_params[2], connector_params[0])
         else:
-            safe_ensure_future(self.call_fetch_pairs(connector.all_trading_pairs(), connector_name))
+            return connector.all_trading_pairs()
 
     async def fetch_all(self, client_config_map: ClientConfigAdapter):
-        connector_settings = self._all_connector_settings()
-        for conn_setting in connector_settings.values():
+        self._load_cache()
+
+        initial_fetches = []
+        for conn_setting in self._all_connector_settings().values():
+            if not self._is_connector_configured(conn_setting):
+                continue
+            if conn_setting.name not in self.trading_pairs:
+                initial_fetches.append(self._schedule_fetch(conn_setting))
+            elif self._is_cache_expired(conn_setting.name):
+                # Cached pairs are served while the refresh runs in the background
+                self._schedule_fetch(conn_setting)
+
+        if len(initial_fetches) > 0:
+            await asyncio.gather(*initial_fetches)
+
+        self.ready = True
+
+    async def call_fetch_pairs(self, fetch_fn: Awaitable[List[str]], exchange_name: str):
+        try:
+            pairs = await fetch_fn
+            self.trading_pairs[exchange_name] = pairs
+            self._fetch_timestamps[exchange_name] = time.time()
+        except Exception:
+            self.logger().error(f"Connector {exchange_name} failed to retrieve its trading pairs. "
+                                f"Trading pairs autocompletion won't work.", exc_info=True)
+            # In case of error keep the cached pairs or assign an empty list, this is st. the bot won't stop working
+            self.trading_pairs.setdefault(exchange_name, [])
+
+    def _schedule_fetch(self, connector_setting: ConnectorSetting) -> asyncio.Task:
+        task = self._pending_fetches.get(connector_setting.name)
+        if task is None or task.done():
+            self._fetch_attempt_timestamps[connector_setting.name] = time.time()
+            task = safe_ensure_future(self._fetch_connector_trading_pairs(connector_setting))
+            self._pending_fetches[connector_setting.name] = task
+        return task
+
+    async def _fetch_connector_trading_pairs(self, conn_setting: ConnectorSetting):
+        connector_name = conn_setting.name
+        async with self._fetch_semaphore:
             # XXX(martin_kou): Some connectors, e.g. uniswap v3, aren't completed yet. Ignore if you can't find the
             # data source module for them.
             try:
                 if conn_setting.base_name().endswith("paper_trade"):
-                    self._fetch_pairs_from_connector_setting(
-                        connector_setting=connector_settings[conn_setting.parent_name],
-                        connector_name=conn_setting.name
-                    )
-                else:
-                    self._fetch_pairs_from_connector_setting(connector_setting=conn_setting)
+                    conn_setting = self._all_connector_settings()[conn_setting.parent_name]
+                fetch_fn = self._trading_pairs_from_connector_setting(connector_setting=conn_setting)
             except ModuleNotFoundError:
-                continue
+                return
             except Exception:
-                self.logger().exception(f"An error occurred when fetching trading pairs for {conn_setting.name}."
+                self.logger().exception(f"An error occurred when fetching trading pairs for {connector_name}."
                                         "Please check the logs")
+                return
+            await self.call_fetch_pairs(fetch_fn, connector_name)
 
-        self.ready = True
+        self._save_cache()
 
-    async def call_fetch_pairs(self, fetch_fn: Callable[[], Awaitable[List[str]]], exchange_name: str):
+    def _is_cache_expired(self, connector_name: str) -> bool:
+        return time.time() - self._fetch_timestamps.get(connector_name, 0) > self.CACHE_TTL
+
+    def _load_cache(self):
         try:
-            pairs = await fetch_fn
-            self.trading_pairs[exchange_name] = pairs
+            with open(self._cache_file_path()) as cache_file:
+                cached_entries: Dict[str, Dict[str, Any]] = json.load(cache_file)
+            for connector_name, entry in cached_entries.items():
+                self.trading_pairs[connector_name] = entry["trading_pairs"]
+                self._fetch_timestamps[connector_name] = entry["timestamp"]
+        except FileNotFoundError:
+            pass
         except Exception:
-            self.logger().error(f"Connector {exchange_name} failed to retrieve its trading pairs. "
-                                f"Trading pairs autocompletion won't work.", exc_info=True)
-            # In case of error just assign empty list, this is st. the bot won't stop working
-            self.trading_pairs[exchange_name] = []
+            self.logger().warning("The trading pairs cache could not be read. It will be rebuilt.", exc_info=True)
+
+    def _save_cache(self):
+        cached_entries = {
+            connector_name: {"trading_pairs": list(pairs), "timestamp": self._fetch_timestamps[connector_name]}
+            for connector_name, pairs in self.trading_pairs.items()
+            if connector_name in self._fetch_timestamps
+        }
+        try:
+            with open(self._cache_file_path(), "w") as cache_file:
+                json.dump(cached_entries, cache_file)
+        except Exception:
+            self.logger().warning("The trading pairs cache could not be saved.", exc_info=True)
+
+    def _is_connector_configured(self, connector_setting: ConnectorSetting) -> bool:
+        # Paper trade and gateway connector settings are only created for the connectors the user enabled
+        return (connector_setting.base_name().endswith("paper_trade")
+                or connector_setting.uses_gateway_generic_connector()
+                or Security.connector_config_file_exists(connector_setting.name))
 
     def _all_connector_settings(self) -> Dict[str, ConnectorSetting]:
         # Method created to enabling patching in unit tests
         return AllConnectorSettings.get_connector_settings()
 
+    @classmethod
+    def _cache_file_path(cls) -> Path:
+        # Method created to enabling patching in unit tests
+        return Path(data_path()) / cls.CACHE_FILE_NAME
+
     @staticmethod
     def _get_client_config_map() -> "ClientConfigAdapter":
         from hummingbot.client.hummingbot_application import HummingbotApplication
@@ -0,0 +1,27 @@
+#!/usr/bin/env python
+from sqlalchemy import JSON, BigInteger, Column, Index, Integer, Text
+
+from . import HummingbotBase
+
+
+class MarketStateDelta(HummingbotBase):
+    """
+    Journal entry of the changes in the tracking states of a market since its `MarketState` snapshot. The tracking
+    states are restored by applying the journal entries, in id order, to the snapshot.
+    """
+    __tablename__ = "MarketStateDelta"
+    __table_args__ = (Index("msd_config_market_index",
+                            "config_file_path", "market", "id"),
+                      )
+
+    id = Column(Integer, primary_key=True, nullable=False)
+    config_file_path = Column(Text, nullable=False)
+    market = Column(Text, nullable=False)
+    timestamp = Column(BigInteger, nullable=False)
+    updated_states = Column(JSON, nullable=False)
+    removed_keys = Column(JSON, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"MarketStateDelta(id='{self.id}', config_file_path='{self.config_file_path}', " \
+               f"market='{self.market}', timestamp={self.timestamp}, updated_states={self.updated_states}, " \
+               f"removed_keys={self.removed_keys})"
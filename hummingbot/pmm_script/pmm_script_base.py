@@ -1,10 +1,10 @@
 import asyncio
 import traceback
+from collections import deque
 from decimal import Decimal
 from multiprocessing import Queue
-from operator import itemgetter
 from statistics import mean, median
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence
 
 from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
@@ -18,8 +18,10 @@ from .pmm_script_interface import (
     OnTick,
     PMMParameters,
     PMMMarketInfo,
-    ScriptError
+    ScriptError,
+    flush_parameter_updates,
 )
+from .pmm_script_queue_reader import start_queue_reader
 
 
 class PMMScriptBase:
@@ -31,8 +33,8 @@ class PMMScriptBase:
         self._parent_queue: Queue = None
         self._child_queue: Queue = None
         self._queue_check_interval: float = 0.0
-        self.mid_prices: List[Decimal] = []
-        self.max_mid_prices_length: int = 86400  # 60 * 60 * 24 = 1 day of prices
+        # mid_prices is a ring of the last max_mid_prices_length prices, 60 * 60 * 24 = 1 day of prices
+        self.mid_prices: Deque[Decimal] = deque(maxlen=86400)
         self.pmm_parameters: PMMParameters = None
         self.pmm_market_info: PMMMarketInfo = None
         # all_total_balances stores balances in {exchange: {token: balance}} format
@@ -46,6 +48,14 @@ class PMMScriptBase:
         self._child_queue = child_queue
         self._queue_check_interval = queue_check_interval
 
+    @property
+    def max_mid_prices_length(self) -> int:
+        return self.mid_prices.maxlen
+
+    @max_mid_prices_length.setter
+    def max_mid_prices_length(self, value: int):
+        self.mid_prices = deque(self.mid_prices, maxlen=value)
+
     @property
     def mid_price(self):
         """
@@ -57,12 +67,10 @@ class PMMScriptBase:
         asyncio.ensure_future(self.listen_to_parent())
 
     async def listen_to_parent(self):
+        items = start_queue_reader(self._parent_queue, asyncio.get_event_loop())
         while True:
             try:
-                if self._parent_queue.empty():
-                    await asyncio.sleep(self._queue_check_interval)
-                    continue
-                item = self._parent_queue.get()
+                item = await items.get()
                 # print(f"child gets {str(item)}")
                 if item is None:
                     # print("child exiting..")
@@ -70,11 +78,13 @@ class PMMScriptBase:
                     break
                 if isinstance(item, OnTick):
                     self.mid_prices.append(item.mid_price)
-                    if len(self.mid_prices) > self.max_mid_prices_length:
-                        self.mid_prices = self.mid_prices[len(self.mid_prices) - self.max_mid_prices_length:]
-                    self.pmm_parameters = item.pmm_parameters
-                    self.all_total_balances = item.all_total_balances
-                    self.all_available_balances = item.all_available_balances
+                    if self.pmm_parameters is None:
+                        self.pmm_parameters = PMMParameters()
+                    self.pmm_parameters.apply_updates(item.updated_parameters)
+                    if item.all_total_balances is not None:
+                        self.all_total_balances = item.all_total_balances
+                    if item.all_available_balances is not None:
+                        self.all_available_balances = item.all_available_balances
                     self.on_tick()
                 elif isinstance(item, BuyOrderCompletedEvent):
                     self.on_buy_order_completed(item)
@@ -88,6 +98,7 @@ class PMMScriptBase:
                     self.on_command(item.cmd, item.args)
                 elif isinstance(item, PMMMarketInfo):
                     self.pmm_market_info = item
+                flush_parameter_updates()
             except asyncio.CancelledError:
                 raise
             except Exception as e:
@@ -179,26 +190,21 @@ class PMMScriptBase:
         return (a_number // step_size) * step_size
 
     @staticmethod
-    def take_samples(a_list: List[Any], interval: int, length: int) -> Optional[List[any]]:
+    def take_samples(a_list: Sequence[Any], interval: int, length: int) -> Optional[List[any]]:
         """
         Takes samples out of a given list where the last item is the most recent,
         Examples: a list = [1, 2, 3, 4, 5, 6, 7] an interval of 3 and length of 2 will return you [4, 7],
         for an interval of 2 and length of 4, you'll get [1, 3, 5, 7]
-        :param a_list: A list which to take samples from
+        Only the sampled items are accessed, whatever the size of the list.
+        :param a_list: A list (or deque) which to take samples from
         :param interval: The interval at which to take sample, starting from the last item on the list.
         :param length: The number of the samples.
         :returns None if there is not enough samples to satisfy length, otherwise the sample list.
         """
-        index_list = list(range(len(a_list) - 1, -1, -1 * interval))
-        index_list = sorted(index_list)
-        index_list = index_list[-1 * length:]
-        if len(index_list) < length:
+        first_index = len(a_list) - 1 - (length - 1) * interval
+        if len(a_list) == 0 or first_index < 0:
             return None
-        if len(index_list) == 1:
-            # return a list with just 1 item in it.
-            return [a_list[index_list[0]]]
-        samples = list(itemgetter(*index_list)(a_list))
-        return samples
+        return [a_list[index] for index in range(first_index, len(a_list), interval)]
 
     def on_tick(self):
         """
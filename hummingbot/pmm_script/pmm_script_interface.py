@@ -1,7 +1,10 @@
+import copy
 from decimal import Decimal
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 
 child_queue = None
+# The parameters changed by the script since the last flush, sent to the strategy in a single message
+parameter_updates: Dict[str, Any] = {}
 
 
 def set_child_queue(queue):
@@ -9,25 +12,33 @@ def set_child_queue(queue):
     child_queue = queue
 
 
+def flush_parameter_updates():
+    """
+    Sends the parameters changed by the script since the last flush to the strategy. It is called after each message
+    handled by the script.
+    """
+    if len(parameter_updates) > 0:
+        # Copied so the script can keep modifying the values (e.g. order_override) while the queue pickles them
+        child_queue.put(StrategyParameterUpdates(copy.deepcopy(parameter_updates)))
+        parameter_updates.clear()
+
+
 class StrategyParameter(object):
     """
     A strategy parameter class that is used as a property for the collection class with its get and set method.
-    The set method detects if there is a value change it will put itself into the child queue.
+    The set method detects if there is a value change and records it in the pending parameter updates.
     """
     def __init__(self, attr):
         self.name = attr
         self.attr = "_" + attr
-        self.updated_value = None
 
     def __get__(self, obj, objtype):
         return getattr(obj, self.attr)
 
     def __set__(self, obj, value):
-        global child_queue
         old_value = getattr(obj, self.attr)
         if old_value is not None and old_value != value:
-            self.updated_value = value
-            child_queue.put(self)
+            parameter_updates[self.name] = value
         setattr(obj, self.attr, value)
 
     def __repr__(self):
@@ -98,6 +109,28 @@ class PMMParameters:
     # ping_pong_enabled = PMMParameter("ping_pong_enabled")
     # minimum_spread = PMMParameter("minimum_spread")
 
+    @classmethod
+    def parameter_names(cls) -> List[str]:
+        return [name for name, value in cls.__dict__.items() if isinstance(value, StrategyParameter)]
+
+    def apply_updates(self, updates: Dict[str, Any]):
+        """
+        Sets the parameter values received from the strategy, without recording them as changes made by the script.
+        """
+        for name, value in updates.items():
+            setattr(self, "_" + name, value)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} {str(self.__dict__)}"
+
+
+class StrategyParameterUpdates:
+    """
+    The parameters changed by the script, keyed by name, to be set on the strategy.
+    """
+    def __init__(self, updates: Dict[str, Any]):
+        self.updates = updates
+
     def __repr__(self):
         return f"{self.__class__.__name__} {str(self.__dict__)}"
 
@@ -113,13 +146,17 @@ class PMMMarketInfo:
 
 
 class OnTick:
+    """
+    Only the strategy parameters changed since the previous tick are sent, and the balances are None when they did
+    not change, so the script keeps its own copy and applies the changes.
+    """
     def __init__(self, mid_price: Decimal,
-                 pmm_parameters: PMMParameters,
-                 all_total_balances: Dict[str, Dict[str, Decimal]],
-                 all_available_balances: Dict[str, Dict[str, Decimal]],
+                 updated_parameters: Dict[str, Any],
+                 all_total_balances: Optional[Dict[str, Dict[str, Decimal]]],
+                 all_available_balances: Optional[Dict[str, Dict[str, Decimal]]],
                  ):
         self.mid_price = mid_price
-        self.pmm_parameters = pmm_parameters
+        self.updated_parameters = updated_parameters
         self.all_total_balances = all_total_balances
         self.all_available_balances = all_available_balances
 
@@ -15,6 +15,10 @@ cdef class PMMScriptIterator(TimeIterator):
         object _script_module
         object _parent_queue
         object _child_queue
+        object _parameter_names
+        dict _sent_parameters
+        object _sent_total_balances
+        object _sent_available_balances
         object _ev_loop
         object _script_process
         object _listen_to_child_task
@@ -1,6 +1,7 @@
 # distutils: language=c++
 
 import asyncio
+import copy
 import logging
 from multiprocessing import Process, Queue
 from pathlib import Path
@@ -25,9 +26,10 @@ from hummingbot.pmm_script.pmm_script_interface import (
     PMMParameters,
     PMMMarketInfo,
     ScriptError,
-    StrategyParameter,
+    StrategyParameterUpdates,
 )
 from hummingbot.pmm_script.pmm_script_process import run_pmm_script
+from hummingbot.pmm_script.pmm_script_queue_reader import start_queue_reader
 from hummingbot.strategy.pure_market_making import PureMarketMakingStrategy
 
 sir_logger = None
@@ -52,6 +54,11 @@ cdef class PMMScriptIterator(TimeIterator):
         self._strategy = strategy
         self._is_unit_testing_mode = is_unit_testing_mode
         self._queue_check_interval = queue_check_interval
+        self._parameter_names = PMMParameters.parameter_names()
+        # The values last sent to the script, only the changes are sent on the next ticks
+        self._sent_parameters = {}
+        self._sent_total_balances = None
+        self._sent_available_balances = None
         self._did_complete_buy_order_forwarder = SourceInfoEventForwarder(self._did_complete_buy_order)
         self._did_complete_sell_order_forwarder = SourceInfoEventForwarder(self._did_complete_sell_order)
         self._event_pairs = [
@@ -94,13 +101,28 @@ cdef class PMMScriptIterator(TimeIterator):
         TimeIterator.c_tick(self, timestamp)
         if not self._strategy.all_markets_ready():
             return
-        cdef object pmm_strategy = PMMParameters()
-        for attr in PMMParameters.__dict__.keys():
-            if attr[:1] != '_':
-                param_value = getattr(self._strategy, attr)
-                setattr(pmm_strategy, attr, param_value)
-        cdef object on_tick = OnTick(self.strategy.get_mid_price(), pmm_strategy,
-                                     self.all_total_balances(), self.all_available_balances())
+        cdef:
+            dict updated_parameters = {}
+            object total_balances = self.all_total_balances()
+            object available_balances = self.all_available_balances()
+        for name in self._parameter_names:
+            param_value = getattr(self._strategy, name)
+            if name not in self._sent_parameters or self._sent_parameters[name] != param_value:
+                # Copied so a parameter modified in place (e.g. order_override) is still detected as changed, and is
+                # not modified while the queue feeder thread pickles it
+                sent_value = copy.deepcopy(param_value)
+                self._sent_parameters[name] = sent_value
+                updated_parameters[name] = sent_value
+        if total_balances == self._sent_total_balances:
+            total_balances = None
+        else:
+            self._sent_total_balances = total_balances
+        if available_balances == self._sent_available_balances:
+            available_balances = None
+        else:
+            self._sent_available_balances = available_balances
+        cdef object on_tick = OnTick(self.strategy.get_mid_price(), updated_parameters,
+                                     total_balances, available_balances)
         self._parent_queue.put(on_tick)
 
     def _did_complete_buy_order(self,
@@ -116,17 +138,16 @@ cdef class PMMScriptIterator(TimeIterator):
         self._parent_queue.put(event)
 
     async def listen_to_child_queue(self):
+        items = start_queue_reader(self._child_queue, self._ev_loop)
         while True:
             try:
-                if self._child_queue.empty():
-                    await asyncio.sleep(self._queue_check_interval)
-                    continue
-                item = self._child_queue.get()
+                item = await items.get()
                 if item is None:
                     break
-                if isinstance(item, StrategyParameter):
+                if isinstance(item, StrategyParameterUpdates):
                     self.logger().info(f"received: {str(item)}")
-                    setattr(self._strategy, item.name, item.updated_value)
+                    for name, value in item.updates.items():
+                        setattr(self._strategy, name, value)
                 elif isinstance(item, CallNotify) and not self._is_unit_testing_mode:
                     # ignore this on unit testing as the below import will mess up unit testing.
                     from hummingbot.client.hummingbot_application import HummingbotApplication
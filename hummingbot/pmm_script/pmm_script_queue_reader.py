@@ -0,0 +1,35 @@
+import asyncio
+import threading
+from multiprocessing import Queue
+
+
+def start_queue_reader(source_queue: Queue, ev_loop: asyncio.AbstractEventLoop) -> asyncio.Queue:
+    """
+    Forwards the items of a multiprocessing queue to an asyncio queue, from a daemon thread blocked on the source
+    queue. Each item is handed to the event loop as soon as it arrives, without polling the source queue or occupying
+    the loop default executor.
+    The thread stops after forwarding None, the message closing the script queues.
+
+    :param source_queue: the queue to read
+    :param ev_loop: the event loop the items are handed to
+    :return: the asyncio queue receiving the items
+    """
+    items: asyncio.Queue = asyncio.Queue()
+    reader_thread = threading.Thread(target=_forward_queue_items,
+                                     args=(source_queue, items, ev_loop),
+                                     name="pmm-script-queue-reader",
+                                     daemon=True)
+    reader_thread.start()
+    return items
+
+
+def _forward_queue_items(source_queue: Queue, items: asyncio.Queue, ev_loop: asyncio.AbstractEventLoop):
+    while True:
+        item = source_queue.get()
+        try:
+            ev_loop.call_soon_threadsafe(items.put_nowait, item)
+        except RuntimeError:
+            # The event loop has been closed
+            break
+        if item is None:
+            break
@@ -0,0 +1,96 @@
+import math
+from collections import deque
+from typing import Deque, Tuple
+
+import numpy as np
+
+
+class RangeVolatilityIndicator:
+    """
+    Average of the relative price ranges ((max - min) / min) of the last `processing_length` intervals of
+    `sampling_length` samples, the intervals ending at the last sample.
+
+    Unlike the BaseTrailingIndicator subclasses it does not recompute the value from its buffers on each sample:
+    - the min and max of the last interval are kept with monotonic deques (O(1) amortized per sample)
+    - the range of the interval ending at each sample is stored in a fixed size ring, and a running sum is kept for
+    each position in the interval, so the ranges of the intervals ending at the last sample, one interval before,
+    two intervals before... are averaged in O(1).
+    Until the first interval is complete the value is the range of all the samples received.
+    """
+
+    def __init__(self, sampling_length: int = 300, processing_length: int = 10):
+        """
+        :param sampling_length: the number of samples in an interval
+        :param processing_length: the number of intervals averaged
+        """
+        if sampling_length < 1 or processing_length < 1:
+            raise ValueError(f"The sampling ({sampling_length}) and processing ({processing_length}) lengths must "
+                             f"be positive.")
+        self._sampling_length: int = sampling_length
+        self._processing_length: int = processing_length
+        self._min_samples: Deque[Tuple[int, float]] = deque()
+        self._max_samples: Deque[Tuple[int, float]] = deque()
+        self._ranges: np.ndarray = np.zeros(sampling_length * processing_length, dtype=np.float64)
+        self._position_sums: np.ndarray = np.zeros(sampling_length, dtype=np.float64)
+        self._position_counts: np.ndarray = np.zeros(sampling_length, dtype=np.int64)
+        self._samples_count: int = 0
+        self._current_value: float = math.nan
+
+    @property
+    def sampling_length(self) -> int:
+        return self._sampling_length
+
+    @property
+    def processing_length(self) -> int:
+        return self._processing_length
+
+    @property
+    def samples_count(self) -> int:
+        return self._samples_count
+
+    @property
+    def is_sampling_buffer_full(self) -> bool:
+        return self._samples_count >= self._sampling_length
+
+    @property
+    def current_value(self) -> float:
+        return self._current_value
+
+    def add_sample(self, value: float):
+        """
+        Adds a price sample. NaN and non positive prices are ignored.
+        """
+        if not value > 0:
+            return
+        index = self._samples_count
+        self._samples_count += 1
+
+        while len(self._min_samples) > 0 and self._min_samples[-1][1] >= value:
+            self._min_samples.pop()
+        self._min_samples.append((index, value))
+        while len(self._max_samples) > 0 and self._max_samples[-1][1] <= value:
+            self._max_samples.pop()
+        self._max_samples.append((index, value))
+        first_index = index - self._sampling_length + 1
+        if self._min_samples[0][0] < first_index:
+            self._min_samples.popleft()
+        if self._max_samples[0][0] < first_index:
+            self._max_samples.popleft()
+
+        min_value = self._min_samples[0][1]
+        price_range = (self._max_samples[0][1] - min_value) / min_value
+        if first_index < 0:
+            # The first interval is not complete yet
+            self._current_value = price_range if index > 0 else math.nan
+            return
+
+        position = index % self._sampling_length
+        slot = index % len(self._ranges)
+        if index - len(self._ranges) >= self._sampling_length - 1:
+            # The range leaving the ring was stored for the same position
+            self._position_sums[position] -= self._ranges[slot]
+            self._position_counts[position] -= 1
+        self._ranges[slot] = price_range
+        self._position_sums[position] += price_range
+        self._position_counts[position] += 1
+        self._current_value = max(float(self._position_sums[position]), 0.0) / int(self._position_counts[position])
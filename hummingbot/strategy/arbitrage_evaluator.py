@@ -0,0 +1,337 @@
+import time
+from decimal import Decimal
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.connector.utils import split_hb_trading_pair
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.trade_fee import TradeFeeBase
+
+s_decimal_1 = Decimal(1)
+s_decimal_nan = Decimal("NaN")
+
+
+class ArbitrageLeg(NamedTuple):
+    market: ConnectorBase
+    trading_pair: str
+    is_buy: bool
+    order_type: OrderType = OrderType.MARKET
+
+
+class FeeSchedule(NamedTuple):
+    """
+    The fee of a trade as floats: the percent fee (0.001 for 0.1%) and the sum of the flat fees in quote asset
+    """
+    percent: float
+    flat_fee: float
+
+
+class CycleEvaluation(NamedTuple):
+    start_amounts: np.ndarray
+    end_amounts: np.ndarray
+    leg_base_amounts: np.ndarray  # one row per leg, the base asset amount bought or sold for each start amount
+    profitability: np.ndarray  # end amount / start amount - 1, NaN when the order books are not deep enough
+
+
+class CrossExchangeEvaluation(NamedTuple):
+    base_amounts: np.ndarray
+    buy_costs: np.ndarray  # converted with the buy market conversion rate, fees included
+    sell_proceeds: np.ndarray  # converted with the sell market conversion rate, fees deducted
+    profitability: np.ndarray  # sell proceeds / buy costs, NaN when the order books are not deep enough
+
+
+class OrderBookDepth:
+    """
+    The top levels of one side of an order book, with the cumulative base and quote amounts of the levels.
+
+    The cumulative amounts are piecewise linear functions of each other (the slope being the level price), so the quote
+    amount of a fill of any base amount, or the base amount of a fill of any quote amount, is a linear interpolation
+    computed for many amounts at once. Fills larger than the snapshot depth are NaN.
+    """
+
+    def __init__(self, prices: np.ndarray, amounts: np.ndarray):
+        """
+        :param prices: the levels prices, best first
+        :param amounts: the levels base asset amounts. Levels without amount are ignored
+        """
+        with_amount = amounts > 0
+        self._prices: np.ndarray = np.asarray(prices[with_amount], dtype=np.float64)
+        self._amounts: np.ndarray = np.asarray(amounts[with_amount], dtype=np.float64)
+        self._cumulative_base: np.ndarray = np.concatenate(([0.0], np.cumsum(self._amounts)))
+        self._cumulative_quote: np.ndarray = np.concatenate(([0.0], np.cumsum(self._prices * self._amounts)))
+
+    @classmethod
+    def from_order_book(cls, order_book, is_buy: bool, levels: int = 0) -> "OrderBookDepth":
+        """
+        Snapshots the side of the book filling a buy (the asks) or a sell (the bids)
+
+        :param order_book: the order book
+        :param is_buy: True for the asks, False for the bids
+        :param levels: the number of levels kept. 0 keeps all the levels
+        """
+        entries = order_book.asks_array(levels) if is_buy else order_book.bids_array(levels)
+        return cls(entries[:, 0], entries[:, 1])
+
+    @property
+    def prices(self) -> np.ndarray:
+        return self._prices
+
+    @property
+    def amounts(self) -> np.ndarray:
+        return self._amounts
+
+    @property
+    def cumulative_base(self) -> np.ndarray:
+        """
+        The base amounts at the end of each level, starting with 0
+        """
+        return self._cumulative_base
+
+    @property
+    def total_base(self) -> float:
+        return float(self._cumulative_base[-1])
+
+    @property
+    def total_quote(self) -> float:
+        return float(self._cumulative_quote[-1])
+
+    def quote_for_base(self, base_amounts) -> np.ndarray:
+        """
+        Returns the quote amounts of the fills of the base amounts
+        """
+        base_amounts = np.asarray(base_amounts, dtype=np.float64)
+        result = np.interp(base_amounts, self._cumulative_base, self._cumulative_quote)
+        return np.where(base_amounts <= self._cumulative_base[-1], result, np.nan)
+
+    def base_for_quote(self, quote_amounts) -> np.ndarray:
+        """
+        Returns the base amounts of the fills of the quote amounts
+        """
+        quote_amounts = np.asarray(quote_amounts, dtype=np.float64)
+        result = np.interp(quote_amounts, self._cumulative_quote, self._cumulative_base)
+        return np.where(quote_amounts <= self._cumulative_quote[-1], result, np.nan)
+
+
+class TradingFeeCache:
+    """
+    Keeps the fees returned by the markets `get_fee` for `ttl` seconds, by market, trading pair, order type and side.
+
+    The fees of most connectors only depend on those (the trading fees schedule of the account), so the fee of the
+    first trade evaluated is used for all the amounts and prices evaluated until it expires.
+    """
+
+    def __init__(self, ttl: float = 60.0):
+        self._ttl: float = ttl
+        self._fees: Dict[Tuple[Any, str, str, OrderType, TradeType], Tuple[float, TradeFeeBase, FeeSchedule]] = {}
+
+    @property
+    def ttl(self) -> float:
+        return self._ttl
+
+    def get_fee(self,
+                market: ConnectorBase,
+                base_currency: str,
+                quote_currency: str,
+                order_type: OrderType,
+                order_side: TradeType,
+                amount: Decimal = s_decimal_1,
+                price: Decimal = s_decimal_nan) -> TradeFeeBase:
+        return self._get_entry(market, base_currency, quote_currency, order_type, order_side, amount, price)[1]
+
+    def get_fee_schedule(self,
+                         market: ConnectorBase,
+                         base_currency: str,
+                         quote_currency: str,
+                         order_type: OrderType,
+                         order_side: TradeType,
+                         amount: Decimal = s_decimal_1,
+                         price: Decimal = s_decimal_nan) -> FeeSchedule:
+        return self._get_entry(market, base_currency, quote_currency, order_type, order_side, amount, price)[2]
+
+    def invalidate(self):
+        self._fees.clear()
+
+    def _get_entry(self,
+                   market: ConnectorBase,
+                   base_currency: str,
+                   quote_currency: str,
+                   order_type: OrderType,
+                   order_side: TradeType,
+                   amount: Decimal,
+                   price: Decimal) -> Tuple[float, TradeFeeBase, FeeSchedule]:
+        key = (market, base_currency, quote_currency, order_type, order_side)
+        entry = self._fees.get(key)
+        now = self._time()
+        if entry is None or now - entry[0] >= self._ttl:
+            fee = market.get_fee(base_currency, quote_currency, order_type, order_side, amount, price)
+            entry = (now, fee, FeeSchedule(float(fee.percent), float(self.sum_flat_fees(quote_currency, fee))))
+            self._fees[key] = entry
+        return entry
+
+    @staticmethod
+    def sum_flat_fees(quote_currency: str, fee: TradeFeeBase) -> Decimal:
+        """
+        Sums the flat fees of the fee, that must be in quote asset (see StrategyBase.c_sum_flat_fees)
+        """
+        total_flat_fees = Decimal(0)
+        for flat_fee_currency, flat_fee_amount in fee.flat_fees:
+            if flat_fee_currency != quote_currency:
+                raise ValueError(f"Flat fee in other token ({flat_fee_currency}) than quote asset ({quote_currency}) "
+                                 f"is not supported.")
+            total_flat_fees += flat_fee_amount
+        return total_flat_fees
+
+    @staticmethod
+    def _time() -> float:
+        return time.monotonic()
+
+
+class ArbitrageEvaluator:
+    """
+    Evaluates the profitability of arbitrage cycles (e.g. triangular arbitrage on one exchange) and of cross exchange
+    arbitrage on market pairs, for many order sizes at once.
+
+    The order books sides used are snapshotted into arrays once per tick (`start_tick`) and shared by all the
+    evaluations of the tick, so scanning many cycles or market pairs using the same books walks each book once. The
+    fees are taken from a `TradingFeeCache`.
+    The percent fee of a leg is deducted from what the leg returns, and its flat fees (in quote asset) from the quote
+    amount spent or received.
+    """
+
+    def __init__(self, depth: int = 100, fee_cache: Optional[TradingFeeCache] = None):
+        """
+        :param depth: the number of levels snapshotted for each order book side. Orders larger than the snapshot
+        depth are evaluated as NaN
+        :param fee_cache: the fees cache, shared with other components if provided
+        """
+        self._depth: int = depth
+        self._fee_cache: TradingFeeCache = fee_cache or TradingFeeCache()
+        self._timestamp: float = float("nan")
+        self._order_book_depths: Dict[Tuple[Any, str, bool], OrderBookDepth] = {}
+
+    @property
+    def depth(self) -> int:
+        return self._depth
+
+    @property
+    def fee_cache(self) -> TradingFeeCache:
+        return self._fee_cache
+
+    def start_tick(self, timestamp: float):
+        """
+        Discards the order books snapshots if they were taken at another timestamp
+        """
+        if timestamp != self._timestamp:
+            self._timestamp = timestamp
+            self._order_book_depths.clear()
+
+    def order_book_depth(self, market: ConnectorBase, trading_pair: str, is_buy: bool) -> OrderBookDepth:
+        """
+        Returns the snapshot of the side of the order book filling a buy (asks) or a sell (bids), taken once per tick
+        """
+        key = (market, trading_pair, is_buy)
+        depth = self._order_book_depths.get(key)
+        if depth is None:
+            depth = OrderBookDepth.from_order_book(market.get_order_book(trading_pair), is_buy, self._depth)
+            self._order_book_depths[key] = depth
+        return depth
+
+    def leg_fee_schedule(self, leg: ArbitrageLeg) -> FeeSchedule:
+        base, quote = split_hb_trading_pair(leg.trading_pair)
+        return self._fee_cache.get_fee_schedule(
+            leg.market, base, quote, leg.order_type, TradeType.BUY if leg.is_buy else TradeType.SELL)
+
+    def evaluate_cycle(self, legs: Sequence[ArbitrageLeg], start_amounts) -> CycleEvaluation:
+        """
+        Evaluates a cycle of trades, each leg spending what the previous one returned: the quote asset for buys, the
+        base asset for sells.
+
+        :param legs: the cycle legs, in order. The first leg spends the start amounts
+        :param start_amounts: the amounts spent by the first leg, a scalar or an array
+        """
+        start_amounts = np.atleast_1d(np.asarray(start_amounts, dtype=np.float64))
+        leg_base_amounts = np.empty((len(legs), len(start_amounts)), dtype=np.float64)
+        exchanged_amounts = start_amounts
+        for index, leg in enumerate(legs):
+            depth = self.order_book_depth(leg.market, leg.trading_pair, leg.is_buy)
+            fee = self.leg_fee_schedule(leg)
+            if leg.is_buy:
+                base_amounts = depth.base_for_quote(np.maximum(exchanged_amounts - fee.flat_fee, 0))
+                leg_base_amounts[index] = base_amounts
+                exchanged_amounts = base_amounts * (1 - fee.percent)
+            else:
+                leg_base_amounts[index] = exchanged_amounts
+                exchanged_amounts = depth.quote_for_base(exchanged_amounts) * (1 - fee.percent) - fee.flat_fee
+        return CycleEvaluation(start_amounts=start_amounts,
+                               end_amounts=exchanged_amounts,
+                               leg_base_amounts=leg_base_amounts,
+                               profitability=exchanged_amounts / start_amounts - 1)
+
+    def evaluate_cycles(self,
+                        cycles: Dict[str, Sequence[ArbitrageLeg]],
+                        start_amounts) -> Dict[str, CycleEvaluation]:
+        """
+        Evaluates several cycles (e.g. the directions of a triangle, or many triangles) with the same start amounts
+        """
+        return {name: self.evaluate_cycle(legs, start_amounts) for name, legs in cycles.items()}
+
+    def cross_exchange_size_steps(self, buy_leg: ArbitrageLeg, sell_leg: ArbitrageLeg) -> np.ndarray:
+        """
+        Returns the base amounts at which the buy or the sell fill moves to the next level, as long as both books have
+        enough depth: the sizes evaluated by the arbitrage strategy steps
+        """
+        buy_depth = self.order_book_depth(buy_leg.market, buy_leg.trading_pair, True)
+        sell_depth = self.order_book_depth(sell_leg.market, sell_leg.trading_pair, False)
+        max_amount = min(buy_depth.total_base, sell_depth.total_base)
+        steps = np.union1d(buy_depth.cumulative_base[1:], sell_depth.cumulative_base[1:])
+        return steps[steps <= max_amount]
+
+    def evaluate_cross_exchange(self,
+                                buy_leg: ArbitrageLeg,
+                                sell_leg: ArbitrageLeg,
+                                base_amounts=None,
+                                buy_conversion_rate: float = 1.0,
+                                sell_conversion_rate: float = 1.0) -> CrossExchangeEvaluation:
+        """
+        Evaluates buying base amounts on the buy leg market and selling them on the sell leg market.
+
+        :param buy_leg: the market the base asset is bought on
+        :param sell_leg: the market the base asset is sold on
+        :param base_amounts: the order sizes evaluated, all the size steps (see cross_exchange_size_steps) if None
+        :param buy_conversion_rate: the rate converting the buy market quote asset to a common quote asset
+        :param sell_conversion_rate: the rate converting the sell market quote asset to the common quote asset
+        """
+        if base_amounts is None:
+            base_amounts = self.cross_exchange_size_steps(buy_leg, sell_leg)
+        base_amounts = np.atleast_1d(np.asarray(base_amounts, dtype=np.float64))
+        buy_depth = self.order_book_depth(buy_leg.market, buy_leg.trading_pair, True)
+        sell_depth = self.order_book_depth(sell_leg.market, sell_leg.trading_pair, False)
+        buy_fee = self.leg_fee_schedule(buy_leg._replace(is_buy=True))
+        sell_fee = self.leg_fee_schedule(sell_leg._replace(is_buy=False))
+
+        buy_costs = (buy_depth.quote_for_base(base_amounts) * buy_conversion_rate * (1 + buy_fee.percent)
+                     + buy_fee.flat_fee)
+        sell_proceeds = (sell_depth.quote_for_base(base_amounts) * sell_conversion_rate * (1 - sell_fee.percent)
+                         - sell_fee.flat_fee)
+        return CrossExchangeEvaluation(base_amounts=base_amounts,
+                                       buy_costs=buy_costs,
+                                       sell_proceeds=sell_proceeds,
+                                       profitability=sell_proceeds / buy_costs)
+
+    def best_cross_exchange_amount(self,
+                                   buy_leg: ArbitrageLeg,
+                                   sell_leg: ArbitrageLeg,
+                                   min_profitability: float,
+                                   buy_conversion_rate: float = 1.0,
+                                   sell_conversion_rate: float = 1.0) -> Tuple[float, float]:
+        """
+        Returns the largest size step with a profitability above 1 + min_profitability, and its profitability.
+        (0, NaN) if there is none
+        """
+        evaluation = self.evaluate_cross_exchange(buy_leg, sell_leg, None, buy_conversion_rate, sell_conversion_rate)
+        profitable: List[int] = np.flatnonzero(evaluation.profitability > 1 + min_profitability).tolist()
+        if len(profitable) == 0:
+            return 0.0, float("nan")
+        return float(evaluation.base_amounts[profitable[-1]]), float(evaluation.profitability[profitable[-1]])
@@ -79,4 +79,5 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
     cdef c_calculate_reservation_price_and_optimal_spread(self)
     cdef object c_calculate_target_inventory(self)
     cdef object c_calculate_inventory(self)
+    cdef double c_calculate_inventory_q(self)
     cdef c_did_complete_order(self, object order_completed_event)
@@ -25,6 +25,8 @@ from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils import map_df_to_str
 from hummingbot.strategy.__utils__.trailing_indicators.instant_volatility import InstantVolatilityIndicator
 from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import TradingIntensityIndicator
+from hummingbot.strategy.avellaneda_market_making cimport avellaneda_model
+from hummingbot.strategy.avellaneda_market_making.avellaneda_model cimport AvellanedaQuotes
 from hummingbot.strategy.avellaneda_market_making.avellaneda_market_making_config_map_pydantic import (
     AvellanedaMarketMakingConfigMap,
     DailyBetweenTimesModel,
@@ -700,9 +702,6 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
 
         self._alpha, self._kappa = self._trading_intensity.current_value
 
-        self._alpha = Decimal(self._alpha)
-        self._kappa = Decimal(self._kappa)
-
         if self._is_debug:
             self.logger().info(f"alpha={self._alpha:.4f} | "
                                f"kappa={self._kappa:.4f}")
@@ -712,29 +711,28 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
 
     cdef c_calculate_reservation_price_and_optimal_spread(self):
         cdef:
-            ExchangeBase market = self._market_info.market
-
-        # Current mid price
-        price = self.get_price()
+            double price = float(self.get_price())
+            double q
+            double vol
+            double time_left_fraction
+            AvellanedaQuotes quotes
 
         # The amount of stocks owned - q - has to be in relative units, not absolute, because changing the portfolio size shouldn't change the reservation price
         # The reservation price should concern itself only with the strategy performance, i.e. amount of stocks relative to the target
-        inventory = Decimal(str(self.c_calculate_inventory()))
-        if inventory == 0:
+        q = self.c_calculate_inventory_q()
+        if isnan(q):
             return
 
-        q_target = Decimal(str(self.c_calculate_target_inventory()))
-        q = (market.get_balance(self.base_asset) - q_target) / (inventory)
         # Volatility has to be in absolute values (prices) because in calculation of reservation price it's not multiplied by the current price, therefore
         # it can't be a percentage. The result of the multiplication has to be an absolute price value because it's being subtracted from the current price
-        vol = self.get_volatility()
+        vol = self._avg_vol.current_value
 
         # order book liquidity - kappa and alpha have to represent absolute values because the second member of the optimal spread equation has to be an absolute price
         # and from the reservation price calculation we know that gamma's unit is not absolute price
-        if all((self.gamma, self._kappa)) and self._alpha != 0 and self._kappa > 0 and vol != 0:
+        if all((self.gamma, self._kappa)) and self._alpha != 0 and self._kappa > 0 and vol != 0 and not isnan(vol):
             if self._execution_state.time_left is not None and self._execution_state.closing_time is not None:
                 # Avellaneda-Stoikov for a fixed timespan
-                time_left_fraction = Decimal(str(self._execution_state.time_left / self._execution_state.closing_time))
+                time_left_fraction = self._execution_state.time_left / self._execution_state.closing_time
             else:
                 # Avellaneda-Stoikov for an infinite timespan
                 # The equations in the paper for this contain a few mistakes
@@ -752,18 +750,19 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
             # current mid price
             # This leads to normalization of the risk_factor and will guaranetee consistent behavior on all price ranges of the asset, and across assets
 
-            self._reservation_price = price - (q * self.gamma * vol * time_left_fraction)
-
-            self._optimal_spread = self.gamma * vol * time_left_fraction
-            self._optimal_spread += 2 * Decimal(1 + self.gamma / self._kappa).ln() / self.gamma
-
-            min_spread = price / 100 * Decimal(str(self._config_map.min_spread))
-
-            max_limit_bid = price - min_spread / 2
-            min_limit_ask = price + min_spread / 2
-
-            self._optimal_ask = max(self._reservation_price + self._optimal_spread / 2, min_limit_ask)
-            self._optimal_bid = min(self._reservation_price - self._optimal_spread / 2, max_limit_bid)
+            # The model is computed with floats, the results are converted to Decimal once here and quantized when
+            # the orders are proposed
+            quotes = avellaneda_model.c_calculate_quotes(price,
+                                                         q,
+                                                         float(self.gamma),
+                                                         vol,
+                                                         self._kappa,
+                                                         time_left_fraction,
+                                                         float(self._config_map.min_spread))
+            self._reservation_price = Decimal(str(quotes.reservation_price))
+            self._optimal_spread = Decimal(str(quotes.optimal_spread))
+            self._optimal_ask = Decimal(str(quotes.optimal_ask))
+            self._optimal_bid = Decimal(str(quotes.optimal_bid))
 
             # This is not what the algorithm will use as proposed bid and ask. This is just the raw output.
             # Optimal bid and optimal ask prices will be used
@@ -771,10 +770,10 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
                 self.logger().info(f"q={q:.4f} | "
                                    f"vol={vol:.10f}")
                 self.logger().info(f"mid_price={price:.10f} | "
-                                   f"reservation_price={self._reservation_price:.10f} | "
-                                   f"optimal_spread={self._optimal_spread:.10f}")
-                self.logger().info(f"optimal_bid={(price-(self._reservation_price - self._optimal_spread / 2)) / price * 100:.4f}% | "
-                                   f"optimal_ask={((self._reservation_price + self._optimal_spread / 2) - price) / price * 100:.4f}%")
+                                   f"reservation_price={quotes.reservation_price:.10f} | "
+                                   f"optimal_spread={quotes.optimal_spread:.10f}")
+                self.logger().info(f"optimal_bid={(price-(quotes.reservation_price - quotes.optimal_spread / 2)) / price * 100:.4f}% | "
+                                   f"optimal_ask={((quotes.reservation_price + quotes.optimal_spread / 2) - price) / price * 100:.4f}%")
 
     def calculate_reservation_price_and_optimal_spread(self):
         return self.c_calculate_reservation_price_and_optimal_spread()
@@ -783,24 +782,14 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
         cdef:
             ExchangeBase market = self._market_info.market
             str trading_pair = self._market_info.trading_pair
-            str base_asset = self._market_info.base_asset
-            str quote_asset = self._market_info.quote_asset
-            object mid_price
-            object base_value
-            object inventory_value
-            object target_inventory_value
-
-        price = self.get_price()
-        base_asset_amount = market.get_balance(base_asset)
-        quote_asset_amount = market.get_balance(quote_asset)
-        # Base asset value in quote asset prices
-        base_value = base_asset_amount * price
-        # Total inventory value in quote asset prices
-        inventory_value = base_value + quote_asset_amount
-        # Target base asset value in quote asset prices
-        target_inventory_value = inventory_value * self.inventory_target_base
-        # Target base asset amount
-        target_inventory_amount = target_inventory_value / price
+            double target_inventory_amount
+
+        # Target base asset amount, from the total inventory value in quote asset prices
+        target_inventory_amount = avellaneda_model.c_calculate_target_inventory(
+            float(market.c_get_balance(self._market_info.base_asset)),
+            float(market.c_get_balance(self._market_info.quote_asset)),
+            float(self.get_price()),
+            float(self.inventory_target_base))
         return market.c_quantize_order_amount(trading_pair, Decimal(str(target_inventory_amount)))
 
     def calculate_target_inventory(self) -> Decimal:
@@ -809,28 +798,39 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
     cdef c_calculate_inventory(self):
         cdef:
             ExchangeBase market = self._market_info.market
-            str base_asset = self._market_info.base_asset
-            str quote_asset = self._market_info.quote_asset
-            object mid_price
-            object base_value
-            object inventory_value
-            object inventory_value_quote
-            object inventory_value_base
 
-        price = self.get_price()
-        base_asset_amount = market.get_balance(base_asset)
-        quote_asset_amount = market.get_balance(quote_asset)
-        # Base asset value in quote asset prices
-        base_value = base_asset_amount * price
-        # Total inventory value in quote asset prices
-        inventory_value_quote = base_value + quote_asset_amount
         # Total inventory value in base asset prices
-        inventory_value_base = inventory_value_quote / price
-        return inventory_value_base
+        return Decimal(str(avellaneda_model.c_calculate_inventory(
+            float(market.c_get_balance(self._market_info.base_asset)),
+            float(market.c_get_balance(self._market_info.quote_asset)),
+            float(self.get_price()))))
 
     def calculate_inventory(self) -> Decimal:
         return self.c_calculate_inventory()
 
+    cdef double c_calculate_inventory_q(self):
+        """
+        Returns the deviation of the base asset amount from the target inventory, relative to the total inventory.
+        NaN if there is no inventory.
+        """
+        cdef:
+            ExchangeBase market = self._market_info.market
+            double base_asset_amount = float(market.c_get_balance(self._market_info.base_asset))
+            double quote_asset_amount = float(market.c_get_balance(self._market_info.quote_asset))
+            double price = float(self.get_price())
+
+        return avellaneda_model.c_calculate_inventory_q(
+            base_asset_amount,
+            quote_asset_amount,
+            price,
+            avellaneda_model.c_calculate_target_inventory(base_asset_amount,
+                                                          quote_asset_amount,
+                                                          price,
+                                                          float(self.inventory_target_base)))
+
+    def calculate_inventory_q(self) -> float:
+        return self.c_calculate_inventory_q()
+
     cdef bint c_is_algorithm_ready(self):
         return self._avg_vol.is_sampling_buffer_full and self._trading_intensity.is_sampling_buffer_full
 
@@ -1082,6 +1082,8 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
         cdef:
             ExchangeBase market = self._market_info.market
             str trading_pair = self._market_info.trading_pair
+            double q
+            object amount_factor
 
         # Order amounts should be changed only if order_override is not active
         if (self.order_override is None) or (len(self.order_override) == 0):
@@ -1090,26 +1092,21 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
 
             # q cannot be in absolute values - cannot be dependent on the size of the inventory or amount of base asset
             # because it's a scaling factor
-            inventory = Decimal(str(self.c_calculate_inventory()))
-
-            if inventory == 0:
+            q = self.c_calculate_inventory_q()
+            if isnan(q):
                 return
 
-            q_target = Decimal(str(self.c_calculate_target_inventory()))
-            q = (market.get_balance(self.base_asset) - q_target) / (inventory)
-
-            if len(proposal.buys) > 0:
-                if q > 0:
-                    for i, proposed in enumerate(proposal.buys):
-
-                        proposal.buys[i].size = market.c_quantize_order_amount(trading_pair, proposal.buys[i].size * Decimal.exp(-self.eta * q))
-                    proposal.buys = [o for o in proposal.buys if o.size > 0]
-
-            if len(proposal.sells) > 0:
-                if q < 0:
-                    for i, proposed in enumerate(proposal.sells):
-                        proposal.sells[i].size = market.c_quantize_order_amount(trading_pair, proposal.sells[i].size * Decimal.exp(self.eta * q))
-                    proposal.sells = [o for o in proposal.sells if o.size > 0]
+            if len(proposal.buys) > 0 and q > 0:
+                amount_factor = Decimal(str(avellaneda_model.c_order_amount_factor(q, float(self.eta), True)))
+                for proposed in proposal.buys:
+                    proposed.size = market.c_quantize_order_amount(trading_pair, proposed.size * amount_factor)
+                proposal.buys = [o for o in proposal.buys if o.size > 0]
+
+            if len(proposal.sells) > 0 and q < 0:
+                amount_factor = Decimal(str(avellaneda_model.c_order_amount_factor(q, float(self.eta), False)))
+                for proposed in proposal.sells:
+                    proposed.size = market.c_quantize_order_amount(trading_pair, proposed.size * amount_factor)
+                proposal.sells = [o for o in proposal.sells if o.size > 0]
 
     def apply_order_amount_eta_transformation(self, proposal: Proposal):
         self.c_apply_order_amount_eta_transformation(proposal)
@@ -0,0 +1,23 @@
+cdef struct AvellanedaQuotes:
+    double reservation_price
+    double optimal_spread
+    double optimal_bid
+    double optimal_ask
+
+cdef double c_calculate_inventory(double base_asset_amount, double quote_asset_amount, double price)
+cdef double c_calculate_target_inventory(double base_asset_amount,
+                                         double quote_asset_amount,
+                                         double price,
+                                         double target_base_asset_ratio)
+cdef double c_calculate_inventory_q(double base_asset_amount,
+                                    double quote_asset_amount,
+                                    double price,
+                                    double target_base_asset_amount)
+cdef AvellanedaQuotes c_calculate_quotes(double price,
+                                         double q,
+                                         double gamma,
+                                         double volatility,
+                                         double kappa,
+                                         double time_left_fraction,
+                                         double min_spread)
+cdef double c_order_amount_factor(double q, double eta, bint is_buy)
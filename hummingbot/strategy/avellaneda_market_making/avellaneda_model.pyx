@@ -0,0 +1,160 @@
+from libc.math cimport NAN, exp, log
+
+import numpy as np
+import pandas as pd
+
+
+def calculate_inventory(base_asset_amount: float, quote_asset_amount: float, price: float) -> float:
+    return c_calculate_inventory(base_asset_amount, quote_asset_amount, price)
+
+
+def calculate_target_inventory(base_asset_amount: float,
+                                quote_asset_amount: float,
+                                price: float,
+                                target_base_asset_ratio: float) -> float:
+    return c_calculate_target_inventory(base_asset_amount, quote_asset_amount, price, target_base_asset_ratio)
+
+
+def calculate_inventory_q(base_asset_amount: float,
+                          quote_asset_amount: float,
+                          price: float,
+                          target_base_asset_amount: float) -> float:
+    return c_calculate_inventory_q(base_asset_amount, quote_asset_amount, price, target_base_asset_amount)
+
+
+def calculate_quotes(price: float,
+                     q: float,
+                     gamma: float,
+                     volatility: float,
+                     kappa: float,
+                     time_left_fraction: float = 1.0,
+                     min_spread: float = 0.0):
+    """
+    Returns the (reservation price, optimal spread, optimal bid, optimal ask) of the model for a single point
+    """
+    cdef AvellanedaQuotes quotes = c_calculate_quotes(price, q, gamma, volatility, kappa, time_left_fraction,
+                                                      min_spread)
+    return quotes.reservation_price, quotes.optimal_spread, quotes.optimal_bid, quotes.optimal_ask
+
+
+def order_amount_factor(q: float, eta: float, is_buy: bool) -> float:
+    return c_order_amount_factor(q, eta, is_buy)
+
+
+def evaluate_model(price,
+                   q,
+                   gamma,
+                   volatility,
+                   kappa,
+                   time_left_fraction=1.0,
+                   min_spread=0.0,
+                   eta=0.0) -> pd.DataFrame:
+    """
+    Evaluates the model for many points at once, for sensitivity analysis and parameter sweeps.
+
+    The arguments are scalars or arrays broadcast against each other (use np.meshgrid for a full grid), and the
+    result has one row per point with the inputs and the model outputs. The points where the model is not defined
+    (non positive kappa or gamma) have NaN outputs.
+
+    :param price: the mid price
+    :param q: the inventory deviation from the target, relative to the total inventory in base asset
+    :param gamma: the risk factor
+    :param volatility: the mid price volatility, in price units
+    :param kappa: the order book depth factor estimated by the trading intensity indicator
+    :param time_left_fraction: the fraction of the trading session left, 1 for an infinite session
+    :param min_spread: the minimum spread, in percentage of the mid price
+    :param eta: the order amount shape factor
+    """
+    inputs = np.broadcast_arrays(*(np.asarray(value, dtype=np.float64).ravel()
+                                   for value in (price, q, gamma, volatility, kappa, time_left_fraction,
+                                                 min_spread, eta)))
+    price, q, gamma, volatility, kappa, time_left_fraction, min_spread, eta = inputs
+    valid = (gamma > 0) & (kappa > 0)
+    gamma_safe = np.where(valid, gamma, 1.0)
+    kappa_safe = np.where(valid, kappa, 1.0)
+
+    risk_term = gamma * volatility * time_left_fraction
+    reservation_price = price - q * risk_term
+    optimal_spread = risk_term + 2 * np.log1p(gamma_safe / kappa_safe) / gamma_safe
+    min_spread_value = price / 100 * min_spread
+    optimal_ask = np.maximum(reservation_price + optimal_spread / 2, price + min_spread_value / 2)
+    optimal_bid = np.minimum(reservation_price - optimal_spread / 2, price - min_spread_value / 2)
+    for output in (reservation_price, optimal_spread, optimal_ask, optimal_bid):
+        output[~valid] = np.nan
+
+    return pd.DataFrame({
+        "price": price,
+        "q": q,
+        "gamma": gamma,
+        "volatility": volatility,
+        "kappa": kappa,
+        "time_left_fraction": time_left_fraction,
+        "reservation_price": reservation_price,
+        "optimal_spread": optimal_spread,
+        "optimal_bid": optimal_bid,
+        "optimal_ask": optimal_ask,
+        "buy_amount_factor": np.where(q > 0, np.exp(-eta * q), 1.0),
+        "sell_amount_factor": np.where(q < 0, np.exp(eta * q), 1.0),
+    })
+
+
+cdef double c_calculate_inventory(double base_asset_amount, double quote_asset_amount, double price):
+    """
+    Returns the total inventory value in base asset
+    """
+    return (base_asset_amount * price + quote_asset_amount) / price
+
+
+cdef double c_calculate_target_inventory(double base_asset_amount,
+                                         double quote_asset_amount,
+                                         double price,
+                                         double target_base_asset_ratio):
+    """
+    Returns the target base asset amount, before quantization
+    """
+    return c_calculate_inventory(base_asset_amount, quote_asset_amount, price) * target_base_asset_ratio
+
+
+cdef double c_calculate_inventory_q(double base_asset_amount,
+                                    double quote_asset_amount,
+                                    double price,
+                                    double target_base_asset_amount):
+    """
+    Returns the deviation of the base asset amount from its target, relative to the total inventory so that the
+    portfolio size does not change the reservation price. NaN if there is no inventory.
+    """
+    cdef double inventory = c_calculate_inventory(base_asset_amount, quote_asset_amount, price)
+    if inventory == 0:
+        return NAN
+    return (base_asset_amount - target_base_asset_amount) / inventory
+
+
+cdef AvellanedaQuotes c_calculate_quotes(double price,
+                                         double q,
+                                         double gamma,
+                                         double volatility,
+                                         double kappa,
+                                         double time_left_fraction,
+                                         double min_spread):
+    cdef:
+        AvellanedaQuotes quotes
+        double risk_term = gamma * volatility * time_left_fraction
+        double min_spread_value = price / 100 * min_spread
+
+    quotes.reservation_price = price - q * risk_term
+    quotes.optimal_spread = risk_term + 2 * log(1 + gamma / kappa) / gamma
+    quotes.optimal_ask = max(quotes.reservation_price + quotes.optimal_spread / 2, price + min_spread_value / 2)
+    quotes.optimal_bid = min(quotes.reservation_price - quotes.optimal_spread / 2, price - min_spread_value / 2)
+    return quotes
+
+
+cdef double c_order_amount_factor(double q, double eta, bint is_buy):
+    """
+    Returns the factor applied to the orders amount, decreasing exponentially for the orders going against the
+    inventory target (buying with excess inventory or selling with an inventory deficit)
+    """
+    if is_buy and q > 0:
+        return exp(-eta * q)
+    if not is_buy and q < 0:
+        return exp(eta * q)
+    return 1
@@ -40,6 +40,8 @@ cdef class FixedGridStrategy(StrategyBase):
         list _base_inv_levels
         list _quote_inv_levels 
         list _quote_inv_levels_current_price
+        list _quantized_price_levels
+        object _quantized_order_amount
         int _current_level
         object _grid_spread 
         bint _inv_correct
@@ -49,14 +51,16 @@ cdef class FixedGridStrategy(StrategyBase):
 
     cdef object c_get_mid_price(self)
     cdef object c_create_rebalance_proposal(self)
+    cdef c_quantize_grid_levels(self)
     cdef object c_create_grid_proposal(self)
     cdef tuple c_get_adjusted_available_balance(self, list orders)
     cdef c_apply_order_price_modifiers(self, object proposal)
     cdef c_filter_out_takers(self, object proposal)
     cdef c_apply_order_optimization(self, object proposal)
-    cdef bint c_is_within_tolerance(self, list current_prices, list proposal_prices)
-    cdef c_cancel_active_orders(self, object proposal)
+    cdef list c_diff_orders(self, list active_orders, list proposed, list cancel_order_ids)
     cdef c_cancel_active_orders_on_max_age_limit(self)
-    cdef bint c_to_create_orders(self, object proposal)
+    cdef object c_create_orders_batch(self, object proposal)
+    cdef c_execute_orders_batch(self, object orders_proposal)
+    cdef bint c_to_create_orders(self, object orders_proposal)
     cdef c_execute_orders_proposal(self, object proposal)
     cdef set_timers(self)
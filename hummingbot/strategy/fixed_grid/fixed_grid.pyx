@@ -1,5 +1,6 @@
 import logging
 import time
+from bisect import bisect_left
 from decimal import Decimal
 from math import (
     ceil,
@@ -28,6 +29,9 @@ from hummingbot.strategy.strategy_base import StrategyBase
 from hummingbot.strategy.utils import order_age
 from hummingbot.strategy.order_tracker import OrderTracker
 from .data_types import (
+    ORDER_PROPOSAL_ACTION_CANCEL_ORDERS,
+    ORDER_PROPOSAL_ACTION_CREATE_ORDERS,
+    OrdersProposal,
     PriceSize,
     Proposal,
 )
@@ -109,6 +113,8 @@ cdef class FixedGridStrategy(StrategyBase):
         self._base_inv_levels = []
         self._quote_inv_levels = []
         self._quote_inv_levels_current_price = []
+        self._quantized_price_levels = []
+        self._quantized_order_amount = s_decimal_zero
         self._current_level = -100
         self._grid_spread = (self._grid_price_ceiling - self._grid_price_floor)/(self._n_levels-1)
         self._inv_correct = True
@@ -424,12 +430,16 @@ cdef class FixedGridStrategy(StrategyBase):
 
     cdef c_start(self, Clock clock, double timestamp):
         StrategyBase.c_start(self, clock, timestamp)
-        
+
+        # The grid levels are computed once, the quote inventory of a level is the cost of buying back the order
+        # amount at each level below it
+        cdef object prices_below_sum = s_decimal_zero
         for i in range(self._n_levels):
             self._price_levels.append(self._grid_price_floor + (i)*self._grid_spread)
             self._base_inv_levels.append((self._n_levels-i-1)*self._order_amount)
-            self._quote_inv_levels.append(sum(self._price_levels[0:i])*self._order_amount)
+            self._quote_inv_levels.append(prices_below_sum*self._order_amount)
             self._quote_inv_levels_current_price.append(self._quote_inv_levels[i]/self._price_levels[i])
+            prices_below_sum += self._price_levels[i]
 
         self._last_timestamp = timestamp
 
@@ -466,13 +476,12 @@ cdef class FixedGridStrategy(StrategyBase):
                 # If grid level not yet set, find it. 
                 if self._current_level is -100:
                     price = self._market_info.get_mid_price()
-                    # Find level closest to market
-                    min_diff = 1e8
-                    for i in range(self._n_levels):
-                        if min(min_diff, abs(self._price_levels[i]-price)) < min_diff:
-                            min_diff = abs(self._price_levels[i]-price)
-                            self._current_level = i
-                            
+                    # Find level closest to market, the lower one if the price is halfway between two levels
+                    level = min(bisect_left(self._price_levels, price), self._n_levels - 1)
+                    if level > 0 and price - self._price_levels[level - 1] <= abs(self._price_levels[level] - price):
+                        level -= 1
+                    self._current_level = level
+
                     self.logger().info(f"Initial level {self._current_level+1}")
 
                     if price > self._grid_price_ceiling:
@@ -532,34 +541,33 @@ cdef class FixedGridStrategy(StrategyBase):
                     self.c_filter_out_takers(proposal)
 
             self.c_cancel_active_orders_on_max_age_limit()
-            self.c_cancel_active_orders(proposal)
-            if self.c_to_create_orders(proposal):
-                self.c_execute_orders_proposal(proposal)
+            self.c_execute_orders_batch(self.c_create_orders_batch(proposal))
         finally:
             self._last_timestamp = timestamp
 
-    cdef object c_create_grid_proposal(self):
+    cdef c_quantize_grid_levels(self):
+        """
+        Quantizes the grid level prices and the order amount once, the market trading rules are only available once
+        the market is ready
+        """
         cdef:
             ExchangeBase market = self._market_info.market
+        self._quantized_price_levels = [market.c_quantize_order_price(self.trading_pair, price)
+                                        for price in self._price_levels]
+        self._quantized_order_amount = market.c_quantize_order_amount(self.trading_pair, self._order_amount)
+
+    cdef object c_create_grid_proposal(self):
+        cdef:
             list buys = []
             list sells = []
 
+        if len(self._quantized_price_levels) == 0:
+            self.c_quantize_grid_levels()
         # Proposal will be created according to grid price levels
-        for i in range(self._current_level):
-            price = self._price_levels[i]
-            price = market.c_quantize_order_price(self.trading_pair, price)
-            size = self._order_amount
-            size = market.c_quantize_order_amount(self.trading_pair, size)
-            if size > 0:
-                buys.append(PriceSize(price, size))
-
-        for i in range(self._current_level+1,self._n_levels):
-            price = self._price_levels[i]
-            price = market.c_quantize_order_price(self.trading_pair, price)
-            size = self._order_amount
-            size = market.c_quantize_order_amount(self.trading_pair, size)
-            if size > 0:
-                sells.append(PriceSize(price, size))
+        size = self._quantized_order_amount
+        if size > 0:
+            buys = [PriceSize(price, size) for price in self._quantized_price_levels[:self._current_level]]
+            sells = [PriceSize(price, size) for price in self._quantized_price_levels[self._current_level + 1:]]
 
         return Proposal(buys, sells)
 
@@ -734,10 +742,10 @@ cdef class FixedGridStrategy(StrategyBase):
             # Set the new level
             self._current_level = self._current_level - 1
             # Add sell order above current level
-            price = self._price_levels[self._current_level+1]
-            price = market.c_quantize_order_price(self.trading_pair, price)
-            size = self._order_amount
-            size = market.c_quantize_order_amount(self.trading_pair, size)
+            if len(self._quantized_price_levels) == 0:
+                self.c_quantize_grid_levels()
+            price = self._quantized_price_levels[self._current_level+1]
+            size = self._quantized_order_amount
             self.c_execute_orders_proposal(Proposal([], [PriceSize(price, size)]))
 
         self.notify_hb_app(
@@ -776,10 +784,10 @@ cdef class FixedGridStrategy(StrategyBase):
             # Set the new level
             self._current_level = self._current_level + 1
             # Add buy order above current level
-            price = self._price_levels[self._current_level-1]
-            price = market.c_quantize_order_price(self.trading_pair, price)
-            size = self._order_amount
-            size = market.c_quantize_order_amount(self.trading_pair, size)
+            if len(self._quantized_price_levels) == 0:
+                self.c_quantize_grid_levels()
+            price = self._quantized_price_levels[self._current_level-1]
+            size = self._quantized_order_amount
             self.c_execute_orders_proposal(Proposal([PriceSize(price, size)], []))
 
         self.notify_hb_app(
@@ -787,16 +795,35 @@ cdef class FixedGridStrategy(StrategyBase):
             f"{limit_order_record.price} {limit_order_record.quote_currency} is filled."
         )
 
-    cdef bint c_is_within_tolerance(self, list current_prices, list proposal_prices):
-        if len(current_prices) != len(proposal_prices):
-            return False
-        current_prices = sorted(current_prices)
-        proposal_prices = sorted(proposal_prices)
-        for current, proposal in zip(current_prices, proposal_prices):
-            # if spread diff is more than the tolerance or order quantities are different, return false.
-            if abs(proposal - current)/current > self._order_refresh_tolerance_pct:
-                return False
-        return True
+    cdef list c_diff_orders(self, list active_orders, list proposed, list cancel_order_ids):
+        """
+        Matches the active orders of a side with the proposed orders of the same side, both sorted by price. An active
+        order matches a proposed order if its price is within order_refresh_tolerance_pct of the proposed price and it
+        has the proposed size (no order matches with a negative tolerance).
+        Adds the ids of the unmatched active orders to cancel_order_ids and returns the unmatched proposed orders.
+        """
+        cdef:
+            list unmatched = []
+            int i = 0
+            int j = 0
+        active_orders = sorted(active_orders, key=lambda o: o.price)
+        proposed = sorted(proposed, key=lambda p: p.price)
+        while i < len(active_orders) and j < len(proposed):
+            order = active_orders[i]
+            price_size = proposed[j]
+            if (order.quantity == price_size.size
+                    and abs(price_size.price - order.price) / order.price <= self._order_refresh_tolerance_pct):
+                i += 1
+                j += 1
+            elif order.price < price_size.price:
+                cancel_order_ids.append(order.client_order_id)
+                i += 1
+            else:
+                unmatched.append(price_size)
+                j += 1
+        cancel_order_ids.extend([o.client_order_id for o in active_orders[i:]])
+        unmatched.extend(proposed[j:])
+        return unmatched
 
     cdef c_cancel_active_orders_on_max_age_limit(self):
         """
@@ -809,47 +836,58 @@ cdef class FixedGridStrategy(StrategyBase):
             for order in active_orders:
                 self.c_cancel_order(self._market_info, order.client_order_id)
 
-    cdef c_cancel_active_orders(self, object proposal):
+    cdef object c_create_orders_batch(self, object proposal):
         """
-        Cancels active non hanging orders, checks if the order prices are within tolerance threshold
+        Diffs the proposal against the active orders so that only the grid levels that changed are touched: the active
+        orders matching a proposed order are kept, the others are cancelled and the proposed orders without a matching
+        active order are created. All the active orders are cancelled if there is no proposal.
+        :return: an OrdersProposal with the orders to cancel and to create, executed as one batch
         """
-        if self._cancel_timestamp > self._current_timestamp:
-            return
-
         cdef:
-            list active_orders = self.active_orders
-            list active_buy_prices = []
-            list active_sells = []
-            bint to_defer_canceling = False
-        if len(active_orders) == 0:
-            return
-        if proposal is not None and \
-                self._order_refresh_tolerance_pct >= 0:
-
-            active_buy_prices = [Decimal(str(o.price)) for o in active_orders if o.is_buy]
-            active_sell_prices = [Decimal(str(o.price)) for o in active_orders if not o.is_buy]
-            proposal_buys = [buy.price for buy in proposal.buys]
-            proposal_sells = [sell.price for sell in proposal.sells]
-
-            if self.c_is_within_tolerance(active_buy_prices, proposal_buys) and \
-                    self.c_is_within_tolerance(active_sell_prices, proposal_sells):
-                to_defer_canceling = True
-
-        if not to_defer_canceling:
-            for order in self.active_orders:
-                    self.c_cancel_order(self._market_info, order.client_order_id)
-        # else:
-        #     self.set_timers()
-
-   
+            list active_orders = [o for o in self.active_orders
+                                  if not self._sb_order_tracker.has_in_flight_cancel(o.client_order_id)]
+            list cancel_order_ids = []
+            list buys = []
+            list sells = []
+            int actions = 0
 
-    cdef bint c_to_create_orders(self, object proposal):
-        non_hanging_orders_non_cancelled = [o for o in self.active_orders]
+        if proposal is None:
+            cancel_order_ids = [o.client_order_id for o in active_orders]
+        else:
+            buys = self.c_diff_orders([o for o in active_orders if o.is_buy], proposal.buys, cancel_order_ids)
+            sells = self.c_diff_orders([o for o in active_orders if not o.is_buy], proposal.sells, cancel_order_ids)
+        if len(cancel_order_ids) > 0:
+            if self._cancel_timestamp > self._current_timestamp:
+                # The outdated orders are replaced together at the next refresh
+                return OrdersProposal(0, self._limit_order_type, [], [], self._limit_order_type, [], [], [])
+            actions |= ORDER_PROPOSAL_ACTION_CANCEL_ORDERS
+        if len(buys) > 0 or len(sells) > 0:
+            actions |= ORDER_PROPOSAL_ACTION_CREATE_ORDERS
+        return OrdersProposal(actions,
+                              self._limit_order_type,
+                              [buy.price for buy in buys],
+                              [buy.size for buy in buys],
+                              self._limit_order_type,
+                              [sell.price for sell in sells],
+                              [sell.size for sell in sells],
+                              cancel_order_ids)
+
+    cdef c_execute_orders_batch(self, object orders_proposal):
+        if orders_proposal.actions & ORDER_PROPOSAL_ACTION_CANCEL_ORDERS:
+            for order_id in orders_proposal.cancel_order_ids:
+                self.c_cancel_order(self._market_info, order_id)
+        if self.c_to_create_orders(orders_proposal):
+            self.c_execute_orders_proposal(Proposal(
+                [PriceSize(price, size) for price, size in zip(orders_proposal.buy_order_prices,
+                                                               orders_proposal.buy_order_sizes)],
+                [PriceSize(price, size) for price, size in zip(orders_proposal.sell_order_prices,
+                                                               orders_proposal.sell_order_sizes)]))
+
+    cdef bint c_to_create_orders(self, object orders_proposal):
         return (self._create_timestamp < self._current_timestamp
                 and (not self._should_wait_order_cancel_confirmation or
                      len(self._sb_order_tracker.in_flight_cancels) == 0)
-                and proposal is not None
-                and len(non_hanging_orders_non_cancelled) == 0)
+                and orders_proposal.actions & ORDER_PROPOSAL_ACTION_CREATE_ORDERS)
 
     cdef c_execute_orders_proposal(self, object proposal):
         cdef:
@@ -1,6 +1,8 @@
+import heapq
 import logging
+from bisect import bisect_left, bisect_right
 from decimal import Decimal
-from typing import Dict, List, Optional, Set, Tuple, Union
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
 
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.limit_order import LimitOrder
@@ -42,6 +44,16 @@ class CreatedPairOfOrders:
 
 
 class HangingOrdersTracker:
+    """
+    Keeps the hanging orders of a strategy and the limit orders they are based on.
+
+    Besides the sets of orders, the tracker keeps indexes so that the checks done on every tick and order event do not
+    scan all the orders:
+    - the original (limit) orders and the current hanging orders by order id
+    - the original orders prices, sorted for each side, to find the orders far from the price with two binary searches
+    - a heap of the current hanging orders by creation time, to find the orders past the max order age from the oldest
+    Entries of orders removed from the hanging orders are discarded when they reach the top of the heap.
+    """
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -61,9 +73,21 @@ class HangingOrdersTracker:
         self.orders_being_renewed: Set[HangingOrder] = set()
         self.orders_being_cancelled: Set[str] = set()
         self.current_created_pairs_of_orders: List[CreatedPairOfOrders] = list()
-        self.original_orders: Set[LimitOrder] = orders or set()
-        self.strategy_current_hanging_orders: Set[HangingOrder] = set()
         self.completed_hanging_orders: Set[HangingOrder] = set()
+        self._completed_hanging_order_ids: Set[str] = set()
+
+        self._original_orders: Set[LimitOrder] = set()
+        self._original_orders_by_id: Dict[str, LimitOrder] = {}
+        # Prices and ids of the original orders sorted by price, for buys (True) and sells (False)
+        self._original_order_prices: Dict[bool, List[Decimal]] = {True: [], False: []}
+        self._original_order_ids_by_price: Dict[bool, List[str]] = {True: [], False: []}
+        self._equivalent_orders: Optional[FrozenSet[HangingOrder]] = None
+        self.original_orders = orders or set()
+
+        self._strategy_current_hanging_orders: Set[HangingOrder] = set()
+        self._hanging_orders_by_id: Dict[str, HangingOrder] = {}
+        self._hanging_orders_by_creation: List[Tuple[float, int, HangingOrder]] = []
+        self._hanging_orders_pushed: int = 0
 
         self._cancel_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(self._did_cancel_order)
         self._complete_buy_order_forwarder: SourceInfoEventForwarder = SourceInfoEventForwarder(
@@ -75,6 +99,33 @@ class HangingOrdersTracker:
             (MarketEvent.BuyOrderCompleted, self._complete_buy_order_forwarder),
             (MarketEvent.SellOrderCompleted, self._complete_sell_order_forwarder)]
 
+    @property
+    def original_orders(self) -> Set[LimitOrder]:
+        return self._original_orders
+
+    @original_orders.setter
+    def original_orders(self, orders: Iterable[LimitOrder]):
+        self._original_orders = set()
+        self._original_orders_by_id.clear()
+        for is_buy in (True, False):
+            self._original_order_prices[is_buy].clear()
+            self._original_order_ids_by_price[is_buy].clear()
+        self._equivalent_orders = None
+        for order in orders:
+            self.add_order(order)
+
+    @property
+    def strategy_current_hanging_orders(self) -> Set[HangingOrder]:
+        return self._strategy_current_hanging_orders
+
+    @strategy_current_hanging_orders.setter
+    def strategy_current_hanging_orders(self, orders: Iterable[HangingOrder]):
+        self._strategy_current_hanging_orders = set()
+        self._hanging_orders_by_id.clear()
+        self._hanging_orders_by_creation.clear()
+        for order in orders:
+            self._add_hanging_order(order)
+
     @property
     def hanging_orders_cancel_pct(self):
         return self._hanging_orders_cancel_pct
@@ -103,14 +154,12 @@ class HangingOrdersTracker:
         self._process_cancel_as_part_of_renew(event)
 
         self.orders_being_cancelled.discard(event.order_id)
-        order_to_be_removed = next((order for order in self.strategy_current_hanging_orders
-                                    if order.order_id == event.order_id), None)
+        order_to_be_removed = self._hanging_orders_by_id.get(event.order_id)
         if order_to_be_removed:
-            self.strategy_current_hanging_orders.remove(order_to_be_removed)
+            self._remove_hanging_order(order_to_be_removed)
             self.logger().notify(f"({self.trading_pair}) Hanging order {event.order_id} canceled.")
 
-        limit_order_to_be_removed = next((order for order in self.original_orders
-                                          if order.client_order_id == event.order_id), None)
+        limit_order_to_be_removed = self._original_orders_by_id.get(event.order_id)
         if limit_order_to_be_removed:
             self.remove_order(limit_order_to_be_removed)
 
@@ -129,8 +178,7 @@ class HangingOrdersTracker:
     def _did_complete_order(self,
                             event: Union[BuyOrderCompletedEvent, SellOrderCompletedEvent],
                             is_buy: bool):
-        hanging_order = next((hanging_order for hanging_order in self.strategy_current_hanging_orders
-                              if hanging_order.order_id == event.order_id), None)
+        hanging_order = self._hanging_orders_by_id.get(event.order_id)
 
         if hanging_order:
             self._did_complete_hanging_order(hanging_order)
@@ -145,15 +193,15 @@ class HangingOrdersTracker:
         if order:
             order_side = "BUY" if order.is_buy else "SELL"
             self.completed_hanging_orders.add(order)
-            self.strategy_current_hanging_orders.remove(order)
+            self._completed_hanging_order_ids.add(order.order_id)
+            self._remove_hanging_order(order)
             self.logger().notify(
                 f"({self.trading_pair}) Hanging maker {order_side} order {order.order_id} "
                 f"({order.trading_pair} {order.amount} @ "
                 f"{order.price}) has been completely filled."
             )
 
-            limit_order_to_be_removed = next((original_order for original_order in self.original_orders
-                                              if original_order.client_order_id == order.order_id), None)
+            limit_order_to_be_removed = self._original_orders_by_id.get(order.order_id)
             if limit_order_to_be_removed:
                 self.remove_order(limit_order_to_be_removed)
 
@@ -170,12 +218,12 @@ class HangingOrdersTracker:
         self.renew_hanging_orders_past_max_order_age()
 
     def _process_cancel_as_part_of_renew(self, event: OrderCancelledEvent):
-        renewing_order = next((order for order in self.orders_being_renewed if order.order_id == event.order_id), None)
-        if renewing_order:
+        renewing_order = self._hanging_orders_by_id.get(event.order_id)
+        if renewing_order and renewing_order in self.orders_being_renewed:
             self.logger().info(f"({self.trading_pair}) Hanging order {event.order_id} "
                                f"has been canceled as part of the renew process. "
                                f"Now the replacing order will be created.")
-            self.strategy_current_hanging_orders.remove(renewing_order)
+            self._remove_hanging_order(renewing_order)
             self.orders_being_renewed.remove(renewing_order)
             order_to_be_created = HangingOrder(None,
                                                renewing_order.trading_pair,
@@ -185,42 +233,78 @@ class HangingOrdersTracker:
                                                self.strategy.current_timestamp)
 
             executed_orders = self._execute_orders_in_strategy([order_to_be_created])
-            self.strategy_current_hanging_orders = self.strategy_current_hanging_orders.union(executed_orders)
             for new_hanging_order in executed_orders:
+                self._add_hanging_order(new_hanging_order)
                 limit_order_from_hanging_order = next((o for o in self.strategy.active_orders
                                                        if o.client_order_id == new_hanging_order.order_id), None)
                 if limit_order_from_hanging_order:
                     self.add_order(limit_order_from_hanging_order)
 
     def add_order(self, order: LimitOrder):
-        self.original_orders.add(order)
+        if order in self._original_orders:
+            return
+        previous_order = self._original_orders_by_id.get(order.client_order_id)
+        if previous_order is not None:
+            self.remove_order(previous_order)
+        self._original_orders.add(order)
+        self._original_orders_by_id[order.client_order_id] = order
+        prices = self._original_order_prices[order.is_buy]
+        index = bisect_right(prices, order.price)
+        prices.insert(index, order.price)
+        self._original_order_ids_by_price[order.is_buy].insert(index, order.client_order_id)
+        self._equivalent_orders = None
 
     def add_as_hanging_order(self, order: LimitOrder):
-        self.strategy_current_hanging_orders.add(self._get_hanging_order_from_limit_order(order))
+        self._add_hanging_order(self._get_hanging_order_from_limit_order(order))
         self.add_order(order)
 
     def remove_order(self, order: LimitOrder):
-        if order in self.original_orders:
-            self.original_orders.remove(order)
+        if order in self._original_orders:
+            self._original_orders.remove(order)
+            del self._original_orders_by_id[order.client_order_id]
+            prices = self._original_order_prices[order.is_buy]
+            order_ids = self._original_order_ids_by_price[order.is_buy]
+            index = bisect_left(prices, order.price)
+            while order_ids[index] != order.client_order_id:
+                index += 1
+            del prices[index]
+            del order_ids[index]
+            self._equivalent_orders = None
 
     def remove_all_orders(self):
-        self.original_orders.clear()
+        self.original_orders = set()
 
     def remove_all_buys(self):
-        to_be_removed = []
-        for order in self.original_orders:
-            if order.is_buy:
-                to_be_removed.append(order)
-        for order in to_be_removed:
-            self.original_orders.remove(order)
+        for order_id in list(self._original_order_ids_by_price[True]):
+            self.remove_order(self._original_orders_by_id[order_id])
 
     def remove_all_sells(self):
-        to_be_removed = []
-        for order in self.original_orders:
-            if not order.is_buy:
-                to_be_removed.append(order)
-        for order in to_be_removed:
-            self.original_orders.remove(order)
+        for order_id in list(self._original_order_ids_by_price[False]):
+            self.remove_order(self._original_orders_by_id[order_id])
+
+    def _add_hanging_order(self, order: HangingOrder):
+        if order in self._strategy_current_hanging_orders:
+            return
+        self._strategy_current_hanging_orders.add(order)
+        if order.order_id is not None:
+            self._hanging_orders_by_id[order.order_id] = order
+        if order.creation_timestamp:
+            self._hanging_orders_pushed += 1
+            heapq.heappush(self._hanging_orders_by_creation,
+                           (order.creation_timestamp, self._hanging_orders_pushed, order))
+            if len(self._hanging_orders_by_creation) > 2 * len(self._strategy_current_hanging_orders) + 16:
+                # Drop the entries of the orders no longer hanging
+                self._hanging_orders_by_creation = [entry for entry in self._hanging_orders_by_creation
+                                                    if self._is_current_hanging_order(entry[2])]
+                heapq.heapify(self._hanging_orders_by_creation)
+
+    def _remove_hanging_order(self, order: HangingOrder):
+        self._strategy_current_hanging_orders.remove(order)
+        if self._hanging_orders_by_id.get(order.order_id) is order:
+            del self._hanging_orders_by_id[order.order_id]
+
+    def _is_current_hanging_order(self, order: HangingOrder) -> bool:
+        return self._hanging_orders_by_id.get(order.order_id) is order
 
     def hanging_order_age(self, hanging_order: HangingOrder) -> float:
         """
@@ -234,8 +318,13 @@ class HangingOrdersTracker:
         to_be_cancelled: Set[HangingOrder] = set()
         max_order_age = getattr(self.strategy, "max_order_age", None)
         if max_order_age:
-            for order in self.strategy_current_hanging_orders:
-                if self.hanging_order_age(order) > max_order_age and order not in self.orders_being_renewed:
+            # The oldest orders are at the top of the heap. The orders popped are either no longer hanging orders, or
+            # are being renewed and will be replaced by a new hanging order once cancelled
+            heap = self._hanging_orders_by_creation
+            while len(heap) > 0 and (not self._is_current_hanging_order(heap[0][2])
+                                     or self.hanging_order_age(heap[0][2]) > max_order_age):
+                order = heapq.heappop(heap)[2]
+                if self._is_current_hanging_order(order) and order not in self.orders_being_renewed:
                     self.logger().info(f"Reached max_order_age={max_order_age}sec hanging order: {order}. Renewing...")
                     to_be_cancelled.add(order)
 
@@ -244,19 +333,29 @@ class HangingOrdersTracker:
 
     def remove_orders_far_from_price(self):
         current_price = self.strategy.get_price()
+        max_distance = current_price * Decimal(str(self._hanging_orders_cancel_pct))
         orders_to_be_removed = set()
-        for order in self.original_orders:
-            if (order.client_order_id not in self.orders_being_cancelled
-                    and abs(order.price - current_price) / current_price > self._hanging_orders_cancel_pct):
-                self.logger().info(
-                    f"Hanging order passed max_distance from price={self._hanging_orders_cancel_pct * 100}% {order}. Removing...")
-                orders_to_be_removed.add(order)
+        for is_buy in (True, False):
+            prices = self._original_order_prices[is_buy]
+            order_ids = self._original_order_ids_by_price[is_buy]
+            # Only the orders below the lower limit or above the upper limit can be far from the price
+            far_order_ids = (order_ids[:bisect_right(prices, current_price - max_distance)]
+                             + order_ids[bisect_left(prices, current_price + max_distance):])
+            for order_id in far_order_ids:
+                order = self._original_orders_by_id[order_id]
+                if (order_id not in self.orders_being_cancelled
+                        and abs(order.price - current_price) / current_price > self._hanging_orders_cancel_pct):
+                    self.logger().info(
+                        f"Hanging order passed max_distance from price={self._hanging_orders_cancel_pct * 100}% {order}. Removing...")
+                    orders_to_be_removed.add(order)
 
         self._cancel_multiple_orders_in_strategy([order.client_order_id for order in orders_to_be_removed])
 
     def _get_equivalent_orders(self) -> Set[HangingOrder]:
-        if self.original_orders:
-            return self._get_equivalent_orders_no_aggregation(self.original_orders)
+        if self._original_orders:
+            if self._equivalent_orders is None:
+                self._equivalent_orders = self._get_equivalent_orders_no_aggregation(self._original_orders)
+            return self._equivalent_orders
         return set()
 
     @property
@@ -265,20 +364,21 @@ class HangingOrdersTracker:
         return self._get_equivalent_orders()
 
     def is_order_id_in_hanging_orders(self, order_id: str) -> bool:
-        return any((o.order_id == order_id for o in self.strategy_current_hanging_orders))
+        return order_id in self._hanging_orders_by_id
 
     def is_order_id_in_completed_hanging_orders(self, order_id: str) -> bool:
-        return any((o.order_id == order_id for o in self.completed_hanging_orders))
+        return order_id in self._completed_hanging_order_ids
 
     def is_hanging_order_in_strategy_active_orders(self, order: HangingOrder) -> bool:
-        return any(all(order.trading_pair == o.trading_pair,
-                       order.is_buy == o.is_buy,
-                       order.price == o.price,
-                       order.amount == o.quantity) for o in self.strategy.active_orders)
+        return any(order.trading_pair == o.trading_pair
+                   and order.is_buy == o.is_buy
+                   and order.price == o.price
+                   and order.amount == o.quantity
+                   for o in self.strategy.active_orders)
 
     def is_potential_hanging_order(self, order: LimitOrder) -> bool:
         """Checks if the order is registered as a hanging order."""
-        return order in self.original_orders
+        return order in self._original_orders
 
     def update_strategy_orders_with_equivalent_orders(self):
         """Updates the strategy hanging orders.
@@ -304,7 +404,8 @@ class HangingOrdersTracker:
             self.logger().info(f"Need to cancel: {orders_to_cancel}")
 
         executed_orders = self._execute_orders_in_strategy(orders_to_create)
-        self.strategy_current_hanging_orders = self.strategy_current_hanging_orders.union(executed_orders)
+        for order in executed_orders:
+            self._add_hanging_order(order)
 
     def _execute_orders_in_strategy(self, candidate_orders: Set[HangingOrder]):
         new_hanging_orders = set()
@@ -343,8 +444,11 @@ class HangingOrdersTracker:
         return new_hanging_orders
 
     def _cancel_multiple_orders_in_strategy(self, order_ids: List[str]):
+        if len(order_ids) == 0:
+            return
+        active_order_ids = set(o.client_order_id for o in self.strategy.active_orders)
         for order_id in order_ids:
-            if any(o.client_order_id == order_id for o in self.strategy.active_orders):
+            if order_id in active_order_ids:
                 self.strategy.cancel_order(order_id)
                 self.orders_being_cancelled.add(order_id)
 
@@ -1,7 +1,7 @@
 import asyncio
 import logging
+import math
 from decimal import Decimal
-from statistics import mean
 from typing import Dict, List, Set, Union
 
 import numpy as np
@@ -15,6 +15,7 @@ from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.estimate_fee import build_trade_fee
 from hummingbot.logger import HummingbotLogger
+from hummingbot.strategy.__utils__.trailing_indicators.range_volatility import RangeVolatilityIndicator
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.pure_market_making.inventory_skew_calculator import (
     calculate_bid_ask_ratios_from_base_asset_ratio,
@@ -85,7 +86,8 @@ class LiquidityMiningStrategy(StrategyPyBase):
         self._token_balances = {}
         self._sell_budgets = {}
         self._buy_budgets = {}
-        self._mid_prices = {market: [] for market in market_infos}
+        self._volatility_indicators = {market: RangeVolatilityIndicator(volatility_interval, avg_volatility_period)
+                                       for market in market_infos}
         self._volatility = {market: s_decimal_nan for market in self._market_infos}
         self._last_vol_reported = 0.
         self._hb_app_notification = hb_app_notification
@@ -563,28 +565,16 @@ class LiquidityMiningStrategy(StrategyPyBase):
         """
         for market in self._market_infos:
             mid_price = self._market_infos[market].get_mid_price()
-            self._mid_prices[market].append(mid_price)
-            # To avoid memory leak, we store only the last part of the list needed for volatility calculation
-            max_len = self._volatility_interval * self._avg_volatility_period
-            self._mid_prices[market] = self._mid_prices[market][-1 * max_len:]
+            self._volatility_indicators[market].add_sample(float(mid_price))
 
     def update_volatility(self):
         """
         Update volatility data from the market
         """
         self._volatility = {market: s_decimal_nan for market in self._market_infos}
-        for market, mid_prices in self._mid_prices.items():
-            last_index = len(mid_prices) - 1
-            atr = []
-            first_index = last_index - (self._volatility_interval * self._avg_volatility_period)
-            first_index = max(first_index, 0)
-            for i in range(last_index, first_index, self._volatility_interval * -1):
-                prices = mid_prices[i - self._volatility_interval + 1: i + 1]
-                if not prices:
-                    break
-                atr.append((max(prices) - min(prices)) / min(prices))
-            if atr:
-                self._volatility[market] = mean(atr)
+        for market, indicator in self._volatility_indicators.items():
+            if not math.isnan(indicator.current_value):
+                self._volatility[market] = Decimal(str(indicator.current_value))
         if self._last_vol_reported < self.current_timestamp - self._volatility_interval:
             for market, vol in self._volatility.items():
                 if not vol.is_nan():
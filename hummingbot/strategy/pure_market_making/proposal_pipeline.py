@@ -0,0 +1,122 @@
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import pandas as pd
+
+from .data_types import PriceSize, Proposal
+
+ProposalSnapshot = Tuple[Tuple[Tuple[Any, Any], ...], Tuple[Tuple[Any, Any], ...]]
+
+
+class ProposalStage:
+    def __init__(self, name: str):
+        self.name: str = name
+        self.inputs: Optional[Tuple] = None
+        self.output: Optional[ProposalSnapshot] = None
+        self.runs: int = 0
+        self.reused: int = 0
+        self.last_elapsed: float = 0.0
+        self.total_elapsed: float = 0.0
+
+
+class ProposalPipeline:
+    """
+    Runs the stages building the orders proposal of a tick, and reuses the result of a stage when nothing it depends
+    on changed since its previous run.
+
+    Each stage declares its inputs (the prices, balances, orders and configuration values it reads) as a tuple,
+    compared with the tuple of its previous run. The proposal received by a stage is the same as on its previous run
+    when the stages before it were all reused or produced the same proposal again. When both are unchanged the stage
+    output is rebuilt from the prices and sizes it produced last time instead of being computed again.
+
+    The time spent in each stage, inputs comparison included, is recorded for the status report.
+    """
+
+    def __init__(self):
+        self._stages: Dict[str, ProposalStage] = {}
+        self._upstream_changed: bool = True
+        self._run_complete: bool = True
+
+    @property
+    def stages(self) -> Dict[str, ProposalStage]:
+        return self._stages
+
+    def start(self):
+        """
+        Starts the run of the stages for a tick. The cached outputs are discarded if the previous run did not
+        complete, since the stages after the failing one did not see the latest outputs.
+        """
+        if not self._run_complete:
+            self.reset()
+        self._upstream_changed = False
+        self._run_complete = False
+
+    def finish(self):
+        self._run_complete = True
+
+    def reset(self):
+        for stage in self._stages.values():
+            stage.inputs = None
+            stage.output = None
+
+    def run_stage(self,
+                  name: str,
+                  inputs: Tuple,
+                  proposal: Optional[Proposal],
+                  stage_function: Callable[[Optional[Proposal]], Proposal]) -> Proposal:
+        """
+        Runs a stage, or rebuilds its previous output if its inputs and the proposal it receives did not change.
+
+        :param name: the stage name, as shown in the status report
+        :param inputs: the values read by the stage other than the proposal
+        :param proposal: the proposal output by the previous stage, None for the first stage
+        :param stage_function: computes the stage output from the proposal, either modifying it in place (and returning
+        None) or returning a new proposal
+        :return: the stage output, a proposal the next stages are free to modify
+        """
+        start = self._time()
+        stage = self._stages.get(name)
+        if stage is None:
+            stage = self._stages[name] = ProposalStage(name)
+        if not self._upstream_changed and stage.output is not None and stage.inputs == inputs:
+            proposal = self.proposal_from_snapshot(stage.output)
+            stage.reused += 1
+        else:
+            result = stage_function(proposal)
+            if result is not None:
+                proposal = result
+            output = self.snapshot(proposal)
+            if output != stage.output:
+                self._upstream_changed = True
+            stage.inputs = inputs
+            stage.output = output
+        stage.runs += 1
+        stage.last_elapsed = self._time() - start
+        stage.total_elapsed += stage.last_elapsed
+        return proposal
+
+    def timing_data_frame(self) -> pd.DataFrame:
+        columns = ["Stage", "Last (ms)", "Avg (ms)", "Reused"]
+        data = []
+        for stage in self._stages.values():
+            data.append([
+                stage.name,
+                round(stage.last_elapsed * 1e3, 3),
+                round(stage.total_elapsed * 1e3 / stage.runs, 3) if stage.runs > 0 else 0,
+                f"{stage.reused / stage.runs:.0%}" if stage.runs > 0 else "",
+            ])
+        return pd.DataFrame(data=data, columns=columns)
+
+    @staticmethod
+    def snapshot(proposal: Proposal) -> ProposalSnapshot:
+        return (tuple((buy.price, buy.size) for buy in proposal.buys),
+                tuple((sell.price, sell.size) for sell in proposal.sells))
+
+    @staticmethod
+    def proposal_from_snapshot(snapshot: ProposalSnapshot) -> Proposal:
+        return Proposal([PriceSize(price, size) for price, size in snapshot[0]],
+                        [PriceSize(price, size) for price, size in snapshot[1]])
+
+    @staticmethod
+    def _time() -> float:
+        return time.perf_counter()
@@ -58,20 +58,23 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         bint _should_wait_order_cancel_confirmation
 
         object _moving_price_band
+        object _proposal_pipeline
 
     cdef object c_get_mid_price(self)
-    cdef object c_create_base_proposal(self)
+    cdef object c_create_proposal(self)
+    cdef tuple c_get_reference_prices(self, object price)
+    cdef object c_create_base_proposal(self, object buy_reference_price, object sell_reference_price)
     cdef tuple c_get_adjusted_available_balance(self, list orders)
     cdef c_apply_order_levels_modifiers(self, object proposal)
     cdef c_apply_price_band(self, object proposal)
     cdef c_apply_ping_pong(self, object proposal)
-    cdef c_apply_order_price_modifiers(self, object proposal)
-    cdef c_apply_order_size_modifiers(self, object proposal)
-    cdef c_apply_inventory_skew(self, object proposal)
-    cdef c_apply_budget_constraint(self, object proposal)
+    cdef c_apply_order_price_modifiers(self, object proposal, object top_bid_price, object top_ask_price)
+    cdef c_apply_order_size_modifiers(self, object proposal, tuple adjusted_available_balance)
+    cdef c_apply_inventory_skew(self, object proposal, tuple adjusted_available_balance)
+    cdef c_apply_budget_constraint(self, object proposal, tuple adjusted_available_balance)
 
     cdef c_filter_out_takers(self, object proposal)
-    cdef c_apply_order_optimization(self, object proposal)
+    cdef c_apply_order_optimization(self, object proposal, object top_bid_price, object top_ask_price)
     cdef c_apply_add_transaction_costs(self, object proposal)
     cdef bint c_is_within_tolerance(self, list current_prices, list proposal_prices)
     cdef c_cancel_active_orders(self, object proposal)
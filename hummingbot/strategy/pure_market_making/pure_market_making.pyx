@@ -27,6 +27,7 @@ from .inventory_skew_calculator cimport c_calculate_bid_ask_ratios_from_base_ass
 from .inventory_skew_calculator import calculate_total_order_size
 from .pure_market_making_order_tracker import PureMarketMakingOrderTracker
 from .moving_price_band import MovingPriceBand
+from .proposal_pipeline import ProposalPipeline
 
 
 NaN = float("nan")
@@ -144,6 +145,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         self._last_own_trade_price = Decimal('nan')
         self._should_wait_order_cancel_confirmation = should_wait_order_cancel_confirmation
         self._moving_price_band = moving_price_band
+        self._proposal_pipeline = ProposalPipeline()
         self.c_add_markets([market_info.market])
 
     def all_markets_ready(self):
@@ -472,6 +474,10 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     def logging_options(self, int64_t logging_options):
         self._logging_options = logging_options
 
+    @property
+    def proposal_pipeline(self) -> ProposalPipeline:
+        return self._proposal_pipeline
+
     @property
     def hanging_orders_tracker(self):
         return self._hanging_orders_tracker
@@ -675,6 +681,11 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         else:
             lines.extend(["", "  No active maker orders."])
 
+        if len(self._proposal_pipeline.stages) > 0:
+            df = map_df_to_str(self._proposal_pipeline.timing_data_frame())
+            lines.extend(["", "  Proposal pipeline:"] +
+                         ["    " + line for line in df.to_string(index=False).split("\n")])
+
         warning_lines.extend(self.balance_warning([self._market_info]))
 
         if len(warning_lines) > 0:
@@ -738,19 +749,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
             proposal = None
             if self._create_timestamp <= self._current_timestamp:
-                # 1. Create base order proposals
-                proposal = self.c_create_base_proposal()
-                # 2. Apply functions that limit numbers of buys and sells proposal
-                self.c_apply_order_levels_modifiers(proposal)
-                # 3. Apply functions that modify orders price
-                self.c_apply_order_price_modifiers(proposal)
-                # 4. Apply functions that modify orders size
-                self.c_apply_order_size_modifiers(proposal)
-                # 5. Apply budget constraint, i.e. can't buy/sell more than what you have.
-                self.c_apply_budget_constraint(proposal)
-
-                if not self._take_if_crossed:
-                    self.c_filter_out_takers(proposal)
+                proposal = self.c_create_proposal()
 
             self._hanging_orders_tracker.process_tick()
 
@@ -762,13 +761,96 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         finally:
             self._last_timestamp = timestamp
 
-    cdef object c_create_base_proposal(self):
+    cdef object c_create_proposal(self):
+        """
+        Runs the proposal stages through the proposal pipeline, each stage declaring the values it reads so it is only
+        computed again when one of them changed.
+        """
         cdef:
             ExchangeBase market = self._market_info.market
-            list buys = []
-            list sells = []
-
-        buy_reference_price = sell_reference_price = self.get_price()
+            object pipeline = self._proposal_pipeline
+            object price = self.get_price()
+            object buy_size_for_optimization = s_decimal_zero
+            object sell_size_for_optimization = s_decimal_zero
+            object top_bid_price = None
+            object top_ask_price = None
+            tuple reference_prices
+            tuple adjusted_available_balance = None
+            tuple budget_available_balance
+            tuple inputs
+            object proposal
+
+        pipeline.start()
+        # 1. Create base order proposals
+        reference_prices = self.c_get_reference_prices(price)
+        inputs = reference_prices + (self._bid_spread, self._ask_spread, self._order_amount, self._buy_levels,
+                                     self._sell_levels, self._order_level_spread, self._order_level_amount,
+                                     tuple((key, tuple(value)) for key, value in self._order_override.items())
+                                     if self._order_override is not None else None)
+        proposal = pipeline.run_stage(
+            "Base proposal", inputs, None,
+            lambda _: self.c_create_base_proposal(reference_prices[0], reference_prices[1]))
+
+        # 2. Apply functions that limit numbers of buys and sells proposal
+        inputs = (price, self._price_ceiling, self._price_floor, self.moving_price_band_enabled,
+                  self._ping_pong_enabled, self._filled_buys_balance, self._filled_sells_balance)
+        if self.moving_price_band_enabled:
+            # The band is updated here so that the inputs have the band used by the stage
+            self._moving_price_band.check_and_update_price_band(self.current_timestamp, price)
+            inputs += (self._moving_price_band.price_floor, self._moving_price_band.price_ceiling)
+        proposal = pipeline.run_stage("Order levels", inputs, proposal,
+                                      lambda p: self.c_apply_order_levels_modifiers(p))
+
+        # 3. Apply functions that modify orders price
+        inputs = (self._order_optimization_enabled, self._add_transaction_costs_to_orders, self._limit_order_type)
+        if self._order_optimization_enabled:
+            for order in self.active_orders:
+                if order.is_buy:
+                    buy_size_for_optimization = order.quantity
+                else:
+                    sell_size_for_optimization = order.quantity
+            # The top prices are only looked up for the sides with orders, and passed to the stage
+            if len(proposal.buys) > 0:
+                top_bid_price = self._market_info.get_price_for_volume(
+                    False, self._bid_order_optimization_depth + buy_size_for_optimization).result_price
+            if len(proposal.sells) > 0:
+                top_ask_price = self._market_info.get_price_for_volume(
+                    True, self._ask_order_optimization_depth + sell_size_for_optimization).result_price
+            inputs += (top_bid_price, top_ask_price, self._order_level_spread, self._split_order_levels_enabled,
+                       tuple(self._bid_order_level_spreads or ()), tuple(self._ask_order_level_spreads or ()))
+        proposal = pipeline.run_stage("Price modifiers", inputs, proposal,
+                                      lambda p: self.c_apply_order_price_modifiers(p, top_bid_price, top_ask_price))
+
+        # 4. Apply functions that modify orders size
+        inputs = (self._inventory_skew_enabled,)
+        if self._inventory_skew_enabled:
+            adjusted_available_balance = self.c_get_adjusted_available_balance(self.active_orders)
+            inputs += (adjusted_available_balance, price, self._order_amount, self._order_level_amount,
+                       self._order_levels, self._inventory_target_base_pct, self._inventory_range_multiplier)
+        proposal = pipeline.run_stage("Size modifiers", inputs, proposal,
+                                      lambda p: self.c_apply_order_size_modifiers(p, adjusted_available_balance))
+
+        # 5. Apply budget constraint, i.e. can't buy/sell more than what you have.
+        budget_available_balance = self.adjusted_available_balance_for_orders_budget_constrain()
+        proposal = pipeline.run_stage("Budget constraint", budget_available_balance, proposal,
+                                      lambda p: self.c_apply_budget_constraint(p, budget_available_balance))
+
+        if not self._take_if_crossed:
+            inputs = (market.c_get_price(self.trading_pair, True), market.c_get_price(self.trading_pair, False))
+            proposal = pipeline.run_stage("Takers filter", inputs, proposal,
+                                          lambda p: self.c_filter_out_takers(p))
+        pipeline.finish()
+        return proposal
+
+    cdef tuple c_get_reference_prices(self, object price):
+        """
+        :return: the (buy, sell) reference prices of the proposal. The sell reference price is limited by the inventory
+        cost price if the inventory cost delegate is set.
+        """
+        cdef:
+            ExchangeBase market = self._market_info.market
+            object buy_reference_price = price
+            object sell_reference_price = price
 
         if self._inventory_cost_price_delegate is not None:
             inventory_cost_price = self._inventory_cost_price_delegate.get_price()
@@ -779,6 +861,13 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                 base_balance = float(market.get_balance(self._market_info.base_asset))
                 if base_balance > 0:
                     raise RuntimeError("Initial inventory price is not set while inventory_cost feature is active.")
+        return buy_reference_price, sell_reference_price
+
+    cdef object c_create_base_proposal(self, object buy_reference_price, object sell_reference_price):
+        cdef:
+            ExchangeBase market = self._market_info.market
+            list buys = []
+            list sells = []
 
         # First to check if a customized order override is configured, otherwise the proposal will be created according
         # to order spread, amount, and levels setting.
@@ -875,25 +964,25 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                 [f"  Ping-pong removed {self._filled_sells_balance} sell orders."]
             )
 
-    cdef c_apply_order_price_modifiers(self, object proposal):
+    cdef c_apply_order_price_modifiers(self, object proposal, object top_bid_price, object top_ask_price):
         if self._order_optimization_enabled:
-            self.c_apply_order_optimization(proposal)
+            self.c_apply_order_optimization(proposal, top_bid_price, top_ask_price)
 
         if self._add_transaction_costs_to_orders:
             self.c_apply_add_transaction_costs(proposal)
 
-    cdef c_apply_order_size_modifiers(self, object proposal):
+    cdef c_apply_order_size_modifiers(self, object proposal, tuple adjusted_available_balance):
         if self._inventory_skew_enabled:
-            self.c_apply_inventory_skew(proposal)
+            self.c_apply_inventory_skew(proposal, adjusted_available_balance)
 
-    cdef c_apply_inventory_skew(self, object proposal):
+    cdef c_apply_inventory_skew(self, object proposal, tuple adjusted_available_balance):
         cdef:
             ExchangeBase market = self._market_info.market
             object bid_adj_ratio
             object ask_adj_ratio
             object size
 
-        base_balance, quote_balance = self.c_get_adjusted_available_balance(self.active_orders)
+        base_balance, quote_balance = adjusted_available_balance
 
         total_order_size = calculate_total_order_size(self._order_amount, self._order_level_amount, self._order_levels)
         bid_ask_ratios = c_calculate_bid_ask_ratios_from_base_asset_ratio(
@@ -926,14 +1015,14 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         all_non_hanging_orders = list(set(non_hanging) - set(candidate_hanging_orders))
         return self.c_get_adjusted_available_balance(all_non_hanging_orders)
 
-    cdef c_apply_budget_constraint(self, object proposal):
+    cdef c_apply_budget_constraint(self, object proposal, tuple adjusted_available_balance):
         cdef:
             ExchangeBase market = self._market_info.market
             object quote_size
             object base_size
             object adjusted_amount
 
-        base_balance, quote_balance = self.adjusted_available_balance_for_orders_budget_constrain()
+        base_balance, quote_balance = adjusted_available_balance
 
         for buy in proposal.buys:
             buy_fee = market.c_get_fee(self.base_asset, self.quote_asset, OrderType.LIMIT, TradeType.BUY,
@@ -981,22 +1070,17 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             proposal.sells = [sell for sell in proposal.sells if sell.price > top_bid]
 
     # Compare the market price with the top bid and top ask price
-    cdef c_apply_order_optimization(self, object proposal):
+    cdef c_apply_order_optimization(self, object proposal, object top_bid_price, object top_ask_price):
+        """
+        :param top_bid_price: the top bid price for the order optimization depth and the own buy order volume, looked
+        up when the proposal has buys
+        :param top_ask_price: the top ask price for the order optimization depth and the own sell order volume, looked
+        up when the proposal has sells
+        """
         cdef:
             ExchangeBase market = self._market_info.market
-            object own_buy_size = s_decimal_zero
-            object own_sell_size = s_decimal_zero
-
-        for order in self.active_orders:
-            if order.is_buy:
-                own_buy_size = order.quantity
-            else:
-                own_sell_size = order.quantity
 
         if len(proposal.buys) > 0:
-            # Get the top bid price in the market using order_optimization_depth and your buy order volume
-            top_bid_price = self._market_info.get_price_for_volume(
-                False, self._bid_order_optimization_depth + own_buy_size).result_price
             price_quantum = market.c_get_order_price_quantum(
                 self.trading_pair,
                 top_bid_price
@@ -1017,9 +1101,6 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                 proposal.buys[i].price = market.c_quantize_order_price(self.trading_pair, lower_buy_price) * (1 - self.order_level_spread * i)
 
         if len(proposal.sells) > 0:
-            # Get the top ask price in the market using order_optimization_depth and your sell order volume
-            top_ask_price = self._market_info.get_price_for_volume(
-                True, self._ask_order_optimization_depth + own_sell_size).result_price
             price_quantum = market.c_get_order_price_quantum(
                 self.trading_pair,
                 top_ask_price
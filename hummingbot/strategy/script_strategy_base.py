@@ -29,6 +29,9 @@ class ScriptStrategyBase(StrategyPyBase):
 
     # This class member defines connectors and their trading pairs needed for the strategy operation,
     markets: Dict[str, Set[str]]
+    # When False, the strategy starts ticking as soon as each connector has one of its trading pairs ready, instead of
+    # waiting for all of them. The strategy then checks is_trading_pair_ready before operating on a trading pair.
+    wait_for_all_trading_pairs: bool = True
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -77,14 +80,36 @@ class ScriptStrategyBase(StrategyPyBase):
         :param timestamp: current tick timestamp
         """
         if not self.ready_to_trade:
-            self.ready_to_trade = all(ex.ready for ex in self.connectors.values())
+            self.ready_to_trade = all(self.is_connector_ready(name) for name in self.connectors)
             if not self.ready_to_trade:
-                for con in [c for c in self.connectors.values() if not c.ready]:
-                    self.logger().warning(f"{con.name} is not ready. Please wait...")
+                for name in [name for name in self.connectors if not self.is_connector_ready(name)]:
+                    self.logger().warning(f"{self.connectors[name].name} is not ready. Please wait...")
                 return
         else:
             self.on_tick()
 
+    def is_connector_ready(self, connector_name: str) -> bool:
+        """
+        Checks if the connector is ready for the strategy to start. Unless the strategy waits for all the trading
+        pairs, one of the connector trading pairs in the strategy markets being ready is enough.
+
+        :param connector_name: The name of the connector
+        """
+        connector = self.connectors[connector_name]
+        if self.wait_for_all_trading_pairs:
+            return connector.ready
+        return any(connector.is_trading_pair_ready(trading_pair)
+                   for trading_pair in self.markets.get(connector_name, []))
+
+    def is_trading_pair_ready(self, connector_name: str, trading_pair: str) -> bool:
+        """
+        Checks if the connector is ready to operate on the trading pair.
+
+        :param connector_name: The name of the connector
+        :param trading_pair: The trading pair to check
+        """
+        return self.connectors[connector_name].is_trading_pair_ready(trading_pair)
+
     def on_tick(self):
         """
         An event which is called on every tick, a sub class implements this to define what operation the strategy needs
@@ -175,6 +200,20 @@ class ScriptStrategyBase(StrategyPyBase):
             result.update(split_hb_trading_pair(trading_pair))
         return sorted(result)
 
+    def get_candles_df(self, connector_name: str, trading_pair: str, interval: float) -> pd.DataFrame:
+        """
+        Returns the OHLCV bars of a market, built from its public trades since they were first requested.
+        The bars are shared with the other strategies using the same connector, trading pair and interval, and the
+        data frame is a view on them valid until the next update: it must not be modified.
+
+        :param connector_name: The name of the connector
+        :param trading_pair: The trading pair
+        :param interval: The bars length in seconds
+
+        :return: A data frame with the open, high, low, close, volume and trades columns, indexed by the bar open time
+        """
+        return self.connectors[connector_name].get_candles(trading_pair, interval).to_pandas()
+
     def get_market_trading_pair_tuples(self) -> List[MarketTradingPairTuple]:
         """
         Returns a list of MarketTradingPairTuple for all connectors and trading pairs combination.
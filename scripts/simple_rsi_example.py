@@ -10,8 +10,7 @@ from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.order_candidate import OrderCandidate
-from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
-from hummingbot.core.event.events import OrderBookEvent, OrderBookTradeEvent, OrderFilledEvent
+from hummingbot.core.event.events import OrderFilledEvent
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 
@@ -35,30 +34,28 @@ class SimpleRSIScript(ScriptStrategyBase):
     buy_rsi = int(os.getenv("BUY_RSI", "30"))
     sell_rsi = int(os.getenv("SELL_RSI", "70"))
 
-    # It depends on a timeframe. Make sure you have enough trades to calculate rsi_length number of candlesticks.
-    trade_count_limit = int(os.getenv("TRADE_COUNT_LIMIT", "100000"))
-
     trading_pair = combine_to_hb_trading_pair(base, quote)
     markets = {connector_name: {trading_pair}}
 
-    subscribed_to_order_book_trade_event: bool = False
     position: Optional[OrderFilledEvent] = None
 
-    _trades: 'list[OrderBookTradeEvent]' = []
+    _interval: Optional[int] = None
     _cumulative_price_change_pct = Decimal(0)
     _filling_position: bool = False
 
     def on_tick(self):
         """
-        On every tick calculate OHLCV candlesticks, calculate RSI, react on overbought or oversold signal with creating,
+        On every tick get the OHLCV candlesticks, calculate RSI, react on overbought or oversold signal with creating,
         adjusting and sending an order.
         """
-        if not self.subscribed_to_order_book_trade_event:
-            # Set pandas resample rule for a timeframe
-            self._set_resample_rule(self.timeframe)
-            self.subscribe_to_order_book_trade_event()
-        elif len(self._trades) > 0:
-            df = self.calculate_candlesticks()
+        if self._interval is None:
+            # The candlesticks are built from the public trades from the first request
+            self._set_interval(self.timeframe)
+            self.get_candles_df(self.connector_name, self.trading_pair, self._interval)
+        else:
+            df = self.get_candles_df(self.connector_name, self.trading_pair, self._interval)
+            if len(df) == 0:
+                return
             df = self.calculate_rsi(df, self.rsi_length, self.rsi_is_ema)
             should_open_position = self.should_open_position(df)
             should_close_position = self.should_close_position(df)
@@ -75,22 +72,21 @@ class SimpleRSIScript(ScriptStrategyBase):
                 self._rsi = df.iloc[-1]['rsi']
                 self.logger().info(f"RSI is {self._rsi:.0f}")
 
-    def _set_resample_rule(self, timeframe):
+    def _set_interval(self, timeframe):
         """
-        Convert timeframe to pandas resample rule value.
-        https://pandas.pydata.org/docs/reference/api/pandas.DataFrame.resample.html
+        Convert timeframe to the candlesticks interval in seconds.
         """
-        timeframe_to_rule = {
-            "1s": "1S",
-            "10s": "10S",
-            "30s": "30S",
-            "1m": "1T",
-            "15m": "15T"
+        timeframe_to_interval = {
+            "1s": 1,
+            "10s": 10,
+            "30s": 30,
+            "1m": 60,
+            "15m": 900
         }
-        if timeframe not in timeframe_to_rule.keys():
-            self.logger().error(f"{timeframe} timeframe is not mapped to resample rule.")
+        if timeframe not in timeframe_to_interval.keys():
+            self.logger().error(f"{timeframe} timeframe is not mapped to a candlesticks interval.")
             HummingbotApplication.main_application().stop()
-        self._resample_rule = timeframe_to_rule[timeframe]
+        self._interval = timeframe_to_interval[timeframe]
 
     def should_open_position(self, df: pd.DataFrame) -> bool:
         """
@@ -157,23 +153,6 @@ class SimpleRSIScript(ScriptStrategyBase):
         self.notify_hb_app_with_timestamp(msg)
         self.logger().info(msg)
 
-    def calculate_candlesticks(self) -> pd.DataFrame:
-        """
-        Convert raw trades to OHLCV dataframe.
-        """
-        df = pd.DataFrame(self._trades)
-        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='s')
-        df["timestamp"] = pd.to_datetime(df["timestamp"])
-        df.drop(columns=[df.columns[0]], axis=1, inplace=True)
-        df = df.set_index('timestamp')
-        df = df.resample(self._resample_rule).agg({
-            'price': ['first', 'max', 'min', 'last'],
-            'amount': 'sum',
-        })
-        df.columns = df.columns.to_flat_index().map(lambda x: x[1])
-        df.rename(columns={'first': 'open', 'max': 'high', 'min': 'low', 'last': 'close', 'sum': 'volume'}, inplace=True)
-        return df
-
     def did_fill_order(self, event: OrderFilledEvent):
         """
         Indicate that position is filled, save position properties on enter, calculate cumulative price change on exit.
@@ -192,8 +171,9 @@ class SimpleRSIScript(ScriptStrategyBase):
     @staticmethod
     def calculate_rsi(df: pd.DataFrame, length: int = 14, is_ema: bool = True):
         """
-        Calculate relative strength index and add it to the dataframe.
+        Calculate relative strength index and add it to a copy of the dataframe.
         """
+        df = df.copy()
         close_delta = df['close'].diff()
         up = close_delta.clip(lower=0)
         down = close_delta.clip(upper=0).abs()
@@ -211,24 +191,6 @@ class SimpleRSIScript(ScriptStrategyBase):
         df["rsi"] = 100 - (100 / (1 + rs))
         return df
 
-    def subscribe_to_order_book_trade_event(self):
-        """
-        Subscribe to raw trade event.
-        """
-        self.order_book_trade_event = SourceInfoEventForwarder(self._process_public_trade)
-        for market in self.connectors.values():
-            for order_book in market.order_books.values():
-                order_book.add_listener(OrderBookEvent.TradeEvent, self.order_book_trade_event)
-        self.subscribed_to_order_book_trade_event = True
-
-    def _process_public_trade(self, event_tag: int, market: ConnectorBase, event: OrderBookTradeEvent):
-        """
-        Add new trade to list, remove old trade event, if count greater than trade_count_limit.
-        """
-        if len(self._trades) >= self.trade_count_limit:
-            self._trades.pop(0)
-        self._trades.append(event)
-
     def format_status(self) -> str:
         """
         Returns status of the current strategy on user balances and current active orders. This function is called
@@ -11,6 +11,7 @@ from hummingbot.core.event.events import (
     SellOrderCompletedEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.strategy.arbitrage_evaluator import ArbitrageEvaluator, ArbitrageLeg
 from hummingbot.strategy.script_strategy_base import Decimal, OrderType, ScriptStrategyBase
 
 
@@ -30,7 +31,8 @@ class TriangularArbitrage(ScriptStrategyBase):
     - The order amount is fixed and set in holding asset
     - The strategy has 2nd and 3d orders creation check and makes several trials if there is a failure
     - Profit is calculated each round and total profit is checked for the kill_switch to prevent from excessive losses
-    - !!! Profitability calculation doesn't take into account trading fees, set min_profitability to at least 3 * fee
+    - The profitability of both directions is evaluated with the trading fees of the 3 markets, from order book
+    snapshots taken once per tick (see ArbitrageEvaluator)
     """
     # Config params
     connector_name: str = "kucoin"
@@ -56,6 +58,7 @@ class TriangularArbitrage(ScriptStrategyBase):
     place_order_trials_limit: int = 10
     place_order_failure: bool = False
     order_candidate = None
+    arbitrage_evaluator: ArbitrageEvaluator = None
     initial_spent_amount = Decimal("0")
     total_profit = Decimal("0")
     total_profit_pct = Decimal("0")
@@ -84,17 +87,21 @@ class TriangularArbitrage(ScriptStrategyBase):
         if not self.ready_for_new_orders():
             return
 
-        self.profit["direct"], self.order_amount["direct"] = self.calculate_profit(self.trading_pair["direct"],
-                                                                                   self.order_side["direct"])
-        self.profit["reverse"], self.order_amount["reverse"] = self.calculate_profit(self.trading_pair["reverse"],
-                                                                                     self.order_side["reverse"])
+        self.arbitrage_evaluator.start_tick(self.current_timestamp)
+        for direction in ("direct", "reverse"):
+            self.profit[direction], self.order_amount[direction] = self.calculate_profit(self.trading_pair[direction],
+                                                                                         self.order_side[direction])
         self.log_with_clock(logging.INFO, f"Profit direct: {round(self.profit['direct'], 2)}, "
                                           f"Profit reverse: {round(self.profit['reverse'], 2)}")
 
-        if self.profit["direct"] < self.min_profitability and self.profit["reverse"] < self.min_profitability:
+        # The profit is NaN when the order books are not deep enough for the order amount
+        profitable_directions = [direction for direction in ("direct", "reverse")
+                                 if not self.profit[direction].is_nan()
+                                 and self.profit[direction] >= self.min_profitability]
+        if len(profitable_directions) == 0:
             return
 
-        self.profitable_direction = "direct" if self.profit["direct"] > self.profit["reverse"] else "reverse"
+        self.profitable_direction = max(profitable_directions, key=lambda direction: self.profit[direction])
         self.start_arbitrage(self.trading_pair[self.profitable_direction],
                              self.order_side[self.profitable_direction],
                              self.order_amount[self.profitable_direction])
@@ -104,6 +111,7 @@ class TriangularArbitrage(ScriptStrategyBase):
         Initializes strategy once before the start.
         """
         self.status = "ACTIVE"
+        self.arbitrage_evaluator = ArbitrageEvaluator()
         self.check_trading_pair()
         self.set_trading_pair()
         self.set_order_side()
@@ -194,23 +202,13 @@ class TriangularArbitrage(ScriptStrategyBase):
 
     def calculate_profit(self, trading_pair, order_side):
         """
-        Calculates profitability and order amounts for 3 trading pairs based on the orderbook depth.
-        """
-        exchanged_amount = self.order_amount_in_holding_asset
-        order_amount = [0, 0, 0]
-
-        for i in range(3):
-            order_amount[i] = self.get_order_amount_from_exchanged_amount(trading_pair[i], order_side[i],
-                                                                          exchanged_amount)
-            # Update exchanged_amount for the next cycle
-            if order_side[i]:
-                exchanged_amount = order_amount[i]
-            else:
-                exchanged_amount = self.connector.get_quote_volume_for_base_amount(trading_pair[i], order_side[i],
-                                                                                   order_amount[i]).result_volume
-        start_amount = self.order_amount_in_holding_asset
-        end_amount = exchanged_amount
-        profit = (end_amount / start_amount - 1) * 100
+        Calculates profitability (in percent, fees included) and order amounts for 3 trading pairs based on the
+        orderbook depth. The profitability is NaN if the order books are not deep enough for the order amount.
+        """
+        legs = [ArbitrageLeg(self.connector, pair, bool(side)) for pair, side in zip(trading_pair, order_side)]
+        evaluation = self.arbitrage_evaluator.evaluate_cycle(legs, float(self.order_amount_in_holding_asset))
+        profit = Decimal(str(evaluation.profitability[0] * 100))
+        order_amount = [Decimal(str(amount)) for amount in evaluation.leg_base_amounts[:, 0]]
 
         return profit, order_amount
 
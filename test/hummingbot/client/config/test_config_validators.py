@@ -1,5 +1,6 @@
 
 import unittest
+from unittest.mock import MagicMock, patch
 
 import hummingbot.client.config.config_validators as config_validators
 from hummingbot.client.settings import AllConnectorSettings
@@ -286,3 +287,15 @@ class ConfigValidatorsTests(unittest.TestCase):
 
         validation = config_validators.validate_float(value, max_value=max_value, inclusive=inclusive)
         self.assertEqual(validation, f"Value cannot be more than {max_value}.")
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher.get_instance")
+    def test_validate_market_trading_pair_uses_fetcher_accessor(self, get_instance_mock):
+        trading_pair_fetcher = MagicMock()
+        trading_pair_fetcher.ready = True
+        trading_pair_fetcher.get_trading_pairs.return_value = ["COINALPHA-HBOT"]
+        get_instance_mock.return_value = trading_pair_fetcher
+
+        self.assertIsNone(config_validators.validate_market_trading_pair("binance", "COINALPHA-HBOT"))
+        self.assertEqual("WETH-HBOT is not an active market on binance.",
+                         config_validators.validate_market_trading_pair("binance", "WETH-HBOT"))
+        trading_pair_fetcher.get_trading_pairs.assert_called_with("binance")
@@ -5,7 +5,7 @@ from decimal import Decimal
 from typing import Awaitable
 from unittest.mock import MagicMock, patch
 
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import PerformanceMetrics, PerformanceMetricsAccumulator
 from hummingbot.core.data_type.common import PositionAction, OrderType, TradeType
 from hummingbot.core.data_type.trade import Trade
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
@@ -171,6 +171,85 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
         self.assertEqual(Decimal("799"), metrics.trade_pnl)
         print(metrics)
 
+    def test_performance_metrics_accumulator_matches_performance_metrics(self):
+        rate_oracle = RateOracle()
+        rate_oracle._prices[trading_pair] = Decimal("110")
+        rate_oracle._prices["BNB-USDT"] = Decimal("300")
+        RateOracle._shared_instance = rate_oracle
+
+        trades = []
+        for i, (trade_type, price, amount, fee) in enumerate((
+                ("BUY", 100, 10, AddedToCostTradeFee(percent=Decimal("0.001"))),
+                ("SELL", 120, 15, AddedToCostTradeFee(flat_fees=[TokenAmount("BNB", Decimal("0.01"))])),
+                ("BUY", 105, 2, AddedToCostTradeFee(percent=Decimal("0.002"))))):
+            trades.append(TradeFill(
+                config_file_path="some-strategy.yml",
+                strategy="pure_market_making",
+                market="binance",
+                symbol=trading_pair,
+                base_asset=base,
+                quote_asset=quote,
+                timestamp=int(time.time()),
+                order_id=f"someId{i}",
+                trade_type=trade_type,
+                order_type="LIMIT",
+                price=price,
+                amount=amount,
+                trade_fee=fee.to_json(),
+                exchange_trade_id=f"someExchangeId{i}",
+                position=PositionAction.NIL.value,
+            ))
+        cur_bals = {base: Decimal("100"), quote: Decimal("10000")}
+
+        accumulator = PerformanceMetricsAccumulator(trading_pair)
+        for trade in trades:
+            accumulator.add_trade(trade)
+        total_pnl, return_pct = self.async_run_with_timeout(accumulator.pnl_and_return(cur_bals))
+        metrics = self.async_run_with_timeout(PerformanceMetrics.create(trading_pair, trades, cur_bals))
+
+        self.assertEqual(3, accumulator.num_trades)
+        self.assertEqual(metrics.total_pnl, total_pnl)
+        self.assertEqual(metrics.return_pct, return_pct)
+
+    def test_performance_metrics_accumulator_for_derivatives_does_not_change_the_trades(self):
+        rate_oracle = RateOracle()
+        rate_oracle._prices[trading_pair] = Decimal("12")
+        RateOracle._shared_instance = rate_oracle
+
+        trades = []
+        for i, (order_id, trade_type, position, price, amount) in enumerate((
+                ("someId0", "BUY", "OPEN", 10, 1),
+                ("someId0", "BUY", "OPEN", 11, 1),
+                ("someId1", "SELL", "CLOSE", 12, 2))):
+            trades.append(TradeFill(
+                config_file_path="some-strategy.yml",
+                strategy="perpetual_market_making",
+                market="binance_perpetual",
+                symbol=trading_pair,
+                base_asset=base,
+                quote_asset=quote,
+                timestamp=int(time.time()),
+                order_id=order_id,
+                trade_type=trade_type,
+                order_type="LIMIT",
+                price=Decimal(price),
+                amount=Decimal(amount),
+                trade_fee=AddedToCostTradeFee().to_json(),
+                exchange_trade_id=f"someExchangeId{i}",
+                position=position,
+            ))
+        cur_bals = {base: Decimal("100"), quote: Decimal("10000")}
+
+        accumulator = PerformanceMetricsAccumulator(trading_pair)
+        for trade in trades:
+            accumulator.add_trade(trade)
+        first_result = self.async_run_with_timeout(accumulator.pnl_and_return(cur_bals))
+        second_result = self.async_run_with_timeout(accumulator.pnl_and_return(cur_bals))
+
+        self.assertEqual(first_result, second_result)
+        self.assertEqual([Decimal(10), Decimal(11), Decimal(12)], [trade.price for trade in trades])
+        self.assertEqual([Decimal(1), Decimal(1), Decimal(2)], [trade.amount for trade in trades])
+
     @patch('hummingbot.client.performance.PerformanceMetrics._is_trade_fill')
     def test_performance_metrics_for_derivatives(self, is_trade_fill_mock):
         rate_oracle = RateOracle()
@@ -1,8 +1,17 @@
 import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest.mock import patch
 
 from pydantic import SecretStr
 
-from hummingbot.client.settings import ConnectorSetting, ConnectorType
+from hummingbot.client.settings import (
+    CONNECTOR_SETTINGS_MANIFEST_FILE_NAME,
+    AllConnectorSettings,
+    ConnectorSetting,
+    ConnectorType,
+    ManifestConnectorSetting,
+)
 from hummingbot.connector.exchange.binance.binance_utils import BinanceConfigMap
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 
@@ -36,3 +45,34 @@ class SettingsTest(unittest.TestCase):
         self.assertEqual(api_key, connector.api_key)
         self.assertNotIsInstance(connector.secret_key, SecretStr)
         self.assertEqual(api_secret, connector.secret_key)
+
+    def test_connector_settings_restored_from_manifest(self):
+        with TemporaryDirectory() as temp_dir:
+            manifest_path = Path(temp_dir) / CONNECTOR_SETTINGS_MANIFEST_FILE_NAME
+            original_settings = dict(AllConnectorSettings.all_connector_settings)
+            try:
+                with patch.object(AllConnectorSettings, "connector_settings_manifest_path", manifest_path):
+                    scanned_settings = dict(AllConnectorSettings.create_connector_settings(use_manifest=True))
+                    # Creating the settings never writes the manifest, only the client entry points save it
+                    self.assertFalse(manifest_path.exists())
+
+                    AllConnectorSettings.save_connector_settings_manifest()
+                    self.assertTrue(manifest_path.exists())
+
+                    restored_settings = dict(AllConnectorSettings.create_connector_settings(use_manifest=True))
+                    manifest_modification_time = manifest_path.stat().st_mtime_ns
+                    AllConnectorSettings.save_connector_settings_manifest()
+                    self.assertEqual(manifest_modification_time, manifest_path.stat().st_mtime_ns)
+            finally:
+                AllConnectorSettings.all_connector_settings = original_settings
+
+        self.assertEqual(scanned_settings.keys(), restored_settings.keys())
+        binance_setting = restored_settings["binance"]
+        self.assertIsInstance(binance_setting, ManifestConnectorSetting)
+        self.assertEqual(scanned_settings["binance"].type, binance_setting.type)
+        self.assertEqual(scanned_settings["binance"].example_pair, binance_setting.example_pair)
+        self.assertEqual(scanned_settings["binance"].trade_fee_schema, binance_setting.trade_fee_schema)
+        self.assertIs(BinanceConfigMap, type(binance_setting.config_keys))
+        self.assertEqual(
+            scanned_settings["binance_us"].config_keys.connector, restored_settings["binance_us"].config_keys.connector
+        )
@@ -6,7 +6,7 @@ from prompt_toolkit.document import Document
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, read_system_configs_from_yml
-from hummingbot.client.ui.custom_widgets import FormattedTextLexer
+from hummingbot.client.ui.custom_widgets import CustomTextArea, FormattedTextLexer
 
 
 class CustomWidgetUnitTests(unittest.TestCase):
@@ -91,3 +91,34 @@ class CustomWidgetUnitTests(unittest.TestCase):
         line_fragments = get_line(1)
         self.assertEqual(0, len(line_fragments))
         self.assertEqual(expected_fragments, line_fragments)
+
+    def test_get_line_reuses_fragments_of_lines_already_lexed(self):
+        TEXT = "SOME RANDOM TEXT WITH &cSPECIAL_WORD"
+        first_fragments = self.lexer.lex_document(Document(text=TEXT))(0)
+        second_fragments = self.lexer.lex_document(Document(text=f"NEW LINE\n{TEXT}"))(1)
+
+        self.assertIs(first_fragments, second_fragments)
+
+    def test_log_refreshes_text_immediately_by_default(self):
+        text_area = CustomTextArea(max_line_count=3)
+        for i in range(4):
+            text_area.log(f"line {i}")
+
+        self.assertEqual("line 1\nline 2\nline 3", text_area.text)
+
+    def test_log_with_max_refresh_rate_coalesces_refreshes(self):
+        text_area = CustomTextArea(max_line_count=3, max_refresh_rate=10)
+        text_area._last_refresh_time = text_area._time()
+        for i in range(4):
+            text_area.log(f"line {i}")
+
+        self.assertEqual("", text_area.text)
+
+        self.async_run_with_timeout(asyncio.sleep(0.15))
+
+        self.assertEqual("line 1\nline 2\nline 3", text_area.text)
+        self.assertFalse(text_area._refresh_requested)
+
+        text_area.log("line 4", silent=True)
+        self.async_run_with_timeout(asyncio.sleep(0.15))
+        self.assertEqual("line 1\nline 2\nline 3", text_area.text)
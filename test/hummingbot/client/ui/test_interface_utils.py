@@ -7,18 +7,31 @@ from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 import pandas as pd
 
 from hummingbot.client.ui.interface_utils import (
+    TradeMonitorFills,
     format_bytes,
     format_df_for_printout,
     start_process_monitor,
     start_timer,
     start_trade_monitor,
 )
+from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
+from hummingbot.core.pubsub import PubSub
+from hummingbot.model.order import Order  # noqa — Order needs to be defined for TradeFill
+from hummingbot.model.order_status import OrderStatus  # noqa — Order needs to be defined for TradeFill
+from hummingbot.model.trade_fill import TradeFill
 
 
 class ExpectedException(Exception):
     pass
 
 
+class MockMarket(PubSub):
+    display_name = "ExchangeA"
+    ready = True
+
+
 class InterfaceUtilsTest(unittest.TestCase):
     @classmethod
     def setUpClass(cls) -> None:
@@ -67,41 +80,53 @@ class InterfaceUtilsTest(unittest.TestCase):
             "CPU:    30%, Mem:   512.00 B (1.00 KB), Threads:   2, ",
             mock_monitor.log.call_args_list[0].args[0])
 
+    @staticmethod
+    def trade_fill(market: str, symbol: str, trade_type: str = "BUY", price: int = 10, amount: int = 1) -> TradeFill:
+        return TradeFill(market=market,
+                         symbol=symbol,
+                         trade_type=trade_type,
+                         price=Decimal(price),
+                         amount=Decimal(amount),
+                         trade_fee=AddedToCostTradeFee().to_json(),
+                         position=PositionAction.NIL.value)
+
     @patch("hummingbot.client.ui.interface_utils._sleep", new_callable=AsyncMock)
-    @patch("hummingbot.client.ui.interface_utils.PerformanceMetrics.create", new_callable=AsyncMock)
+    @patch("hummingbot.client.ui.interface_utils.PerformanceMetricsAccumulator.pnl_and_return", new_callable=AsyncMock)
     @patch("hummingbot.client.hummingbot_application.HummingbotApplication")
-    def test_start_trade_monitor_multi_loops(self, mock_hb_app, mock_perf, mock_sleep):
+    def test_start_trade_monitor_multi_loops(self, mock_hb_app, mock_pnl_and_return, mock_sleep):
         mock_result = MagicMock()
         mock_app = mock_hb_app.main_application()
         mock_app.strategy_task.done.return_value = False
         mock_app.markets.return_values = {"a": MagicMock(ready=True)}
-        mock_app._get_trades_from_session.return_value = [MagicMock(market="ExchangeA", symbol="HBOT-USDT")]
+        mock_app._get_trades_from_session.return_value = [self.trade_fill(market="ExchangeA", symbol="HBOT-USDT")]
         mock_app.get_current_balances = AsyncMock()
-        mock_perf.side_effect = [MagicMock(return_pct=Decimal("0.01"), total_pnl=Decimal("2")),
-                                 MagicMock(return_pct=Decimal("0.02"), total_pnl=Decimal("2"))]
-        mock_sleep.side_effect = [None, asyncio.CancelledError()]
+        mock_pnl_and_return.side_effect = [(Decimal("2"), Decimal("0.01")),
+                                           (Decimal("2"), Decimal("0.02")),
+                                           (Decimal("2"), Decimal("0.02"))]
+        mock_sleep.side_effect = [None, None, asyncio.CancelledError()]
         with self.assertRaises(asyncio.CancelledError):
             self.async_run_with_timeout(start_trade_monitor(mock_result))
+        # The trades are loaded once, and the monitor is only updated when the values change
+        self.assertEqual(1, mock_app._get_trades_from_session.call_count)
         self.assertEqual(3, mock_result.log.call_count)
         self.assertEqual('Trades: 0, Total P&L: 0.00, Return %: 0.00%', mock_result.log.call_args_list[0].args[0])
         self.assertEqual('Trades: 1, Total P&L: 2.00 USDT, Return %: 1.00%', mock_result.log.call_args_list[1].args[0])
         self.assertEqual('Trades: 1, Total P&L: 2.00 USDT, Return %: 2.00%', mock_result.log.call_args_list[2].args[0])
 
     @patch("hummingbot.client.ui.interface_utils._sleep", new_callable=AsyncMock)
-    @patch("hummingbot.client.ui.interface_utils.PerformanceMetrics.create", new_callable=AsyncMock)
+    @patch("hummingbot.client.ui.interface_utils.PerformanceMetricsAccumulator.pnl_and_return", new_callable=AsyncMock)
     @patch("hummingbot.client.hummingbot_application.HummingbotApplication")
-    def test_start_trade_monitor_multi_pairs_diff_quotes(self, mock_hb_app, mock_perf, mock_sleep):
+    def test_start_trade_monitor_multi_pairs_diff_quotes(self, mock_hb_app, mock_pnl_and_return, mock_sleep):
         mock_result = MagicMock()
         mock_app = mock_hb_app.main_application()
         mock_app.strategy_task.done.return_value = False
         mock_app.markets.return_values = {"a": MagicMock(ready=True)}
         mock_app._get_trades_from_session.return_value = [
-            MagicMock(market="ExchangeA", symbol="HBOT-USDT"),
-            MagicMock(market="ExchangeA", symbol="HBOT-BTC")
+            self.trade_fill(market="ExchangeA", symbol="HBOT-USDT"),
+            self.trade_fill(market="ExchangeA", symbol="HBOT-BTC")
         ]
         mock_app.get_current_balances = AsyncMock()
-        mock_perf.side_effect = [MagicMock(return_pct=Decimal("0.01"), total_pnl=Decimal("2")),
-                                 MagicMock(return_pct=Decimal("0.02"), total_pnl=Decimal("3"))]
+        mock_pnl_and_return.side_effect = [(Decimal("2"), Decimal("0.01")), (Decimal("3"), Decimal("0.02"))]
         mock_sleep.side_effect = asyncio.CancelledError()
         with self.assertRaises(asyncio.CancelledError):
             self.async_run_with_timeout(start_trade_monitor(mock_result))
@@ -110,20 +135,19 @@ class InterfaceUtilsTest(unittest.TestCase):
         self.assertEqual('Trades: 2, Total P&L: N/A, Return %: 1.50%', mock_result.log.call_args_list[1].args[0])
 
     @patch("hummingbot.client.ui.interface_utils._sleep", new_callable=AsyncMock)
-    @patch("hummingbot.client.ui.interface_utils.PerformanceMetrics.create", new_callable=AsyncMock)
+    @patch("hummingbot.client.ui.interface_utils.PerformanceMetricsAccumulator.pnl_and_return", new_callable=AsyncMock)
     @patch("hummingbot.client.hummingbot_application.HummingbotApplication")
-    def test_start_trade_monitor_multi_pairs_same_quote(self, mock_hb_app, mock_perf, mock_sleep):
+    def test_start_trade_monitor_multi_pairs_same_quote(self, mock_hb_app, mock_pnl_and_return, mock_sleep):
         mock_result = MagicMock()
         mock_app = mock_hb_app.main_application()
         mock_app.strategy_task.done.return_value = False
         mock_app.markets.return_values = {"a": MagicMock(ready=True)}
         mock_app._get_trades_from_session.return_value = [
-            MagicMock(market="ExchangeA", symbol="HBOT-USDT"),
-            MagicMock(market="ExchangeA", symbol="BTC-USDT")
+            self.trade_fill(market="ExchangeA", symbol="HBOT-USDT"),
+            self.trade_fill(market="ExchangeA", symbol="BTC-USDT")
         ]
         mock_app.get_current_balances = AsyncMock()
-        mock_perf.side_effect = [MagicMock(return_pct=Decimal("0.01"), total_pnl=Decimal("2")),
-                                 MagicMock(return_pct=Decimal("0.02"), total_pnl=Decimal("3"))]
+        mock_pnl_and_return.side_effect = [(Decimal("2"), Decimal("0.01")), (Decimal("3"), Decimal("0.02"))]
         mock_sleep.side_effect = asyncio.CancelledError()
         with self.assertRaises(asyncio.CancelledError):
             self.async_run_with_timeout(start_trade_monitor(mock_result))
@@ -131,6 +155,65 @@ class InterfaceUtilsTest(unittest.TestCase):
         self.assertEqual('Trades: 0, Total P&L: 0.00, Return %: 0.00%', mock_result.log.call_args_list[0].args[0])
         self.assertEqual('Trades: 2, Total P&L: 5.00 USDT, Return %: 1.50%', mock_result.log.call_args_list[1].args[0])
 
+    @patch("hummingbot.client.ui.interface_utils._sleep", new_callable=AsyncMock)
+    @patch("hummingbot.client.ui.interface_utils.PerformanceMetricsAccumulator.pnl_and_return", new_callable=AsyncMock)
+    @patch("hummingbot.client.hummingbot_application.HummingbotApplication")
+    def test_start_trade_monitor_adds_fills_from_market_events(self, mock_hb_app, mock_pnl_and_return, mock_sleep):
+        mock_result = MagicMock()
+        market = MockMarket()
+        mock_app = mock_hb_app.main_application()
+        mock_app.strategy_task.done.return_value = False
+        mock_app.markets = {"ExchangeA": market}
+        mock_app._get_trades_from_session.return_value = [self.trade_fill(market="ExchangeA", symbol="HBOT-USDT")]
+        mock_app.get_current_balances = AsyncMock()
+        mock_pnl_and_return.return_value = (Decimal("2"), Decimal("0.01"))
+
+        def fill_order_then_cancel(_):
+            if mock_sleep.call_count > 1:
+                raise asyncio.CancelledError()
+            market.trigger_event(MarketEvent.OrderFilled, OrderFilledEvent(
+                timestamp=1,
+                order_id="OID1",
+                trading_pair="HBOT-USDT",
+                trade_type=TradeType.SELL,
+                order_type=OrderType.LIMIT,
+                price=Decimal("11"),
+                amount=Decimal("1"),
+                trade_fee=AddedToCostTradeFee()))
+
+        mock_sleep.side_effect = fill_order_then_cancel
+        with self.assertRaises(asyncio.CancelledError):
+            self.async_run_with_timeout(start_trade_monitor(mock_result))
+        self.assertEqual(1, mock_app._get_trades_from_session.call_count)
+        self.assertEqual('Trades: 2, Total P&L: 2.00 USDT, Return %: 1.00%', mock_result.log.call_args_list[-1].args[0])
+        self.assertEqual(0, len(market.get_listeners(MarketEvent.OrderFilled)))
+
+    def test_trade_monitor_fills_records_the_fill_event_fields(self):
+        fills = TradeMonitorFills()
+        fills._did_fill_order(MarketEvent.OrderFilled.value, MockMarket(), OrderFilledEvent(
+            timestamp=1640001112.223,
+            order_id="OID1",
+            trading_pair="HBOT-USDT",
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal("11"),
+            amount=Decimal("1"),
+            trade_fee=AddedToCostTradeFee(),
+            exchange_trade_id="EOID1",
+            leverage=2,
+            position=PositionAction.OPEN.value))
+
+        accumulator = fills.accumulators[("ExchangeA", "HBOT-USDT")]
+        trade = accumulator._derivative_trades[0]
+        self.assertEqual(1, fills.num_trades)
+        self.assertEqual("OID1", trade.order_id)
+        self.assertEqual("EOID1", trade.exchange_trade_id)
+        self.assertEqual(1640001112223, trade.timestamp)
+        self.assertEqual("HBOT", trade.base_asset)
+        self.assertEqual("USDT", trade.quote_asset)
+        self.assertEqual(OrderType.LIMIT.name, trade.order_type)
+        self.assertEqual(2, trade.leverage)
+
     @patch("hummingbot.client.ui.interface_utils._sleep", new_callable=AsyncMock)
     @patch("hummingbot.client.hummingbot_application.HummingbotApplication")
     def test_start_trade_monitor_market_not_ready(self, mock_hb_app, mock_sleep):
@@ -332,6 +332,7 @@ class AscendExAPIOrderBookDataSourceUnitTests(TestCase):
         msg: OrderBookMessage = self.async_run_with_timeout(msg_queue.get())
 
         self.assertEqual(diff_event["data"]["ts"] / 1000, msg.update_id)
+        self.assertEqual(diff_event["data"]["ts"] / 1000, msg.exchange_timestamp)
 
     @aioresponses()
     def test_listen_for_order_book_snapshots_cancelled_when_fetching_snapshot(self, mock_api):
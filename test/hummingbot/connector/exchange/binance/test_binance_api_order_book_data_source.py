@@ -133,6 +133,10 @@ class BinanceAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         }
         return resp
 
+    def test_max_concurrent_snapshot_requests_derived_from_request_weight_limit(self):
+        # The snapshot request weights 50 out of the 1200 request weight per minute
+        self.assertEqual(24, self.data_source.max_concurrent_snapshot_requests)
+
     @aioresponses()
     def test_get_new_order_book_successful(self, mock_api):
         url = web_utils.public_rest_url(path_url=CONSTANTS.SNAPSHOT_PATH_URL, domain=self.domain)
@@ -731,6 +731,35 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
             asyncio.CancelledError,
             self.async_run_with_timeout, self.exchange._update_time_synchronizer())
 
+    @aioresponses()
+    def test_get_last_trade_prices_from_tickers_snapshot(self, mock_api):
+        symbol = self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset)
+        url = web_utils.public_rest_url(path_url=CONSTANTS.TICKER_BOOK_PATH_URL, domain=self.exchange._domain)
+        book_tickers = [
+            {"symbol": symbol, "bidPrice": "4.00000000", "bidQty": "100.00000000",
+             "askPrice": "4.00000200", "askQty": "100.00000000"},
+            {"symbol": "SOMEPAIR", "bidPrice": "1.00000000", "bidQty": "100.00000000",
+             "askPrice": "1.00000200", "askQty": "100.00000000"},
+        ]
+        mock_api.get(url, body=json.dumps(book_tickers))
+        url = web_utils.public_rest_url(path_url=CONSTANTS.TICKER_PRICE_PATH_URL, domain=self.exchange._domain)
+        prices = [
+            {"symbol": symbol, "price": str(self.expected_latest_price)},
+            {"symbol": "SOMEPAIR", "price": "1.00000100"},
+        ]
+        mock_api.get(url, body=json.dumps(prices))
+
+        latest_prices: Dict[str, float] = self.async_run_with_timeout(
+            self.exchange.get_last_traded_prices(trading_pairs=[self.trading_pair])
+        )
+        # The second request is served from the snapshot
+        tickers = self.async_run_with_timeout(self.exchange.ticker_snapshot_service.get_tickers())
+
+        self.assertEqual({self.trading_pair: self.expected_latest_price}, latest_prices)
+        self.assertEqual([self.trading_pair], list(tickers.keys()))
+        self.assertEqual(Decimal("4.00000100"), tickers[self.trading_pair].mid_price)
+        self.assertEqual(2, len(mock_api.requests))
+
     @aioresponses()
     def test_update_order_fills_from_trades_triggers_filled_event(self, mock_api):
         self.exchange._set_current_timestamp(1640780000)
@@ -63,6 +63,7 @@ class BinanceOrderBookTests(TestCase):
         self.assertEqual("COINALPHA-HBOT", diff_msg.trading_pair)
         self.assertEqual(OrderBookMessageType.DIFF, diff_msg.type)
         self.assertEqual(1640000000.0, diff_msg.timestamp)
+        self.assertAlmostEqual(123456.789, diff_msg.exchange_timestamp)
         self.assertEqual(2, diff_msg.update_id)
         self.assertEqual(1, diff_msg.first_update_id)
         self.assertEqual(-1, diff_msg.trade_id)
@@ -88,6 +88,31 @@ class TestKucoinAPIOrderBookDataSource(unittest.TestCase):
         }
         return snapshot
 
+    @aioresponses()
+    def test_get_last_traded_prices(self, mock_api):
+        url = web_utils.public_rest_url(path_url=CONSTANTS.ALL_TICKERS_PATH_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        resp = {
+            "code": "200000",
+            "data": {
+                "time": 1602832092060,
+                "ticker": [
+                    {
+                        "symbol": self.trading_pair,
+                        "symbolName": "OLDALPHA-HBOT",
+                        "buy": "0.3003",
+                        "sell": "0.3004",
+                        "last": "0.3003",
+                    },
+                ],
+            },
+        }
+        mock_api.get(regex_url, body=json.dumps(resp))
+
+        prices = self.async_run_with_timeout(self.ob_data_source.get_last_traded_prices([self.trading_pair]))
+
+        self.assertEqual({self.trading_pair: 0.3003}, prices)
+
     @aioresponses()
     def test_get_new_order_book(self, mock_api):
         url = web_utils.public_rest_url(path_url=CONSTANTS.SNAPSHOT_NO_AUTH_PATH_URL)
@@ -427,7 +452,8 @@ class TestKucoinAPIOrderBookDataSource(unittest.TestCase):
 
                     "asks": [["6", "1", "1545896669105"]],
                     "bids": [["4", "1", "1545896669106"]]
-                }
+                },
+                "time": 1663747970273,
             }
         }
         mock_queue.get.side_effect = [diff_event, asyncio.CancelledError()]
@@ -445,6 +471,7 @@ class TestKucoinAPIOrderBookDataSource(unittest.TestCase):
         msg: OrderBookMessage = self.async_run_with_timeout(msg_queue.get())
 
         self.assertTrue(diff_event["data"]["sequenceEnd"], msg.update_id)
+        self.assertEqual(1663747970.273, msg.exchange_timestamp)
 
     @aioresponses()
     def test_listen_for_order_book_snapshots_cancelled_when_fetching_snapshot(self, mock_api):
@@ -210,41 +210,36 @@ class KucoinExchangeTests(unittest.TestCase):
         map["TKN1-TKN2"] = "TKN1-TKN2"
         self.exchange._set_trading_pair_symbol_map(map)
 
-        url1 = web_utils.public_rest_url(path_url=CONSTANTS.TICKER_PRICE_CHANGE_PATH_URL,
-                                         domain=CONSTANTS.DEFAULT_DOMAIN)
-        url1 = f"{url1}?symbol={self.trading_pair}"
-        regex_url = re.compile(f"^{url1}".replace(".", r"\.").replace("?", r"\?"))
-        resp = {
-            "code": "200000",
-            "data": {
-                "sequence": "1550467636704",
-                "bestAsk": "0.03715004",
-                "size": "0.17",
-                "price": "100",
-                "bestBidSize": "3.803",
-                "bestBid": "0.03710768",
-                "bestAskSize": "1.788",
-                "time": 1550653727731
-            }
-        }
-        mock_api.get(regex_url, body=json.dumps(resp))
-
-        url2 = web_utils.public_rest_url(path_url=CONSTANTS.TICKER_PRICE_CHANGE_PATH_URL,
-                                         domain=CONSTANTS.DEFAULT_DOMAIN)
-        url2 = f"{url2}?symbol=TKN1-TKN2"
-        regex_url = re.compile(f"^{url2}".replace(".", r"\.").replace("?", r"\?"))
+        url = web_utils.public_rest_url(path_url=CONSTANTS.ALL_TICKERS_PATH_URL, domain=CONSTANTS.DEFAULT_DOMAIN)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
         resp = {
             "code": "200000",
             "data": {
-                "sequence": "1550467636704",
-                "bestAsk": "0.03715004",
-                "size": "0.17",
-                "price": "200",
-                "bestBidSize": "3.803",
-                "bestBid": "0.03710768",
-                "bestAskSize": "1.788",
-                "time": 1550653727731
-            }
+                "time": 1602832092060,
+                "ticker": [
+                    {
+                        "symbol": self.trading_pair,
+                        "symbolName": "OLDALPHA-HBOT",
+                        "buy": "99",
+                        "sell": "101",
+                        "last": "100",
+                    },
+                    {
+                        "symbol": "TKN1-TKN2",
+                        "symbolName": "TKN1-TKN2",
+                        "buy": "199",
+                        "sell": "201",
+                        "last": "200",
+                    },
+                    {
+                        "symbol": "SOME-PAIR",
+                        "symbolName": "SOME-PAIR",
+                        "buy": "299",
+                        "sell": "301",
+                        "last": "300",
+                    },
+                ],
+            },
         }
         mock_api.get(regex_url, body=json.dumps(resp))
 
@@ -252,13 +247,8 @@ class KucoinExchangeTests(unittest.TestCase):
             coroutine=self.exchange.get_last_traded_prices([self.trading_pair, "TKN1-TKN2"])
         )
 
-        ticker_requests = [(key, value) for key, value in mock_api.requests.items()
-                           if key[1].human_repr().startswith(url1) or key[1].human_repr().startswith(url2)]
-
-        request_params = ticker_requests[0][1][0].kwargs["params"]
-        self.assertEqual(f"{self.base_asset}-{self.quote_asset}", request_params["symbol"])
-        request_params = ticker_requests[1][1][0].kwargs["params"]
-        self.assertEqual("TKN1-TKN2", request_params["symbol"])
+        self.assertEqual({self.trading_pair: 100, "TKN1-TKN2": 200}, ret)
+        self.assertEqual(1, len(mock_api.requests))
 
         self.assertEqual(ret[self.trading_pair], 100)
         self.assertEqual(ret["TKN1-TKN2"], 200)
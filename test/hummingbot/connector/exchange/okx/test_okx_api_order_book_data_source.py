@@ -422,6 +422,7 @@ class OkxAPIOrderBookDataSourceUnitTests(unittest.TestCase):
         self.assertEqual(OrderBookMessageType.DIFF, msg.type)
         self.assertEqual(-1, msg.trade_id)
         self.assertEqual(int(diff_event["data"][0]["ts"]) * 1e-3, msg.timestamp)
+        self.assertEqual(int(diff_event["data"][0]["ts"]) * 1e-3, msg.exchange_timestamp)
         expected_update_id = int(int(diff_event["data"][0]["ts"]) * 1e-3)
         self.assertEqual(expected_update_id, msg.update_id)
 
@@ -1,3 +1,4 @@
+from decimal import Decimal
 from unittest import TestCase
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
@@ -5,7 +6,13 @@ from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.connector.exchange.binance.binance_api_order_book_data_source import BinanceAPIOrderBookDataSource
 from hummingbot.connector.exchange.kucoin.kucoin_api_order_book_data_source import KucoinAPIOrderBookDataSource
 from hummingbot.connector.exchange.paper_trade import create_paper_trade_market, get_order_book_tracker
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.trade_fee import TradeFeeSchema
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import MarketEvent, OrderBookTradeEvent
 
 
 class PaperTradeExchangeTests(TestCase):
@@ -29,3 +36,92 @@ class PaperTradeExchangeTests(TestCase):
             client_config_map=ClientConfigAdapter(ClientConfigMap()),
             trading_pairs=["COINALPHA-HBOT"])
         self.assertEqual(KucoinAPIOrderBookDataSource, type(paper_exchange.order_book_tracker.data_source))
+
+
+class PaperTradeExchangeFillTests(TestCase):
+    start_timestamp: float = 1640000000.0
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.clock = Clock(ClockMode.BACKTEST, 1.0, self.start_timestamp, self.start_timestamp + 3600)
+        self.exchange = MockPaperExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            trade_fee_schema=TradeFeeSchema(maker_percent_fee_decimal=Decimal("0.01"),
+                                            taker_percent_fee_decimal=Decimal("0.01")),
+        )
+        self.exchange.set_balanced_order_book(
+            self.trading_pair, mid_price=100, min_price=50, max_price=150, price_step_size=1, volume_step_size=10
+        )
+        self.exchange.set_balance("COINALPHA", 1000)
+        self.exchange.set_balance("HBOT", 100000)
+
+        self.order_filled_logger = EventLogger()
+        self.buy_order_completed_logger = EventLogger()
+        self.sell_order_completed_logger = EventLogger()
+        self.exchange.add_listener(MarketEvent.OrderFilled, self.order_filled_logger)
+        self.exchange.add_listener(MarketEvent.BuyOrderCompleted, self.buy_order_completed_logger)
+        self.exchange.add_listener(MarketEvent.SellOrderCompleted, self.sell_order_completed_logger)
+
+        self.clock.add_iterator(self.exchange)
+        self.clock.backtest_til(self.start_timestamp + 1)
+
+    def simulate_trade(self, trade_type: TradeType, price: Decimal, amount: Decimal):
+        self.exchange.get_order_book(self.trading_pair).apply_trade(
+            OrderBookTradeEvent(self.trading_pair, self.clock.current_timestamp, trade_type, price, amount)
+        )
+
+    def test_market_sell_order_filled_across_order_book_levels(self):
+        order_id = self.exchange.sell(self.trading_pair, Decimal("25"), OrderType.MARKET)
+        self.clock.backtest_til(self.start_timestamp + 10)
+
+        fills = self.order_filled_logger.event_log
+        self.assertEqual(2, len(fills))
+        self.assertEqual([Decimal("99.5"), Decimal("98.5")], [fill.price for fill in fills])
+        self.assertEqual([Decimal("10"), Decimal("15")], [fill.amount for fill in fills])
+        self.assertTrue(all(fill.order_id == order_id for fill in fills))
+
+        completed_event = self.sell_order_completed_logger.event_log[0]
+        self.assertEqual(order_id, completed_event.order_id)
+        self.assertEqual(Decimal("25"), completed_event.base_asset_amount)
+        # The fee is deducted from the quote asset returns
+        self.assertEqual(Decimal("2447.775"), completed_event.quote_asset_amount)
+        self.assertEqual(Decimal("975"), self.exchange.get_balance("COINALPHA"))
+        self.assertEqual(Decimal("102447.775"), self.exchange.get_balance("HBOT"))
+
+    def test_limit_buy_order_partially_filled_by_traded_quantity(self):
+        order_id = self.exchange.buy(self.trading_pair, Decimal("30"), OrderType.LIMIT, Decimal("99"))
+
+        self.simulate_trade(TradeType.SELL, Decimal("98"), Decimal("10"))
+
+        self.assertEqual(1, len(self.order_filled_logger.event_log))
+        self.assertEqual(Decimal("10"), self.order_filled_logger.event_log[0].amount)
+        self.assertEqual(0, len(self.buy_order_completed_logger.event_log))
+        limit_order = self.exchange.limit_orders[0]
+        self.assertEqual(order_id, limit_order.client_order_id)
+        self.assertEqual(Decimal("10"), limit_order.filled_quantity)
+        self.assertEqual(Decimal("20") * Decimal("99"), self.exchange.on_hold_balances["HBOT"])
+        self.assertEqual(Decimal("99010"), self.exchange.get_balance("HBOT"))
+
+        self.simulate_trade(TradeType.SELL, Decimal("98"), Decimal("25"))
+
+        self.assertEqual(2, len(self.order_filled_logger.event_log))
+        self.assertEqual(Decimal("20"), self.order_filled_logger.event_log[1].amount)
+        self.assertEqual(0, len(self.exchange.limit_orders))
+        completed_event = self.buy_order_completed_logger.event_log[0]
+        self.assertEqual(order_id, completed_event.order_id)
+        self.assertEqual(Decimal("2970"), completed_event.quote_asset_amount)
+        self.assertEqual(Decimal("97030"), self.exchange.get_balance("HBOT"))
+        self.assertEqual(Decimal("1030"), self.exchange.get_balance("COINALPHA"))
+
+    def test_trade_quantity_consumed_in_price_priority(self):
+        best_order_id = self.exchange.sell(self.trading_pair, Decimal("5"), OrderType.LIMIT, Decimal("101"))
+        other_order_id = self.exchange.sell(self.trading_pair, Decimal("5"), OrderType.LIMIT, Decimal("102"))
+
+        self.simulate_trade(TradeType.BUY, Decimal("103"), Decimal("7"))
+
+        fills = self.order_filled_logger.event_log
+        self.assertEqual([best_order_id, other_order_id], [fill.order_id for fill in fills])
+        self.assertEqual([Decimal("5"), Decimal("2")], [fill.amount for fill in fills])
+        self.assertEqual([best_order_id], [event.order_id for event in self.sell_order_completed_logger.event_log])
+        self.assertEqual(Decimal("2"), self.exchange.limit_orders[0].filled_quantity)
@@ -1082,3 +1082,127 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
 
         self.assertTrue(order.is_failure)
         self.assertIn(order.client_order_id, self.tracker.lost_orders)
+
+    def test_order_views_are_live_and_read_only(self):
+        all_orders = self.tracker.all_orders
+        all_fillable_orders = self.tracker.all_fillable_orders
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+
+        self.tracker.start_tracking_order(order)
+        self.assertIn(order.client_order_id, all_orders)
+        self.assertIn(order.client_order_id, all_fillable_orders)
+        self.assertEqual({order.client_order_id: order}, all_orders)
+
+        self.tracker.stop_tracking_order(order.client_order_id)
+        self.assertIn(order.client_order_id, all_orders)
+        self.assertIn(order.client_order_id, self.tracker.cached_orders)
+        self.assertNotIn(order.client_order_id, self.tracker.all_updatable_orders)
+
+        with self.assertRaises(TypeError):
+            all_orders["anotherClientOrderId"] = order
+
+    def test_fetch_order_by_exchange_order_id_assigned_after_tracking(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+        updated_order = self.tracker.update_exchange_order_id(order.client_order_id, "someExchangeOrderId")
+
+        self.assertEqual(order, updated_order)
+        self.assertEqual("someExchangeOrderId", order.exchange_order_id)
+        self.assertEqual(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+        self.assertEqual(
+            order.client_order_id, self.tracker._client_order_id_by_exchange_order_id["someExchangeOrderId"])
+        self.assertIsNone(self.tracker.update_exchange_order_id("unknownClientOrderId", "otherExchangeOrderId"))
+
+    def test_fetch_order_by_unknown_exchange_order_id(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="unknownExchangeOrderId"))
+
+        # The index entry is stale once the order has been assigned another exchange order id
+        self.tracker.update_exchange_order_id(order.client_order_id, "newExchangeOrderId")
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+        self.assertEqual(order, self.tracker.fetch_order(exchange_order_id="newExchangeOrderId"))
+
+    def test_fetch_order_by_exchange_order_id_from_order_update(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+
+        order_update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            exchange_order_id="someExchangeOrderId",
+            trading_pair=self.trading_pair,
+            update_timestamp=1,
+            new_state=OrderState.OPEN,
+        )
+        self.async_run_with_timeout(self.tracker.process_order_update(order_update))
+
+        self.assertEqual(
+            order.client_order_id, self.tracker._client_order_id_by_exchange_order_id["someExchangeOrderId"])
+        self.assertEqual(order, self.tracker.fetch_order(exchange_order_id="someExchangeOrderId"))
+
+    def test_active_orders_for_trading_pair(self):
+        order: InFlightOrder = InFlightOrder(
+            client_order_id="someClientOrderId",
+            trading_pair=self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        other_order: InFlightOrder = InFlightOrder(
+            client_order_id="otherClientOrderId",
+            trading_pair="OTHER-HBOT",
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.SELL,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+        self.tracker.start_tracking_order(order)
+        self.tracker.start_tracking_order(other_order)
+
+        self.assertEqual({order.client_order_id: order}, self.tracker.active_orders_for_trading_pair(self.trading_pair))
+        self.assertEqual({other_order.client_order_id: other_order},
+                         self.tracker.active_orders_for_trading_pair("OTHER-HBOT"))
+
+        self.tracker.stop_tracking_order(order.client_order_id)
+
+        self.assertEqual(0, len(self.tracker.active_orders_for_trading_pair(self.trading_pair)))
+        self.assertNotIn(self.trading_pair, self.tracker._active_orders_by_trading_pair)
@@ -17,6 +17,8 @@ from hummingbot.core.event.events import (
     OrderFilledEvent,
     SellOrderCreatedEvent,
 )
+from hummingbot.model.market_state import MarketState
+from hummingbot.model.market_state_delta import MarketStateDelta
 from hummingbot.model.order import Order
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
@@ -42,6 +44,10 @@ class MarketsRecorderTests(TestCase):
         )
 
         self.tracking_states = dict()
+        self.restored_tracking_states = None
+
+    def restore_tracking_states(self, saved_states):
+        self.restored_tracking_states = saved_states
 
     def add_trade_fills_from_market_recorder(self, current_trade_fills):
         pass
@@ -266,3 +272,90 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(MarketEvent.BuyOrderCreated.name, order_status[0].status)
         self.assertEqual(MarketEvent.BuyOrderCompleted.name, order_status[1].status)
         self.assertEqual(0, len(trade_fills))
+
+    def _save_market_states(self, recorder: MarketsRecorder):
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                recorder.save_market_states(self.config_file_path, self, session=session)
+
+    def test_save_market_states_journals_only_changed_orders(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name
+        )
+
+        self.tracking_states = {"OID1": {"state": "OPEN"}, "OID2": {"state": "OPEN"}}
+        self._save_market_states(recorder)
+        self.tracking_states = {"OID1": {"state": "PARTIALLY_FILLED"}, "OID2": {"state": "OPEN"}}
+        self._save_market_states(recorder)
+        self.tracking_states = {"OID1": {"state": "PARTIALLY_FILLED"}}
+        self._save_market_states(recorder)
+        # Nothing changed, no journal entry should be written
+        self._save_market_states(recorder)
+
+        with self.manager.get_new_session() as session:
+            snapshot = session.query(MarketState).one()
+            deltas = session.query(MarketStateDelta).order_by(MarketStateDelta.id).all()
+
+            self.assertEqual({"OID1": {"state": "OPEN"}, "OID2": {"state": "OPEN"}}, snapshot.saved_state)
+            self.assertEqual(2, len(deltas))
+            self.assertEqual({"OID1": {"state": "PARTIALLY_FILLED"}}, deltas[0].updated_states)
+            self.assertEqual([], deltas[0].removed_keys)
+            self.assertEqual({}, deltas[1].updated_states)
+            self.assertEqual(["OID2"], deltas[1].removed_keys)
+
+    def test_restore_market_states_replays_journal_on_snapshot(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name
+        )
+
+        self.tracking_states = {"OID1": {"state": "OPEN"}, "OID2": {"state": "OPEN"}}
+        self._save_market_states(recorder)
+        self.tracking_states = {"OID2": {"state": "OPEN"}, "OID3": {"state": "OPEN"}}
+        self._save_market_states(recorder)
+
+        new_recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name
+        )
+        new_recorder.restore_market_states(self.config_file_path, self)
+
+        self.assertEqual(self.tracking_states, self.restored_tracking_states)
+
+        # The restored recorder keeps journaling from the restored states
+        self.tracking_states = {"OID3": {"state": "OPEN"}}
+        self._save_market_states(new_recorder)
+        with self.manager.get_new_session() as session:
+            deltas = new_recorder.get_market_state_deltas(self.config_file_path, self, session=session)
+            self.assertEqual(2, len(deltas))
+            self.assertEqual(["OID2"], deltas[-1].removed_keys)
+
+    def test_market_states_journal_compacted_into_snapshot(self):
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name
+        )
+        recorder.MARKET_STATE_COMPACTION_THRESHOLD = 2
+
+        for i in range(4):
+            self.tracking_states = {"OID1": {"executed_amount": str(i)}}
+            self._save_market_states(recorder)
+
+        with self.manager.get_new_session() as session:
+            snapshot = session.query(MarketState).one()
+            deltas = session.query(MarketStateDelta).all()
+
+            self.assertEqual({"OID1": {"executed_amount": "3"}}, snapshot.saved_state)
+            self.assertEqual(0, len(deltas))
+
+        recorder.restore_market_states(self.config_file_path, self)
+        self.assertEqual(self.tracking_states, self.restored_tracking_states)
@@ -0,0 +1,83 @@
+import asyncio
+from decimal import Decimal
+from typing import Awaitable, Dict
+from unittest import TestCase
+from unittest.mock import patch
+
+from hummingbot.connector.ticker_snapshot_service import Ticker, TickerSnapshotService, decimal_or_none
+
+
+class TickerSnapshotServiceTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.fetch_count = 0
+        self.fetch_exception = None
+        self.tickers = {
+            "COINALPHA-HBOT": Ticker("COINALPHA-HBOT", Decimal("10"), Decimal("9"), Decimal("11")),
+            "COINBETA-HBOT": Ticker("COINBETA-HBOT", None, Decimal("5"), Decimal("4")),
+        }
+        self.service = TickerSnapshotService(fetch_tickers=self.fetch_tickers, ttl=5)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    async def fetch_tickers(self) -> Dict[str, Ticker]:
+        self.fetch_count += 1
+        await asyncio.sleep(0)
+        if self.fetch_exception is not None:
+            raise self.fetch_exception
+        return dict(self.tickers)
+
+    @patch("hummingbot.connector.ticker_snapshot_service.TickerSnapshotService._time")
+    def test_snapshot_reused_until_ttl_expires(self, time_mock):
+        time_mock.return_value = 100
+        self.assertEqual(self.tickers, self.async_run_with_timeout(self.service.get_tickers()))
+        self.assertEqual(100, self.service.snapshot_timestamp)
+
+        time_mock.return_value = 104
+        self.async_run_with_timeout(self.service.get_tickers())
+        self.assertEqual(1, self.fetch_count)
+
+        time_mock.return_value = 105
+        self.async_run_with_timeout(self.service.get_tickers())
+        self.assertEqual(2, self.fetch_count)
+
+        self.service.invalidate()
+        self.async_run_with_timeout(self.service.get_tickers())
+        self.assertEqual(3, self.fetch_count)
+
+    def test_concurrent_requests_share_one_fetch(self):
+        results = self.async_run_with_timeout(asyncio.gather(*[self.service.get_tickers() for _ in range(5)]))
+
+        self.assertEqual(1, self.fetch_count)
+        self.assertTrue(all(result == self.tickers for result in results))
+
+    def test_failed_fetch_raises_and_is_retried(self):
+        self.fetch_exception = IOError("Test error")
+
+        with self.assertRaises(IOError):
+            self.async_run_with_timeout(self.service.get_tickers())
+
+        self.fetch_exception = None
+        self.assertEqual(self.tickers, self.async_run_with_timeout(self.service.get_tickers()))
+        self.assertEqual(2, self.fetch_count)
+
+    def test_get_last_traded_prices(self):
+        last_prices = self.async_run_with_timeout(
+            self.service.get_last_traded_prices(["COINALPHA-HBOT", "COINBETA-HBOT", "COINGAMMA-HBOT"]))
+
+        self.assertEqual({"COINALPHA-HBOT": 10.0}, last_prices)
+
+    def test_ticker_mid_price(self):
+        self.assertEqual(Decimal("10"), self.tickers["COINALPHA-HBOT"].mid_price)
+        # Crossed or missing prices
+        self.assertIsNone(self.tickers["COINBETA-HBOT"].mid_price)
+        self.assertIsNone(Ticker("COINALPHA-HBOT", None, None, Decimal("1")).mid_price)
+
+    def test_decimal_or_none(self):
+        self.assertEqual(Decimal("1.5"), decimal_or_none("1.5"))
+        self.assertEqual(Decimal("2"), decimal_or_none(2))
+        self.assertIsNone(decimal_or_none(""))
+        self.assertIsNone(decimal_or_none(None))
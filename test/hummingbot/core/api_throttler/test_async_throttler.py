@@ -91,6 +91,12 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         self.assertEqual(TEST_PATH_URL, rate_limit.limit_id)
         self.assertEqual(1, len(related_limits))
 
+    def test_max_concurrent_tasks(self):
+        self.assertEqual(1, self.throttler.max_concurrent_tasks(TEST_PATH_URL))
+        self.assertEqual(2, self.throttler.max_concurrent_tasks(TEST_WEIGHTED_TASK_1_ID))
+        self.assertEqual(10, self.throttler.max_concurrent_tasks(TEST_WEIGHTED_TASK_2_ID))
+        self.assertIsNone(self.throttler.max_concurrent_tasks("UNDEFINED_LIMIT"))
+
     def test_flush_empty_task_logs(self):
         # Test: No entries in task_logs to flush
         lock = asyncio.Lock()
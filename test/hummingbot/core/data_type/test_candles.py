@@ -0,0 +1,89 @@
+import math
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.candles import Candles
+
+
+class CandlesTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.candles = Candles(trading_pair="COINALPHA-HBOT", interval=60, capacity=3)
+
+    def test_invalid_parameters_raise_error(self):
+        with self.assertRaises(ValueError):
+            Candles(trading_pair="COINALPHA-HBOT", interval=0)
+        with self.assertRaises(ValueError):
+            Candles(trading_pair="COINALPHA-HBOT", interval=60, capacity=0)
+
+    def test_empty_candles(self):
+        self.assertEqual(0, len(self.candles))
+        self.assertTrue(math.isnan(self.candles.last_close))
+        self.assertEqual((0, len(Candles.COLUMNS)), self.candles.to_array().shape)
+        self.assertEqual(0, len(self.candles.to_pandas()))
+
+    def test_trades_aggregated_in_bars(self):
+        self.candles.add_trade(60, 10, 1)
+        self.candles.add_trade(70, 12, 2)
+        self.candles.add_trade(80, 9, 1)
+        self.candles.add_trade(119, 11, 3)
+        self.candles.add_trade(125, 13, 1)
+
+        self.assertEqual([[60, 10, 12, 9, 11, 7, 4], [120, 13, 13, 13, 13, 1, 1]], self.candles.to_array().tolist())
+        self.assertEqual(13, self.candles.last_close)
+
+    def test_late_trade_updates_its_bar(self):
+        self.candles.add_trade(60, 10, 1)
+        self.candles.add_trade(125, 13, 1)
+        self.candles.add_trade(90, 14, 1)
+        # Older than the bars kept
+        self.candles.add_trade(0, 100, 1)
+
+        self.assertEqual([[60, 10, 14, 10, 14, 2, 2], [120, 13, 13, 13, 13, 1, 1]], self.candles.to_array().tolist())
+
+    def test_intervals_without_trades_filled_with_previous_close(self):
+        self.candles.add_trade(60, 10, 1)
+        self.candles.add_trade(61, 11, 1)
+        self.candles.add_trade(200, 12, 1)
+
+        self.assertEqual([[60, 10, 11, 10, 11, 2, 2], [120, 11, 11, 11, 11, 0, 0], [180, 12, 12, 12, 12, 1, 1]],
+                         self.candles.to_array().tolist())
+
+    def test_mid_prices_used_for_bars_without_trades(self):
+        self.candles.add_mid_price(60, 10)
+        self.candles.add_mid_price(70, 12)
+        self.candles.add_mid_price(80, 8)
+        self.candles.add_mid_price(130, 11)
+        self.candles.add_trade(140, 20, 1)
+        self.candles.add_mid_price(150, 30)
+        self.candles.add_mid_price(160, float("nan"))
+
+        self.assertEqual([[60, 10, 12, 8, 8, 0, 0], [120, 20, 20, 20, 20, 1, 1]], self.candles.to_array().tolist())
+
+    def test_oldest_bars_discarded_when_full(self):
+        for i in range(5):
+            self.candles.add_trade(60 * i, 10 + i, 1)
+
+        self.assertEqual(3, len(self.candles))
+        self.assertEqual([120, 180, 240], self.candles.to_array()[:, Candles.TIMESTAMP].tolist())
+        self.assertEqual([12, 13, 14], self.candles.to_array()[:, Candles.CLOSE].tolist())
+
+        # A gap longer than the capacity only keeps the last bars
+        self.candles.add_trade(60 * 100, 20, 1)
+        self.assertEqual([60 * 98, 60 * 99, 60 * 100], self.candles.to_array()[:, Candles.TIMESTAMP].tolist())
+        self.assertEqual([14, 14, 20], self.candles.to_array()[:, Candles.CLOSE].tolist())
+
+    def test_views_share_the_bars_memory(self):
+        self.candles.add_trade(60, 10, 1)
+        self.candles.add_trade(120, 11, 2)
+
+        array = self.candles.to_array()
+        df = self.candles.to_pandas()
+
+        self.assertFalse(array.flags.writeable)
+        self.assertTrue(np.shares_memory(array, df.values))
+        self.assertEqual(["open", "high", "low", "close", "volume", "trades"], list(df.columns))
+        self.assertEqual([11, 2], df.iloc[-1][["close", "volume"]].tolist())
+        self.assertEqual(120, df.index[-1].timestamp())
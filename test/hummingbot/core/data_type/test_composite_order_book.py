@@ -0,0 +1,90 @@
+import unittest
+from decimal import Decimal
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+from hummingbot.core.event.events import OrderFilledEvent
+
+
+class CompositeOrderBookTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.order_book = CompositeOrderBook()
+        self.order_book.apply_snapshot([OrderBookRow(100 - i, 1, 1) for i in range(5)],
+                                       [OrderBookRow(101 + i, 1, 1) for i in range(5)],
+                                       1)
+
+    def record_fill(self, trade_type: TradeType, price: float, amount: float, timestamp: float = 1640000000):
+        self.order_book.record_filled_order(OrderFilledEvent(
+            timestamp=timestamp,
+            order_id="OID1",
+            trading_pair="COINALPHA-HBOT",
+            trade_type=trade_type,
+            order_type=OrderType.MARKET,
+            price=Decimal(str(price)),
+            amount=Decimal(str(amount)),
+            trade_fee=AddedToCostTradeFee(),
+        ))
+
+    def test_recorded_fills_deducted_from_levels(self):
+        self.record_fill(TradeType.BUY, 101, 1)
+        self.record_fill(TradeType.BUY, 102, 0.25)
+        self.record_fill(TradeType.SELL, 100, 0.5)
+
+        self.assertEqual([OrderBookRow(102, 0.75, 1), OrderBookRow(103, 1, 1)], list(self.order_book.ask_entries())[:2])
+        self.assertEqual(OrderBookRow(100, 0.5, 1), next(self.order_book.bid_entries()))
+        self.assertEqual(OrderBookRow(101, 1, 1), next(self.order_book.original_ask_entries()))
+        self.assertEqual([[101, 1, 1640000000], [102, 0.25, 1640000000]],
+                         [list(row) for row in self.order_book.traded_order_book.ask_entries()])
+
+        self.assertEqual(102, self.order_book.get_price(True))
+        self.assertEqual(100, self.order_book.get_price(False))
+        self.assertEqual(103, self.order_book.get_price_for_volume(True, 1).result_price)
+        self.assertEqual((102 * 0.75 + 103 * 0.25), self.order_book.get_vwap_for_volume(True, 1).result_price)
+        self.assertEqual(1.75, self.order_book.get_volume_for_price(True, 103).result_volume)
+        self.assertEqual(1.5, self.order_book.get_volume_for_price(False, 99).result_volume)
+        self.assertEqual([[102, 0.75, 1]], self.order_book.asks_array(1).tolist())
+        self.assertEqual([OrderBookRow(102, 0.75, 1), OrderBookRow(103, 0.25, 1)], self.order_book.simulate_buy(1))
+
+    def test_recorded_fills_accumulate_up_to_level_amount(self):
+        self.record_fill(TradeType.SELL, 100, 0.5)
+        self.record_fill(TradeType.SELL, 100, 0.75)
+        # Fill on a price without level is ignored
+        self.record_fill(TradeType.SELL, 99.5, 1)
+
+        self.assertEqual([OrderBookRow(100, 1, 1640000000)], list(self.order_book.traded_order_book.bid_entries()))
+        self.assertEqual(99, self.order_book.get_price(False))
+
+    def test_recorded_fill_cleared_when_level_changes(self):
+        self.record_fill(TradeType.BUY, 101, 1)
+        self.record_fill(TradeType.BUY, 102, 0.5)
+
+        self.order_book.apply_diffs([], [OrderBookRow(101, 2, 2)], 2)
+
+        self.assertEqual(101, self.order_book.get_price(True))
+        self.assertEqual([OrderBookRow(101, 2, 2), OrderBookRow(102, 0.5, 1)], list(self.order_book.ask_entries())[:2])
+
+        # The level is removed from the book
+        self.order_book.apply_diffs([], [OrderBookRow(102, 0, 3)], 3)
+        self.assertEqual([], list(self.order_book.traded_order_book.ask_entries()))
+
+    def test_recorded_fills_cleared_by_snapshot(self):
+        self.record_fill(TradeType.BUY, 101, 1)
+        self.record_fill(TradeType.SELL, 100, 1)
+
+        self.order_book.apply_snapshot([OrderBookRow(100, 1, 2)], [OrderBookRow(101, 1, 2)], 2)
+
+        self.assertEqual(101, self.order_book.get_price(True))
+        self.assertEqual(100, self.order_book.get_price(False))
+        self.assertEqual([], list(self.order_book.traded_order_book.bid_entries()))
+
+    def test_get_price_when_all_levels_consumed(self):
+        for i in range(5):
+            self.record_fill(TradeType.SELL, 100 - i, 1)
+
+        with self.assertRaises(EnvironmentError):
+            self.order_book.get_price(False)
+        self.assertEqual([], list(self.order_book.bid_entries()))
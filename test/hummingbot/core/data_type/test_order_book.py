@@ -3,6 +3,11 @@
 import logging
 import unittest
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent, OrderBookTradeEvent
 import numpy as np
 
 
@@ -50,6 +55,131 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_max_depth_discards_levels_beyond_limit(self):
+        order_book = OrderBook(max_depth=2)
+        bids = [OrderBookRow(100 - i, 1, 1) for i in range(10)]
+        asks = [OrderBookRow(101 + i, 1, 1) for i in range(10)]
+        order_book.apply_snapshot(bids, asks, 1)
+
+        self.assertEqual([100, 99, 98, 97], [row.price for row in order_book.bid_entries()])
+        self.assertEqual([101, 102, 103, 104], [row.price for row in order_book.ask_entries()])
+        self.assertFalse(order_book.depth_incomplete)
+
+        # Levels in the discarded range are ignored, new top levels push out the deepest ones
+        order_book.apply_diffs([OrderBookRow(95, 1, 2), OrderBookRow(99.5, 1, 2)], [OrderBookRow(100.5, 1, 2)], 2)
+
+        self.assertEqual([100, 99.5, 99, 98], [row.price for row in order_book.bid_entries()])
+        self.assertEqual([100.5, 101, 102, 103], [row.price for row in order_book.ask_entries()])
+        self.assertFalse(order_book.depth_incomplete)
+
+    def test_max_depth_book_incomplete_when_discarded_levels_are_needed(self):
+        order_book = OrderBook(max_depth=2)
+        bids = [OrderBookRow(100 - i, 1, 1) for i in range(10)]
+        asks = [OrderBookRow(101 + i, 1, 1) for i in range(10)]
+        order_book.apply_snapshot(bids, asks, 1)
+
+        order_book.apply_diffs([OrderBookRow(100, 0, 2), OrderBookRow(99, 0, 2)], [], 2)
+        self.assertFalse(order_book.depth_incomplete)
+        order_book.apply_diffs([OrderBookRow(98, 0, 3)], [], 3)
+        self.assertTrue(order_book.depth_incomplete)
+
+        order_book.apply_snapshot(bids[3:], asks, 4)
+        self.assertFalse(order_book.depth_incomplete)
+        self.assertEqual([97, 96, 95, 94], [row.price for row in order_book.bid_entries()])
+
+    def test_apply_deep_levels_only_fills_the_discarded_range(self):
+        order_book = OrderBook(max_depth=2)
+        bids = [OrderBookRow(100 - i, 1, 1) for i in range(10)]
+        asks = [OrderBookRow(101 + i, 1, 1) for i in range(10)]
+        order_book.apply_snapshot(bids, asks, 1)
+        order_book.apply_diffs([OrderBookRow(100, 0, 2), OrderBookRow(99, 0, 2), OrderBookRow(98, 0, 2)],
+                               [OrderBookRow(101, 2, 2)], 2)
+        self.assertTrue(order_book.depth_incomplete)
+
+        order_book.apply_deep_levels([OrderBookRow(97, 5, 3)] + bids[4:],
+                                     [OrderBookRow(101, 7, 3)] + asks[1:])
+
+        self.assertFalse(order_book.depth_incomplete)
+        self.assertEqual([(97, 1), (96, 1), (95, 1), (94, 1)],
+                         [(row.price, row.amount) for row in order_book.bid_entries()])
+        self.assertEqual([(101, 2), (102, 1), (103, 1), (104, 1)],
+                         [(row.price, row.amount) for row in order_book.ask_entries()])
+        self.assertEqual(2, order_book.last_diff_uid)
+
+    def test_max_distance_from_mid_discards_far_levels(self):
+        order_book = OrderBook(max_distance_from_mid=0.01)
+        bids = [OrderBookRow(100 - i * 0.5, 1, 1) for i in range(20)]
+        asks = [OrderBookRow(101 + i * 0.5, 1, 1) for i in range(20)]
+        order_book.apply_snapshot(bids, asks, 1)
+
+        # Mid price is 100.5, levels further than 2% (the configured distance plus headroom) are discarded
+        self.assertEqual(98.5, list(order_book.bid_entries())[-1].price)
+        self.assertEqual(102.5, list(order_book.ask_entries())[-1].price)
+        self.assertFalse(order_book.depth_incomplete)
+
+        # The mid price moves down and the discarded bids are now within 1% of it
+        order_book.apply_diffs([OrderBookRow(price, 0, 2) for price in (100, 99.5, 99, 98.5)],
+                               [OrderBookRow(98.6, 1, 2)], 2)
+        self.assertTrue(order_book.depth_incomplete)
+
+    def test_export_entries_arrays(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(100 - i, i + 1, 1) for i in range(5)],
+                                  [OrderBookRow(101 + i, i + 1, 1) for i in range(3)],
+                                  1)
+
+        self.assertEqual([[100, 1, 1], [99, 2, 1], [98, 3, 1], [97, 4, 1], [96, 5, 1]],
+                         order_book.bids_array().tolist())
+        self.assertEqual([[101, 1, 1], [102, 2, 1]], order_book.asks_array(2).tolist())
+        self.assertEqual([[101, 1, 1], [102, 2, 1], [103, 3, 1]], order_book.asks_array(10).tolist())
+
+        out = np.zeros((4, 3), dtype=np.float64)
+        bids = order_book.bids_array(out=out)
+        self.assertEqual([[100, 1, 1], [99, 2, 1], [98, 3, 1], [97, 4, 1]], bids.tolist())
+        self.assertTrue(np.shares_memory(out, bids))
+        asks = order_book.asks_array(4, out=out)
+        self.assertEqual(3, len(asks))
+        self.assertEqual([103, 3, 1], out[2].tolist())
+
+        with self.assertRaises(ValueError):
+            order_book.bids_array(out=np.zeros((4, 2), dtype=np.float64))
+
+    def test_export_entries_arrays_empty_book(self):
+        order_book = OrderBook()
+
+        self.assertEqual((0, 3), order_book.bids_array().shape)
+        self.assertEqual((0, 3), order_book.asks_array(5).shape)
+        bids, asks = order_book.snapshot
+        self.assertEqual(list(OrderBookRow._fields), list(bids.columns))
+        self.assertEqual(0, len(asks))
+
+    def test_simulate_buy_and_sell(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(100 - i, 1, 1) for i in range(3)],
+                                  [OrderBookRow(101 + i, 1, 2) for i in range(3)],
+                                  2)
+
+        self.assertEqual([OrderBookRow(101, 1, 2), OrderBookRow(102, 0.5, 2)], order_book.simulate_buy(1.5))
+        self.assertEqual([OrderBookRow(100, 1, 1)], order_book.simulate_sell(1))
+        self.assertEqual([OrderBookRow(100, 1, 1), OrderBookRow(99, 1, 1), OrderBookRow(98, 1, 1)],
+                         order_book.simulate_sell(10))
+
+    def test_apply_trades_delivers_batch(self):
+        order_book = OrderBook()
+        event_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.TradeEvent, event_logger)
+        trades = [OrderBookTradeEvent("COINALPHA-HBOT", 1640000000 + i, TradeType.BUY, 100 + i, 1) for i in range(3)]
+        last_trade_prices = []
+        forwarder = EventForwarder(lambda trade: last_trade_prices.append(order_book.last_trade_price))
+        order_book.add_listener(OrderBookEvent.TradeEvent, forwarder)
+
+        order_book.apply_trades(trades)
+
+        self.assertEqual(trades, event_logger.event_log)
+        self.assertEqual(102, order_book.last_trade_price)
+        # Listeners see the last trade price of the trade they process
+        self.assertEqual([100, 101, 102], last_trade_prices)
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -0,0 +1,364 @@
+import asyncio
+import time
+import unittest
+from decimal import Decimal
+from typing import Awaitable, Dict, List, Optional
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class SnapshotRequestsDataSource(OrderBookTrackerDataSource):
+    MAX_CONCURRENT_SNAPSHOT_REQUESTS = 2
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(trading_pairs)
+        self.snapshot_requests_in_flight = 0
+        self.max_snapshot_requests_in_flight = 0
+        self.failures_to_raise: Dict[str, int] = {}
+        self.release_snapshot_requests = asyncio.Event()
+        self.snapshot_update_ids: List[int] = [100]
+        self.snapshot_bids: List[List[float]] = [[9, 1]]
+        self.snapshot_asks: List[List[float]] = [[11, 1]]
+        self.snapshot_messages_requested: List[str] = []
+        self.diff_messages: List[OrderBookMessage] = []
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain=None) -> Dict[str, float]:
+        return {trading_pair: 10.0 for trading_pair in trading_pairs}
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        self.snapshot_requests_in_flight += 1
+        self.max_snapshot_requests_in_flight = max(
+            self.max_snapshot_requests_in_flight, self.snapshot_requests_in_flight)
+        try:
+            await self.release_snapshot_requests.wait()
+            if self.failures_to_raise.get(trading_pair, 0) > 0:
+                self.failures_to_raise[trading_pair] -= 1
+                raise IOError("Test snapshot error")
+            return OrderBook()
+        finally:
+            self.snapshot_requests_in_flight -= 1
+
+    async def listen_for_subscriptions(self):
+        pass
+
+    async def listen_for_order_book_diffs(self, ev_loop: asyncio.AbstractEventLoop, output: asyncio.Queue):
+        for message in self.diff_messages:
+            output.put_nowait(message)
+
+    async def listen_for_order_book_snapshots(self, ev_loop: asyncio.AbstractEventLoop, output: asyncio.Queue):
+        pass
+
+    async def listen_for_trades(self, ev_loop: asyncio.AbstractEventLoop, output: asyncio.Queue):
+        pass
+
+    async def _connected_websocket_assistant(self):
+        raise NotImplementedError
+
+    async def _subscribe_channels(self, ws):
+        raise NotImplementedError
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        self.snapshot_messages_requested.append(trading_pair)
+        return OrderBookMessage(
+            OrderBookMessageType.SNAPSHOT,
+            {"trading_pair": trading_pair,
+             "update_id": self.snapshot_update_ids.pop(0),
+             "bids": self.snapshot_bids,
+             "asks": self.snapshot_asks},
+            timestamp=1)
+
+
+class ThrottledSnapshotRequestsDataSource(SnapshotRequestsDataSource):
+    SNAPSHOT_THROTTLER_LIMIT_ID = "/depth"
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(trading_pairs)
+        self.throttler = AsyncThrottler(
+            rate_limits=[
+                RateLimit(limit_id="REQUEST_WEIGHT", limit=10, time_interval=60),
+                RateLimit(limit_id="/depth", limit=100, time_interval=60,
+                          linked_limits=[LinkedLimitWeightPair("REQUEST_WEIGHT", 10)]),
+            ],
+            limits_share_percentage=Decimal("100"))
+
+    def _snapshot_requests_throttler(self) -> Optional[AsyncThrottlerBase]:
+        return self.throttler
+
+
+class OrderBookTrackerTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.trading_pairs = ["COINALPHA-HBOT", "COINBETA-HBOT", "COINGAMMA-HBOT"]
+        self.data_source = SnapshotRequestsDataSource(trading_pairs=self.trading_pairs)
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs)
+        self.tracker._sleep = self._no_sleep
+
+    def tearDown(self) -> None:
+        self.tracker.stop()
+        super().tearDown()
+
+    async def _no_sleep(self, delay: float):
+        await asyncio.sleep(0)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_init_order_books_limits_concurrent_snapshot_requests(self):
+        init_task = asyncio.get_event_loop().create_task(self.tracker._init_order_books())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual(2, self.data_source.snapshot_requests_in_flight)
+        self.assertFalse(self.tracker.ready)
+
+        self.data_source.release_snapshot_requests.set()
+        self.async_run_with_timeout(init_task)
+
+        self.assertEqual(2, self.data_source.max_snapshot_requests_in_flight)
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(self.trading_pairs, self.tracker.ready_trading_pairs)
+        self.assertEqual(set(self.trading_pairs), set(self.tracker.order_books))
+
+    def test_init_order_books_concurrent_snapshot_requests_derived_from_rate_limits(self):
+        self.data_source = ThrottledSnapshotRequestsDataSource(trading_pairs=self.trading_pairs)
+        self.tracker = OrderBookTracker(data_source=self.data_source, trading_pairs=self.trading_pairs)
+        self.assertEqual(1, self.data_source.max_concurrent_snapshot_requests)
+
+        init_task = asyncio.get_event_loop().create_task(self.tracker._init_order_books())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual(1, self.data_source.snapshot_requests_in_flight)
+
+        self.data_source.release_snapshot_requests.set()
+        self.async_run_with_timeout(init_task)
+
+        self.assertEqual(1, self.data_source.max_snapshot_requests_in_flight)
+        self.assertTrue(self.tracker.ready)
+
+    def test_order_book_ready_before_all_order_books_initialized(self):
+        self.data_source.failures_to_raise["COINGAMMA-HBOT"] = 1000000
+        self.data_source.release_snapshot_requests.set()
+        init_task = asyncio.get_event_loop().create_task(self.tracker._init_order_books())
+
+        order_book = self.async_run_with_timeout(self.tracker.wait_for_order_book("COINALPHA-HBOT"))
+
+        self.assertIs(self.tracker.order_books["COINALPHA-HBOT"], order_book)
+        self.assertTrue(self.tracker.is_order_book_ready("COINALPHA-HBOT"))
+        self.assertFalse(self.tracker.is_order_book_ready("COINGAMMA-HBOT"))
+        self.assertNotIn("COINGAMMA-HBOT", self.tracker.ready_trading_pairs)
+        self.assertFalse(self.tracker.ready)
+
+        init_task.cancel()
+
+    def test_init_order_books_retries_failed_snapshot_requests(self):
+        self.data_source.failures_to_raise["COINBETA-HBOT"] = 2
+        self.data_source.release_snapshot_requests.set()
+
+        # The first network error logged loads the application notifiers, which can be slow
+        self.async_run_with_timeout(self.tracker._init_order_books(), timeout=10)
+
+        self.assertEqual(0, self.data_source.failures_to_raise["COINBETA-HBOT"])
+        self.assertTrue(self.tracker.ready)
+        self.assertTrue(self.tracker.is_order_book_ready("COINBETA-HBOT"))
+
+    def test_trades_recorded_in_trade_tape(self):
+        self.tracker._order_books["COINALPHA-HBOT"] = OrderBook()
+        for timestamp, price, trade_type in ((1, 10, TradeType.BUY), (2, 12, TradeType.SELL)):
+            self.tracker._order_book_trade_stream.put_nowait(OrderBookMessage(
+                OrderBookMessageType.TRADE,
+                {"trading_pair": "COINALPHA-HBOT", "price": price, "amount": 1, "trade_type": float(trade_type.value)},
+                timestamp=timestamp))
+        self.tracker._order_book_trade_stream.put_nowait(OrderBookMessage(
+            OrderBookMessageType.TRADE,
+            {"trading_pair": "UNKNOWN-HBOT", "price": 1, "amount": 1, "trade_type": float(TradeType.BUY.value)},
+            timestamp=2))
+
+        emit_task = asyncio.get_event_loop().create_task(self.tracker._emit_trade_event_loop())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        emit_task.cancel()
+
+        trade_tape = self.tracker.get_trade_tape("COINALPHA-HBOT")
+        self.assertEqual(2, len(trade_tape))
+        self.assertEqual(11, trade_tape.vwap(10))
+        self.assertEqual(0, trade_tape.imbalance(10))
+        self.assertEqual(12, self.tracker.order_books["COINALPHA-HBOT"].last_trade_price)
+        self.assertNotIn("UNKNOWN-HBOT", self.tracker.trade_tapes)
+
+    def test_candles_built_from_trades_and_mid_prices(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(9, 1, 1)], [OrderBookRow(11, 1, 1)], 1)
+        self.tracker._order_books["COINALPHA-HBOT"] = order_book
+        self.tracker._order_book_initialized_events["COINALPHA-HBOT"].set()
+        candles = self.tracker.get_candles("COINALPHA-HBOT", 60)
+        self.assertIs(candles, self.tracker.get_candles("COINALPHA-HBOT", 60))
+
+        self.tracker._update_candles_mid_prices(60)
+        self.tracker._order_book_trade_stream.put_nowait(OrderBookMessage(
+            OrderBookMessageType.TRADE,
+            {"trading_pair": "COINALPHA-HBOT", "price": 12, "amount": 2, "trade_type": float(TradeType.BUY.value)},
+            timestamp=130))
+        emit_task = asyncio.get_event_loop().create_task(self.tracker._emit_trade_event_loop())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        emit_task.cancel()
+        self.tracker._update_candles_mid_prices(150)
+
+        self.assertEqual([[60, 10, 10, 10, 10, 0, 0], [120, 12, 12, 12, 12, 2, 1]], candles.to_array().tolist())
+
+    def test_candles_skip_mid_prices_of_empty_order_books(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(9, 1, 1)], [], 1)
+        self.tracker._order_books["COINALPHA-HBOT"] = order_book
+        self.tracker._order_book_initialized_events["COINALPHA-HBOT"].set()
+        candles = self.tracker.get_candles("COINALPHA-HBOT", 60)
+
+        self.tracker._update_candles_mid_prices(60)
+
+        self.assertEqual(0, len(candles.to_array()))
+
+    def _diff_message(self, first_update_id: int, update_id: int, bids: List = None, asks: List = None,
+                      exchange_timestamp: Optional[float] = None):
+        return OrderBookMessage(
+            OrderBookMessageType.DIFF,
+            {"trading_pair": "COINALPHA-HBOT",
+             "first_update_id": first_update_id,
+             "update_id": update_id,
+             "bids": bids or [],
+             "asks": asks or [],
+             "exchange_timestamp": exchange_timestamp},
+            timestamp=1)
+
+    def _start_tracking_single_book(self) -> OrderBook:
+        order_book = OrderBook()
+        order_book.apply_snapshot([], [], 10)
+        self.tracker._order_books["COINALPHA-HBOT"] = order_book
+        self.tracker._tracking_message_queues["COINALPHA-HBOT"] = asyncio.Queue()
+        self.tracker._tracking_tasks["COINALPHA-HBOT"] = asyncio.get_event_loop().create_task(
+            self.tracker._track_single_book("COINALPHA-HBOT"))
+        return order_book
+
+    def test_contiguous_diffs_are_applied_without_resync(self):
+        order_book = self._start_tracking_single_book()
+        message_queue = self.tracker._tracking_message_queues["COINALPHA-HBOT"]
+
+        message_queue.put_nowait(self._diff_message(11, 12, bids=[[9, 1]]))
+        message_queue.put_nowait(self._diff_message(13, 13, asks=[[11, 1]]))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual(13, order_book.last_diff_uid)
+        self.assertEqual({}, self.tracker.sequence_gap_counts)
+        self.assertEqual([], self.data_source.snapshot_messages_requested)
+
+    def test_sequence_gap_buffers_diffs_and_resyncs_from_snapshot(self):
+        order_book = self._start_tracking_single_book()
+        message_queue = self.tracker._tracking_message_queues["COINALPHA-HBOT"]
+
+        message_queue.put_nowait(self._diff_message(11, 12))
+        message_queue.put_nowait(self._diff_message(20, 99, bids=[[8, 1]]))
+        message_queue.put_nowait(self._diff_message(100, 101, bids=[[9.5, 2]]))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual(["COINALPHA-HBOT"], self.data_source.snapshot_messages_requested)
+        self.assertEqual({"COINALPHA-HBOT": 1}, self.tracker.sequence_gap_counts)
+        self.assertEqual({"COINALPHA-HBOT": 1}, self.tracker.resync_counts)
+        self.assertFalse(self.tracker.is_order_book_resyncing("COINALPHA-HBOT"))
+        self.assertEqual(100, order_book.snapshot_uid)
+        self.assertEqual(101, order_book.last_diff_uid)
+        bids, asks = order_book.snapshot
+        self.assertEqual([9.5, 9.0], bids["price"].tolist())
+        self.assertEqual([11.0], asks["price"].tolist())
+
+    def test_sequence_gap_resync_requests_new_snapshot_when_snapshot_is_outdated(self):
+        self._start_tracking_single_book()
+        message_queue = self.tracker._tracking_message_queues["COINALPHA-HBOT"]
+        self.data_source.snapshot_update_ids = [50, 110]
+
+        message_queue.put_nowait(self._diff_message(90, 101))
+        message_queue.put_nowait(self._diff_message(102, 105))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual(2, len(self.data_source.snapshot_messages_requested))
+        self.assertEqual({"COINALPHA-HBOT": 2}, self.tracker.sequence_gap_counts)
+        self.assertEqual({"COINALPHA-HBOT": 1}, self.tracker.resync_counts)
+        self.assertFalse(self.tracker.is_order_book_resyncing("COINALPHA-HBOT"))
+        self.assertEqual(110, self.tracker.order_books["COINALPHA-HBOT"].snapshot_uid)
+
+    def test_direct_dispatch_applies_diffs_without_router_tasks(self):
+        self.data_source.diff_messages = [
+            self._diff_message(1, 1, bids=[[9, 1]]),
+            self._diff_message(2, 2, asks=[[11, 3]], exchange_timestamp=time.time()),
+        ]
+
+        self.tracker.start()
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        self.data_source.release_snapshot_requests.set()
+        self.async_run_with_timeout(self.tracker.wait_for_order_book("COINALPHA-HBOT"))
+
+        self.assertTrue(self.tracker.uses_direct_dispatch)
+        self.assertIsNone(self.tracker._order_book_diff_router_task)
+        self.assertEqual({}, self.tracker._tracking_tasks)
+        order_book = self.tracker.order_books["COINALPHA-HBOT"]
+        self.assertEqual(2, order_book.last_diff_uid)
+        self.assertEqual([11.0], [row.price for row in order_book.ask_entries()])
+        # Only the message with the exchange event time is recorded
+        self.assertEqual(1, self.tracker.latency_histograms[OrderBookTracker.EXCHANGE_TO_RECEIVE_LATENCY].count)
+        self.assertEqual(2, self.tracker.latency_histograms[OrderBookTracker.RECEIVE_TO_APPLY_LATENCY].count)
+
+    def test_direct_dispatch_saves_diffs_received_before_order_book_initialization(self):
+        self.tracker._dispatch_diff_message(self._diff_message(1, 1, bids=[[9, 1]]))
+
+        self.assertNotIn("COINALPHA-HBOT", self.tracker.order_books)
+
+        self.data_source.release_snapshot_requests.set()
+        self.async_run_with_timeout(self.tracker._init_order_books())
+
+        order_book = self.tracker.order_books["COINALPHA-HBOT"]
+        self.assertEqual(1, order_book.last_diff_uid)
+        self.assertEqual([9.0], [row.price for row in order_book.bid_entries()])
+
+    def test_trackers_customizing_message_routing_keep_queues_pipeline(self):
+        class CustomTracker(OrderBookTracker):
+            async def _track_single_book(self, trading_pair: str):
+                pass
+
+        self.assertFalse(CustomTracker(data_source=self.data_source, trading_pairs=[]).uses_direct_dispatch)
+
+    def test_depth_limited_order_book_refills_discarded_levels_without_stopping_diffs(self):
+        order_book = OrderBook(max_depth=2)
+        order_book.apply_snapshot([OrderBookRow(10 - i, 1, 10) for i in range(5)], [OrderBookRow(11, 1, 10)], 10)
+        self.tracker._order_books["COINALPHA-HBOT"] = order_book
+        self.data_source.snapshot_update_ids = [14]
+        self.data_source.snapshot_bids = [[9.5, 2], [7, 1], [6, 1], [5, 1], [4, 1]]
+
+        self.tracker._dispatch_diff_message(self._diff_message(11, 11, bids=[[10, 0]]))
+        self.tracker._dispatch_diff_message(self._diff_message(12, 12, bids=[[9, 0]]))
+        self.assertEqual({}, self.tracker.depth_refill_counts)
+
+        self.tracker._dispatch_diff_message(self._diff_message(13, 13, bids=[[8, 0]]))
+        self.assertEqual({"COINALPHA-HBOT": 1}, self.tracker.depth_refill_counts)
+        self.assertTrue(self.tracker.is_order_book_refilling_depth("COINALPHA-HBOT"))
+        self.assertFalse(self.tracker.is_order_book_resyncing("COINALPHA-HBOT"))
+
+        # The diffs received while the snapshot is requested are still applied
+        self.tracker._dispatch_diff_message(self._diff_message(14, 14, bids=[[9.5, 2]]))
+        self.tracker._dispatch_diff_message(self._diff_message(15, 15, bids=[[5, 3]]))
+        self.assertEqual(9.5, order_book.get_price(False))
+        self.assertEqual(15, order_book.last_diff_uid)
+
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertFalse(self.tracker.is_order_book_refilling_depth("COINALPHA-HBOT"))
+        self.assertFalse(order_book.depth_incomplete)
+        self.assertEqual([(9.5, 2), (7, 1), (6, 1), (5, 3)],
+                         [(row.price, row.amount) for row in order_book.bid_entries()])
+        self.assertEqual({}, self.tracker.resync_counts)
+        self.assertEqual({}, self.tracker.sequence_gap_counts)
+        self.assertEqual(10, order_book.snapshot_uid)
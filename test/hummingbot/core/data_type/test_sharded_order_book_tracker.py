@@ -0,0 +1,161 @@
+import asyncio
+import unittest
+from typing import Awaitable, Dict, List
+from unittest.mock import patch
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.data_type.shared_order_book import SharedTopOfBookBuffer
+from hummingbot.core.data_type.sharded_order_book_tracker import ShardedOrderBookTracker
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent, OrderBookTradeEvent
+
+
+class StaticOrderBookTrackerDataSource(OrderBookTrackerDataSource):
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain=None) -> Dict[str, float]:
+        return {}
+
+    async def get_new_order_book(self, trading_pair: str) -> OrderBook:
+        return self.static_order_book(trading_pair)
+
+    def static_order_book(self, trading_pair: str) -> OrderBook:
+        order_book = OrderBook()
+        mid_price = 100 * (self._trading_pairs.index(trading_pair) + 1)
+        order_book.apply_snapshot(
+            [OrderBookRow(mid_price - 1 - i, 1, 1) for i in range(5)],
+            [OrderBookRow(mid_price + 1 + i, 1, 1) for i in range(5)],
+            1)
+        return order_book
+
+
+class CountingOrderBook(OrderBook):
+
+    def __init__(self):
+        super().__init__()
+        self.applied_snapshots_count = 0
+
+    def apply_numpy_snapshot(self, bids, asks):
+        self.applied_snapshots_count += 1
+        super().apply_numpy_snapshot(bids, asks)
+
+
+class StaticOrderBookTracker(OrderBookTracker):
+    TRADE_DELAY = 0.5
+
+    def start(self):
+        for trading_pair in self._trading_pairs:
+            self._order_books[trading_pair] = self._data_source.static_order_book(trading_pair)
+        asyncio.get_event_loop().call_later(self.TRADE_DELAY, self._apply_static_trades)
+
+    def _apply_static_trades(self):
+        for trading_pair, order_book in self._order_books.items():
+            order_book.apply_trades([OrderBookTradeEvent(trading_pair, 1640000000, TradeType.BUY, 150, 2)])
+
+
+class StaticOrderBookTrackerFactory:
+
+    def __call__(self, trading_pairs: List[str]) -> OrderBookTracker:
+        return StaticOrderBookTracker(StaticOrderBookTrackerDataSource(trading_pairs), trading_pairs)
+
+
+class ShardedOrderBookTrackerTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.trading_pairs = ["COINALPHA-HBOT", "COINBETA-HBOT", "COINGAMMA-HBOT"]
+        self.tracker = ShardedOrderBookTracker(
+            data_source=StaticOrderBookTrackerDataSource(self.trading_pairs),
+            trading_pairs=self.trading_pairs,
+            tracker_factory=StaticOrderBookTrackerFactory(),
+            shards=2,
+            depth=3)
+
+    def tearDown(self) -> None:
+        self.tracker.stop()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def test_shard_trading_pairs(self):
+        self.assertEqual([["COINALPHA-HBOT", "COINGAMMA-HBOT"], ["COINBETA-HBOT"]], self.tracker._shard_trading_pairs())
+
+    def test_order_books_synchronized_from_worker_processes(self):
+        self.tracker.start()
+        self.assertEqual(2, len(self.tracker.worker_processes))
+
+        # Spawning the worker processes and importing the application modules is slow
+        self.async_run_with_timeout(self.tracker._order_books_initialized.wait(), timeout=60)
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(self.trading_pairs, self.tracker.ready_trading_pairs)
+        # Each shard tracker initializes its books with its own list of pairs
+        order_book: OrderBook = self.tracker.order_books["COINGAMMA-HBOT"]
+        self.assertEqual(199, order_book.get_price(False))
+        self.assertEqual(201, order_book.get_price(True))
+        self.assertEqual([199, 198, 197], [row.price for row in order_book.bid_entries()])
+        self.assertEqual(202, order_book.get_price_for_volume(True, 2).result_price)
+        self.assertEqual(101, self.tracker.order_books["COINBETA-HBOT"].get_price(True))
+        self.assertEqual(199, self.tracker.get_top_of_book("COINGAMMA-HBOT").best_bid)
+
+        # The trades of the worker trackers are forwarded
+        trades_logger = EventLogger()
+        order_book.add_listener(OrderBookEvent.TradeEvent, trades_logger)
+        self.async_run_with_timeout(trades_logger.wait_for(OrderBookTradeEvent), timeout=10)
+
+        self.assertEqual(150, order_book.last_trade_price)
+        self.assertEqual(1, len(self.tracker.get_trade_tape("COINGAMMA-HBOT")))
+
+        self.tracker.stop()
+
+        self.assertEqual([], self.tracker.worker_processes)
+
+    def test_forwarded_trades_recorded_and_applied_to_order_books(self):
+        data_source = StaticOrderBookTrackerDataSource(self.trading_pairs)
+        self.tracker._order_books["COINALPHA-HBOT"] = data_source.static_order_book("COINALPHA-HBOT")
+        trades_logger = EventLogger()
+        self.tracker._order_books["COINALPHA-HBOT"].add_listener(OrderBookEvent.TradeEvent, trades_logger)
+        trades = [OrderBookTradeEvent("COINALPHA-HBOT", 1640000000, TradeType.BUY, 101, 1),
+                  OrderBookTradeEvent("COINBETA-HBOT", 1640000000, TradeType.SELL, 199, 1),
+                  OrderBookTradeEvent("COINALPHA-HBOT", 1640000001, TradeType.SELL, 99, 2)]
+
+        self.tracker._apply_forwarded_trades(trades)
+
+        self.assertEqual([trades[0], trades[2]], trades_logger.event_log)
+        self.assertEqual(99, self.tracker.order_books["COINALPHA-HBOT"].last_trade_price)
+        self.assertEqual(2, len(self.tracker.get_trade_tape("COINALPHA-HBOT")))
+        # The trades of order books not synchronized yet are ignored
+        self.assertNotIn("COINBETA-HBOT", self.tracker.trade_tapes)
+
+    def test_sync_skips_shards_without_new_publications(self):
+        data_source = StaticOrderBookTrackerDataSource(self.trading_pairs)
+        self.tracker._data_source.order_book_create_function = CountingOrderBook
+        buffers = [SharedTopOfBookBuffer(trading_pairs=shard, depth=3, create=True)
+                   for shard in self.tracker._shard_trading_pairs()]
+        self.tracker._buffers.extend(buffers)
+        self.tracker._synced_generations.extend([0] * len(buffers))
+        buffers[0].publish("COINALPHA-HBOT", data_source.static_order_book("COINALPHA-HBOT"), 1640000000)
+
+        self.tracker._sync_order_books()
+        alpha_order_book = self.tracker.order_books["COINALPHA-HBOT"]
+        self.assertEqual(1, alpha_order_book.applied_snapshots_count)
+
+        # Nothing published since the last sync
+        with patch.object(SharedTopOfBookBuffer, "read") as read_mock:
+            self.tracker._sync_order_books()
+            read_mock.assert_not_called()
+
+        # Only the order book published again is rebuilt
+        buffers[0].publish("COINGAMMA-HBOT", data_source.static_order_book("COINGAMMA-HBOT"), 1640000001)
+        self.tracker._sync_order_books()
+
+        self.assertEqual(1, alpha_order_book.applied_snapshots_count)
+        self.assertEqual(1, self.tracker.order_books["COINGAMMA-HBOT"].applied_snapshots_count)
+        self.assertEqual(101, alpha_order_book.get_price(True))
+        self.assertEqual(301, self.tracker.order_books["COINGAMMA-HBOT"].get_price(True))
+        self.assertNotIn("COINBETA-HBOT", self.tracker.order_books)
@@ -0,0 +1,81 @@
+import math
+import unittest
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.shared_order_book import SharedTopOfBookBuffer
+
+
+class SharedTopOfBookBufferTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.trading_pairs = ["COINALPHA-HBOT", "COINBETA-HBOT"]
+        self.writer = SharedTopOfBookBuffer(trading_pairs=self.trading_pairs, depth=2, create=True)
+        self.reader = SharedTopOfBookBuffer(trading_pairs=self.trading_pairs, depth=2, name=self.writer.name)
+
+    def tearDown(self) -> None:
+        self.reader.close()
+        self.writer.close()
+        self.writer.unlink()
+        super().tearDown()
+
+    def test_read_not_published_trading_pair(self):
+        self.assertEqual(0, self.reader.sequence("COINALPHA-HBOT"))
+        self.assertIsNone(self.reader.read("COINALPHA-HBOT"))
+
+    def test_publish_top_levels(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot(
+            [OrderBookRow(10, 1, 5), OrderBookRow(9, 2, 5), OrderBookRow(8, 3, 5)],
+            [OrderBookRow(11, 4, 5)],
+            5)
+        order_book.last_trade_price = 10.5
+
+        self.writer.publish("COINBETA-HBOT", order_book, timestamp=1640000000)
+        top_of_book = self.reader.read("COINBETA-HBOT")
+
+        self.assertEqual(2, top_of_book.sequence)
+        self.assertEqual(self.reader.sequence("COINBETA-HBOT"), top_of_book.sequence)
+        self.assertEqual(5, top_of_book.update_id)
+        self.assertEqual(10, top_of_book.best_bid)
+        self.assertEqual(11, top_of_book.best_ask)
+        self.assertEqual(10.5, top_of_book.mid_price)
+        self.assertEqual(10.5, top_of_book.last_trade_price)
+        self.assertEqual(1640000000, top_of_book.timestamp)
+        self.assertEqual([[10, 1, 5], [9, 2, 5]], top_of_book.bids.tolist())
+        self.assertEqual([[11, 4, 5]], top_of_book.asks.tolist())
+        self.assertIsNone(self.reader.read("COINALPHA-HBOT"))
+
+    def test_publish_empty_side(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(10, 1, 5)], [], 5)
+
+        self.writer.publish("COINALPHA-HBOT", order_book, timestamp=1640000000)
+        top_of_book = self.reader.read("COINALPHA-HBOT")
+
+        self.assertEqual(0, len(top_of_book.asks))
+        self.assertTrue(math.isnan(top_of_book.best_ask))
+        self.assertTrue(math.isnan(top_of_book.mid_price))
+
+    def test_read_gives_up_while_slot_is_being_written(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(10, 1, 5)], [OrderBookRow(11, 1, 5)], 5)
+        self.writer.publish("COINALPHA-HBOT", order_book, timestamp=1640000000)
+
+        # Simulate a writer in the middle of an update
+        self.writer._sequences[0] += 1
+
+        self.assertIsNone(self.reader.read("COINALPHA-HBOT"))
+        self.assertEqual(SharedTopOfBookBuffer.MAX_READ_ATTEMPTS - 1, self.reader.read_retries)
+
+    def test_generation_counts_publications(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(10, 1, 5)], [OrderBookRow(11, 1, 5)], 5)
+        self.assertEqual(0, self.reader.generation)
+
+        self.writer.publish("COINALPHA-HBOT", order_book, timestamp=1640000000)
+        self.writer.publish("COINBETA-HBOT", order_book, timestamp=1640000000)
+
+        self.assertEqual(2, self.reader.generation)
+        self.assertEqual(2, self.reader.sequence("COINALPHA-HBOT"))
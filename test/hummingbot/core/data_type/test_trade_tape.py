@@ -0,0 +1,87 @@
+import math
+import unittest
+
+from hummingbot.core.data_type.common import TradeType
+from hummingbot.core.data_type.trade_tape import TradeTape
+
+
+class TradeTapeTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.tape = TradeTape(trading_pair="COINALPHA-HBOT", capacity=4)
+
+    def test_empty_tape(self):
+        self.assertEqual(0, len(self.tape))
+        self.assertEqual(0, self.tape.volume(60))
+        self.assertEqual(0, self.tape.trades_count(60))
+        self.assertEqual(0, self.tape.imbalance(60))
+        self.assertTrue(math.isnan(self.tape.vwap(60)))
+        self.assertTrue(math.isnan(self.tape.last_price))
+        self.assertEqual((0, 4), self.tape.trades().shape)
+
+    def test_invalid_capacity_raises_error(self):
+        with self.assertRaises(ValueError):
+            TradeTape(trading_pair="COINALPHA-HBOT", capacity=0)
+
+    def test_window_aggregates(self):
+        self.tape.append(100, 10, 1, TradeType.BUY)
+        self.tape.append(110, 12, 2, TradeType.SELL)
+        self.tape.append(120, 11, 3, TradeType.BUY)
+
+        self.assertEqual(3, len(self.tape))
+        self.assertEqual(120, self.tape.last_timestamp)
+        self.assertEqual(11, self.tape.last_price)
+
+        # The window (100, 120] excludes the first trade
+        self.assertEqual(5, self.tape.volume(20))
+        self.assertEqual(3, self.tape.buy_volume(20))
+        self.assertEqual(2, self.tape.sell_volume(20))
+        self.assertEqual(2, self.tape.trades_count(20))
+        self.assertAlmostEqual((12 * 2 + 11 * 3) / 5, self.tape.vwap(20))
+        self.assertAlmostEqual(0.2, self.tape.imbalance(20))
+
+        self.assertEqual(6, self.tape.volume(60))
+        self.assertAlmostEqual((10 + 12 * 2 + 11 * 3) / 6, self.tape.vwap(60))
+
+    def test_window_ending_at_given_timestamp(self):
+        self.tape.append(100, 10, 1, TradeType.BUY)
+        self.tape.append(110, 12, 2, TradeType.SELL)
+        self.tape.append(120, 11, 3, TradeType.BUY)
+
+        self.assertEqual(3, self.tape.volume(15, now=110))
+        self.assertEqual(-1, self.tape.imbalance(5, now=112))
+        self.assertEqual(0, self.tape.volume(5, now=200))
+
+    def test_oldest_trades_discarded_when_full(self):
+        for i in range(6):
+            self.tape.append(100 + i, 10 + i, 1, TradeType.BUY if i % 2 == 0 else TradeType.SELL)
+
+        self.assertEqual(4, len(self.tape))
+        self.assertEqual(4, self.tape.trades_count(1000))
+        self.assertEqual(4, self.tape.volume(1000))
+        self.assertAlmostEqual((12 + 13 + 14 + 15) / 4, self.tape.vwap(1000))
+        self.assertEqual(0, self.tape.imbalance(1000))
+
+        trades = self.tape.trades()
+        self.assertEqual([102, 103, 104, 105], trades[:, 0].tolist())
+        self.assertEqual([12, 13, 14, 15], trades[:, 1].tolist())
+        self.assertEqual([1, -1, 1, -1], trades[:, 3].tolist())
+
+        self.assertEqual([[104, 14, 1, 1], [105, 15, 1, -1]], self.tape.trades(window=2).tolist())
+
+    def test_out_of_order_trade_recorded_with_previous_timestamp(self):
+        self.tape.append(100, 10, 1, TradeType.BUY)
+        self.tape.append(90, 11, 1, TradeType.BUY)
+
+        self.assertEqual([100, 100], self.tape.trades()[:, 0].tolist())
+        self.assertEqual(2, self.tape.trades_count(5))
+
+    def test_clear(self):
+        self.tape.append(100, 10, 1, TradeType.BUY)
+        self.tape.clear()
+        self.tape.append(200, 20, 2, TradeType.SELL)
+
+        self.assertEqual(1, len(self.tape))
+        self.assertEqual(2, self.tape.volume(1000))
+        self.assertEqual(20, self.tape.vwap(1000))
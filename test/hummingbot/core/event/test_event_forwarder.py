@@ -0,0 +1,66 @@
+import asyncio
+from typing import Awaitable
+from unittest import TestCase
+
+from hummingbot.core.event.event_forwarder import AsyncEventForwarder
+from hummingbot.core.pubsub import PubSub
+from test.mock.mock_events import MockEvent, MockEventType
+
+
+class AsyncEventForwarderTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.pubsub = PubSub()
+        self.received_events = []
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    async def slow_listener(self, event: MockEvent):
+        await asyncio.sleep(0)
+        self.received_events.append(event)
+
+    def test_events_forwarded_in_order_after_trigger(self):
+        forwarder = AsyncEventForwarder(self.slow_listener)
+        self.pubsub.add_listener(MockEventType.EVENT_ZERO, forwarder)
+
+        for payload in range(3):
+            self.pubsub.trigger_event(MockEventType.EVENT_ZERO, MockEvent(payload=payload))
+
+        self.assertEqual([], self.received_events)
+        self.assertEqual(3, forwarder.pending_events_count)
+
+        self.async_run_with_timeout(asyncio.sleep(0.05))
+
+        self.assertEqual([MockEvent(payload=0), MockEvent(payload=1), MockEvent(payload=2)], self.received_events)
+        self.assertEqual(0, forwarder.pending_events_count)
+        forwarder.stop()
+
+    def test_oldest_events_discarded_when_queue_full(self):
+        forwarder = AsyncEventForwarder(self.received_events.append, max_queue_size=2)
+        self.pubsub.add_listener(MockEventType.EVENT_ZERO, forwarder)
+
+        self.pubsub.trigger_events(MockEventType.EVENT_ZERO, [MockEvent(payload=payload) for payload in range(3)])
+        self.async_run_with_timeout(asyncio.sleep(0.05))
+
+        self.assertEqual([MockEvent(payload=1), MockEvent(payload=2)], self.received_events)
+        self.assertEqual(1, forwarder.discarded_events_count)
+        forwarder.stop()
+
+    def test_listener_error_does_not_stop_forwarding(self):
+        def failing_listener(event: MockEvent):
+            if event.payload == 0:
+                raise Exception("Test error")
+            self.received_events.append(event)
+
+        forwarder = AsyncEventForwarder(failing_listener)
+        self.pubsub.add_listener(MockEventType.EVENT_ZERO, forwarder)
+
+        self.pubsub.trigger_event(MockEventType.EVENT_ZERO, MockEvent(payload=0))
+        self.pubsub.trigger_event(MockEventType.EVENT_ZERO, MockEvent(payload=1))
+        self.async_run_with_timeout(asyncio.sleep(0.05))
+
+        self.assertEqual([MockEvent(payload=1)], self.received_events)
+        forwarder.stop()
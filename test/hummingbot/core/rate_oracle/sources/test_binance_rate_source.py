@@ -94,6 +94,17 @@ class BinanceRateSourceTest(unittest.TestCase):
         mock_api.get(pairs_url, body=json.dumps(symbols_response))
         mock_api.get(binance_prices_us_url, body=json.dumps(binance_prices_us_response))
         mock_api.get(binance_prices_global_url, body=json.dumps(binance_prices_global_response))
+        binance_last_prices_us_url = web_utils.public_rest_url(path_url=CONSTANTS.TICKER_PRICE_PATH_URL, domain="us")
+        binance_last_prices_us_response = [
+            {"symbol": self.binance_us_pair, "price": "20863.0000"},
+            {"symbol": self.binance_ignored_pair, "price": "0"},
+        ]
+        binance_last_prices_global_url = web_utils.public_rest_url(path_url=CONSTANTS.TICKER_PRICE_PATH_URL)
+        binance_last_prices_global_response = [
+            {"symbol": self.binance_pair, "price": str(expected_rate)},
+        ]
+        mock_api.get(binance_last_prices_us_url, body=json.dumps(binance_last_prices_us_response))
+        mock_api.get(binance_last_prices_global_url, body=json.dumps(binance_last_prices_global_response))
 
     @aioresponses()
     def test_get_binance_prices(self, mock_api):
@@ -51,7 +51,7 @@ class KucoinRateSourceTest(unittest.TestCase):
                 "ticker": [
                     {
                         "symbol": self.trading_pair,
-                        "symbolName": self.trading_pair,
+                        "symbolName": f"OLD{self.trading_pair}",
                         "buy": str(expected_rate - Decimal("0.1")),
                         "sell": str(expected_rate + Decimal("0.1")),
                     },
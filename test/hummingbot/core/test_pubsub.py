@@ -3,6 +3,7 @@ import gc
 import weakref
 
 from hummingbot.core.pubsub import PubSub
+from hummingbot.core.event.event_forwarder import EventForwarder
 from hummingbot.core.event.event_logger import EventLogger
 
 from test.mock.mock_events import MockEventType, MockEvent
@@ -89,6 +90,76 @@ class PubSubTest(unittest.TestCase):
         listeners = self.pubsub.get_listeners(self.event_tag_zero)
         self.assertEqual(0, len(listeners))
 
+    def test_trigger_events_delivers_batch_in_order(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_one, self.listener_one)
+        events = [MockEvent(payload=1), MockEvent(payload=2), MockEvent(payload=3)]
+
+        self.pubsub.trigger_events(self.event_tag_zero, events)
+
+        self.assertEqual(events, self.listener_zero.event_log)
+        self.assertEqual(0, len(self.listener_one.event_log))
+
+    def test_trigger_events_isolates_failing_events(self):
+        received_events = []
+
+        def process_event(event):
+            if event.payload == 1:
+                raise ValueError("Invalid event")
+            received_events.append(event)
+
+        forwarder = EventForwarder(process_event)
+        self.pubsub.add_listener(self.event_tag_zero, forwarder)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        events = [MockEvent(payload=1), MockEvent(payload=2), MockEvent(payload=3)]
+
+        with self.assertLogs("hummingbot.core.pubsub", level="ERROR") as logs:
+            self.pubsub.trigger_events(self.event_tag_zero, events)
+
+        self.assertEqual(events[1:], received_events)
+        self.assertEqual(events, self.listener_zero.event_log)
+        self.assertEqual(1, len(logs.records))
+        self.assertEqual(0, forwarder.current_event_tag)
+
+    def test_listener_added_while_triggering_receives_next_event(self):
+        def add_listener(event):
+            self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+            self.pubsub.remove_listener(self.event_tag_zero, adding_forwarder)
+
+        adding_forwarder = EventForwarder(add_listener)
+        self.pubsub.add_listener(self.event_tag_zero, adding_forwarder)
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(0, len(self.listener_one.event_log))
+        self.assertEqual([self.listener_one], self.pubsub.get_listeners(self.event_tag_zero))
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.assertEqual(1, len(self.listener_one.event_log))
+
+    def test_lapsed_listener_remove_on_trigger_event(self):
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_zero)
+        self.pubsub.add_listener(self.event_tag_zero, self.listener_one)
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+        self.listener_zero = None  # remove strong reference
+        gc.collect()
+
+        self.pubsub.trigger_event(self.event_tag_zero, self.event)
+
+        self.assertEqual(2, len(self.listener_one.event_log))
+        self.assertEqual([self.listener_one], self.pubsub.get_listeners(self.event_tag_zero))
+
+    def test_event_info_set_only_while_processing_event(self):
+        received_info = []
+        forwarder = EventForwarder(
+            lambda event: received_info.append((forwarder.current_event_tag, forwarder.current_event_caller)))
+        self.pubsub.add_listener(self.event_tag_one, forwarder)
+
+        self.pubsub.trigger_event(self.event_tag_one, self.event)
+
+        self.assertEqual([(self.event_tag_one.value, self.pubsub)], received_info)
+        self.assertEqual(0, forwarder.current_event_tag)
+        self.assertIsNone(forwarder.current_event_caller)
+
 
 if __name__ == "__main__":
     unittest.main()
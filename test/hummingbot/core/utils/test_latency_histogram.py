@@ -0,0 +1,49 @@
+from unittest import TestCase
+
+from hummingbot.core.utils.latency_histogram import LatencyHistogram
+
+
+class LatencyHistogramTest(TestCase):
+
+    def test_record_latencies(self):
+        histogram = LatencyHistogram()
+        for latency in [0.0005, 0.003, 0.003, 0.15, 7]:
+            histogram.record(latency)
+
+        self.assertEqual(5, histogram.count)
+        self.assertEqual(7000, histogram.max_ms)
+        self.assertAlmostEqual((0.5 + 3 + 3 + 150 + 7000) / 5, histogram.mean_ms)
+        buckets = histogram.buckets()
+        self.assertEqual(1, buckets["<=1ms"])
+        self.assertEqual(2, buckets["<=5ms"])
+        self.assertEqual(1, buckets["<=200ms"])
+        self.assertEqual(1, buckets[">5000ms"])
+
+    def test_negative_latency_recorded_as_zero(self):
+        histogram = LatencyHistogram()
+        histogram.record(-0.2)
+
+        self.assertEqual(1, histogram.buckets()["<=1ms"])
+        self.assertEqual(0, histogram.max_ms)
+
+    def test_percentiles(self):
+        histogram = LatencyHistogram()
+        self.assertEqual(0, histogram.percentile_ms(50))
+
+        for _ in range(90):
+            histogram.record(0.004)
+        for _ in range(10):
+            histogram.record(0.3)
+
+        self.assertEqual(5, histogram.percentile_ms(50))
+        self.assertEqual(5, histogram.percentile_ms(90))
+        self.assertEqual(300, histogram.percentile_ms(99))
+
+    def test_reset(self):
+        histogram = LatencyHistogram()
+        histogram.record(0.01)
+        histogram.reset()
+
+        self.assertEqual(0, histogram.count)
+        self.assertEqual(0, histogram.mean_ms)
+        self.assertEqual(0, sum(histogram.buckets().values()))
@@ -1,7 +1,10 @@
 import asyncio
 import json
+import time
 import unittest
 from decimal import Decimal
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from typing import Any, Awaitable, Dict
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -23,6 +26,25 @@ class TestTradingPairFetcher(unittest.TestCase):
 
         cls.ev_loop = asyncio.get_event_loop()
 
+    def setUp(self) -> None:
+        super().setUp()
+        self.cache_dir = TemporaryDirectory()
+        self.cache_file_path = Path(self.cache_dir.name) / TradingPairFetcher.CACHE_FILE_NAME
+        cache_path_patch = patch(
+            "hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._cache_file_path",
+            return_value=self.cache_file_path)
+        cache_path_patch.start()
+        self.addCleanup(cache_path_patch.stop)
+        configured_patch = patch(
+            "hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._is_connector_configured",
+            return_value=True)
+        self.is_configured_mock = configured_patch.start()
+        self.addCleanup(configured_patch.stop)
+
+    def tearDown(self) -> None:
+        self.cache_dir.cleanup()
+        super().tearDown()
+
     @classmethod
     async def wait_until_trading_pair_fetcher_ready(cls, tpf):
         while True:
@@ -71,6 +93,75 @@ class TestTradingPairFetcher(unittest.TestCase):
         instance = TradingPairFetcher.get_instance()
         self.assertIs(instance, TradingPairFetcher.get_instance())
 
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_fetched_trading_pairs_are_saved_in_cache(self, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mockConnector": self.MockConnectorSetting(name="mockConnector", connector=connector),
+        }
+
+        trading_pair_fetcher = TradingPairFetcher(ClientConfigAdapter(ClientConfigMap()))
+        self.async_run_with_timeout(trading_pair_fetcher._fetch_task)
+
+        with open(self.cache_file_path) as cache_file:
+            cached_entries = json.load(cache_file)
+        self.assertEqual(["MOCK-HBOT"], cached_entries["mockConnector"]["trading_pairs"])
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_cached_trading_pairs_are_not_fetched_again(self, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mockConnector": self.MockConnectorSetting(name="mockConnector", connector=connector),
+        }
+        with open(self.cache_file_path, "w") as cache_file:
+            json.dump({"mockConnector": {"trading_pairs": ["CACHED-HBOT"], "timestamp": time.time()}}, cache_file)
+
+        trading_pair_fetcher = TradingPairFetcher(ClientConfigAdapter(ClientConfigMap()))
+        self.async_run_with_timeout(trading_pair_fetcher._fetch_task)
+
+        self.assertTrue(trading_pair_fetcher.ready)
+        self.assertEqual({"mockConnector": ["CACHED-HBOT"]}, trading_pair_fetcher.trading_pairs)
+        connector.all_trading_pairs.assert_not_called()
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_expired_cached_trading_pairs_are_refreshed_in_background(self, mock_connector_settings):
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mockConnector": self.MockConnectorSetting(name="mockConnector", connector=connector),
+        }
+        expired_timestamp = time.time() - TradingPairFetcher.CACHE_TTL - 1
+        with open(self.cache_file_path, "w") as cache_file:
+            json.dump({"mockConnector": {"trading_pairs": ["CACHED-HBOT"], "timestamp": expired_timestamp}}, cache_file)
+
+        trading_pair_fetcher = TradingPairFetcher(ClientConfigAdapter(ClientConfigMap()))
+        self.async_run_with_timeout(trading_pair_fetcher._fetch_task)
+
+        self.assertTrue(trading_pair_fetcher.ready)
+        self.async_run_with_timeout(trading_pair_fetcher._pending_fetches["mockConnector"])
+        self.assertEqual({"mockConnector": ["MOCK-HBOT"]}, trading_pair_fetcher.trading_pairs)
+
+    @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
+    def test_not_configured_connector_trading_pairs_fetched_on_demand(self, mock_connector_settings):
+        self.is_configured_mock.return_value = False
+        connector = AsyncMock()
+        connector.all_trading_pairs.return_value = ["MOCK-HBOT"]
+        mock_connector_settings.return_value = {
+            "mockConnector": self.MockConnectorSetting(name="mockConnector", connector=connector),
+        }
+
+        trading_pair_fetcher = TradingPairFetcher(ClientConfigAdapter(ClientConfigMap()))
+        self.async_run_with_timeout(trading_pair_fetcher._fetch_task)
+
+        self.assertEqual({}, trading_pair_fetcher.trading_pairs)
+        self.assertEqual([], trading_pair_fetcher.get_trading_pairs("mockConnector"))
+
+        self.async_run_with_timeout(trading_pair_fetcher._pending_fetches["mockConnector"])
+
+        self.assertEqual(["MOCK-HBOT"], trading_pair_fetcher.get_trading_pairs("mockConnector"))
+
     @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._all_connector_settings")
     @patch("hummingbot.core.utils.trading_pair_fetcher.TradingPairFetcher._sf_shared_instance")
     def test_fetched_connector_trading_pairs(self, _, mock_connector_settings):
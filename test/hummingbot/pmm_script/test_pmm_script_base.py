@@ -1,8 +1,27 @@
+import asyncio
+import queue
 import unittest
+from collections import deque
 from decimal import Decimal
 from statistics import mean
 
 from hummingbot.pmm_script.pmm_script_base import PMMScriptBase
+from hummingbot.pmm_script.pmm_script_interface import (
+    OnTick,
+    PMMParameters,
+    StrategyParameterUpdates,
+    flush_parameter_updates,
+    set_child_queue,
+)
+from hummingbot.pmm_script.pmm_script_queue_reader import start_queue_reader
+
+
+class ParametersUpdateScript(PMMScriptBase):
+
+    def on_tick(self):
+        if len(self.mid_prices) == 2:
+            self.pmm_parameters.bid_spread = Decimal("0.2")
+            self.pmm_parameters.order_levels = 3
 
 
 class PMMScriptIteratorTests(unittest.TestCase):
@@ -70,3 +89,75 @@ class PMMScriptIteratorTests(unittest.TestCase):
         self.assertEqual(Decimal("1.75"), PMMScriptBase.round_by_step(Decimal("1.7567"), Decimal("0.01")))
         self.assertEqual(Decimal("1"), PMMScriptBase.round_by_step(Decimal("1.7567"), Decimal("1")))
         self.assertEqual(Decimal("-1.75"), PMMScriptBase.round_by_step(Decimal("-1.8"), Decimal("0.25")))
+
+    def test_take_samples_from_deque(self):
+        samples = PMMScriptBase.take_samples(deque([1, 2, 3, 4, 5, 6, 7], maxlen=5), 2, 3)
+        self.assertEqual([3, 5, 7], samples)
+        self.assertIsNone(PMMScriptBase.take_samples(deque(), 1, 1))
+
+    def test_mid_prices_kept_up_to_max_length(self):
+        script_base = PMMScriptBase()
+        script_base.mid_prices.extend([Decimal("1"), Decimal("2"), Decimal("3")])
+        script_base.max_mid_prices_length = 2
+        self.assertEqual(2, script_base.max_mid_prices_length)
+        self.assertEqual([Decimal("2"), Decimal("3")], list(script_base.mid_prices))
+        script_base.mid_prices.append(Decimal("4"))
+        self.assertEqual([Decimal("3"), Decimal("4")], list(script_base.mid_prices))
+        self.assertEqual(Decimal("4"), script_base.mid_price)
+
+    def test_parameters_and_balances_deltas(self):
+        parent_queue = queue.Queue()
+        child_queue = queue.Queue()
+        script = ParametersUpdateScript()
+        script.assign_init(parent_queue, child_queue, 0.1)
+        set_child_queue(child_queue)
+        balances = {"binance": {"BTC": Decimal("1")}}
+        parent_queue.put(OnTick(Decimal("100"), {"bid_spread": Decimal("0.1"), "order_levels": 1}, balances, balances))
+        parent_queue.put(OnTick(Decimal("101"), {"ask_spread": Decimal("0.3")}, None, None))
+        parent_queue.put(None)
+
+        # The script stops its event loop when it receives None
+        ev_loop = asyncio.get_event_loop()
+        task = ev_loop.create_task(script.listen_to_parent())
+        timeout = ev_loop.call_later(5, ev_loop.stop)
+        ev_loop.run_forever()
+        timeout.cancel()
+        self.assertTrue(task.done())
+
+        self.assertEqual([Decimal("100"), Decimal("101")], list(script.mid_prices))
+        self.assertEqual(Decimal("0.2"), script.pmm_parameters.bid_spread)
+        self.assertEqual(Decimal("0.3"), script.pmm_parameters.ask_spread)
+        self.assertEqual(balances, script.all_total_balances)
+        self.assertEqual(balances, script.all_available_balances)
+        updates = child_queue.get_nowait()
+        self.assertIsInstance(updates, StrategyParameterUpdates)
+        self.assertEqual({"bid_spread": Decimal("0.2"), "order_levels": 3}, updates.updates)
+        # The parameter values received from the strategy are not sent back
+        self.assertTrue(child_queue.empty())
+
+    def test_queue_reader_forwards_items_until_none(self):
+        source_queue = queue.Queue()
+        ev_loop = asyncio.get_event_loop()
+
+        async def read_items():
+            items = start_queue_reader(source_queue, ev_loop)
+            source_queue.put(1)
+            source_queue.put(2)
+            source_queue.put(None)
+            return [await items.get() for _ in range(3)]
+
+        self.assertEqual([1, 2, None], ev_loop.run_until_complete(asyncio.wait_for(read_items(), 5)))
+
+    def test_parameter_updates_sent_as_copies(self):
+        child_queue = queue.Queue()
+        set_child_queue(child_queue)
+        parameters = PMMParameters()
+        parameters.apply_updates({"order_override": {}})
+        order_override = {"order_1": ["buy", Decimal("0.5"), Decimal("100")]}
+
+        parameters.order_override = order_override
+        flush_parameter_updates()
+        order_override["order_2"] = ["sell", Decimal("0.5"), Decimal("100")]
+
+        updates = child_queue.get_nowait()
+        self.assertEqual({"order_1": ["buy", Decimal("0.5"), Decimal("100")]}, updates.updates["order_override"])
@@ -0,0 +1,72 @@
+import math
+import unittest
+from decimal import Decimal
+
+import numpy as np
+
+from hummingbot.strategy.avellaneda_market_making.avellaneda_model import (
+    calculate_inventory,
+    calculate_inventory_q,
+    calculate_quotes,
+    calculate_target_inventory,
+    evaluate_model,
+    order_amount_factor,
+)
+
+
+class AvellanedaModelTest(unittest.TestCase):
+
+    def test_inventory(self):
+        self.assertAlmostEqual(15, calculate_inventory(10, 500, 100))
+        self.assertAlmostEqual(7.5, calculate_target_inventory(10, 500, 100, 0.5))
+        self.assertAlmostEqual(2.5 / 15, calculate_inventory_q(10, 500, 100, 7.5))
+        self.assertTrue(math.isnan(calculate_inventory_q(0, 0, 100, 0)))
+
+    def test_quotes_match_decimal_model(self):
+        price, q, gamma, vol, kappa, time_left_fraction, min_spread = (
+            Decimal("100"), Decimal("0.2"), Decimal("0.5"), Decimal("0.3"), Decimal("2.5"), Decimal("0.75"), Decimal("0")
+        )
+        reservation_price = price - q * gamma * vol * time_left_fraction
+        optimal_spread = gamma * vol * time_left_fraction + 2 * (1 + gamma / kappa).ln() / gamma
+
+        quotes = calculate_quotes(float(price), float(q), float(gamma), float(vol), float(kappa),
+                                  float(time_left_fraction), float(min_spread))
+
+        self.assertAlmostEqual(float(reservation_price), quotes[0], 10)
+        self.assertAlmostEqual(float(optimal_spread), quotes[1], 10)
+        self.assertAlmostEqual(float(reservation_price - optimal_spread / 2), quotes[2], 10)
+        self.assertAlmostEqual(float(reservation_price + optimal_spread / 2), quotes[3], 10)
+
+    def test_quotes_limited_by_min_spread(self):
+        _, _, optimal_bid, optimal_ask = calculate_quotes(100, 0, 0.5, 0.0001, 1000, 1, 2)
+
+        self.assertAlmostEqual(99, optimal_bid)
+        self.assertAlmostEqual(101, optimal_ask)
+
+    def test_order_amount_factor(self):
+        self.assertAlmostEqual(math.exp(-0.2), order_amount_factor(0.1, 2, True))
+        self.assertEqual(1, order_amount_factor(0.1, 2, False))
+        self.assertAlmostEqual(math.exp(-0.2), order_amount_factor(-0.1, 2, False))
+        self.assertEqual(1, order_amount_factor(-0.1, 2, True))
+
+    def test_evaluate_model_matches_single_point(self):
+        q, vol, kappa = np.meshgrid([-0.5, 0, 0.5], [0.1, 0.3], [1.5, 2.5])
+
+        result = evaluate_model(100, q, 0.5, vol, kappa, 0.75, 0.1, eta=2)
+
+        self.assertEqual(12, len(result))
+        for row in result.itertuples():
+            expected = calculate_quotes(100, row.q, 0.5, row.volatility, row.kappa, 0.75, 0.1)
+            self.assertAlmostEqual(expected[0], row.reservation_price, 10)
+            self.assertAlmostEqual(expected[1], row.optimal_spread, 10)
+            self.assertAlmostEqual(expected[2], row.optimal_bid, 10)
+            self.assertAlmostEqual(expected[3], row.optimal_ask, 10)
+            self.assertAlmostEqual(order_amount_factor(row.q, 2, True), row.buy_amount_factor, 10)
+            self.assertAlmostEqual(order_amount_factor(row.q, 2, False), row.sell_amount_factor, 10)
+
+    def test_evaluate_model_undefined_points(self):
+        result = evaluate_model(100, 0.1, 0.5, 0.3, [0, 2.5])
+
+        self.assertTrue(math.isnan(result["optimal_spread"][0]))
+        self.assertTrue(math.isnan(result["optimal_bid"][0]))
+        self.assertFalse(math.isnan(result["optimal_spread"][1]))
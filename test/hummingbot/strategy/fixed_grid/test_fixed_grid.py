@@ -228,3 +228,40 @@ class FixedGridUnitTest(unittest.TestCase):
         self.simulate_maker_market_trade(False, 5.0, 89.5)
         self.assertEqual(5, len(strategy.active_buys))
         self.assertEqual(4, len(strategy.active_sells))
+
+    def test_grid_levels_precomputed(self):
+        strategy = self.no_rebalance_strategy
+        self.clock.add_iterator(strategy)
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+
+        self.assertEqual([Decimal(40 + 10 * i) for i in range(10)], strategy.price_levels)
+        self.assertEqual([Decimal(5 * (9 - i)) for i in range(10)], strategy.base_inv_levels)
+        self.assertEqual([sum(strategy.price_levels[:i]) * 5 for i in range(10)], strategy.quote_inv_levels)
+
+    def test_only_changed_levels_replaced_on_refresh(self):
+        strategy = self.no_rebalance_strategy
+        strategy.order_refresh_tolerance_pct = Decimal("0.01")
+        self.clock.add_iterator(strategy)
+
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+        self.assertEqual(6, len(strategy.active_buys))
+        self.assertEqual(3, len(strategy.active_sells))
+        initial_ids = {o.client_order_id for o in strategy.active_orders}
+
+        # Within tolerance the orders are kept on refresh
+        self.clock.backtest_til(self.start_timestamp + 15)
+        self.assertEqual(initial_ids, {o.client_order_id for o in strategy.active_orders})
+        self.assertEqual(0, len(self.cancel_order_logger.event_log))
+
+        # A missing level is created again, without touching the other levels
+        cancelled_order = strategy.active_buys[0]
+        strategy.cancel_order(cancelled_order.client_order_id)
+        self.assertEqual(8, len(strategy.active_orders))
+        self.clock.backtest_til(self.start_timestamp + 30)
+        self.assertEqual(9, len(strategy.active_orders))
+        self.assertEqual(1, len(self.cancel_order_logger.event_log))
+        new_ids = {o.client_order_id for o in strategy.active_orders} - initial_ids
+        self.assertEqual(1, len(new_ids))
+        new_order = next(o for o in strategy.active_orders if o.client_order_id in new_ids)
+        self.assertTrue(new_order.is_buy)
+        self.assertEqual(cancelled_order.price, new_order.price)
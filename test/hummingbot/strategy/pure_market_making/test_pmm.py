@@ -2,6 +2,7 @@ import unittest
 from decimal import Decimal
 from test.mock.mock_asset_price_delegate import MockAssetPriceDelegate
 from typing import List, Optional
+from unittest.mock import patch
 
 import pandas as pd
 
@@ -43,6 +44,14 @@ def simulate_order_book_widening(order_book: OrderBook, top_bid: float, top_ask:
     order_book.apply_diffs(bid_diffs, ask_diffs, update_id)
 
 
+class BudgetBalanceCountingStrategy(PureMarketMakingStrategy):
+    budget_balance_lookups = 0
+
+    def adjusted_available_balance_for_orders_budget_constrain(self):
+        self.budget_balance_lookups += 1
+        return super().adjusted_available_balance_for_orders_budget_constrain()
+
+
 class PMMUnitTest(unittest.TestCase):
     start: pd.Timestamp = pd.Timestamp("2019-01-01", tz="UTC")
     end: pd.Timestamp = pd.Timestamp("2019-01-01 01:00:00", tz="UTC")
@@ -224,6 +233,51 @@ class PMMUnitTest(unittest.TestCase):
         self.assertEqual(1, len(strategy.active_buys))
         self.assertEqual(1, len(strategy.active_sells))
 
+    def test_proposal_stages_reused_while_inputs_unchanged(self):
+        strategy = self.multi_levels_strategy
+        self.clock.add_iterator(strategy)
+
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+        first_prices = sorted(o.price for o in strategy.active_orders)
+        # After order_refresh_time, the orders are replaced with the same proposal, computed from the cached stages
+        self.clock.backtest_til(self.start_timestamp + 7)
+        self.assertEqual(first_prices, sorted(o.price for o in strategy.active_orders))
+        base_stage = strategy.proposal_pipeline.stages["Base proposal"]
+        takers_filter_stage = strategy.proposal_pipeline.stages["Takers filter"]
+        self.assertEqual(base_stage.runs - 1, base_stage.reused)
+        self.assertEqual(takers_filter_stage.runs - 1, takers_filter_stage.reused)
+        self.assertIn("Proposal pipeline:", strategy.format_status())
+
+        # A config change recomputes the proposal
+        strategy.bid_spread = Decimal("0.02")
+        self.clock.backtest_til(self.start_timestamp + 14)
+        self.assertLess(base_stage.reused, base_stage.runs - 1)
+        self.assertEqual(98, max(o.price for o in strategy.active_buys))
+
+    def test_proposal_balances_and_top_prices_looked_up_once_per_tick(self):
+        strategy = BudgetBalanceCountingStrategy()
+        strategy.init_params(
+            self.market_info,
+            bid_spread=Decimal("0.01"),
+            ask_spread=Decimal("0.01"),
+            order_amount=Decimal("1"),
+            order_refresh_time=5.0,
+            filled_order_delay=5.0,
+            order_refresh_tolerance_pct=-1,
+            minimum_spread=-1,
+            order_optimization_enabled=True,
+        )
+        self.clock.add_iterator(strategy)
+
+        with patch.object(MarketTradingPairTuple, "get_price_for_volume", autospec=True,
+                          side_effect=MarketTradingPairTuple.get_price_for_volume) as get_price_for_volume_mock:
+            self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+
+        self.assertEqual(1, strategy.budget_balance_lookups)
+        self.assertEqual(2, get_price_for_volume_mock.call_count)
+        self.assertEqual(1, len(strategy.active_buys))
+        self.assertEqual(1, len(strategy.active_sells))
+
     def test_basic_one_level_price_type_own_last_trade(self):
         strategy = PureMarketMakingStrategy()
         strategy.init_params(
@@ -0,0 +1,80 @@
+import unittest
+from decimal import Decimal
+
+from hummingbot.strategy.pure_market_making.data_types import PriceSize, Proposal
+from hummingbot.strategy.pure_market_making.proposal_pipeline import ProposalPipeline
+
+
+class ProposalPipelineTest(unittest.TestCase):
+
+    def setUp(self):
+        self.pipeline = ProposalPipeline()
+        self.calls = []
+
+    def base_stage(self, _):
+        self.calls.append("base")
+        return Proposal([PriceSize(Decimal("99"), Decimal("1"))], [PriceSize(Decimal("101"), Decimal("1"))])
+
+    def double_sizes_stage(self, proposal: Proposal):
+        self.calls.append("double")
+        for order in proposal.buys + proposal.sells:
+            order.size *= 2
+
+    def run_pipeline(self, base_inputs, double_inputs) -> Proposal:
+        self.pipeline.start()
+        proposal = self.pipeline.run_stage("base", base_inputs, None, self.base_stage)
+        proposal = self.pipeline.run_stage("double", double_inputs, proposal, self.double_sizes_stage)
+        self.pipeline.finish()
+        return proposal
+
+    def test_stages_reused_when_inputs_unchanged(self):
+        first = self.run_pipeline((1,), (1,))
+        second = self.run_pipeline((1,), (1,))
+
+        self.assertEqual(["base", "double"], self.calls)
+        self.assertEqual(ProposalPipeline.snapshot(first), ProposalPipeline.snapshot(second))
+        self.assertEqual(Decimal("2"), second.buys[0].size)
+        self.assertIsNot(first.buys[0], second.buys[0])
+        self.assertEqual(2, self.pipeline.stages["base"].runs)
+        self.assertEqual(1, self.pipeline.stages["base"].reused)
+
+    def test_stage_recomputed_when_its_inputs_change(self):
+        self.run_pipeline((1,), (1,))
+        self.run_pipeline((1,), (2,))
+
+        self.assertEqual(["base", "double", "double"], self.calls)
+
+    def test_next_stages_recomputed_when_output_changes(self):
+        self.run_pipeline((1,), (1,))
+        self.pipeline.start()
+        proposal = self.pipeline.run_stage("base", (2,), None,
+                                           lambda _: Proposal([PriceSize(Decimal("98"), Decimal("1"))], []))
+        proposal = self.pipeline.run_stage("double", (1,), proposal, self.double_sizes_stage)
+        self.pipeline.finish()
+
+        self.assertEqual(["base", "double", "double"], self.calls)
+        self.assertEqual(Decimal("98"), proposal.buys[0].price)
+        self.assertEqual(Decimal("2"), proposal.buys[0].size)
+
+    def test_next_stages_reused_when_recomputed_output_is_the_same(self):
+        self.run_pipeline((1,), (1,))
+        self.run_pipeline((2,), (1,))
+
+        self.assertEqual(["base", "double", "base"], self.calls)
+
+    def test_cache_discarded_after_incomplete_run(self):
+        self.run_pipeline((1,), (1,))
+        self.pipeline.start()
+        self.pipeline.run_stage("base", (1,), None, self.base_stage)
+        self.run_pipeline((1,), (1,))
+
+        self.assertEqual(["base", "double", "base", "double"], self.calls)
+
+    def test_timing_data_frame(self):
+        self.run_pipeline((1,), (1,))
+        self.run_pipeline((1,), (1,))
+
+        df = self.pipeline.timing_data_frame()
+        self.assertEqual(["Stage", "Last (ms)", "Avg (ms)", "Reused"], list(df.columns))
+        self.assertEqual(["base", "double"], list(df["Stage"]))
+        self.assertEqual(["50%", "50%"], list(df["Reused"]))
@@ -0,0 +1,133 @@
+import math
+import unittest
+from decimal import Decimal
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
+from hummingbot.strategy.arbitrage_evaluator import (
+    ArbitrageEvaluator,
+    ArbitrageLeg,
+    OrderBookDepth,
+    TradingFeeCache,
+)
+
+
+class ArbitrageEvaluatorTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.order_books = {}
+        self.market = self.create_market(self.order_books, Decimal("0"))
+        self.evaluator = ArbitrageEvaluator(depth=10)
+
+    @staticmethod
+    def create_market(order_books, percent_fee: Decimal, flat_fees=None):
+        market = MagicMock()
+        market.get_order_book.side_effect = lambda trading_pair: order_books[trading_pair]
+        market.get_fee.return_value = AddedToCostTradeFee(percent=percent_fee, flat_fees=flat_fees or [])
+        return market
+
+    @staticmethod
+    def create_order_book(bids, asks) -> OrderBook:
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(price, amount, 1) for price, amount in bids],
+                                  [OrderBookRow(price, amount, 1) for price, amount in asks],
+                                  1)
+        return order_book
+
+    def test_order_book_depth_fills(self):
+        order_book = self.create_order_book(bids=[(99, 1), (98, 2)], asks=[(101, 1), (102, 0), (103, 2)])
+        asks = OrderBookDepth.from_order_book(order_book, is_buy=True)
+        bids = OrderBookDepth.from_order_book(order_book, is_buy=False)
+
+        self.assertEqual([101, 103], asks.prices.tolist())
+        self.assertEqual(3, asks.total_base)
+        np.testing.assert_allclose([50.5, 101, 204, 307], asks.quote_for_base([0.5, 1, 2, 3]))
+        np.testing.assert_allclose([1, 2], asks.base_for_quote([101, 204]))
+        np.testing.assert_allclose([99, 197], bids.quote_for_base([1, 2]))
+        self.assertTrue(math.isnan(bids.quote_for_base(4)))
+        self.assertTrue(math.isnan(asks.base_for_quote(400)))
+
+    def test_order_books_snapshotted_once_per_tick(self):
+        self.order_books["COINALPHA-HBOT"] = self.create_order_book(bids=[(99, 1)], asks=[(101, 1)])
+
+        self.evaluator.start_tick(1000)
+        first = self.evaluator.order_book_depth(self.market, "COINALPHA-HBOT", True)
+        self.assertIs(first, self.evaluator.order_book_depth(self.market, "COINALPHA-HBOT", True))
+        self.evaluator.start_tick(1000)
+        self.assertIs(first, self.evaluator.order_book_depth(self.market, "COINALPHA-HBOT", True))
+        self.evaluator.start_tick(1001)
+        self.assertIsNot(first, self.evaluator.order_book_depth(self.market, "COINALPHA-HBOT", True))
+        self.assertEqual(2, self.market.get_order_book.call_count)
+
+    def test_fees_cached_per_market_pair_and_side(self):
+        fee_cache = TradingFeeCache(ttl=60)
+        market = self.create_market({}, Decimal("0.001"), [TokenAmount("HBOT", Decimal("0.5"))])
+
+        with patch.object(TradingFeeCache, "_time", return_value=1000):
+            schedule = fee_cache.get_fee_schedule(market, "COINALPHA", "HBOT", OrderType.MARKET, TradeType.BUY)
+            fee_cache.get_fee_schedule(market, "COINALPHA", "HBOT", OrderType.MARKET, TradeType.BUY, Decimal(5))
+            fee_cache.get_fee_schedule(market, "COINALPHA", "HBOT", OrderType.MARKET, TradeType.SELL)
+        self.assertAlmostEqual(0.001, schedule.percent)
+        self.assertAlmostEqual(0.5, schedule.flat_fee)
+        self.assertEqual(2, market.get_fee.call_count)
+
+        with patch.object(TradingFeeCache, "_time", return_value=1060):
+            fee_cache.get_fee_schedule(market, "COINALPHA", "HBOT", OrderType.MARKET, TradeType.BUY)
+        self.assertEqual(3, market.get_fee.call_count)
+
+    def test_flat_fees_in_other_token_not_supported(self):
+        market = self.create_market({}, Decimal("0"), [TokenAmount("ETH", Decimal("0.01"))])
+
+        with self.assertRaises(ValueError):
+            TradingFeeCache().get_fee(market, "COINALPHA", "HBOT", OrderType.MARKET, TradeType.BUY)
+
+    def test_evaluate_triangular_cycle(self):
+        # Buy ALPHA with HBOT, sell ALPHA for BETA, sell BETA for HBOT
+        self.order_books["ALPHA-HBOT"] = self.create_order_book(bids=[(9, 100)], asks=[(10, 1), (11, 100)])
+        self.order_books["ALPHA-BETA"] = self.create_order_book(bids=[(5, 100)], asks=[(6, 100)])
+        self.order_books["BETA-HBOT"] = self.create_order_book(bids=[(2.2, 100)], asks=[(2.3, 100)])
+        legs = [ArbitrageLeg(self.market, "ALPHA-HBOT", True),
+                ArbitrageLeg(self.market, "ALPHA-BETA", False),
+                ArbitrageLeg(self.market, "BETA-HBOT", False)]
+
+        self.evaluator.start_tick(1000)
+        evaluation = self.evaluator.evaluate_cycle(legs, [10, 21, 10000])
+
+        np.testing.assert_allclose([1, 2], evaluation.leg_base_amounts[0, :2])
+        np.testing.assert_allclose([11, 22], evaluation.end_amounts[:2])
+        np.testing.assert_allclose([0.1, 22 / 21 - 1], evaluation.profitability[:2])
+        # Not enough depth for the last amount
+        self.assertTrue(math.isnan(evaluation.profitability[2]))
+
+    def test_cycle_evaluated_with_fees(self):
+        self.order_books["ALPHA-HBOT"] = self.create_order_book(bids=[(10, 100)], asks=[(10, 100)])
+        market = self.create_market(self.order_books, Decimal("0.01"))
+        legs = [ArbitrageLeg(market, "ALPHA-HBOT", True), ArbitrageLeg(market, "ALPHA-HBOT", False)]
+
+        evaluation = self.evaluator.evaluate_cycles({"round trip": legs}, 100)["round trip"]
+
+        self.assertAlmostEqual(0.99 * 0.99 - 1, evaluation.profitability[0])
+
+    def test_evaluate_cross_exchange(self):
+        self.order_books["COINALPHA-HBOT"] = self.create_order_book(bids=[(99, 1)], asks=[(100, 1), (101, 2)])
+        sell_order_books = {"COINALPHA-HBOT": self.create_order_book(bids=[(103, 1.5), (100.5, 5)],
+                                                                     asks=[(104, 1)])}
+        sell_market = self.create_market(sell_order_books, Decimal("0.001"))
+        buy_leg = ArbitrageLeg(self.market, "COINALPHA-HBOT", True)
+        sell_leg = ArbitrageLeg(sell_market, "COINALPHA-HBOT", False)
+
+        evaluation = self.evaluator.evaluate_cross_exchange(buy_leg, sell_leg)
+
+        np.testing.assert_allclose([1, 1.5, 3], evaluation.base_amounts)
+        np.testing.assert_allclose([100, 150.5, 302], evaluation.buy_costs)
+        np.testing.assert_allclose(np.array([103, 154.5, 305.25]) * 0.999, evaluation.sell_proceeds)
+
+        amount, profitability = self.evaluator.best_cross_exchange_amount(buy_leg, sell_leg, 0.01)
+        self.assertEqual(1.5, amount)
+        self.assertAlmostEqual(154.5 * 0.999 / 150.5, profitability)
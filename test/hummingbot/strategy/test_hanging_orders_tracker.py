@@ -504,3 +504,80 @@ class TestHangingOrdersTracker(unittest.TestCase):
         hanging_order = next((hanging_order for hanging_order in self.tracker.strategy_current_hanging_orders))
 
         self.assertEqual(order.client_order_id, hanging_order.order_id)
+
+    def test_only_orders_far_from_price_are_cancelled(self):
+        cancelled_orders_ids = []
+        strategy_active_orders = []
+        type(self.strategy).active_orders = PropertyMock(return_value=strategy_active_orders)
+        self.strategy.cancel_order.side_effect = lambda order_id: cancelled_orders_ids.append(order_id)
+
+        for index, price in enumerate((80, 89, 90, 95, 100, 105, 110, 111, 130)):
+            for is_buy in (True, False):
+                order = LimitOrder(f"Order-{is_buy}-{index}", "BTC-USDT", is_buy, "BTC", "USDT", Decimal(price),
+                                   Decimal(1))
+                self.tracker.add_order(order)
+                strategy_active_orders.append(order)
+
+        self.tracker.remove_orders_far_from_price()
+
+        expected_ids = [f"Order-{is_buy}-{index}" for is_buy in (True, False) for index in (0, 1, 7, 8)]
+        self.assertEqual(sorted(expected_ids), sorted(cancelled_orders_ids))
+
+        # The orders removed from the tracker are no longer considered
+        self.tracker.remove_all_buys()
+        self.tracker.orders_being_cancelled.clear()
+        cancelled_orders_ids.clear()
+        self.tracker.remove_orders_far_from_price()
+
+        expected_ids = [f"Order-False-{index}" for index in (0, 1, 7, 8)]
+        self.assertEqual(sorted(expected_ids), sorted(cancelled_orders_ids))
+        self.assertEqual(9, len(self.tracker.original_orders))
+
+    def test_hanging_orders_indexed_by_order_id(self):
+        type(self.strategy).active_orders = PropertyMock(return_value=[])
+        order_1 = LimitOrder("Order-1", "BTC-USDT", True, "BTC", "USDT", Decimal(100), Decimal(1))
+        order_2 = LimitOrder("Order-2", "BTC-USDT", False, "BTC", "USDT", Decimal(101), Decimal(1))
+        self.tracker.add_as_hanging_order(order_1)
+        self.tracker.add_as_hanging_order(order_2)
+
+        self.assertTrue(self.tracker.is_order_id_in_hanging_orders("Order-1"))
+        self.assertTrue(self.tracker.is_order_id_in_hanging_orders("Order-2"))
+        self.assertFalse(self.tracker.is_order_id_in_hanging_orders("Order-3"))
+
+        self.tracker._did_cancel_order(MarketEvent.OrderCancelled,
+                                       self,
+                                       OrderCancelledEvent(datetime.now().timestamp(), "Order-1", "Order-1"))
+
+        self.assertFalse(self.tracker.is_order_id_in_hanging_orders("Order-1"))
+        self.assertTrue(self.tracker.is_order_id_in_hanging_orders("Order-2"))
+        self.assertNotIn(order_1, self.tracker.original_orders)
+
+    def test_removed_hanging_order_not_renewed(self):
+        cancelled_orders_ids = []
+        strategy_active_orders = []
+        type(self.strategy).current_timestamp = PropertyMock(return_value=1234967891)
+        type(self.strategy).active_orders = PropertyMock(return_value=strategy_active_orders)
+        self.strategy.cancel_order.side_effect = lambda order_id: cancelled_orders_ids.append(order_id)
+
+        old_orders = [LimitOrder(f"Order-{index}", "BTC-USDT", True, "BTC", "USDT", Decimal(100 + index), Decimal(1),
+                                 creation_timestamp=1234565991000000 + index * 1000000)
+                      for index in range(3)]
+        for order in old_orders:
+            self.tracker.add_as_hanging_order(order)
+            strategy_active_orders.append(order)
+
+        # The first order is filled before reaching the max order age
+        self.tracker._did_complete_buy_order(MarketEvent.BuyOrderCompleted,
+                                             self,
+                                             BuyOrderCompletedEvent(
+                                                 timestamp=datetime.now().timestamp(),
+                                                 order_id="Order-0",
+                                                 base_asset="BTC",
+                                                 quote_asset="USDT",
+                                                 base_asset_amount=Decimal(1),
+                                                 quote_asset_amount=Decimal(100),
+                                                 order_type=OrderType.LIMIT))
+        self.tracker.renew_hanging_orders_past_max_order_age()
+
+        self.assertEqual(["Order-1", "Order-2"], sorted(cancelled_orders_ids))
+        self.assertEqual(2, len(self.tracker.orders_being_renewed))
@@ -1,6 +1,6 @@
 import unittest
 from decimal import Decimal
-from typing import List
+from typing import List, Set
 
 import pandas as pd
 
@@ -19,6 +19,20 @@ class MockScriptStrategy(ScriptStrategyBase):
     pass
 
 
+class PartiallyReadyMockPaperExchange(MockPaperExchange):
+
+    def __init__(self, client_config_map, ready_trading_pairs: Set[str]):
+        super().__init__(client_config_map=client_config_map)
+        self.ready_trading_pairs = ready_trading_pairs
+
+    @property
+    def ready(self) -> bool:
+        return False
+
+    def is_trading_pair_ready(self, trading_pair: str) -> bool:
+        return trading_pair in self.ready_trading_pairs
+
+
 class ScriptStrategyBaseTest(unittest.TestCase):
     level = 0
 
@@ -74,6 +88,32 @@ class ScriptStrategyBaseTest(unittest.TestCase):
     def test_load_script_class_raises_exception_for_non_existing_script(self):
         self.assertRaises(ImportError, ScriptStrategyBase.load_script_class, "non_existing_script")
 
+    def test_tick_waits_for_all_trading_pairs_by_default(self):
+        connector = PartiallyReadyMockPaperExchange(ClientConfigAdapter(ClientConfigMap()), {self.trading_pair})
+        strategy = MockScriptStrategy({self.connector_name: connector})
+
+        strategy.tick(self.start_timestamp)
+
+        self.assertFalse(strategy.ready_to_trade)
+        self.assertTrue(strategy.is_trading_pair_ready(self.connector_name, self.trading_pair))
+
+    def test_tick_starts_with_ready_trading_pairs_when_not_waiting_for_all(self):
+        connector = PartiallyReadyMockPaperExchange(ClientConfigAdapter(ClientConfigMap()), set())
+        ScriptStrategyBase.markets = {self.connector_name: {self.trading_pair, "COINALPHA-USDT"}}
+        strategy = MockScriptStrategy({self.connector_name: connector})
+        strategy.wait_for_all_trading_pairs = False
+
+        strategy.tick(self.start_timestamp)
+
+        self.assertFalse(strategy.ready_to_trade)
+
+        connector.ready_trading_pairs.add(self.trading_pair)
+        strategy.tick(self.start_timestamp + 1)
+
+        self.assertTrue(strategy.ready_to_trade)
+        self.assertTrue(strategy.is_trading_pair_ready(self.connector_name, self.trading_pair))
+        self.assertFalse(strategy.is_trading_pair_ready(self.connector_name, "COINALPHA-USDT"))
+
     def test_start(self):
         self.assertFalse(self.strategy.ready_to_trade)
         self.strategy.start(Clock(ClockMode.BACKTEST), self.start_timestamp)
@@ -95,6 +135,20 @@ class ScriptStrategyBaseTest(unittest.TestCase):
         self.assertEqual("ETH", assets[1])
         self.assertEqual("HBOT", assets[2])
 
+    def test_get_candles_df(self):
+        candles_df = self.strategy.get_candles_df(self.connector_name, self.trading_pair, 60)
+        self.assertEqual(0, len(candles_df))
+
+        self.connector.order_book_tracker.get_candles(self.trading_pair, 60).add_trade(self.start_timestamp, 100, 2)
+
+        candles_df = self.strategy.get_candles_df(self.connector_name, self.trading_pair, 60)
+        self.assertEqual(["open", "high", "low", "close", "volume", "trades"], list(candles_df.columns))
+        self.assertEqual([100, 100, 100, 100, 2, 1], candles_df.iloc[0].tolist())
+
+    def test_get_candles_df_raises_error_for_unknown_trading_pair(self):
+        with self.assertRaises(ValueError):
+            self.strategy.get_candles_df(self.connector_name, "COINALPHA-USDT", 60)
+
     def test_get_market_trading_pair_tuples(self):
         market_infos: List[MarketTradingPairTuple] = self.strategy.get_market_trading_pair_tuples()
         self.assertEqual(1, len(market_infos))
@@ -0,0 +1,61 @@
+import math
+import unittest
+from statistics import mean
+
+import numpy as np
+
+from hummingbot.strategy.__utils__.trailing_indicators.range_volatility import RangeVolatilityIndicator
+
+
+class RangeVolatilityTest(unittest.TestCase):
+    INITIAL_RANDOM_SEED = 3141592653
+
+    def setUp(self) -> None:
+        np.random.seed(self.INITIAL_RANDOM_SEED)
+
+    @staticmethod
+    def recalculated_volatility(samples, sampling_length: int, processing_length: int) -> float:
+        ranges = []
+        for end in range(len(samples), 0, -sampling_length)[:processing_length]:
+            if end < sampling_length:
+                break
+            interval = samples[end - sampling_length:end]
+            ranges.append((max(interval) - min(interval)) / min(interval))
+        return mean(ranges)
+
+    def test_invalid_lengths_raise_error(self):
+        with self.assertRaises(ValueError):
+            RangeVolatilityIndicator(0, 1)
+        with self.assertRaises(ValueError):
+            RangeVolatilityIndicator(1, 0)
+
+    def test_volatility_before_first_interval_complete(self):
+        indicator = RangeVolatilityIndicator(5, 2)
+        indicator.add_sample(100)
+        self.assertTrue(math.isnan(indicator.current_value))
+
+        indicator.add_sample(105)
+        indicator.add_sample(110)
+        self.assertFalse(indicator.is_sampling_buffer_full)
+        self.assertAlmostEqual(0.1, indicator.current_value)
+
+    def test_invalid_samples_ignored(self):
+        indicator = RangeVolatilityIndicator(5, 2)
+        indicator.add_sample(100)
+        indicator.add_sample(float("nan"))
+        indicator.add_sample(0)
+        indicator.add_sample(110)
+
+        self.assertEqual(2, indicator.samples_count)
+        self.assertAlmostEqual(0.1, indicator.current_value)
+
+    def test_volatility_matches_recalculation_over_intervals(self):
+        samples = list(np.random.normal(100, 2, 500))
+        for sampling_length, processing_length in ((1, 3), (7, 1), (10, 4)):
+            indicator = RangeVolatilityIndicator(sampling_length, processing_length)
+            for count, sample in enumerate(samples, start=1):
+                indicator.add_sample(sample)
+                if count >= sampling_length:
+                    self.assertAlmostEqual(
+                        self.recalculated_volatility(samples[:count], sampling_length, processing_length),
+                        indicator.current_value)